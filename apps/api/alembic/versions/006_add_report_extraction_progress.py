@@ -0,0 +1,26 @@
+"""add report extraction progress
+
+Revision ID: 006_add_report_extraction_progress
+Revises: 005_create_api_logs
+Create Date: 2025-11-20 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006_add_report_extraction_progress'
+down_revision = '005_create_api_logs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('reports', sa.Column('total_pages', sa.Integer(), nullable=True))
+    op.add_column('reports', sa.Column('pages_processed', sa.Integer(), nullable=True, server_default='0'))
+
+
+def downgrade():
+    op.drop_column('reports', 'pages_processed')
+    op.drop_column('reports', 'total_pages')
@@ -0,0 +1,24 @@
+"""add report extraction tier
+
+Revision ID: 007_add_report_extraction_tier
+Revises: 006_add_report_extraction_progress
+Create Date: 2025-11-21 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_add_report_extraction_tier'
+down_revision = '006_add_report_extraction_progress'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('reports', sa.Column('extraction_tier', sa.String(length=20), nullable=True))
+
+
+def downgrade():
+    op.drop_column('reports', 'extraction_tier')
@@ -0,0 +1,24 @@
+"""add report parse key
+
+Revision ID: 008_add_report_parse_key
+Revises: 007_add_report_extraction_tier
+Create Date: 2025-11-24 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008_add_report_parse_key'
+down_revision = '007_add_report_extraction_tier'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('reports', sa.Column('parse_key', sa.String(length=128), nullable=True))
+
+
+def downgrade():
+    op.drop_column('reports', 'parse_key')
@@ -2,6 +2,7 @@
 Celery application
 """
 from celery import Celery
+from celery.signals import worker_process_init
 import os
 
 celery_app = Celery(
@@ -19,5 +20,17 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=3600,  # 1시간
     worker_max_tasks_per_child=50,
+    # 표/이미지/OCR 보강 추출은 별도 큐에서 낮은 우선순위로 처리
+    task_routes={
+        "extract_report_deep": {"queue": os.getenv("DEEP_EXTRACTION_QUEUE", "deep_extraction")},
+    },
 )
 
+
+
+@worker_process_init.connect
+def preload_ocr_engines(**kwargs):
+    """워커 프로세스 시작 시 OCR 엔진을 한 번만 로드 (OCR_PRELOAD=false로 비활성화)"""
+    if os.getenv("OCR_PRELOAD", "true").lower() == "true":
+        from app.services.extraction.ocr_engine_pool import get_ocr_engine_pool
+        get_ocr_engine_pool().preload()
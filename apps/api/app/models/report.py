@@ -22,6 +22,10 @@ class Report(BaseModel):
     file_path = Column(Text)  # PDF 파일 경로
     file_size = Column(Integer)  # 파일 크기 (bytes)
     status = Column(String(20), default="pending", index=True)  # pending, processing, completed, failed
+    total_pages = Column(Integer)  # PDF 전체 페이지 수
+    pages_processed = Column(Integer, default=0)  # 추출 완료된 페이지 수 (진행률)
+    extraction_tier = Column(String(20))  # text (텍스트만 추출, 보강 대기), full (표/이미지/OCR 포함)
+    parse_key = Column(String(128))  # 마지막 파싱 키 (파일 해시 + 추출기/파서 버전, 같으면 재파싱 생략)
 
     # Extracted content
     parsed_json = Column(JSONB)  # 파싱된 JSON 데이터
@@ -56,6 +56,7 @@ class ReportParsingRequest(BaseModel):
     report_id: UUID
     report_type: str
     source_format: str = "pdf"
+    force: bool = False  # 같은 파일/버전으로 파싱 완료된 리포트도 다시 파싱
 
 
 class CompanyVerificationRequest(BaseModel):
@@ -162,13 +163,18 @@ async def run_report_parsing_agent(
     request: ReportParsingRequest,
     db: Session = Depends(get_db)
 ):
-    """리포트 파싱 에이전트 실행"""
+    """리포트 파싱 에이전트 실행 (이미 파싱된 리포트는 결과를 교체, 변경이 없으면 건너뜀)"""
+    from app.models.report import Report
+
+    report = db.query(Report).filter(Report.id == request.report_id).first()
+    if not report or not report.file_path:
+        raise HTTPException(status_code=404, detail="Report file not found")
     try:
         agent = ReportParsingAgent(db)
         result = await agent.parse_report(
             report_id=request.report_id,
-            report_type=request.report_type,
-            source_format=request.source_format
+            file_path=report.file_path,
+            force=request.force
         )
         return result
     except Exception as e:
@@ -1,7 +1,7 @@
 """
 Reports router
 """
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 from uuid import UUID
@@ -17,6 +17,7 @@ from app.schemas.report import (
     CompanyExtractionResponse
 )
 from app.services.report_service import ReportService
+from app.services.document_extraction_service import EXTRACTION_BACKENDS
 
 router = APIRouter()
 
@@ -26,12 +27,20 @@ async def upload_report(
     file: UploadFile = File(...),
     analyst_id: Optional[UUID] = None,
     company_id: Optional[UUID] = None,
+    extraction_backend: Optional[str] = None,
     background_tasks: BackgroundTasks = BackgroundTasks(),
     db: Session = Depends(get_db)
 ):
-    """리포트 업로드 및 추출 시작"""
+    """리포트 업로드 및 추출 시작 (extraction_backend: pdfplumber 또는 pdfium)"""
+    if extraction_backend and extraction_backend not in EXTRACTION_BACKENDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"지원하지 않는 추출 백엔드입니다: {extraction_backend} (가능한 값: {', '.join(EXTRACTION_BACKENDS)})"
+        )
     service = ReportService(db)
-    return await service.upload_and_extract(file, analyst_id, company_id, background_tasks)
+    return await service.upload_and_extract(
+        file, analyst_id, company_id, background_tasks, extraction_backend=extraction_backend
+    )
 
 
 @router.get("/{report_id}/extraction-status", response_model=ExtractionStatusResponse)
@@ -68,6 +77,23 @@ async def get_reports(
     )
 
 
+@router.get("/search")
+async def search_reports(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=100),
+    report_id: Optional[List[UUID]] = Query(None),
+    sort: str = Query("relevance", pattern="^(relevance|date)$"),
+    db: Session = Depends(get_db)
+):
+    """리포트 문단 의미 검색 (sort=date이면 발간일 순)"""
+    service = ReportService(db)
+    try:
+        results = await service.search_passages(q, limit=limit, report_ids=report_id, sort=sort)
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    return {"query": q, "results": results}
+
+
 @router.get("/{report_id}", response_model=ReportDetailResponse)
 async def get_report(
     report_id: UUID,
@@ -95,7 +121,7 @@ async def get_report(
         "report_type": report.report_type,
         "file_path": report.file_path,
         "file_size": report.file_size,
-        "total_pages": None,  # TODO: 페이지 수 계산
+        "total_pages": report.total_pages,
         "status": report.status,
         "created_at": report.created_at,
         "updated_at": report.updated_at,
@@ -137,6 +163,34 @@ async def get_predictions(
     return {"report_id": report_id, "predictions": predictions}
 
 
+@router.get("/{report_id}/pages/{page_number}")
+async def get_report_page(
+    report_id: UUID,
+    page_number: int,
+    db: Session = Depends(get_db)
+):
+    """추출된 페이지 내용 조회 (텍스트, 문단, 수치 데이터, 표, 이미지)"""
+    service = ReportService(db)
+    page = service.get_report_page(report_id, page_number)
+    if page is None:
+        raise HTTPException(status_code=404, detail="Extracted page not found")
+    return {"report_id": report_id, "page": page}
+
+
+@router.get("/{report_id}/tables")
+async def get_report_tables(
+    report_id: UUID,
+    page_number: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """추출된 표 조회 (page_number로 페이지 지정)"""
+    service = ReportService(db)
+    tables = service.get_report_tables(report_id, page_number)
+    if tables is None:
+        raise HTTPException(status_code=404, detail="Extraction artifact not found")
+    return {"report_id": report_id, "tables": tables}
+
+
 @router.get("/{report_id}/extracted-company", response_model=CompanyExtractionResponse)
 async def get_extracted_company(
     report_id: UUID,
@@ -1,8 +1,8 @@
 """
 Report schemas
 """
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, field_validator
+from typing import Optional, List, Dict, Any, Literal
 from uuid import UUID
 from datetime import datetime, date
 
@@ -71,3 +71,49 @@ class CompanyExtractionResponse(BaseModel):
     ticker: Optional[str] = None
     confidence: Optional[str] = None  # high, medium, low
     message: str
+
+
+# LLM 구조화 추출 응답 (기업명, 섹션, 예측을 한 번의 호출로 추출)
+
+class StructuredCompany(BaseModel):
+    """추출된 분석 대상 기업"""
+    company_name_kr: str = ""
+    company_name_en: Optional[str] = None
+    ticker: Optional[str] = None
+    confidence: Literal["high", "medium", "low"] = "low"
+
+    @field_validator("company_name_kr", mode="before")
+    @classmethod
+    def _empty_name(cls, value):
+        return (value or "").strip()
+
+    @field_validator("company_name_en", "ticker", mode="before")
+    @classmethod
+    def _strip_optional(cls, value):
+        value = str(value).strip() if value is not None else ""
+        return value or None
+
+
+class StructuredSection(BaseModel):
+    """추출된 리포트 섹션"""
+    section_type: str
+    title: str = ""
+    content: str = ""
+    page_number: Optional[int] = None
+
+
+class StructuredPrediction(BaseModel):
+    """추출된 예측 정보"""
+    prediction_type: Literal["target_price", "revenue", "operating_profit", "net_profit"]
+    predicted_value: float
+    unit: Optional[str] = None
+    period: Optional[str] = None
+    reasoning: Optional[str] = None
+
+    @field_validator("predicted_value", mode="before")
+    @classmethod
+    def _strip_thousands(cls, value):
+        # "120,000" 처럼 천 단위 구분자가 있는 문자열 허용
+        if isinstance(value, str):
+            return value.replace(",", "").strip()
+        return value
@@ -1,15 +1,114 @@
 """
 Report Parsing Agent - 리포트 파싱 에이전트
 """
+from sqlalchemy import func, insert
 from sqlalchemy.orm import Session
-from uuid import UUID
-from typing import Dict, Any
+from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from functools import partial
 from pathlib import Path
+from pydantic import ValidationError
+import asyncio
+import json
+import logging
+import os
+import re
+import shutil
 
 from app.models.report import Report, ReportSection, ExtractedText, ExtractedTable, ExtractedImage
 from app.models.enums import ReportStatus
+from app.schemas.report import StructuredCompany, StructuredPrediction, StructuredSection
 from app.services.document_extraction_service import DocumentExtractionService
+from app.services.company_matcher import COMPANY_MATCH_PAGES, get_company_matcher
+from app.services.extraction.boilerplate import (
+    mark_boilerplate,
+    page_texts,
+    prompt_texts,
+    search_passages,
+    strip_boilerplate_lines,
+)
+from app.services.extraction.chunking import LLM_CHUNK_CONCURRENCY, chunk_pages, chunk_texts
+from app.services.extraction.page_store import PageResultStore
+from app.services.extraction.prediction_rules import PREDICTION_TYPES, extract_rule_predictions
+from app.services.extraction.report_artifact import ReportArtifact, artifact_path_for, write_report_artifact
+from app.services.extraction.result_cache import ExtractionResultCache
 from app.services.llm_service import LLMService
+from app.services.vector_index import VectorIndex
+
+logger = logging.getLogger(__name__)
+
+# 단계별 추출: 텍스트만 먼저 추출해 파싱을 끝내고, 표/이미지/OCR은 별도 작업으로 보강
+TIERED_EXTRACTION = os.getenv("TIERED_EXTRACTION", "true").lower() == "true"
+
+# 분산 추출: 이 페이지 수 이상인 PDF는 페이지 범위 작업으로 나눠 여러 Celery 워커에서 추출 (0이면 사용 안 함)
+DISTRIBUTED_EXTRACTION_MIN_PAGES = int(os.getenv("DISTRIBUTED_EXTRACTION_MIN_PAGES", "100"))
+DISTRIBUTED_EXTRACTION_PAGES_PER_TASK = int(os.getenv("DISTRIBUTED_EXTRACTION_PAGES_PER_TASK", "20"))
+
+# 파서 버전: LLM 프롬프트나 섹션/예측 처리 규칙을 바꾸면 올려서 기존 리포트를 다시 파싱
+PARSER_VERSION = "5"
+
+# 구조화 추출: 기업명/섹션/예측을 LLM 한 번 호출로 추출 (실패한 항목만 개별 호출로 대체)
+STRUCTURED_EXTRACTION = os.getenv("STRUCTURED_EXTRACTION", "true").lower() == "true"
+
+# 규칙 기반 예측: 목표주가/실적 전망 표처럼 규칙으로 확정한 예측은 LLM 없이 저장 (확정하지 못한 타입만 LLM)
+RULE_PREDICTIONS = os.getenv("RULE_PREDICTIONS", "true").lower() == "true"
+
+# LLM 프롬프트의 예측 타입 설명
+PREDICTION_TYPE_DESCRIPTIONS = {
+    "target_price": '목표주가 (예: "목표주가 120,000원", "TP 120000원")',
+    "revenue": '매출액 예측 (예: "매출액 1조 2,000억원")',
+    "operating_profit": '영업이익 예측 (예: "영업이익 500억원")',
+    "net_profit": '당기순이익 예측 (예: "순이익 300억원")',
+}
+
+
+# 추출 이미지 파일 이름 ({리포트 id}_page{페이지}_img{번호}.확장자)
+_IMAGE_FILE_REPORT = re.compile(r"^([0-9a-fA-F-]{36})_(.+)$")
+
+
+def _prediction_key(prediction: Dict[str, Any]) -> Tuple[str, str]:
+    return prediction.get("prediction_type") or "", str(prediction.get("period") or "")
+
+
+def _merge_items(item_lists: List[list], key) -> list:
+    """청크별 결과 목록을 순서대로 합치고 같은 키는 앞 청크(문서 앞부분) 항목만 남김"""
+    merged, seen = [], set()
+    for items in item_lists:
+        for item in items:
+            item_key = key(item)
+            if item_key in seen:
+                continue
+            seen.add(item_key)
+            merged.append(item)
+    return merged
+
+
+def _merge_sections(section_lists: List[list]) -> list:
+    """
+    청크별 섹션을 section_type별 하나로 병합 (처음 나온 순서, 제목/페이지는 첫 섹션 기준)
+
+    청크마다 같은 타입(요약 등)을 다른 제목으로 돌려주므로, 같은 타입의 내용은 청크 순서대로
+    이어 붙입니다 (같은 내용은 한 번만).
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for sections in section_lists:
+        for section in sections:
+            section_type = section.get("section_type") or ""
+            content = (section.get("content") or "").strip()
+            if section_type not in merged:
+                merged[section_type] = {**section, "content": content}
+                continue
+            target = merged[section_type]
+            if content and content not in target["content"].split("\n\n"):
+                target["content"] = f"{target['content']}\n\n{content}" if target["content"] else content
+            if not target.get("page_number"):
+                target["page_number"] = section.get("page_number")
+    return list(merged.values())
+
+
+def _deep_text_id(report_id: UUID, block: Dict[str, Any]) -> UUID:
+    """보강 추출 텍스트(OCR) 행 id (같은 리포트/블록이면 항상 같은 값)"""
+    return uuid5(NAMESPACE_URL, f"report/{report_id}/deep/{block.get('id')}")
 
 
 class ReportParsingAgent:
@@ -18,77 +117,645 @@ class ReportParsingAgent:
     def __init__(self, db: Session):
         self.db = db
         self.extraction_service = DocumentExtractionService()
+        self.extraction_cache = ExtractionResultCache()
         self.llm_service = LLMService()
+        self.vector_index = VectorIndex()
 
     async def parse_report(
         self,
         report_id: UUID,
-        file_path: str
+        file_path: str,
+        extraction_backend: Optional[str] = None,
+        tiered: Optional[bool] = None,
+        distributed: bool = False,
+        force: bool = False
     ) -> Dict[str, Any]:
-        """리포트 파싱"""
+        """
+        리포트 파싱
+
+        extraction_backend로 이 작업의 추출 백엔드를 지정합니다
+        ("pdfium"은 텍스트만 빠르게 추출, 기본값은 서비스 설정).
+        tiered이면(기본값 TIERED_EXTRACTION) 텍스트 단계만 추출해 파싱을 완료하고
+        표/이미지/OCR 보강 추출(enrich_report)은 낮은 우선순위 작업으로 예약합니다.
+        extraction_backend="pdfium"을 직접 지정한 작업(텍스트 전용 대량 수집)은 보강 추출을 예약하지 않습니다.
+        distributed이면 페이지 범위 작업(extract_page_range)이 저장한 페이지 결과를 병합해 사용합니다.
+
+        다시 파싱하면 추출 데이터와 섹션을 추가하지 않고 교체합니다. 같은 파일을 같은
+        추출기/파서 버전으로 이미 파싱했으면(parse_key) force가 아닌 한 건너뜁니다.
+        """
         report = self.db.query(Report).filter(Report.id == report_id).first()
         if not report:
             raise ValueError(f"Report {report_id} not found")
 
-        # 1. 문서 추출
-        extraction_result = await self.extraction_service.extract_async(report_id, file_path)
+        if tiered is None:
+            tiered = TIERED_EXTRACTION
+
+        extraction_service = self._extraction_service_for(extraction_backend, tiered)
+        parse_key = self._parse_key(file_path, extraction_service)
+        if not force and self._is_parsed(report, parse_key):
+            logger.info(f"리포트 {report_id}: 같은 파일/버전으로 파싱 완료된 상태, 건너뜀")
+            artifact_path = artifact_path_for(report_id)
+            return {
+                "report_id": report_id,
+                "skipped": True,
+                "parse_key": parse_key,
+                "artifact_path": str(artifact_path) if artifact_path.exists() else None,
+            }
+
+        # 1. 문서 추출 (캐시 재사용, 없으면 페이지 단위로 저장하며 진행률 갱신)
+        if distributed:
+            extraction_result = await self._collect_page_ranges(report, file_path, extraction_service)
+        else:
+            # 이미 파싱된 리포트는 추출 데이터를 마지막에 한 번에 교체 (재파싱 중에는 이전 결과 유지)
+            extraction_result = await self._extract_document(
+                report, file_path, extraction_service, replace=self._has_parsed_data(report)
+            )
+        # 페이지마다 반복되는 머리글/바닥글/고지문 표시 (LLM 프롬프트에서 제외)
+        mark_boilerplate(extraction_result)
+        # API 조회용 컬럼형 아티팩트 저장 (페이지 단위로 지연 로드)
+        artifact_path = self._write_artifact(report_id, extraction_result)
+
+        # 2. 기업 사전으로 대상 기업 매칭 (애매하거나 후보가 없을 때만 LLM으로 추출)
+        if not report.company_id:
+            matched_company = self._match_company_dictionary(extraction_result)
+            if matched_company:
+                report.company_id = matched_company
+                self.db.commit()
+
+        # 규칙 기반 예측 후보 (규칙으로 확정하지 못한 예측 타입만 LLM으로 추출)
+        rule_result = {"predictions": [], "unresolved": list(PREDICTION_TYPES)}
+        if RULE_PREDICTIONS:
+            rule_result = extract_rule_predictions(extraction_result)
+
+        # 2~4. 기업명/섹션/예측 구조화 추출 (한 번의 LLM 호출, 검증에 실패한 항목은 개별 추출)
+        structured = {}
+        if STRUCTURED_EXTRACTION:
+            structured = await self._extract_structured(
+                extraction_result,
+                include_company=not report.company_id,
+                prediction_types=rule_result["unresolved"],
+            )
 
         # 2. 기업명 자동 추출 (company_id가 없을 경우)
         if not report.company_id:
-            extracted_company = await self._extract_company_name(extraction_result)
+            if "company" in structured:
+                extracted_company = self._match_company(structured["company"])
+            else:
+                extracted_company = await self._extract_company_name(extraction_result)
             if extracted_company:
                 report.company_id = extracted_company
                 self.db.commit()
 
         # 3. 섹션 추출 및 정규화
-        sections = await self._extract_sections(extraction_result)
+        if "sections" in structured:
+            sections = self._normalize_sections(structured["sections"], extraction_result.get("texts", []))
+        else:
+            sections = await self._extract_sections(extraction_result)
 
-        # 4. 예측 정보 자동 추출
-        predictions = await self._extract_predictions(report_id, extraction_result, sections)
+        # 4. 예측 정보 자동 추출 (이전 예측은 교체, 섹션과 함께 커밋)
+        predictions = await self._extract_predictions(
+            report_id, extraction_result, sections, structured.get("predictions"), rule_result
+        )
 
         # 5. 임베딩 생성
         embeddings = await self._generate_embeddings(extraction_result)
 
-        # 6. 구조화된 데이터 저장
-        await self._save_extracted_data(report_id, extraction_result, sections, embeddings)
+        # 6. 구조화된 데이터 저장 (페이지별 추출 데이터는 1단계에서 저장됨)
+        await self._save_extracted_data(report_id, sections, embeddings)
 
-        # 7. 리포트 파싱 완료 후 자동 데이터 수집 시작
+        report.status = ReportStatus.COMPLETED.value
+        report.extraction_tier = "text" if tiered else "full"
+        report.parse_key = parse_key
+        self.db.commit()
+
+        # 7. 리포트 파싱 완료 후 자동 데이터 수집 시작 (수집 서비스가 따로 커밋하므로 완료 커밋 뒤에 실행)
         if report.company_id:
             await self._start_auto_data_collection(report_id, report.company_id)
 
-        report.status = ReportStatus.COMPLETED.value
-        self.db.commit()
+        # 8. 표/이미지/OCR 보강 추출 예약 (pdfium을 지정한 텍스트 전용 작업은 제외)
+        if tiered and extraction_backend != "pdfium":
+            await self._schedule_deep_extraction(report_id, file_path)
 
+        # 추출 결과 전체는 아티팩트로 조회하므로 작업 결과에는 요약만 반환
         return {
             "report_id": report_id,
             "sections": sections,
             "predictions": [{"id": str(p.id), "type": p.prediction_type} for p in predictions],
-            "extraction_result": extraction_result,
+            "artifact_path": str(artifact_path) if artifact_path else None,
+            "extraction_summary": {
+                "page_count": len(extraction_result.get("pages", [])),
+                "texts": len(extraction_result.get("texts", [])),
+                "tables": len(extraction_result.get("tables", [])),
+                "images": len(extraction_result.get("images", [])),
+            },
+        }
+
+    def _parse_key(self, file_path: str, extraction_service: DocumentExtractionService) -> Optional[str]:
+        """파싱 결과 키 (파일 내용 + 추출기 버전 + 파서 버전), 파일이 없으면 None"""
+        try:
+            return f"{self.extraction_cache.key_for(file_path, extraction_service.cache_version)}-p{PARSER_VERSION}"
+        except OSError:
+            return None
+
+    def _is_parsed(self, report: Report, parse_key: Optional[str]) -> bool:
+        """같은 키로 파싱 완료된 리포트인지"""
+        return bool(parse_key) and report.parse_key == parse_key and report.status == ReportStatus.COMPLETED.value
+
+    def _has_parsed_data(self, report: Report) -> bool:
+        """이전 파싱 결과가 있는 리포트인지 (재파싱)"""
+        return report.parse_key is not None or report.status == ReportStatus.COMPLETED.value
+
+    def _extraction_service_for(
+        self,
+        extraction_backend: Optional[str],
+        tiered: bool
+    ) -> DocumentExtractionService:
+        """작업별 추출 서비스 (tiered이면 text 단계, 기본 백엔드 pdfium)"""
+        if tiered:
+            return DocumentExtractionService(backend=extraction_backend or "pdfium", tier="text")
+        if extraction_backend and extraction_backend != self.extraction_service.backend:
+            return DocumentExtractionService(backend=extraction_backend)
+        return self.extraction_service
+
+    async def plan_page_ranges(
+        self,
+        report_id: UUID,
+        file_path: str,
+        extraction_backend: Optional[str] = None,
+        tiered: Optional[bool] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        분산 추출 페이지 범위 목록
+
+        DISTRIBUTED_EXTRACTION_MIN_PAGES 이상인 PDF를 DISTRIBUTED_EXTRACTION_PAGES_PER_TASK
+        페이지씩 나눕니다. 분산할 필요가 없으면(짧은 PDF, 캐시된 결과, 재파싱) 빈 목록을 반환합니다.
+        """
+        if DISTRIBUTED_EXTRACTION_MIN_PAGES <= 0:
+            return []
+        report = self.db.query(Report).filter(Report.id == report_id).first()
+        if not report:
+            raise ValueError(f"Report {report_id} not found")
+        # 재파싱은 한 워커에서 추출해 추출 데이터를 한 번에 교체
+        if self._has_parsed_data(report):
+            return []
+
+        extraction_service = self._extraction_service_for(
+            extraction_backend, TIERED_EXTRACTION if tiered is None else tiered
+        )
+        try:
+            if self.extraction_cache.has(
+                self.extraction_cache.key_for(file_path, extraction_service.cache_version)
+            ):
+                return []
+        except OSError:
+            return []
+
+        page_count = (await extraction_service.new_result(file_path))["metadata"].get("page_count", 0)
+        if page_count < DISTRIBUTED_EXTRACTION_MIN_PAGES:
+            return []
+
+        pages_per_task = max(1, DISTRIBUTED_EXTRACTION_PAGES_PER_TASK)
+        self._update_progress(report, 0, page_count)
+        return [
+            (first, min(first + pages_per_task - 1, page_count))
+            for first in range(1, page_count + 1, pages_per_task)
+        ]
+
+    async def extract_page_range(
+        self,
+        report_id: UUID,
+        file_path: str,
+        first_page: int,
+        last_page: int,
+        extraction_backend: Optional[str] = None,
+        tiered: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        페이지 범위 추출 (분산 추출의 map 단계)
+
+        페이지마다 추출 데이터를 DB에 저장하고 결과를 PageResultStore에 기록합니다.
+        진행률은 다른 범위 작업과 동시에 갱신되므로 DB에서 원자적으로 더합니다.
+        """
+        report = self.db.query(Report).filter(Report.id == report_id).first()
+        if not report:
+            raise ValueError(f"Report {report_id} not found")
+
+        extraction_service = self._extraction_service_for(
+            extraction_backend, TIERED_EXTRACTION if tiered is None else tiered
+        )
+        store = PageResultStore(report_id, extraction_service.cache_version)
+        # 재시도된 작업이면 이미 체크포인트가 있는 페이지는 건너뜀
+        restored = {"pages": [], "texts": [], "tables": [], "images": []}
+        resume_page = self._restore_checkpoint(
+            report, store, extraction_service, restored, first_page, last_page
+        )
+        # 복원한 페이지는 이전 시도에서 진행률에 반영됨
+        pages = resume_page - first_page
+        if resume_page > last_page:
+            return {"first_page": first_page, "last_page": last_page, "pages": pages}
+
+        async for page_result in extraction_service.iter_pages(
+            report_id, file_path, last_page, parallel=False, first_page=resume_page,
+            image_scope=self._image_scope(report)
+        ):
+            self._save_pages_data(report_id, [page_result])
+            self.db.query(Report).filter(Report.id == report_id).update(
+                {Report.pages_processed: func.coalesce(Report.pages_processed, 0) + 1},
+                synchronize_session=False
+            )
+            self.db.commit()
+            store.put(page_result)
+            pages += 1
+
+        return {"first_page": first_page, "last_page": last_page, "pages": pages}
+
+    async def _collect_page_ranges(
+        self,
+        report: Report,
+        file_path: str,
+        extraction_service: DocumentExtractionService
+    ) -> Dict[str, Any]:
+        """
+        분산 추출 결과 병합 (reduce 단계)
+
+        범위 작업이 저장한 페이지 결과를 페이지 순서대로 병합하고, 실패한 범위 등
+        저장되지 않은 페이지는 직접 추출합니다. 병합한 결과는 추출 결과 캐시에 저장합니다.
+        직접 추출해도 빠진 페이지가 있으면 일부만 병합한 결과로 파싱하지 않도록 ValueError를
+        올립니다 (체크포인트는 남겨 재시도할 때 저장된 페이지를 다시 씀).
+        """
+        store = PageResultStore(report.id, extraction_service.cache_version)
+        extraction_result = await extraction_service.new_result(file_path)
+        page_count = extraction_result["metadata"].get("page_count") or 0
+        # 페이지 수를 모르면 저장된 마지막 페이지까지 병합하고 그 뒤는 끝까지 추출
+        total_pages = page_count or max(store.page_numbers(), default=0)
+
+        async def extract_missing(first_page: int, last_page: Optional[int]):
+            # 실패한 범위 작업이 일부 저장한 데이터는 지우고 다시 추출 (last_page가 None이면 끝까지)
+            self._delete_page_data(report.id, first_page, last_page)
+            async for page_result in extraction_service.iter_pages(
+                report.id, file_path, last_page or 0, parallel=False, first_page=first_page,
+                image_scope=self._image_scope(report)
+            ):
+                extraction_service.merge_page_result(extraction_result, page_result)
+                self._save_pages_data(report.id, [page_result])
+            self.db.commit()
+
+        missing_from = None
+        for page_number in range(1, total_pages + 1):
+            page_result = store.get(page_number)
+            if page_result is None:
+                missing_from = missing_from or page_number
+                continue
+            if missing_from is not None:
+                await extract_missing(missing_from, page_number - 1)
+                missing_from = None
+            extraction_service.merge_page_result(extraction_result, page_result)
+        if missing_from is not None:
+            await extract_missing(missing_from, total_pages)
+        if not page_count:
+            await extract_missing(total_pages + 1, None)
+            total_pages = max((page["page_number"] for page in extraction_result["pages"]), default=0)
+
+        collected = {page["page_number"] for page in extraction_result["pages"]}
+        missing = [page_number for page_number in range(1, total_pages + 1) if page_number not in collected]
+        if not total_pages or missing:
+            raise ValueError(
+                f"리포트 {report.id} 분산 추출 결과 불완전: 전체 {total_pages}페이지 중 누락 {missing[:20]}"
+            )
+
+        self._update_progress(report, total_pages, total_pages)
+        try:
+            self.extraction_cache.put(
+                self.extraction_cache.key_for(file_path, extraction_service.cache_version),
+                extraction_result
+            )
+        except OSError:
+            pass
+        store.clear()
+        return extraction_result
+
+    async def _extract_document(
+        self,
+        report: Report,
+        file_path: str,
+        extraction_service: Optional[DocumentExtractionService] = None,
+        replace: bool = False
+    ) -> Dict[str, Any]:
+        """
+        문서 추출
+
+        파일 해시 + 추출기 버전 기반 캐시에 결과가 있으면 재사용하고, 없으면
+        스트리밍 추출로 페이지가 끝날 때마다 추출 데이터와 진행률을 저장합니다.
+        캐시 결과가 다른 리포트(같은 내용의 PDF)의 것이면 이미지 파일을 이 리포트 경로로 옮겨
+        씁니다 (_localize_images, 원본 이미지가 없으면 다시 추출).
+
+        끝난 페이지는 체크포인트(PageResultStore)에 기록하므로, 워커 종료 등으로 중단된
+        추출을 다시 실행하면 첫 번째 미완료 페이지부터 이어서 추출합니다.
+
+        replace이면(재파싱) 기존 추출 데이터를 유지한 채 추출하고, 끝난 뒤 한 트랜잭션에서
+        기존 데이터를 지우고 새 데이터를 저장합니다.
+
+        페이지를 스트리밍으로 저장하더라도 반환하는 추출 결과에는 모든 페이지가 모이므로
+        메모리 사용량은 페이지 수에 비례합니다 (캐시 저장, 반복 문구 표시, 이후 파싱 단계가
+        문서 전체를 사용).
+        """
+        extraction_service = extraction_service or self.extraction_service
+
+        cache_key = None
+        try:
+            cache_key = self.extraction_cache.key_for(file_path, extraction_service.cache_version)
+            cached = self.extraction_cache.get(cache_key)
+            if cached is not None and self._localize_images(report.id, file_path, cached):
+                # 기존(또는 이전 시도에서 일부 저장된) 데이터를 캐시 결과로 교체 (한 트랜잭션)
+                self._delete_page_data(report.id, 1, commit=False)
+                self._save_pages_data(report.id, cached.get("pages", []))
+                # 저장한 ExtractedText id가 기록된 페이지 블록으로 텍스트 목록 재구성
+                cached["texts"] = [
+                    block for page_result in cached.get("pages", []) for block in page_result.get("text_blocks", [])
+                ]
+                total_pages = cached.get("metadata", {}).get("page_count") or len(cached.get("pages", []))
+                self._update_progress(report, total_pages, total_pages)
+                return cached
+        except OSError:
+            # 파일이 없으면 추출 단계에서 FileNotFoundError 발생
+            pass
+
+        extraction_result = await extraction_service.new_result(file_path)
+        total_pages = extraction_result["metadata"].get("page_count", 0)
+        # 재파싱 체크포인트는 DB에 저장되지 않은 페이지이므로 따로 보관
+        checkpoint = PageResultStore(
+            report.id, f"{extraction_service.cache_version}-replace" if replace else extraction_service.cache_version
+        )
+        first_page = self._restore_checkpoint(
+            report, checkpoint, extraction_service, extraction_result, delete_rest=not replace
+        )
+        self._update_progress(report, first_page - 1, total_pages)
+
+        if not total_pages or first_page <= total_pages:
+            async for page_result in extraction_service.iter_pages(
+                report.id, file_path, total_pages, first_page=first_page,
+                image_scope=self._image_scope(report)
+            ):
+                extraction_service.merge_page_result(extraction_result, page_result)
+                if not replace:
+                    self._save_pages_data(report.id, [page_result])
+                # 진행률 저장(커밋) 후 체크포인트 기록: 체크포인트가 있는 페이지는 DB 저장도 끝난 상태
+                self._update_progress(report, len(extraction_result["pages"]), total_pages)
+                checkpoint.put(page_result)
+
+        if replace:
+            self._delete_page_data(report.id, 1, commit=False)
+            self._save_pages_data(report.id, extraction_result["pages"])
+            self.db.commit()
+
+        if cache_key:
+            self.extraction_cache.put(cache_key, extraction_result)
+        checkpoint.clear()
+        return extraction_result
+
+    def _restore_checkpoint(
+        self,
+        report: Report,
+        checkpoint: PageResultStore,
+        extraction_service: DocumentExtractionService,
+        extraction_result: Dict[str, Any],
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+        delete_rest: bool = True
+    ) -> int:
+        """
+        이전 시도의 체크포인트 복원, 다음에 추출할 페이지 번호 반환
+
+        first_page부터 연속으로 저장된 페이지를 결과에 병합합니다. 저장한 이미지 파일이
+        없어진 페이지에서 멈추며, delete_rest이면 그 이후 페이지의 이전 시도 데이터는
+        지웁니다 (중복 저장 방지).
+        """
+        page_number = first_page
+        while last_page is None or page_number <= last_page:
+            page_result = checkpoint.get(page_number)
+            if page_result is None or not all(
+                os.path.exists(image.get("image_path", "")) for image in page_result.get("images", [])
+            ):
+                break
+            extraction_service.merge_page_result(extraction_result, page_result)
+            page_number += 1
+
+        if page_number > first_page:
+            logger.info(f"리포트 {report.id}: {first_page}~{page_number - 1}페이지를 체크포인트에서 복원")
+        if delete_rest:
+            self._delete_page_data(report.id, page_number, last_page)
+        return page_number
+
+    def _localize_images(self, report_id: UUID, file_path: str, result: Dict[str, Any]) -> bool:
+        """
+        캐시 결과의 이미지 경로를 이 리포트의 이미지로 교체 (원본 파일이 없으면 False)
+
+        이미지 파일 이름은 추출한 리포트 id로 시작하므로, 다른 리포트의 파일은 이 리포트의
+        이미지 디렉토리에 하드 링크(안 되면 복사)하고 image_path/duplicate_of를 바꿉니다.
+        그래야 원래 리포트를 지워도 이 리포트의 이미지가 남습니다.
+        """
+        prefix = f"{report_id}_"
+        storage_dir = Path(file_path).parent / "images"
+        for page_result in result.get("pages", []):
+            for image in page_result.get("images", []):
+                source = Path(image.get("image_path") or "")
+                match = _IMAGE_FILE_REPORT.match(source.name)
+                if not match or source.name.startswith(prefix):
+                    continue
+                source_report, rest = match.groups()
+                target = storage_dir / f"{report_id}_{rest}"
+                if not target.exists():
+                    try:
+                        storage_dir.mkdir(parents=True, exist_ok=True)
+                        try:
+                            os.link(source, target)
+                        except OSError:
+                            shutil.copy2(source, target)
+                    except OSError as e:
+                        logger.warning(f"캐시 결과 이미지 복사 실패, 다시 추출: {str(e)}")
+                        return False
+                image["image_path"] = str(target)
+                duplicate_of = image.get("duplicate_of") or ""
+                if duplicate_of.startswith(f"{source_report}:"):
+                    image["duplicate_of"] = f"{report_id}:{duplicate_of.partition(':')[2]}"
+        result["images"] = [
+            image for page_result in result.get("pages", []) for image in page_result.get("images", [])
+        ]
+        return True
+
+    def _delete_page_data(
+        self,
+        report_id: UUID,
+        first_page: int,
+        last_page: Optional[int] = None,
+        commit: bool = True
+    ):
+        """페이지 범위의 추출 데이터(텍스트, 표, 이미지) 삭제"""
+        for model in (ExtractedText, ExtractedTable, ExtractedImage):
+            query = self.db.query(model).filter(model.report_id == report_id, model.page_number >= first_page)
+            if last_page is not None:
+                query = query.filter(model.page_number <= last_page)
+            query.delete(synchronize_session=False)
+        if commit:
+            self.db.commit()
+
+    async def enrich_report(self, report_id: UUID, file_path: str) -> Dict[str, Any]:
+        """
+        보강 추출 (deep 단계)
+
+        텍스트 단계로 파싱된 리포트에 표, 이미지, OCR 텍스트를 추가하고, 추출된 표로 규칙 예측을
+        갱신합니다. 이미 전체 추출된 리포트는 건너뜁니다. 재시도/재전달된 작업이 행과 벡터를 중복 추가하지
+        않도록, 이전 시도의 보강 데이터를 지우고 새 결과를 한 트랜잭션에서 저장합니다.
+        """
+        report = self.db.query(Report).filter(Report.id == report_id).first()
+        if not report:
+            raise ValueError(f"Report {report_id} not found")
+        if report.extraction_tier != "text":
+            return {"report_id": report_id, "skipped": True}
+
+        extraction_service = DocumentExtractionService(tier="deep")
+        cache_key = None
+        extraction_result = None
+        try:
+            cache_key = self.extraction_cache.key_for(file_path, extraction_service.cache_version)
+            extraction_result = self.extraction_cache.get(cache_key)
+        except OSError:
+            pass
+        if extraction_result is not None and not self._localize_images(report_id, file_path, extraction_result):
+            extraction_result = None
+
+        if extraction_result is None:
+            extraction_result = await extraction_service.new_result(file_path)
+            async for page_result in extraction_service.iter_pages(
+                report_id, file_path, extraction_result["metadata"].get("page_count", 0),
+                image_scope=self._image_scope(report)
+            ):
+                extraction_service.merge_page_result(extraction_result, page_result)
+            if cache_key:
+                self.extraction_cache.put(cache_key, extraction_result)
+
+        # OCR 텍스트 id는 리포트와 블록 id로 고정 (재시도하면 같은 행/벡터를 교체)
+        pages = extraction_result.get("pages", [])
+        text_id_for = partial(_deep_text_id, report_id)
+        self._delete_deep_data(report_id, [
+            text_id_for(block) for page_result in pages for block in page_result.get("text_blocks", [])
+        ])
+        self._save_pages_data(report_id, pages, text_id_for=text_id_for)
+        self.db.commit()
+        # 저장한 ExtractedText id가 기록된 페이지 블록으로 텍스트 목록 재구성
+        extraction_result["texts"] = [
+            block for page_result in pages for block in page_result.get("text_blocks", [])
+        ]
+
+        merged = self._merge_artifact(report_id, extraction_result)
+        # 추출된 표로 실적 전망 규칙 예측 갱신 (텍스트 단계 파싱에는 표가 없음)
+        try:
+            self._apply_table_predictions(report, merged)
+        except Exception as e:
+            logger.warning(f"리포트 {report_id} 표 기반 예측 갱신 실패: {str(e)}")
+        # OCR 텍스트를 검색 인덱스에 추가 (텍스트 단계 벡터는 유지, 같은 텍스트 id의 이전 벡터는 교체)
+        try:
+            embeddings = await self._generate_embeddings(extraction_result)
+            self._index_embeddings(report_id, embeddings, replace=False)
+        except Exception as e:
+            logger.warning(f"리포트 {report_id} OCR 텍스트 임베딩 실패: {str(e)}")
+        report.extraction_tier = "full"
+        self.db.commit()
+
+        return {
+            "report_id": report_id,
+            "tables": len(extraction_result["tables"]),
+            "images": len(extraction_result["images"]),
+            "ocr_texts": len(extraction_result["texts"]),
         }
 
+    def _delete_deep_data(self, report_id: UUID, text_ids: List[UUID]):
+        """
+        이전 보강 추출 데이터 삭제 (커밋은 호출한 쪽에서)
+
+        텍스트 단계는 표/이미지를 저장하지 않으므로 리포트의 표/이미지는 모두 보강 데이터이고,
+        텍스트는 보강 추출이 저장하는 OCR 텍스트 id만 지웁니다.
+        """
+        for model in (ExtractedTable, ExtractedImage):
+            self.db.query(model).filter(model.report_id == report_id).delete(synchronize_session=False)
+        if text_ids:
+            self.db.query(ExtractedText).filter(
+                ExtractedText.report_id == report_id, ExtractedText.id.in_(text_ids)
+            ).delete(synchronize_session=False)
+
+    def _write_artifact(self, report_id: UUID, extraction_result: Dict[str, Any]) -> Optional[Path]:
+        """추출 결과 아티팩트 저장 (실패해도 파싱은 계속 진행)"""
+        try:
+            return write_report_artifact(artifact_path_for(report_id), extraction_result, report_id)
+        except Exception as e:
+            logger.warning(f"추출 아티팩트 저장 실패: {str(e)}")
+            return None
+
+    def _merge_artifact(self, report_id: UUID, deep_result: Dict[str, Any]) -> Dict[str, Any]:
+        """텍스트 단계 아티팩트에 보강 추출 결과(표, 이미지, OCR 텍스트) 병합 후 병합 결과 반환"""
+        merged = None
+        try:
+            with ReportArtifact(artifact_path_for(report_id)) as artifact:
+                merged = artifact.to_result()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"추출 아티팩트 읽기 실패, 보강 결과로 다시 저장: {str(e)}")
+        if merged is None:
+            merged = {"pages": [], "texts": [], "tables": [], "images": [], "metadata": deep_result.get("metadata", {})}
+
+        pages = {page["page_number"]: page for page in merged["pages"]}
+        for page_result in deep_result.get("pages", []):
+            page = pages.setdefault(page_result["page_number"], {"page_number": page_result["page_number"]})
+            page["extraction_path"] = page_result.get("extraction_path")
+            page.setdefault("text_layer", page_result.get("text_layer"))
+        merged["pages"] = list(pages.values())
+        merged["texts"].extend(deep_result.get("texts", []))
+        merged["tables"].extend(deep_result.get("tables", []))
+        merged["images"].extend(deep_result.get("images", []))
+        self._write_artifact(report_id, merged)
+        return merged
+
+    async def _schedule_deep_extraction(self, report_id: UUID, file_path: str):
+        """보강 추출 예약 (Celery deep_extraction 큐, 사용할 수 없으면 바로 실행)"""
+        try:
+            from app.tasks.report_tasks import extract_report_deep_task
+            extract_report_deep_task.delay(str(report_id), str(file_path))
+        except Exception as e:
+            logger.warning(f"보강 추출 작업 예약 실패, 바로 실행: {str(e)}")
+            try:
+                await self.enrich_report(report_id, file_path)
+            except Exception as enrich_error:
+                logger.error(f"보강 추출 실패: {str(enrich_error)}")
+
+    def _image_scope(self, report: Report) -> Optional[str]:
+        """반복 이미지(로고, 배너 등)를 공유할 범위 - 같은 증권사의 리포트"""
+        try:
+            return report.analyst.firm if report.analyst else None
+        except Exception:
+            return None
+
+    def _update_progress(self, report: Report, pages_processed: int, total_pages: int):
+        """추출 진행률 저장 (/api/reports/{id}/extraction-status에서 조회)"""
+        report.pages_processed = pages_processed
+        report.total_pages = max(total_pages, pages_processed)
+        self.db.commit()
+
     async def _extract_sections(self, extraction_result: Dict[str, Any]) -> list:
-        """섹션 추출 - LLM을 활용한 실제 섹션 분석"""
+        """섹션 추출 - LLM을 활용한 실제 섹션 분석 (청크별 추출 후 병합)"""
         texts = extraction_result.get("texts", [])
-        tables = extraction_result.get("tables", [])
-        
-        # 텍스트 결합 (처음 8000자, 너무 길면 LLM 토큰 제한)
-        combined_text = "\n".join([t.get("content", "") for t in texts[:50]])  # 최대 50개 텍스트 블록
-        if len(combined_text) > 8000:
-            combined_text = combined_text[:8000] + "..."
-        
-        # 표 정보 추가
-        table_summaries = []
-        for table in tables[:5]:  # 최대 5개 표
-            table_data = table.get("data", [])
-            if table_data:
-                # 표의 첫 행(헤더)과 몇 개 행만 요약
-                table_summary = f"\n[표 {table.get('page_number', 0)}페이지]: "
-                if len(table_data) > 0:
-                    table_summary += " | ".join([str(cell) for cell in table_data[0][:5]])  # 헤더만
-                table_summaries.append(table_summary)
-        
-        combined_text += "\n\n" + "\n".join(table_summaries)
-        
+        chunks = self._prompt_chunks(extraction_result)
+        results = await self._map_chunks(
+            chunks, lambda index, chunk: self._request_sections(self._chunk_context(chunk, index, len(chunks)))
+        )
+        section_lists = [sections for sections in results if sections is not None]
+        if not section_lists:
+            # 모든 청크에서 실패하면 기본 섹션 반환
+            return self._create_default_sections(texts)
+        return self._normalize_sections(_merge_sections(section_lists), texts)
+
+    async def _request_sections(self, combined_text: str) -> Optional[list]:
+        """LLM으로 청크 하나의 섹션 추출 (실패 시 None)"""
         prompt = f"""다음 증권사 애널리스트 리포트를 분석하여 섹션별로 구조화하세요.
 
 리포트 내용:
@@ -133,44 +800,252 @@ JSON 형식으로 반환:
             
             content = result.get("content", "")
             
-            # JSON 추출 (마크다운 코드 블록 제거)
-            import json
-            import re
-            
-            # JSON 코드 블록에서 JSON 추출
+            # JSON 코드 블록에서 JSON 추출 (마크다운 코드 블록 제거)
             json_match = re.search(r'\{[\s\S]*\}', content)
             if json_match:
                 json_str = json_match.group(0)
-                parsed = json.loads(json_str)
-                sections = parsed.get("sections", [])
-                
-                # 페이지 번호 보정 (텍스트 블록의 페이지 번호 참조)
-                for section in sections:
-                    if not section.get("page_number"):
-                        # 텍스트 블록에서 해당 내용이 있는 페이지 찾기
-                        section_title = section.get("title", "").lower()
-                        section_content = section.get("content", "").lower()
-                        
-                        for text_block in texts:
-                            text_content = text_block.get("content", "").lower()
-                            if section_title in text_content or any(word in text_content for word in section_content.split()[:3]):
-                                section["page_number"] = text_block.get("page_number", 1)
-                                break
-                        
-                        if not section.get("page_number"):
-                            section["page_number"] = 1
-                
-                return sections
-            else:
-                # JSON 파싱 실패 시 기본 섹션 반환
-                return self._create_default_sections(texts)
+                sections = json.loads(json_str).get("sections", [])
+                if isinstance(sections, list):
+                    return [section for section in sections if isinstance(section, dict)]
+            logger.warning("섹션 추출 응답에 JSON이 없음")
                 
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"섹션 추출 실패, 기본 섹션 사용: {str(e)}")
-            return self._create_default_sections(texts)
+            logger.warning(f"섹션 추출 실패: {str(e)}")
+        return None
     
+    def _prompt_chunks(self, extraction_result: Dict[str, Any]) -> List[str]:
+        """
+        LLM 프롬프트용 리포트 내용 청크
+
+        반복 머리글/바닥글을 지운 페이지별 본문을 페이지 순서대로 토큰 예산(LLM_CHUNK_TOKENS)
+        단위로 나눕니다. 본문 텍스트에 표 내용도 들어 있으므로 표는 따로 붙이지 않습니다.
+        """
+        return chunk_pages(page_texts(extraction_result))
+
+    def _chunk_context(self, chunk: str, index: int, total: int) -> str:
+        """청크가 여러 개면 전체 중 몇 번째 부분인지 표시"""
+        if total <= 1:
+            return chunk
+        return f"(전체 {total}개 부분 중 {index + 1}번째 부분)\n{chunk}"
+
+    async def _map_chunks(self, chunks: List[str], request) -> list:
+        """청크별 LLM 요청을 동시에 실행 (동시 요청 수는 LLM_CHUNK_CONCURRENCY, 결과는 청크 순서)"""
+        semaphore = asyncio.Semaphore(max(1, LLM_CHUNK_CONCURRENCY))
+
+        async def run(index: int, chunk: str):
+            async with semaphore:
+                return await request(index, chunk)
+
+        return list(await asyncio.gather(*(run(index, chunk) for index, chunk in enumerate(chunks))))
+
+    def _normalize_sections(self, sections: list, texts: list) -> list:
+        """LLM이 반환한 섹션의 페이지 번호 보정 (텍스트 블록의 페이지 번호 참조)"""
+        for section in sections:
+            if not section.get("page_number"):
+                # 텍스트 블록에서 해당 내용이 있는 페이지 찾기
+                section_title = (section.get("title") or "").lower()
+                section_content = (section.get("content") or "").lower()
+                
+                for text_block in texts:
+                    text_content = text_block.get("content", "").lower()
+                    if section_title in text_content or any(word in text_content for word in section_content.split()[:3]):
+                        section["page_number"] = text_block.get("page_number", 1)
+                        break
+                
+                if not section.get("page_number"):
+                    section["page_number"] = 1
+        
+        return sections
+
+    async def _extract_structured(
+        self,
+        extraction_result: Dict[str, Any],
+        include_company: bool,
+        prediction_types: List[str] = PREDICTION_TYPES
+    ) -> Dict[str, Any]:
+        """
+        기업명, 섹션, 예측 정보를 한 번의 LLM 호출로 추출
+
+        리포트 내용을 한 번만 보내고 응답은 항목(company, sections, predictions)별로
+        스키마 검증합니다. 검증을 통과한 항목만 반환하므로 빠진 항목은 호출한 쪽에서
+        개별 추출(_extract_company_name, _extract_sections, _extract_predictions)로 대체합니다.
+        예측은 prediction_types(규칙으로 확정하지 못한 타입)만 요청하며, 비어 있으면 요청하지 않습니다.
+
+        긴 리포트는 토큰 예산 단위 청크로 나눠 동시에 추출하고 합칩니다. 기업명은 첫 청크에서만
+        요청합니다. 섹션/예측 검증에 실패한 청크는 그 청크만 개별 추출 요청으로 다시 추출하며,
+        섹션은 section_type별로 내용을 이어 붙여 병합합니다.
+        """
+        if not extraction_result.get("texts"):
+            return {}
+        chunks = self._prompt_chunks(extraction_result)
+        if not chunks:
+            return {}
+
+        async def request(index: int, chunk: str) -> Dict[str, Any]:
+            chunk_company = include_company and index == 0
+            prompt = self._structured_prompt(
+                self._chunk_context(chunk, index, len(chunks)), chunk_company, prediction_types
+            )
+            try:
+                result = await self.llm_service.generate("openai", prompt, {
+                    "model": "gpt-4",
+                    "max_tokens": 3500,
+                    "temperature": 0.2
+                })
+            except Exception as e:
+                logger.warning(f"구조화 추출 실패 (청크 {index + 1}/{len(chunks)}): {str(e)}")
+                return {}
+
+            usage = result.get("usage") or {}
+            logger.info(f"구조화 추출 완료 (청크 {index + 1}/{len(chunks)}, 토큰 {usage.get('total_tokens')})")
+            return self._parse_structured_response(result.get("content", ""), chunk_company, prediction_types)
+
+        results = await self._map_chunks(chunks, request)
+
+        # 검증에 실패한 청크의 섹션/예측만 개별 추출
+        retries = [(index, "sections") for index, result in enumerate(results) if "sections" not in result]
+        if prediction_types:
+            retries += [(index, "predictions") for index, result in enumerate(results) if "predictions" not in result]
+
+        async def retry(index: int, key: str):
+            context = self._chunk_context(chunks[index], index, len(chunks))
+            if key == "sections":
+                sections = await self._request_sections(context)
+                if sections is not None:
+                    results[index]["sections"] = sections
+            else:
+                predictions = await self._request_prediction_chunk(context, prediction_types)
+                results[index]["predictions"] = [p for p in predictions if p.get("prediction_type") in prediction_types]
+
+        if retries:
+            logger.warning(f"구조화 추출 검증 실패 청크 개별 추출: {retries}")
+            await self._map_chunks(retries, lambda _, item: retry(*item))
+
+        structured: Dict[str, Any] = {}
+        if include_company and "company" in results[0]:
+            structured["company"] = results[0]["company"]
+        section_lists = [result["sections"] for result in results if "sections" in result]
+        # 모든 청크에서 실패하면 기본 섹션 (_extract_sections와 같음)
+        structured["sections"] = (
+            _merge_sections(section_lists) if section_lists
+            else self._create_default_sections(extraction_result.get("texts", []))
+        )
+        if prediction_types:
+            structured["predictions"] = _merge_items([result["predictions"] for result in results], _prediction_key)
+        return structured
+
+    def _structured_prompt(self, combined_text: str, include_company: bool, prediction_types: List[str]) -> str:
+        """구조화 추출 프롬프트 (청크 하나)"""
+        company_spec = ""
+        if include_company:
+            company_spec = """  "company": {
+    "company_name_kr": "한국어 기업명",
+    "company_name_en": "영어 기업명 (있는 경우)",
+    "ticker": "종목코드 (6자리 숫자, 있는 경우)",
+    "confidence": "high|medium|low"
+  },
+"""
+
+        prediction_spec = ""
+        prediction_type_lines = ""
+        if prediction_types:
+            prediction_spec = """,
+  "predictions": [
+    {
+      "prediction_type": "%s",
+      "predicted_value": 120000,
+      "unit": "원",
+      "period": "2025-06",
+      "reasoning": "예측 근거 (간단히)"
+    }
+  ]""" % prediction_types[0]
+            prediction_type_lines = "\n예측 타입 (prediction_type):\n" + "\n".join(
+                f"- {prediction_type}: {PREDICTION_TYPE_DESCRIPTIONS[prediction_type]}"
+                for prediction_type in prediction_types
+            ) + "\n"
+
+        targets = "섹션, 예측 정보를" if prediction_types else "섹션을"
+        return f"""다음 증권사 애널리스트 리포트를 분석하여 {"분석 대상 기업, " if include_company else ""}{targets} 추출하세요.
+
+리포트 내용:
+{combined_text}
+
+섹션 타입 (section_type):
+- summary: 요약, 개요, Executive Summary
+- analysis: 분석, 기업분석, 실적분석, 재무분석
+- forecast: 예측, 전망, 실적전망, 목표주가
+- recommendation: 추천, 투자의견, 투자포인트
+- risk: 위험요소, 리스크, 주의사항
+- target_price: 목표주가 (숫자 포함)
+- investment_opinion: 투자의견 (매수/중립/매도 등)
+{prediction_type_lines}
+JSON 형식으로 반환:
+{{
+{company_spec}  "sections": [
+    {{
+      "section_type": "summary",
+      "title": "섹션 제목",
+      "content": "섹션 내용 (요약)",
+      "page_number": 1
+    }}
+  ]{prediction_spec}
+}}
+
+중요:
+- 기업명이 명확하지 않으면 confidence를 low로 설정하세요
+- predicted_value는 숫자만 입력하세요
+- 반드시 유효한 JSON만 반환하세요"""
+
+    def _parse_structured_response(
+        self,
+        content: str,
+        include_company: bool,
+        prediction_types: List[str] = PREDICTION_TYPES
+    ) -> Dict[str, Any]:
+        """구조화 추출 응답을 항목별로 검증 (검증된 항목만 dict로 반환)"""
+        json_match = re.search(r'\{[\s\S]*\}', content or "")
+        if not json_match:
+            logger.warning("구조화 추출 응답에 JSON이 없음, 개별 추출 사용")
+            return {}
+        try:
+            parsed = json.loads(json_match.group(0))
+        except ValueError as e:
+            logger.warning(f"구조화 추출 응답 파싱 실패, 개별 추출 사용: {str(e)}")
+            return {}
+        if not isinstance(parsed, dict):
+            return {}
+
+        structured: Dict[str, Any] = {}
+        if include_company and isinstance(parsed.get("company"), dict):
+            try:
+                structured["company"] = StructuredCompany.model_validate(parsed["company"])
+            except ValidationError as e:
+                logger.warning(f"구조화 추출 기업명 검증 실패: {e.error_count()}개 오류")
+
+        for key, model in (("sections", StructuredSection), ("predictions", StructuredPrediction)):
+            items = parsed.get(key)
+            if not isinstance(items, list) or (key == "predictions" and not prediction_types):
+                continue
+            valid = self._validate_items(key, items, model)
+            if key == "predictions":
+                valid = [item for item in valid if item["prediction_type"] in prediction_types]
+            # 항목이 있는데 모두 검증에 실패하면 개별 추출로 대체
+            if items and not valid:
+                continue
+            structured[key] = valid
+
+        return structured
+
+    def _validate_items(self, key: str, items: list, model: type) -> list:
+        """목록 항목별 스키마 검증 (실패한 항목은 제외)"""
+        valid = []
+        for item in items:
+            try:
+                valid.append(model.model_validate(item).model_dump())
+            except ValidationError as e:
+                logger.warning(f"구조화 추출 {key} 항목 검증 실패: {e.error_count()}개 오류")
+        return valid
+
     def _create_default_sections(self, texts: list) -> list:
         """기본 섹션 생성 (LLM 실패 시)"""
         if not texts:
@@ -213,86 +1088,129 @@ JSON 형식으로 반환:
         return sections
 
     async def _generate_embeddings(self, extraction_result: Dict[str, Any]) -> Dict[str, list]:
-        """임베딩 생성"""
-        embeddings = {}
-        
-        texts = extraction_result.get("texts", [])
-        for text_data in texts:
-            content = text_data.get("content", "")
-            if content:
-                embedding = await self.llm_service.embed(content)
-                embeddings[text_data.get("id", "")] = embedding
-        
-        return embeddings
+        """
+        검색용 문단 임베딩 생성 ({ExtractedText id: 벡터})
+
+        반복 문구와 수치 데이터를 뺀 문단만 배치/동시 요청으로 임베딩합니다 (같은 내용은 캐시 재사용).
+        """
+        passages = [
+            (block, content) for block, content in search_passages(extraction_result)
+            if block.get("extracted_text_id")
+        ]
+        vectors = await self.llm_service.embed_many([content for _, content in passages])
+        return {block["extracted_text_id"]: vector for (block, _), vector in zip(passages, vectors)}
 
     async def _save_extracted_data(
         self,
         report_id: UUID,
-        extraction_result: Dict[str, Any],
         sections: list,
         embeddings: Dict[str, list]
     ):
-        """추출된 데이터 저장"""
-        # 섹션 저장
-        for section_data in sections:
-            section = ReportSection(
-                report_id=report_id,
-                section_type=section_data.get("section_type"),
-                title=section_data.get("title"),
-                content=section_data.get("content"),
-                page_number=section_data.get("page_number"),
-                order=section_data.get("order", 0),
-            )
-            self.db.add(section)
-
-        # 추출된 텍스트 저장
-        for text_data in extraction_result.get("texts", []):
-            text = ExtractedText(
-                report_id=report_id,
-                page_number=text_data.get("page_number", 1),
-                content=text_data.get("content", ""),
-                bbox=text_data.get("bbox"),
-                confidence=text_data.get("confidence", "medium"),
-                language=text_data.get("language", "ko"),
-            )
-            self.db.add(text)
-
-        # 추출된 표 저장
-        for table_data in extraction_result.get("tables", []):
-            table = ExtractedTable(
-                report_id=report_id,
-                page_number=table_data.get("page_number", 1),
-                table_data=table_data.get("data", []),
-                bbox=table_data.get("bbox"),
-                confidence=table_data.get("confidence", "medium"),
-            )
-            self.db.add(table)
-
-        # 추출된 이미지 저장
-        for image_data in extraction_result.get("images", []):
-            image = ExtractedImage(
-                report_id=report_id,
-                page_number=image_data.get("page_number", 1),
-                image_path=image_data.get("image_path", ""),
-                image_type=image_data.get("image_type", "chart"),
-                bbox=image_data.get("bbox"),
-                analysis_result=image_data.get("analysis_result"),
-            )
-            self.db.add(image)
+        """
+        추출된 섹션 일괄 저장, 문단 임베딩은 검색 인덱스에 추가
+
+        이전 파싱의 섹션과 벡터는 교체합니다 (섹션은 리포트 완료 상태와 같은 트랜잭션에서 커밋).
+        """
+        self.db.query(ReportSection).filter(ReportSection.report_id == report_id).delete(synchronize_session=False)
+        self._bulk_insert(ReportSection, [
+            {
+                "report_id": report_id,
+                "section_type": section_data.get("section_type"),
+                "title": section_data.get("title"),
+                "content": section_data.get("content"),
+                "page_number": section_data.get("page_number"),
+                "order": section_data.get("order", 0),
+            }
+            for section_data in sections
+        ])
+        self._index_embeddings(report_id, embeddings, replace=True)
+
+    def _index_embeddings(self, report_id: UUID, embeddings: Dict[str, list], replace: bool):
+        """검색 인덱스 갱신 (실패해도 파싱은 계속 진행, 세그먼트 병합은 백그라운드 작업으로 예약)"""
+        try:
+            self.vector_index.add_report(report_id, embeddings, replace=replace)
+            if self.vector_index.needs_compaction():
+                self._schedule_index_compaction()
+        except Exception as e:
+            logger.warning(f"리포트 {report_id} 검색 인덱스 갱신 실패: {str(e)}")
+
+    def _schedule_index_compaction(self):
+        """검색 인덱스 병합 예약 (Celery compact_vector_index, 사용할 수 없으면 바로 실행)"""
+        try:
+            from app.tasks.report_tasks import compact_vector_index_task
+            compact_vector_index_task.delay()
+        except Exception as e:
+            logger.warning(f"검색 인덱스 병합 작업 예약 실패, 바로 실행: {str(e)}")
+            self.vector_index.compact()
+
+    def _save_pages_data(
+        self,
+        report_id: UUID,
+        page_results: List[Dict[str, Any]],
+        text_id_for: Optional[Callable[[Dict[str, Any]], UUID]] = None
+    ):
+        """
+        페이지별 추출 데이터(텍스트, 표, 이미지) 일괄 저장
 
-        self.db.flush()
+        ORM 객체를 만들지 않고 테이블마다 INSERT 한 번(executemany)으로 저장합니다.
+        text_id_for가 있으면 ExtractedText id를 블록마다 정해진 값으로 씁니다.
+        커밋은 호출한 쪽에서 합니다.
+        """
+        texts, tables, images = [], [], []
+        for page_result in page_results:
+            # 추출된 텍스트
+            for text_data in page_result.get("text_blocks", []):
+                text_id = text_id_for(text_data) if text_id_for else uuid4()
+                # 검색 인덱스에서 ExtractedText를 참조하도록 id 기록
+                text_data["extracted_text_id"] = str(text_id)
+                texts.append({
+                    "id": text_id,
+                    "report_id": report_id,
+                    "page_number": text_data.get("page_number", 1),
+                    "content": text_data.get("content", ""),
+                    "bbox": text_data.get("bbox"),
+                    "confidence": text_data.get("confidence", "medium"),
+                    "language": text_data.get("language", "ko"),
+                })
+
+            # 추출된 표
+            for table_data in page_result.get("tables", []):
+                tables.append({
+                    "report_id": report_id,
+                    "page_number": table_data.get("page_number", 1),
+                    "table_data": table_data.get("data", []),
+                    "bbox": table_data.get("bbox"),
+                    "confidence": table_data.get("confidence", "medium"),
+                })
+
+            # 추출된 이미지
+            for image_data in page_result.get("images", []):
+                images.append({
+                    "report_id": report_id,
+                    "page_number": image_data.get("page_number", 1),
+                    "image_path": image_data.get("image_path", ""),
+                    "image_type": image_data.get("image_type", "chart"),
+                    "bbox": image_data.get("bbox"),
+                    "analysis_result": image_data.get("analysis_result"),
+                })
+
+        self._bulk_insert(ExtractedText, texts)
+        self._bulk_insert(ExtractedTable, tables)
+        self._bulk_insert(ExtractedImage, images)
+
+    def _bulk_insert(self, model, rows: List[Dict[str, Any]]):
+        """INSERT 한 번으로 여러 행 저장 (id/created_at 등 기본값은 행마다 적용)"""
+        if rows:
+            self.db.execute(insert(model), rows)
 
     async def _extract_company_name(self, extraction_result: Dict[str, Any]) -> Optional[UUID]:
         """PDF에서 기업명 추출 및 Company 레코드 생성/매칭"""
-        from app.models.company import Company
-        import re
-        
         texts = extraction_result.get("texts", [])
         if not texts:
             return None
         
-        # 텍스트 결합 (처음 5000자)
-        combined_text = "\n".join([t.get("content", "") for t in texts[:30]])
+        # 텍스트 결합 (처음 5000자, 반복 머리글/바닥글 제외)
+        combined_text = "\n".join(prompt_texts(extraction_result)[:30])
         if len(combined_text) > 5000:
             combined_text = combined_text[:5000]
         
@@ -326,95 +1244,225 @@ JSON 형식으로 반환:
             content = result.get("content", "")
             
             # JSON 추출
-            import json
             json_match = re.search(r'\{[\s\S]*\}', content)
             if json_match:
                 json_str = json_match.group(0)
-                company_data = json.loads(json_str)
-                
-                company_name_kr = company_data.get("company_name_kr", "").strip()
-                ticker = company_data.get("ticker", "").strip()
-                confidence = company_data.get("confidence", "low")
-                
-                if not company_name_kr or confidence == "low":
-                    return None
-                
-                # Company 테이블에서 매칭 또는 생성
-                company = None
-                
-                # 종목코드로 먼저 검색
-                if ticker:
-                    company = self.db.query(Company).filter(Company.ticker == ticker).first()
-                
-                # 기업명으로 검색
-                if not company:
-                    company = self.db.query(Company).filter(
-                        Company.name_kr.ilike(f"%{company_name_kr}%")
-                    ).first()
-                
-                # 없으면 생성
-                if not company:
-                    # ticker가 없으면 임시 ticker 생성 (나중에 수정 가능)
-                    final_ticker = ticker
-                    if not final_ticker:
-                        # 기업명의 해시를 사용하여 임시 ticker 생성
-                        import hashlib
-                        ticker_hash = hashlib.md5(company_name_kr.encode('utf-8')).hexdigest()[:6]
-                        final_ticker = f"TEMP{ticker_hash}"
-                    
-                    company = Company(
-                        ticker=final_ticker,
-                        name_kr=company_name_kr,
-                        name_en=company_data.get("company_name_en", "").strip() or None,
-                    )
-                    self.db.add(company)
-                    self.db.flush()
-                
-                return company.id
+                company_data = StructuredCompany.model_validate(json.loads(json_str))
+                return self._match_company(company_data)
                 
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"기업명 추출 실패: {str(e)}")
         
         return None
 
+    def _match_company_dictionary(self, extraction_result: Dict[str, Any]) -> Optional[UUID]:
+        """앞 페이지 본문의 기업명/종목코드 언급으로 대상 기업 매칭 (확정되지 않으면 None)"""
+        boilerplate_lines = {entry["text"] for entry in extraction_result.get("boilerplate", [])}
+        pages = []
+        for block in extraction_result.get("texts", []):
+            block_id = block.get("id", "")
+            page_number = block.get("page_number") or 0
+            if page_number > COMPANY_MATCH_PAGES or not block_id.endswith(("_full", "_ocr")):
+                continue
+            if block.get("boilerplate"):
+                continue
+            pages.append((page_number, strip_boilerplate_lines(block.get("content", ""), boilerplate_lines)))
+        if not pages:
+            return None
+
+        try:
+            match = get_company_matcher(self.db).match_report(pages)
+        except Exception as e:
+            logger.warning(f"기업 사전 매칭 실패: {str(e)}")
+            return None
+        if match.ambiguous:
+            logger.info(f"기업 사전 매칭 후보가 애매하여 LLM으로 추출: {match.scores}")
+        return match.company_id
+
+    def _match_company(self, company_data: StructuredCompany) -> Optional[UUID]:
+        """추출된 기업명으로 Company 레코드 매칭 (없으면 생성)"""
+        from app.models.company import Company
+        
+        company_name_kr = company_data.company_name_kr
+        ticker = company_data.ticker or ""
+        
+        if not company_name_kr or company_data.confidence == "low":
+            return None
+        
+        # Company 테이블에서 매칭 또는 생성
+        company = None
+        
+        # 종목코드로 먼저 검색
+        if ticker:
+            company = self.db.query(Company).filter(Company.ticker == ticker).first()
+        
+        # 기업 사전에서 기업명으로 검색 (정확히 일치, 없으면 기업명 안의 유일한 기업)
+        if not company:
+            matched_id = get_company_matcher(self.db).lookup(company_name_kr, ticker)
+            if matched_id is None and company_data.company_name_en:
+                matched_id = get_company_matcher(self.db).lookup(company_data.company_name_en)
+            if matched_id is not None:
+                company = self.db.get(Company, matched_id)
+        
+        # 없으면 생성
+        if not company:
+            # ticker가 없으면 임시 ticker 생성 (나중에 수정 가능)
+            final_ticker = ticker
+            if not final_ticker:
+                # 기업명의 해시를 사용하여 임시 ticker 생성
+                import hashlib
+                ticker_hash = hashlib.md5(company_name_kr.encode('utf-8')).hexdigest()[:6]
+                final_ticker = f"TEMP{ticker_hash}"
+            
+            company = Company(
+                ticker=final_ticker,
+                name_kr=company_name_kr,
+                name_en=company_data.company_name_en,
+            )
+            self.db.add(company)
+            self.db.flush()
+        
+        return company.id
+
     async def _extract_predictions(
         self,
         report_id: UUID,
         extraction_result: Dict[str, Any],
-        sections: list
+        sections: list,
+        prediction_list: Optional[list] = None,
+        rule_result: Optional[Dict[str, Any]] = None
     ) -> list:
-        """리포트에서 예측 정보 추출 및 Prediction 레코드 생성"""
-        from app.models.prediction import Prediction
-        from app.models.report import Report
-        from decimal import Decimal
-        import re
-        import json
-        
-        # 이미 추출된 예측이 있으면 반환
-        existing_predictions = self.db.query(Prediction).filter(
-            Prediction.report_id == report_id
-        ).all()
-        if existing_predictions:
-            return existing_predictions
-        
+        """
+        리포트에서 예측 정보 추출 및 Prediction 레코드 생성
+
+        prediction_list가 주어지면(구조화 추출 결과) LLM을 다시 호출하지 않고 저장합니다.
+        rule_result(extract_rule_predictions 결과)가 주어지면 규칙으로 확정한 예측을 그대로 쓰고,
+        확정하지 못한 타입만 LLM 결과에서 가져옵니다 (모두 확정했으면 LLM을 호출하지 않음).
+        확정하지 못한 타입의 규칙 예측은 LLM이 같은 (타입, 기간)을 주지 않은 경우에만 남습니다.
+
+        다시 파싱하면 이전 예측을 새 결과로 교체합니다. 같은 (타입, 기간)의 예측은 값만 갱신하고
+        (실제 결과 연결 유지), 없어진 예측은 실제 결과가 연결되지 않았으면 삭제합니다.
+        커밋은 호출한 쪽에서 섹션과 함께 합니다.
+        """
         report = self.db.query(Report).filter(Report.id == report_id).first()
         if not report:
             return []
         
-        texts = extraction_result.get("texts", [])
+        rule_predictions = (rule_result or {}).get("predictions", [])
+        unresolved = (rule_result or {}).get("unresolved", PREDICTION_TYPES)
+        if prediction_list is None:
+            prediction_list = []
+            if unresolved:
+                prediction_list = await self._request_predictions(extraction_result, sections, unresolved)
+        llm_predictions = [p for p in prediction_list if p.get("prediction_type") in unresolved]
+        if rule_result is not None:
+            logger.info(f"예측 정보: 규칙 {len(rule_predictions)}개, LLM {len(llm_predictions)}개 (LLM 타입 {unresolved})")
+        # 확정하지 못한 타입의 규칙 예측(medium)은 같은 (타입, 기간)의 LLM 값으로 대체
+        merged = {_prediction_key(p): p for p in rule_predictions}
+        merged.update((_prediction_key(p), p) for p in llm_predictions)
+        prediction_list = list(merged.values())
+
+        existing = self._existing_predictions(report_id)
+        predictions = self._upsert_predictions(report, prediction_list, existing)
+
+        for prediction in existing.values():
+            # 실제 결과로 검증된 예측은 새 파싱에서 빠져도 유지
+            if not prediction.actual_results:
+                self.db.delete(prediction)
         
-        # 텍스트 결합 (예측 관련 섹션 우선)
+        return predictions
+
+    def _existing_predictions(self, report_id: UUID) -> Dict[Tuple[str, str], Any]:
+        """이전 파싱의 예측 ((타입, 기간)별)"""
+        from app.models.prediction import Prediction
+
+        existing = {}
+        for prediction in self.db.query(Prediction).filter(Prediction.report_id == report_id).all():
+            existing.setdefault((prediction.prediction_type or "", str(prediction.period or "")), prediction)
+        return existing
+
+    def _upsert_predictions(self, report: Report, prediction_list: list, existing: Dict[Tuple[str, str], Any]) -> list:
+        """예측 저장 - existing에 같은 (타입, 기간)이 있으면 값만 갱신하고 existing에서 제외"""
+        from app.models.prediction import Prediction
+        from decimal import Decimal
+
+        predictions = []
+        for pred_data in prediction_list:
+            try:
+                fields = {
+                    "company_id": report.company_id,
+                    "prediction_type": pred_data.get("prediction_type"),
+                    "predicted_value": Decimal(str(pred_data.get("predicted_value", 0))),
+                    "unit": pred_data.get("unit"),
+                    "period": pred_data.get("period"),
+                    "reasoning": pred_data.get("reasoning"),
+                    "confidence": pred_data.get("confidence") or ("high" if pred_data.get("predicted_value") else "medium"),
+                    "extra_data": {"source": "rule", "evidence": pred_data.get("evidence", [])}
+                    if pred_data.get("source") == "rule" else None,
+                }
+                prediction = existing.pop(_prediction_key(pred_data), None)
+                if prediction is not None:
+                    for name, value in fields.items():
+                        setattr(prediction, name, value)
+                else:
+                    prediction = Prediction(report_id=report.id, **fields)
+                    self.db.add(prediction)
+                predictions.append(prediction)
+            except Exception as e:
+                logger.warning(f"예측 정보 저장 실패: {str(e)}")
+                continue
+        return predictions
+
+    def _apply_table_predictions(self, report: Report, merged_result: Dict[str, Any]) -> list:
+        """
+        보강 추출 후 규칙 예측 갱신 (커밋은 호출한 쪽에서)
+
+        텍스트 단계에는 추출된 표가 없으므로, 표가 병합된 결과로 규칙을 다시 실행해 확정한
+        타입의 예측만 (타입, 기간)별로 갱신/추가합니다. LLM 예측과 다른 예측은 그대로 둡니다.
+        """
+        if not RULE_PREDICTIONS:
+            return []
+        rule_result = extract_rule_predictions(merged_result)
+        resolved = [
+            p for p in rule_result["predictions"] if p["prediction_type"] not in rule_result["unresolved"]
+        ]
+        if not resolved:
+            return []
+        return self._upsert_predictions(report, resolved, self._existing_predictions(report.id))
+
+    async def _request_predictions(
+        self,
+        extraction_result: Dict[str, Any],
+        sections: list,
+        prediction_types: List[str] = PREDICTION_TYPES
+    ) -> list:
+        """
+        LLM으로 예측 정보 추출 (prediction_types만 요청, 실패 시 빈 목록)
+
+        예측 관련 섹션이 있으면 그 내용을, 없으면 리포트 전체를 청크로 나눠 동시에 추출하고
+        (타입, 기간)별로 앞 청크의 값을 남깁니다.
+        """
         forecast_sections = [s for s in sections if s.get("section_type") in ["forecast", "target_price", "recommendation"]]
         if forecast_sections:
-            combined_text = "\n".join([s.get("content", "") for s in forecast_sections[:5]])
+            chunks = chunk_texts([s.get("content", "") for s in forecast_sections])
         else:
-            combined_text = "\n".join([t.get("content", "") for t in texts[:50]])
-        
-        if len(combined_text) > 8000:
-            combined_text = combined_text[:8000]
-        
+            chunks = self._prompt_chunks(extraction_result)
+
+        results = await self._map_chunks(
+            chunks,
+            lambda index, chunk: self._request_prediction_chunk(
+                self._chunk_context(chunk, index, len(chunks)), prediction_types
+            ),
+        )
+        return _merge_items(results, _prediction_key)
+
+    async def _request_prediction_chunk(self, combined_text: str, prediction_types: List[str]) -> list:
+        """LLM으로 청크 하나의 예측 정보 추출 (실패 시 빈 목록)"""
+        type_lines = "\n".join(
+            f"{idx}. {prediction_type}: {PREDICTION_TYPE_DESCRIPTIONS[prediction_type]}"
+            for idx, prediction_type in enumerate(prediction_types, 1)
+        )
+
         # LLM을 사용하여 예측 정보 추출
         prompt = f"""다음 증권사 애널리스트 리포트에서 예측 정보를 추출하세요.
 
@@ -422,13 +1470,10 @@ JSON 형식으로 반환:
 {combined_text}
 
 다음 예측 타입을 찾아서 JSON 형식으로 반환하세요:
-1. target_price: 목표주가 (예: "목표주가 120,000원", "TP 120000원")
-2. revenue: 매출액 예측 (예: "매출액 1조 2,000억원")
-3. operating_profit: 영업이익 예측 (예: "영업이익 500억원")
-4. net_profit: 당기순이익 예측 (예: "순이익 300억원")
+{type_lines}
 
 각 예측에 대해 다음 정보를 추출:
-- prediction_type: 예측 타입 (target_price, revenue, operating_profit, net_profit)
+- prediction_type: 예측 타입 ({", ".join(prediction_types)})
 - predicted_value: 예측 값 (숫자만)
 - unit: 단위 (원, 억원, 조원, % 등)
 - period: 예측 기간 (2025Q1, 2025-06, 2025년 등)
@@ -450,8 +1495,6 @@ JSON 형식으로 반환:
 
 반드시 유효한 JSON만 반환하세요."""
         
-        predictions = []
-        
         try:
             result = await self.llm_service.generate("openai", prompt, {
                 "model": "gpt-4",
@@ -465,41 +1508,16 @@ JSON 형식으로 반환:
             json_match = re.search(r'\{[\s\S]*\}', content)
             if json_match:
                 json_str = json_match.group(0)
-                parsed = json.loads(json_str)
-                prediction_list = parsed.get("predictions", [])
-                
-                for pred_data in prediction_list:
-                    try:
-                        prediction = Prediction(
-                            report_id=report_id,
-                            company_id=report.company_id,
-                            prediction_type=pred_data.get("prediction_type"),
-                            predicted_value=Decimal(str(pred_data.get("predicted_value", 0))),
-                            unit=pred_data.get("unit"),
-                            period=pred_data.get("period"),
-                            reasoning=pred_data.get("reasoning"),
-                            confidence="high" if pred_data.get("predicted_value") else "medium"
-                        )
-                        self.db.add(prediction)
-                        predictions.append(prediction)
-                    except Exception as e:
-                        import logging
-                        logger = logging.getLogger(__name__)
-                        logger.warning(f"예측 정보 저장 실패: {str(e)}")
-                        continue
-                
-                self.db.commit()
+                predictions = json.loads(json_str).get("predictions", [])
+                return [p for p in predictions if isinstance(p, dict)] if isinstance(predictions, list) else []
                 
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"예측 정보 추출 실패: {str(e)}")
         
-        return predictions
+        return []
 
     async def _start_auto_data_collection(self, report_id: UUID, company_id: UUID):
         """리포트 파싱 완료 후 자동 데이터 수집 시작"""
-        from app.models.report import Report
         from app.services.data_collection_service import DataCollectionService
         from datetime import date, timedelta
         
@@ -527,13 +1545,9 @@ JSON 형식으로 반환:
                     end_date=end_date
                 )
             except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.warning(f"자동 데이터 수집 시작 실패: {str(e)}")
                 # 데이터 수집 실패해도 리포트 파싱은 완료된 것으로 처리
                 
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"자동 데이터 수집 처리 실패: {str(e)}")
 
@@ -0,0 +1,211 @@
+"""
+Company matcher - 기업 사전(Aho-Corasick) 기반 리포트 대상 기업 매칭
+
+companies 테이블의 한글/영문 기업명과 6자리 종목코드로 만든 Aho-Corasick 자동자로
+리포트 앞부분의 기업 언급을 한 번의 순회로 찾습니다. 언급 횟수와 위치로 대상 기업을
+정하고, 후보가 없거나 애매하면 None을 반환해 LLM 추출로 넘깁니다.
+"""
+import os
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+
+# 매칭할 앞 페이지 수, 확정에 필요한 최소 점수, 1위/2위 점수 최소 배율
+COMPANY_MATCH_PAGES = int(os.getenv("COMPANY_MATCH_PAGES", "2"))
+COMPANY_MATCH_MIN_SCORE = float(os.getenv("COMPANY_MATCH_MIN_SCORE", "2"))
+COMPANY_MATCH_MIN_RATIO = float(os.getenv("COMPANY_MATCH_MIN_RATIO", "2"))
+
+# 종목코드 언급 가중치 (예: "삼성전자(005930)"), 첫 페이지 언급 가중치
+TICKER_WEIGHT = 3.0
+FIRST_PAGE_WEIGHT = 2.0
+
+_WHITESPACE = re.compile(r"\s+")
+_TICKER = re.compile(r"^\d{6}$")
+
+
+def normalize(text: str) -> str:
+    """매칭용 정규화 (소문자, 연속 공백은 공백 하나)"""
+    return _WHITESPACE.sub(" ", text or "").strip().lower()
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def _is_hangul(char: str) -> bool:
+    return "가" <= char <= "힣"
+
+
+class AhoCorasick:
+    """Aho-Corasick 자동자 (패턴별 값 목록 보관)"""
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, Any]]] = [[]]
+
+    def add(self, pattern: str, value: Any):
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append((len(pattern), value))
+
+    def build(self):
+        """실패 링크 계산 (패턴 추가 후 한 번 호출)"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, Any]]:
+        """(시작 위치, 끝 위치, 값)"""
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for idx, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, value in output[state]:
+                yield idx + 1 - length, idx + 1, value
+
+
+@dataclass
+class CompanyMatch:
+    """매칭 결과 (company_id가 None이면 애매하거나 후보 없음)"""
+    company_id: Optional[Any]
+    scores: Dict[Any, float] = field(default_factory=dict)
+
+    @property
+    def ambiguous(self) -> bool:
+        return self.company_id is None and bool(self.scores)
+
+
+class CompanyMatcher:
+    """기업 사전 매처"""
+
+    def __init__(self, companies: Iterable[Tuple[Any, Optional[str], Optional[str], Optional[str]]]):
+        """companies: (id, name_kr, name_en, ticker)"""
+        self._automaton = AhoCorasick()
+        self._names: Dict[str, set] = {}
+        self._tickers: Dict[str, Any] = {}
+        for company_id, name_kr, name_en, ticker in companies:
+            for name in {normalize(name_kr), normalize(name_kr).replace(" ", ""), normalize(name_en)}:
+                if len(name) >= 2:
+                    self._names.setdefault(name, set()).add(company_id)
+                    self._automaton.add(name, ("name", company_id))
+            if ticker and _TICKER.match(ticker):
+                self._tickers[ticker] = company_id
+                self._automaton.add(ticker, ("ticker", company_id))
+        self._automaton.build()
+
+    def find(self, text: str) -> List[Tuple[int, int, str, Any]]:
+        """
+        기업 언급 위치 (시작, 끝, "name"|"ticker", company_id)
+
+        겹치는 언급은 가장 긴 것만 남깁니다 (예: "LG에너지솔루션" 안의 "LG").
+        영문명/종목코드는 앞뒤가 영숫자가 아니어야 하고, 한글명은 앞이 한글이 아니어야 합니다
+        (뒤에는 조사가 붙을 수 있음).
+        """
+        text = normalize(text)
+        matches = []
+        for start, end, (kind, company_id) in self._automaton.iter_matches(text):
+            before = text[start - 1] if start else ""
+            after = text[end] if end < len(text) else ""
+            if _is_hangul(text[start]) or _is_hangul(text[end - 1]):
+                if before and (_is_hangul(before) or _is_word_char(before)):
+                    continue
+            elif (before and _is_word_char(before)) or (after and _is_word_char(after)):
+                continue
+            matches.append((start, end, kind, company_id))
+
+        matches.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+        selected = []
+        last_end = -1
+        for match in matches:
+            if match[0] >= last_end:
+                selected.append(match)
+                last_end = match[1]
+            elif match[1] == last_end and selected and match[0] == selected[-1][0]:
+                # 같은 이름의 다른 기업 (동명 기업)
+                selected.append(match)
+        return selected
+
+    def match_report(self, pages: List[Tuple[int, str]]) -> CompanyMatch:
+        """
+        리포트 대상 기업 결정 ([(페이지 번호, 텍스트)])
+
+        언급마다 점수를 더하고(종목코드, 첫 페이지는 가중치) 1위가 최소 점수 이상이며
+        2위의 COMPANY_MATCH_MIN_RATIO배 이상일 때만 확정합니다. 동명 기업은 점수를 나눠 갖습니다.
+        """
+        scores: Dict[Any, float] = {}
+        for page_number, text in pages:
+            page_weight = FIRST_PAGE_WEIGHT if page_number == 1 else 1.0
+            spans: Dict[Tuple[int, int], List[Tuple[str, Any]]] = {}
+            for start, end, kind, company_id in self.find(text):
+                spans.setdefault((start, end), []).append((kind, company_id))
+            for hits in spans.values():
+                for kind, company_id in hits:
+                    weight = TICKER_WEIGHT if kind == "ticker" else page_weight
+                    scores[company_id] = scores.get(company_id, 0.0) + weight / len(hits)
+
+        if not scores:
+            return CompanyMatch(None)
+        ranked = sorted(scores.items(), key=lambda item: -item[1])
+        best_id, best = ranked[0]
+        second = ranked[1][1] if len(ranked) > 1 else 0.0
+        if best >= COMPANY_MATCH_MIN_SCORE and best >= COMPANY_MATCH_MIN_RATIO * second:
+            return CompanyMatch(best_id, scores)
+        return CompanyMatch(None, scores)
+
+    def lookup(self, name: Optional[str] = None, ticker: Optional[str] = None) -> Optional[Any]:
+        """종목코드 또는 기업명(정확히 일치, 없으면 이름 안의 유일한 기업)으로 company_id 조회"""
+        if ticker and ticker in self._tickers:
+            return self._tickers[ticker]
+        if not name:
+            return None
+        for candidate in (normalize(name), normalize(name).replace(" ", "")):
+            ids = self._names.get(candidate)
+            if ids and len(ids) == 1:
+                return next(iter(ids))
+        ids = {company_id for _, _, _, company_id in self.find(name)}
+        return next(iter(ids)) if len(ids) == 1 else None
+
+
+_matcher_lock = threading.Lock()
+_matcher_cache: Dict[str, Any] = {"signature": None, "matcher": None}
+
+
+def get_company_matcher(db: Session) -> CompanyMatcher:
+    """
+    companies 테이블 기업 사전 (프로세스 단위 캐시)
+
+    기업 수와 최종 수정 시각이 바뀌면 다시 만듭니다 (다른 프로세스의 변경도 반영).
+    """
+    from app.models.company import Company
+
+    signature = tuple(db.query(func.count(Company.id), func.max(Company.updated_at)).one())
+    with _matcher_lock:
+        if _matcher_cache["signature"] != signature or _matcher_cache["matcher"] is None:
+            rows = db.query(Company.id, Company.name_kr, Company.name_en, Company.ticker).all()
+            _matcher_cache["matcher"] = CompanyMatcher(rows)
+            _matcher_cache["signature"] = signature
+        return _matcher_cache["matcher"]
@@ -4,74 +4,413 @@ Document extraction service
 import pdfplumber
 import PyPDF2
 from pathlib import Path
-from typing import Dict, Any, List
-from io import BytesIO
+from typing import AsyncIterator, Callable, Dict, Any, Iterator, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+import asyncio
+import itertools
+import logging
 import os
 import json
-from PIL import Image
-import base64
 
-try:
-    from paddleocr import PaddleOCR
-    PADDLEOCR_AVAILABLE = True
-except ImportError:
-    PADDLEOCR_AVAILABLE = False
+from app.services.extraction.boilerplate import mark_boilerplate
+from app.services.extraction.embedded_image import load_embedded_image
+from app.services.extraction.image_dedupe import (
+    IMAGE_DEDUPE_ENABLED,
+    IMAGE_DEDUPE_SHARED_MAX_PT,
+    ImageHashIndex,
+    image_content_hash,
+    image_fingerprint,
+)
+from app.services.extraction.numeric_scanner import scan_numeric_data
+from app.services.extraction.ocr_engine_pool import get_ocr_engine_pool
+from app.services.extraction.page_raster_cache import PageRasterCache
+from app.services.extraction.pdfium_text import PDFIUM_AVAILABLE, PdfiumTextPage, iter_pdfium_pages
+from app.services.extraction.stage_timer import StageTimer
+
+
+logger = logging.getLogger(__name__)
+
+# 추출 로직이나 결과 형식이 바뀌면 올려서 추출 결과 캐시를 무효화
+EXTRACTOR_VERSION = "7"
+
+# 병렬 추출 설정 (워커 수가 1 이하이면 순차 추출)
+PDF_EXTRACTION_WORKERS = int(os.getenv("PDF_EXTRACTION_WORKERS", "1"))
+PDF_EXTRACTION_PAGES_PER_TASK = int(os.getenv("PDF_EXTRACTION_PAGES_PER_TASK", "8"))
+
+# 추출 백엔드
+# - pdfplumber: 텍스트, 표, 이미지, OCR 전체 추출
+# - pdfium: pypdfium2 텍스트/단어 위치만 추출 (LLM 프롬프트용 대량 수집, 수 배 이상 빠름)
+EXTRACTION_BACKENDS = ("pdfplumber", "pdfium")
+PDF_EXTRACTION_BACKEND = os.getenv("PDF_EXTRACTION_BACKEND", "pdfplumber")
+
+# 추출 단계
+# - full: 백엔드가 지원하는 전체 추출
+# - text: 텍스트 블록만 (리포트를 바로 파싱/검색 가능하게 만드는 빠른 단계)
+# - deep: 표, 이미지, OCR만 (text 단계 이후 낮은 우선순위 작업으로 보강, pdfplumber 전용)
+EXTRACTION_TIERS = ("full", "text", "deep")
+
+# 표 탐지 전략 프리셋 (pdfplumber table_settings)
+TABLE_STRATEGIES = {
+    # 괘선 기반 (pdfplumber 기본값)
+    "lines": {
+        "vertical_strategy": "lines",
+        "horizontal_strategy": "lines",
+    },
+    # 실제 그려진 선만 사용 (점선/배경색 경계 무시)
+    "lines_strict": {
+        "vertical_strategy": "lines_strict",
+        "horizontal_strategy": "lines_strict",
+        "snap_tolerance": 3,
+        "join_tolerance": 3,
+        "intersection_tolerance": 3,
+    },
+    # 괘선 없는 표 (단어 정렬 기반)
+    "text": {
+        "vertical_strategy": "text",
+        "horizontal_strategy": "text",
+        "snap_tolerance": 3,
+        "join_tolerance": 3,
+        "min_words_vertical": 3,
+        "min_words_horizontal": 1,
+    },
+}
+PDF_TABLE_STRATEGY = os.getenv("PDF_TABLE_STRATEGY", "lines")
+
+# 텍스트 레이어 품질 기준 (이 기준을 만족하는 페이지는 OCR을 건너뜀)
+TEXT_LAYER_MIN_CHARS = int(os.getenv("TEXT_LAYER_MIN_CHARS", "30"))
+TEXT_LAYER_MAX_GARBAGE_RATIO = float(os.getenv("TEXT_LAYER_MAX_GARBAGE_RATIO", "0.2"))
+# 이보다 작은 이미지 영역(로고, 아이콘 등)은 OCR하지 않음 (단위: pt)
+OCR_MIN_REGION_PT = float(os.getenv("OCR_MIN_REGION_PT", "40"))
+# 이미지 영역 안에 이 개수 이상의 문자가 있으면 텍스트 레이어로 충분하다고 판단
+OCR_REGION_MIN_OVERLAP_CHARS = 3
+
+# 프로세스별 공유 객체 (프로세스 풀 / 워커 프로세스의 추출 서비스)
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_workers = 0
+_worker_services: Dict[tuple, "DocumentExtractionService"] = {}
+
+
+def _lazy(compute: Callable[[], Any]) -> Callable[[], Any]:
+    """처음 호출할 때 한 번만 계산하는 함수"""
+    cached = []
+
+    def get():
+        if not cached:
+            cached.append(compute())
+        return cached[0]
+
+    return get
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """추출용 프로세스 풀 반환 (워커 수가 바뀌면 재생성)"""
+    global _process_pool, _process_pool_workers
+    if _process_pool is None or _process_pool_workers != max_workers:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=False)
+        _process_pool = ProcessPoolExecutor(max_workers=max_workers)
+        _process_pool_workers = max_workers
+    return _process_pool
+
+
+def _reset_process_pool():
+    """손상된 프로세스 풀 폐기"""
+    global _process_pool, _process_pool_workers
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+    _process_pool = None
+    _process_pool_workers = 0
+
+
+def _extract_page_range(
+    report_id: str,
+    file_path: str,
+    first_page: int,
+    last_page: int,
+    backend: str = "pdfplumber",
+    table_strategy: Optional[str] = None,
+    tier: str = "full",
+    image_scope: Optional[str] = None,
+    profile: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    프로세스 풀 워커에서 페이지 범위 추출 (워커 프로세스당 설정별 서비스 1회 생성)
+
+    profile이면 범위의 단계별 소요 시간을 마지막 페이지 결과의 "stage_timings"로 전달합니다.
+    """
+    key = (backend, table_strategy, tier, profile)
+    if key not in _worker_services:
+        _worker_services[key] = DocumentExtractionService(
+            max_workers=1, table_strategy=table_strategy, backend=backend, tier=tier,
+            stage_timer=StageTimer() if profile else None
+        )
+    service = _worker_services[key]
+    page_results = asyncio.run(
+        service._extract_pages(report_id, file_path, first_page, last_page, image_scope)
+    )
+    if service.stage_timer is not None:
+        timings = service.stage_timer.drain()
+        if page_results:
+            page_results[-1]["stage_timings"] = timings
+    return page_results
 
 
 class DocumentExtractionService:
-    """문서 추출 서비스"""
+    """
+    문서 추출 서비스
 
-    def __init__(self):
-        self.ocr = None
-        if PADDLEOCR_AVAILABLE:
-            try:
-                # PaddleOCR 초기화 (한국어, 영어 지원)
-                self.ocr = PaddleOCR(use_angle_cls=True, lang='korean')
-            except Exception as e:
-                print(f"PaddleOCR 초기화 실패: {e}")
-                self.ocr = None
-
-    async def extract_async(self, report_id: str, file_path: str) -> Dict[str, Any]:
-        """비동기 문서 추출"""
+    backend로 추출 백엔드를 선택합니다 (작업별 지정, 기본값 PDF_EXTRACTION_BACKEND).
+    "pdfium" 백엔드는 텍스트 블록만 만들고 표, 이미지, OCR은 건너뜁니다.
+    tier로 추출 단계를 나눌 수 있습니다 (EXTRACTION_TIERS 참고).
+    stage_timer가 주어지면 단계별 소요 시간을 기록합니다 (병렬 추출 워커 포함).
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        pages_per_task: Optional[int] = None,
+        table_strategy: Optional[str] = None,
+        backend: Optional[str] = None,
+        tier: str = "full",
+        stage_timer: Optional[StageTimer] = None
+    ):
+        self.max_workers = max_workers or PDF_EXTRACTION_WORKERS
+        self.pages_per_task = max(1, pages_per_task or PDF_EXTRACTION_PAGES_PER_TASK)
+        self.table_strategy = table_strategy or PDF_TABLE_STRATEGY
+        if self.table_strategy not in TABLE_STRATEGIES:
+            raise ValueError(f"Unknown table strategy: {self.table_strategy}")
+        self.table_settings = TABLE_STRATEGIES[self.table_strategy]
+        self.backend = backend or PDF_EXTRACTION_BACKEND
+        if self.backend not in EXTRACTION_BACKENDS:
+            raise ValueError(f"Unknown extraction backend: {self.backend}")
+        if self.backend == "pdfium" and not PDFIUM_AVAILABLE:
+            raise ValueError("pypdfium2가 설치되어 있지 않아 pdfium 백엔드를 사용할 수 없습니다")
+        if tier not in EXTRACTION_TIERS:
+            raise ValueError(f"Unknown extraction tier: {tier}")
+        if tier == "deep" and self.backend != "pdfplumber":
+            raise ValueError("deep 추출 단계는 pdfplumber 백엔드에서만 사용할 수 있습니다")
+        self.tier = tier
+        self.stage_timer = stage_timer
+        # 프로세스 전역 OCR 엔진 풀 (엔진은 프로세스당 1회 로드)
+        self.ocr_pool = get_ocr_engine_pool()
+
+    @property
+    def cache_version(self) -> str:
+        """추출 결과 캐시 버전 (백엔드/표 탐지 전략/추출 단계별로 결과가 다르므로 구분)"""
+        if self.backend == "pdfium":
+            return f"{EXTRACTOR_VERSION}-pdfium"
+        version = EXTRACTOR_VERSION
+        if self.table_strategy != "lines":
+            version += f"-{self.table_strategy}"
+        if self.tier != "full":
+            version += f"-{self.tier}"
+        return version
+
+    def _stage(self, stage: str):
+        """단계 소요 시간 측정 컨텍스트 (stage_timer가 없으면 측정하지 않음)"""
+        return self.stage_timer.measure(stage) if self.stage_timer is not None else nullcontext()
+
+    async def extract_async(
+        self,
+        report_id: str,
+        file_path: str,
+        parallel: Optional[bool] = None,
+        image_scope: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        비동기 문서 추출
+
+        parallel이 None이면 워커 수(PDF_EXTRACTION_WORKERS)가 2 이상이고
+        페이지 수가 작업 단위보다 많을 때 프로세스 풀 병렬 추출을 사용합니다.
+        image_scope(증권사명 등)가 주어지면 같은 범위의 다른 리포트와 반복 이미지를 공유합니다.
+        """
+        # 1. 메타데이터 추출
+        result = await self.new_result(file_path)
+
+        # 2. 페이지별 텍스트 및 표 추출 (순차 또는 페이지 범위 병렬)
+        async for page_result in self.iter_pages(
+            report_id, file_path, result["metadata"].get("page_count", 0), parallel,
+            image_scope=image_scope
+        ):
+            self.merge_page_result(result, page_result)
+
+        # 3. 페이지마다 반복되는 머리글/바닥글 표시
+        mark_boilerplate(result)
+
+        return result
+
+    async def new_result(self, file_path: str) -> Dict[str, Any]:
+        """메타데이터만 채운 빈 추출 결과 생성"""
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {file_path}")
 
-        result = {
+        return {
             "pages": [],
             "texts": [],
             "tables": [],
             "images": [],
-            "metadata": {}
+            "metadata": await self._extract_metadata(file_path)
         }
 
-        # 1. 메타데이터 추출
-        result["metadata"] = await self._extract_metadata(file_path)
-
-        # 2. pdfplumber로 텍스트 및 표 추출
+    async def iter_pages(
+        self,
+        report_id: str,
+        file_path: str,
+        page_count: int,
+        parallel: Optional[bool] = None,
+        first_page: int = 1,
+        image_scope: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        스트리밍 추출: 페이지 결과를 준비되는 대로 페이지 순서대로 반환
+
+        first_page부터 page_count 페이지까지 추출합니다 (page_count가 0이면 마지막 페이지까지).
+        처리가 끝난 페이지의 pdfplumber 캐시는 즉시 비우므로 PDF 파싱 상태는 페이지 수에
+        비례해 늘지 않습니다. 반환한 페이지 결과를 모아 두는지는 호출하는 쪽에 달려 있습니다.
+        """
+        if parallel is None:
+            parallel = self.max_workers > 1 and page_count - first_page + 1 > self.pages_per_task
+
+        if parallel and page_count >= first_page:
+            async for page_result in self._iter_pages_parallel(
+                report_id, file_path, page_count, first_page, image_scope
+            ):
+                yield page_result
+        else:
+            async for page_result in self._iter_page_range(
+                report_id, file_path, first_page, page_count or None, image_scope=image_scope
+            ):
+                yield page_result
+
+    def _open_pdf(self, file_path: str, pages: Optional[List[int]] = None):
+        """pdfplumber PDF 열기"""
         # pdfplumber는 기본적으로 UTF-8을 사용하지만 명시적으로 설정
         try:
-            with pdfplumber.open(file_path, encoding='utf-8') as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    page_result = await self._extract_page_content(
-                        page, page_num, report_id, file_path
-                    )
-                    result["pages"].append(page_result)
-                    result["texts"].extend(page_result.get("text_blocks", []))
-                    result["tables"].extend(page_result.get("tables", []))
-                    result["images"].extend(page_result.get("images", []))
+            return pdfplumber.open(file_path, pages=pages, encoding='utf-8')
         except TypeError:
             # pdfplumber.open()이 encoding 파라미터를 지원하지 않는 경우
-            with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, start=1):
-                    page_result = await self._extract_page_content(
-                        page, page_num, report_id, file_path
+            return pdfplumber.open(file_path, pages=pages)
+
+    async def _iter_page_range(
+        self,
+        report_id: str,
+        file_path: str,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+        image_scope: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        페이지 범위 순차 추출 (first_page부터 last_page까지, 1부터 시작)
+
+        PDF 열기와 페이지 추출은 스레드에서 실행하므로 추출하는 동안 이벤트 루프를 막지 않습니다
+        (한 번에 한 페이지씩이므로 PDF 객체를 동시에 사용하지 않음).
+        """
+        if self.backend == "pdfium":
+            text_pages = iter_pdfium_pages(file_path, first_page, last_page, self.stage_timer)
+            try:
+                for page_num in itertools.count(first_page):
+                    page_result = await asyncio.to_thread(self._next_text_page, text_pages, page_num)
+                    if page_result is None:
+                        return
+                    yield page_result
+            finally:
+                text_pages.close()
+
+        pages = list(range(first_page, last_page + 1)) if last_page else None
+        # 추출 실행 단위 래스터 캐시 (페이지당 최대 1회 렌더링)
+        raster_cache = PageRasterCache(file_path)
+        # 반복 이미지 인덱스 (리포트 내, image_scope가 있으면 같은 증권사 리포트 간 공유)
+        image_index = ImageHashIndex.for_scope(image_scope)
+
+        try:
+            with await asyncio.to_thread(self._open_pdf, file_path, pages) as pdf:
+                pdf_pages = await asyncio.to_thread(lambda: pdf.pages if pages else pdf.pages[first_page - 1:])
+                for page_num, page in enumerate(pdf_pages, start=first_page):
+                    yield await asyncio.to_thread(
+                        self._extract_page_sync, page, page_num, report_id, file_path, raster_cache, image_index
                     )
-                    result["pages"].append(page_result)
-                    result["texts"].extend(page_result.get("text_blocks", []))
-                    result["tables"].extend(page_result.get("tables", []))
-                    result["images"].extend(page_result.get("images", []))
+        finally:
+            image_index.save()
+
+    def _next_text_page(self, text_pages: Iterator[PdfiumTextPage], page_num: int) -> Optional[Dict[str, Any]]:
+        """pdfium 다음 페이지 추출 결과 (페이지가 없으면 None, 스레드에서 실행)"""
+        text_page = next(text_pages, None)
+        return None if text_page is None else self._extract_text_page_content(text_page, page_num)
+
+    def _extract_page_sync(self, page, page_num: int, *args) -> Dict[str, Any]:
+        """페이지 하나 추출 후 파싱 캐시 해제 (스레드에서 실행)"""
+        page_result = asyncio.run(self._extract_page_content(page, page_num, *args))
+        # 처리한 페이지의 파싱 캐시 해제 (메모리 제한)
+        if hasattr(page, "close"):
+            page.close()
+        return page_result
+
+    async def _extract_pages(
+        self,
+        report_id: str,
+        file_path: str,
+        first_page: int = 1,
+        last_page: Optional[int] = None,
+        image_scope: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """페이지 범위 순차 추출 결과 목록"""
+        return [
+            page_result
+            async for page_result in self._iter_page_range(
+                report_id, file_path, first_page, last_page, image_scope
+            )
+        ]
 
-        return result
+    async def _iter_pages_parallel(
+        self,
+        report_id: str,
+        file_path: str,
+        page_count: int,
+        first_page: int = 1,
+        image_scope: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """페이지 범위를 프로세스 풀에 분배하여 병렬 추출 (결과는 페이지 순서대로 반환)"""
+        page_ranges = [
+            (first, min(first + self.pages_per_task - 1, page_count))
+            for first in range(first_page, page_count + 1, self.pages_per_task)
+        ]
+
+        next_page = first_page
+        try:
+            loop = asyncio.get_running_loop()
+            pool = _get_process_pool(self.max_workers)
+            futures = [
+                loop.run_in_executor(
+                    pool, _extract_page_range, str(report_id), file_path, first, last,
+                    self.backend, self.table_strategy, self.tier, image_scope,
+                    self.stage_timer is not None
+                )
+                for first, last in page_ranges
+            ]
+            for future in futures:
+                chunk = await future
+                for page_result in sorted(chunk, key=lambda page_result: page_result["page_number"]):
+                    timings = page_result.pop("stage_timings", None)
+                    if timings and self.stage_timer is not None:
+                        self.stage_timer.merge(timings)
+                    yield page_result
+                    next_page = page_result["page_number"] + 1
+        except Exception as e:
+            # 데몬 프로세스(Celery prefork 워커 등)에서는 자식 프로세스를 만들 수 없음
+            logger.warning(f"병렬 추출 실패, 페이지 {next_page}부터 순차 추출로 전환: {e}")
+            _reset_process_pool()
+            async for page_result in self._iter_page_range(
+                report_id, file_path, next_page, image_scope=image_scope
+            ):
+                yield page_result
+
+    def merge_page_result(self, result: Dict[str, Any], page_result: Dict[str, Any]):
+        """페이지 추출 결과를 전체 결과에 병합"""
+        result["pages"].append(page_result)
+        result["texts"].extend(page_result.get("text_blocks", []))
+        result["tables"].extend(page_result.get("tables", []))
+        result["images"].extend(page_result.get("images", []))
 
     def _decode_pdf_string(self, value: Any) -> str:
         """PDF 문자열을 UTF-8로 디코딩"""
@@ -126,9 +465,11 @@ class DocumentExtractionService:
         page: Any,
         page_num: int,
         report_id: str,
-        file_path: str
+        file_path: str,
+        raster_cache: Optional[PageRasterCache] = None,
+        image_index: Optional[ImageHashIndex] = None
     ) -> Dict[str, Any]:
-        """페이지별 콘텐츠 추출"""
+        """페이지별 콘텐츠 추출 (text 단계는 1, deep 단계는 2~4만 수행)"""
         result = {
             "page_number": page_num,
             "text_blocks": [],
@@ -136,150 +477,301 @@ class DocumentExtractionService:
             "images": []
         }
 
+        if raster_cache is None:
+            raster_cache = PageRasterCache(file_path)
+
+        # 0. 텍스트 레이어 품질 판정 (스캔/이미지 전용 페이지만 OCR 경로 사용)
+        with self._stage("text"):
+            text_layer = self._assess_text_layer(page)
+        result["text_layer"] = text_layer
+        result["extraction_path"] = "text_layer" if text_layer["usable"] else "ocr"
+
         # 1. 텍스트 추출
-        text_blocks = await self._extract_text_blocks(page, page_num)
-        result["text_blocks"] = text_blocks
+        if self.tier != "deep":
+            text_blocks = await self._extract_text_blocks(page, page_num)
+            result["text_blocks"] = text_blocks
+
+        if self.tier == "text":
+            if not text_layer["usable"]:
+                result["extraction_path"] = "needs_ocr"
+            return result
 
         # 2. 표 추출
-        tables = await self._extract_tables(page, page_num)
+        with self._stage("tables"):
+            tables = await self._extract_tables(page, page_num)
         result["tables"] = tables
 
         # 3. 이미지 추출 및 OCR
-        images = await self._extract_images(page, page_num, report_id, file_path)
+        with self._stage("images"):
+            images = await self._extract_images(
+                page, page_num, report_id, file_path, raster_cache, text_layer, image_index
+            )
         result["images"] = images
 
+        # 4. 텍스트 레이어가 없는 페이지는 OCR 결과를 텍스트 블록으로 추가
+        if not text_layer["usable"]:
+            with self._stage("ocr"):
+                ocr_block = self._build_ocr_text_block(page, page_num, images, raster_cache)
+            if ocr_block:
+                result["text_blocks"].append(ocr_block)
+
         return result
 
+    def _extract_text_page_content(
+        self,
+        text_page: PdfiumTextPage,
+        page_num: int
+    ) -> Dict[str, Any]:
+        """pdfium 백엔드 페이지 추출 (텍스트 블록만, 표/이미지/OCR 없음)"""
+        text_layer = self._assess_char_texts(text_page.chars)
+        with self._stage("text"):
+            text_blocks = self._build_text_blocks(
+                page_num, text_page.width, text_page.height, text_page.text, text_page.words
+            )
+        return {
+            "page_number": page_num,
+            "text_blocks": text_blocks,
+            "tables": [],
+            "images": [],
+            "text_layer": text_layer,
+            # 텍스트 레이어가 없는 페이지는 pdfplumber 백엔드(OCR)로 다시 추출해야 함
+            "extraction_path": "text_layer" if text_layer["usable"] else "needs_ocr",
+        }
+
+    def _assess_text_layer(self, page: Any) -> Dict[str, Any]:
+        """페이지 텍스트 레이어 품질 판정 (문자 수, 깨진 문자 비율)"""
+        try:
+            chars = page.chars
+        except Exception:
+            chars = []
+        return self._assess_char_texts(char.get("text", "") for char in chars)
+
+    def _assess_char_texts(self, texts: Any) -> Dict[str, Any]:
+        """문자 텍스트 목록으로 텍스트 레이어 품질 판정"""
+        char_count = 0
+        garbage_count = 0
+        for text in texts:
+            if not text or text.isspace():
+                continue
+            char_count += 1
+            # 매핑되지 않은 글리프는 "(cid:123)" 또는 대체 문자로 추출됨
+            if text.startswith("(cid:") or "\ufffd" in text:
+                garbage_count += 1
+
+        garbage_ratio = garbage_count / char_count if char_count else 0.0
+        return {
+            "usable": char_count >= TEXT_LAYER_MIN_CHARS and garbage_ratio <= TEXT_LAYER_MAX_GARBAGE_RATIO,
+            "char_count": char_count,
+            "garbage_ratio": round(garbage_ratio, 3),
+        }
+
+    def _region_ocr_path(
+        self,
+        page: Any,
+        region_bbox: tuple,
+        text_layer: Optional[Dict[str, Any]]
+    ) -> str:
+        """
+        이미지 영역 처리 경로 결정
+
+        - "ocr": 텍스트 레이어가 없는 페이지이거나 영역에 겹치는 문자가 없음
+        - "text_layer": 영역의 내용이 이미 텍스트 레이어에 있음
+        - "skipped": 로고/아이콘 등 작은 영역
+        """
+        if not text_layer or not text_layer.get("usable"):
+            return "ocr"
+
+        x0, top, x1, bottom = region_bbox
+        if x1 - x0 < OCR_MIN_REGION_PT or bottom - top < OCR_MIN_REGION_PT:
+            return "skipped"
+
+        overlap = 0
+        for char in page.chars:
+            if (x0 <= char.get("x0", 0) and char.get("x1", 0) <= x1
+                    and top <= char.get("top", 0) and char.get("bottom", 0) <= bottom):
+                overlap += 1
+                if overlap >= OCR_REGION_MIN_OVERLAP_CHARS:
+                    return "text_layer"
+        return "ocr"
+
+    def _build_ocr_text_block(
+        self,
+        page: Any,
+        page_num: int,
+        images: List[Dict[str, Any]],
+        raster_cache: PageRasterCache
+    ) -> Optional[Dict[str, Any]]:
+        """텍스트 레이어가 없는 페이지의 OCR 텍스트 블록 생성"""
+        ocr_text = "\n".join(
+            image["ocr_text"] for image in images if image.get("ocr_text")
+        )
+        # 이미지 영역이 없으면 (벡터 아웃라인 텍스트 등) 페이지 전체를 OCR
+        if not ocr_text and not images and self.ocr_pool.available:
+            raster = raster_cache.get(page, page_num)
+            if raster is not None:
+                ocr_text = self.ocr_pool.ocr(raster)
+
+        if not ocr_text:
+            return None
+
+        return {
+            "id": f"text_{page_num}_ocr",
+            "content": ocr_text.strip(),
+            "page_number": page_num,
+            "bbox": [0, 0, page.width, page.height],
+            "font_size": None,
+            "font_style": None,
+            "order": 0,
+            "confidence": "medium",
+            "language": "ko",
+            "source": "ocr"
+        }
+
     async def _extract_text_blocks(
         self,
         page: Any,
         page_num: int
     ) -> List[Dict[str, Any]]:
         """텍스트 블록 추출"""
-        text_blocks = []
-        
         try:
             # 전체 텍스트 추출 (한글 인코딩 보장)
-            full_text = page.extract_text()
-            if full_text:
-                # 텍스트 정제 (한글 깨짐 방지)
-                if isinstance(full_text, bytes):
-                    full_text = self._decode_pdf_string(full_text)
-                elif not isinstance(full_text, str):
-                    full_text = str(full_text)
-                
-                # 불필요한 공백 정리하되 한글은 유지
-                full_text = full_text.strip()
-                
-                text_blocks.append({
-                    "id": f"text_{page_num}_full",
-                    "content": full_text,
-                    "page_number": page_num,
-                    "bbox": [0, 0, page.width, page.height],
-                    "font_size": None,
-                    "font_style": None,
-                    "order": 0,
-                    "confidence": "high",
-                    "language": "ko"  # 한글 기본값
-                })
+            with self._stage("text"):
+                full_text = page.extract_text()
 
             # 단어별 추출 (위치 정보 포함) - 한글 및 수치 인식 강화
-            words = page.extract_words(
-                x_tolerance=3,
-                y_tolerance=3,
-                keep_blank_chars=False,
-                use_text_flow=True,
-                horizontal_ltr=True,
-                vertical_ttb=True,
-                extra_attrs=["fontname", "size"]
-            )
-            
-            # 수치 데이터 추출 (한글과 함께)
-            numeric_patterns = self._extract_numeric_data(full_text)
-            if numeric_patterns:
-                text_blocks.append({
-                    "id": f"numeric_{page_num}",
-                    "content": json.dumps(numeric_patterns, ensure_ascii=False),
-                    "page_number": page_num,
-                    "bbox": [0, 0, page.width, page.height],
-                    "font_size": None,
-                    "font_style": None,
-                    "order": -1,  # 수치 데이터는 먼저 표시
-                    "confidence": "high",
-                    "language": "ko",
-                    "data_type": "numeric"
-                })
-
-            if words:
-                # 단어들을 문단으로 그룹화
-                current_paragraph = []
-                current_y = None
-                paragraph_id = 0
-
-                for word in words:
-                    word_y = word.get("top", 0)
-                    word_text = word.get("text", "")
-                    
-                    # 텍스트 인코딩 보정
-                    if isinstance(word_text, bytes):
-                        word_text = self._decode_pdf_string(word_text)
-                    word["text"] = word_text
-                    
-                    # 새로운 문단 시작 (y 좌표 차이가 크면)
-                    if current_y is None or abs(word_y - current_y) > 10:
-                        if current_paragraph:
-                            # 이전 문단 저장
-                            paragraph_text = " ".join([w.get("text", "") for w in current_paragraph])
-                            paragraph_text = paragraph_text.strip()
-                            if paragraph_text:
-                                text_blocks.append({
-                                    "id": f"text_{page_num}_para_{paragraph_id}",
-                                    "content": paragraph_text,
-                                    "page_number": page_num,
-                                    "bbox": self._calculate_bbox(current_paragraph),
-                                    "font_size": current_paragraph[0].get("size") if current_paragraph else None,
-                                    "font_style": "bold" if any(w.get("fontname", "").lower().find("bold") >= 0 for w in current_paragraph) else "normal",
-                                    "order": paragraph_id,
-                                    "confidence": "high",
-                                    "language": "ko"
-                                })
-                                paragraph_id += 1
-                        
-                        current_paragraph = [word]
-                        current_y = word_y
-                    else:
-                        current_paragraph.append(word)
-                        current_y = word_y
-
-                # 마지막 문단 저장
-                if current_paragraph:
-                    paragraph_text = " ".join([w.get("text", "") for w in current_paragraph])
-                    paragraph_text = paragraph_text.strip()
-                    if paragraph_text:
-                        text_blocks.append({
-                            "id": f"text_{page_num}_para_{paragraph_id}",
-                            "content": paragraph_text,
-                            "page_number": page_num,
-                            "bbox": self._calculate_bbox(current_paragraph),
-                            "font_size": current_paragraph[0].get("size") if current_paragraph else None,
-                            "font_style": "bold" if any(w.get("fontname", "").lower().find("bold") >= 0 for w in current_paragraph) else "normal",
-                            "order": paragraph_id,
-                            "confidence": "high",
-                            "language": "ko"
-                        })
+            with self._stage("words"):
+                words = page.extract_words(
+                    x_tolerance=3,
+                    y_tolerance=3,
+                    keep_blank_chars=False,
+                    use_text_flow=True,
+                    horizontal_ltr=True,
+                    vertical_ttb=True,
+                    extra_attrs=["fontname", "size"]
+                )
+
+            with self._stage("text"):
+                return self._build_text_blocks(page_num, page.width, page.height, full_text, words)
 
         except Exception as e:
             print(f"텍스트 추출 오류 (페이지 {page_num}): {e}")
             # 오류 발생 시 빈 텍스트라도 추가
-            text_blocks.append({
+            return [{
                 "id": f"text_{page_num}_error",
                 "content": "",
                 "page_number": page_num,
                 "bbox": [0, 0, page.width, page.height],
                 "confidence": "low",
                 "error": str(e)
+            }]
+
+    def _build_text_blocks(
+        self,
+        page_num: int,
+        width: float,
+        height: float,
+        full_text: Any,
+        words: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """전체 텍스트와 단어 위치로 텍스트 블록 생성 (전체, 수치 데이터, 문단)"""
+        text_blocks = []
+
+        if full_text:
+            # 텍스트 정제 (한글 깨짐 방지)
+            if isinstance(full_text, bytes):
+                full_text = self._decode_pdf_string(full_text)
+            elif not isinstance(full_text, str):
+                full_text = str(full_text)
+            
+            # 불필요한 공백 정리하되 한글은 유지
+            full_text = full_text.strip()
+            
+            text_blocks.append({
+                "id": f"text_{page_num}_full",
+                "content": full_text,
+                "page_number": page_num,
+                "bbox": [0, 0, width, height],
+                "font_size": None,
+                "font_style": None,
+                "order": 0,
+                "confidence": "high",
+                "language": "ko"  # 한글 기본값
             })
 
+        # 수치 데이터 추출 (한글과 함께)
+        numeric_patterns = self._extract_numeric_data(full_text)
+        if numeric_patterns:
+            text_blocks.append({
+                "id": f"numeric_{page_num}",
+                "content": json.dumps(numeric_patterns, ensure_ascii=False),
+                "page_number": page_num,
+                "bbox": [0, 0, width, height],
+                "font_size": None,
+                "font_style": None,
+                "order": -1,  # 수치 데이터는 먼저 표시
+                "confidence": "high",
+                "language": "ko",
+                "data_type": "numeric"
+            })
+
+        if words:
+            # 단어들을 문단으로 그룹화
+            current_paragraph = []
+            current_y = None
+            paragraph_id = 0
+
+            for word in words:
+                word_y = word.get("top", 0)
+                word_text = word.get("text", "")
+                
+                # 텍스트 인코딩 보정
+                if isinstance(word_text, bytes):
+                    word_text = self._decode_pdf_string(word_text)
+                word["text"] = word_text
+                
+                # 새로운 문단 시작 (y 좌표 차이가 크면)
+                if current_y is None or abs(word_y - current_y) > 10:
+                    if current_paragraph:
+                        # 이전 문단 저장
+                        paragraph_text = " ".join([w.get("text", "") for w in current_paragraph])
+                        paragraph_text = paragraph_text.strip()
+                        if paragraph_text:
+                            text_blocks.append({
+                                "id": f"text_{page_num}_para_{paragraph_id}",
+                                "content": paragraph_text,
+                                "page_number": page_num,
+                                "bbox": self._calculate_bbox(current_paragraph),
+                                "font_size": current_paragraph[0].get("size") if current_paragraph else None,
+                                "font_style": "bold" if any(w.get("fontname", "").lower().find("bold") >= 0 for w in current_paragraph) else "normal",
+                                "order": paragraph_id,
+                                "confidence": "high",
+                                "language": "ko"
+                            })
+                            paragraph_id += 1
+                    
+                    current_paragraph = [word]
+                    current_y = word_y
+                else:
+                    current_paragraph.append(word)
+                    current_y = word_y
+
+            # 마지막 문단 저장
+            if current_paragraph:
+                paragraph_text = " ".join([w.get("text", "") for w in current_paragraph])
+                paragraph_text = paragraph_text.strip()
+                if paragraph_text:
+                    text_blocks.append({
+                        "id": f"text_{page_num}_para_{paragraph_id}",
+                        "content": paragraph_text,
+                        "page_number": page_num,
+                        "bbox": self._calculate_bbox(current_paragraph),
+                        "font_size": current_paragraph[0].get("size") if current_paragraph else None,
+                        "font_style": "bold" if any(w.get("fontname", "").lower().find("bold") >= 0 for w in current_paragraph) else "normal",
+                        "order": paragraph_id,
+                        "confidence": "high",
+                        "language": "ko"
+                    })
+
         return text_blocks
 
     async def _extract_tables(
@@ -287,38 +779,21 @@ class DocumentExtractionService:
         page: Any,
         page_num: int
     ) -> List[Dict[str, Any]]:
-        """표 추출"""
+        """표 추출 (페이지당 표 탐지 1회, 셀 데이터와 bbox를 같은 Table 객체에서 사용)"""
         tables = []
         
         try:
-            # pdfplumber로 표 추출
-            extracted_tables = page.extract_tables()
+            # pdfplumber로 표 탐지
+            table_objects = page.find_tables(self.table_settings)
             
-            for table_idx, table in enumerate(extracted_tables):
+            for table_idx, table_object in enumerate(table_objects):
+                table = table_object.extract()
                 if not table or len(table) == 0:
                     continue
 
-                # 표 영역 찾기
-                table_settings = {
-                    "vertical_strategy": "lines_strict",
-                    "horizontal_strategy": "lines_strict",
-                    "explicit_vertical_lines": [],
-                    "explicit_horizontal_lines": [],
-                    "snap_tolerance": 3,
-                    "join_tolerance": 3,
-                    "edge_tolerance": 3,
-                    "min_words_vertical": 3,
-                    "min_words_horizontal": 1,
-                }
-                
-                table_bbox = None
-                try:
-                    table_objects = page.find_tables(table_settings)
-                    if table_objects and table_idx < len(table_objects):
-                        bbox = table_objects[table_idx].bbox
-                        table_bbox = [bbox[0], bbox[1], bbox[2] - bbox[0], bbox[3] - bbox[1]]
-                except:
-                    pass
+                # 표 영역 [x, y, width, height]
+                bbox = table_object.bbox
+                table_bbox = [bbox[0], bbox[1], bbox[2] - bbox[0], bbox[3] - bbox[1]]
 
                 # 표 데이터 정제 (한글 인코딩 보장)
                 cleaned_table = []
@@ -345,8 +820,8 @@ class DocumentExtractionService:
                         "data": cleaned_table,
                         "rows": len(cleaned_table),
                         "columns": len(cleaned_table[0]) if cleaned_table else 0,
-                        "bbox": table_bbox or [0, 0, page.width, page.height],
-                        "confidence": "high" if table_bbox else "medium"
+                        "bbox": table_bbox,
+                        "confidence": "high"
                     })
 
         except Exception as e:
@@ -359,10 +834,28 @@ class DocumentExtractionService:
         page: Any,
         page_num: int,
         report_id: str,
-        file_path: str
+        file_path: str,
+        raster_cache: Optional[PageRasterCache] = None,
+        text_layer: Optional[Dict[str, Any]] = None,
+        image_index: Optional[ImageHashIndex] = None
     ) -> List[Dict[str, Any]]:
-        """이미지 추출 및 OCR"""
+        """
+        이미지 추출 및 OCR
+
+        포함된 이미지 XObject는 원본 스트림을 직접 저장하고, 직접 디코딩할 수 없는
+        이미지만 페이지를 1회 렌더링한 래스터에서 영역을 잘라 저장합니다.
+
+        text_layer가 주어지면 텍스트 레이어로 충분한 영역은 OCR을 건너뜁니다.
+        image_index에 이미 있는 이미지(로고, 배너 등 반복 이미지)는 다시 저장하거나
+        OCR하지 않고 기존 파일과 OCR 결과를 참조합니다 (duplicate_of).
+        """
         images = []
+        # OCR 대기 목록: (인덱스 항목, 영역 이미지, 결과를 받을 image_data 목록)
+        ocr_groups = []
+        if raster_cache is None:
+            raster_cache = PageRasterCache(file_path)
+        if image_index is None:
+            image_index = ImageHashIndex()
         
         try:
             # pdfplumber로 이미지 추출
@@ -378,72 +871,118 @@ class DocumentExtractionService:
                         img.get("height", 0)
                     ]
 
+                    region_bbox = (
+                        img.get("x0", 0),
+                        img.get("top", 0),
+                        img.get("x1", img.get("x0", 0) + img.get("width", 0)),
+                        img.get("bottom", img.get("top", 0) + img.get("height", 0)),
+                    )
+                    ocr_path = self._region_ocr_path(page, region_bbox, text_layer)
+
                     # 이미지 저장 경로 생성
                     storage_dir = Path(file_path).parent / "images"
                     storage_dir.mkdir(exist_ok=True)
-                    image_path = storage_dir / f"{report_id}_page{page_num}_img{img_idx}.png"
-
-                    # 이미지 추출 및 저장
-                    try:
-                        # PyPDF2로 이미지 추출 시도
-                        with open(file_path, 'rb') as f:
-                            pdf_reader = PyPDF2.PdfReader(f)
-                            if page_num <= len(pdf_reader.pages):
-                                page_obj = pdf_reader.pages[page_num - 1]
-                                if '/XObject' in page_obj.get('/Resources', {}):
-                                    xObject = page_obj['/Resources']['/XObject'].get_object()
-                                    for obj in xObject:
-                                        if xObject[obj]['/Subtype'] == '/Image':
-                                            # 이미지 추출 (간단한 방법)
-                                            pass
-                        
-                        # pdf2image로 페이지를 이미지로 변환 (대안)
-                        try:
-                            from pdf2image import convert_from_path
-                            if os.path.exists(file_path):
-                                page_images_pil = convert_from_path(
-                                    file_path,
-                                    first_page=page_num,
-                                    last_page=page_num,
-                                    dpi=300
+                    image_id = f"image_{page_num}_{img_idx}"
+                    image_stem = f"{report_id}_page{page_num}_img{img_idx}"
+
+                    # 포함된 이미지 스트림을 원본 그대로 사용 (JPEG는 재인코딩 없음)
+                    # 직접 디코딩할 수 없는 형식만 페이지 래스터에서 영역을 잘라 사용
+                    region = None
+                    source = "embedded"
+                    embedded = load_embedded_image(img)
+                    if embedded is None:
+                        source = "rendered"
+                        region = raster_cache.crop(page, page_num, region_bbox)
+
+                    # 반복 이미지 확인 (지문이 같은 이미지가 이미 저장되어 있으면 참조)
+                    # 다른 리포트의 이미지는 로고 크기이거나 내용 해시가 같을 때만 참조
+                    entry = None
+                    duplicate = False
+                    if IMAGE_DEDUPE_ENABLED:
+                        preview = embedded.preview() if embedded is not None else region
+                        if preview is not None:
+                            fingerprint = image_fingerprint(preview)
+                            content_hash = _lazy(
+                                embedded.content_hash if embedded is not None
+                                else lambda: image_content_hash(region)
+                            )
+                            shareable = max(bbox[2], bbox[3]) <= IMAGE_DEDUPE_SHARED_MAX_PT
+                            entry = image_index.find(fingerprint, str(report_id), content_hash, shareable)
+                            duplicate = entry is not None
+                            if not duplicate:
+                                extension = embedded.extension if embedded is not None else ".png"
+                                entry = image_index.add(
+                                    fingerprint,
+                                    f"{report_id}:{image_id}",
+                                    str(storage_dir / f"{image_stem}{extension}"),
+                                    None if shareable else content_hash()
                                 )
-                                if page_images_pil:
-                                    page_images_pil[0].save(str(image_path))
-                        except ImportError:
-                            # pdf2image가 없으면 이미지 영역만 저장
-                            pass
-                        except Exception as e:
-                            print(f"이미지 저장 오류: {e}")
-                    except Exception as e:
-                        print(f"이미지 추출 오류: {e}")
 
-                    # OCR 처리
-                    ocr_text = ""
-                    if self.ocr and os.path.exists(image_path):
+                    if duplicate:
+                        image_path = Path(entry["image_path"])
+                    else:
                         try:
-                            ocr_result = self.ocr.ocr(str(image_path), cls=True)
-                            if ocr_result and ocr_result[0]:
-                                ocr_text = "\n".join([
-                                    line[1][0] for line in ocr_result[0]
-                                ])
+                            if embedded is not None:
+                                image_path = storage_dir / f"{image_stem}{embedded.extension}"
+                                embedded.save(image_path)
+                            else:
+                                image_path = storage_dir / f"{image_stem}.png"
+                                if region is not None:
+                                    region.save(str(image_path))
                         except Exception as e:
-                            print(f"OCR 오류: {e}")
+                            image_path = storage_dir / f"{image_stem}.png"
+                            print(f"이미지 저장 오류: {e}")
 
-                    images.append({
-                        "id": f"image_{page_num}_{img_idx}",
+                    image_data = {
+                        "id": image_id,
                         "page_number": page_num,
                         "image_path": str(image_path),
                         "image_type": "image",
+                        "image_source": source,
                         "bbox": bbox,
                         "width": bbox[2],
                         "height": bbox[3],
-                        "ocr_text": ocr_text,
-                        "confidence": "high" if ocr_text else "medium"
-                    })
+                        "ocr_text": "",
+                        "ocr_path": ocr_path,
+                        "confidence": "medium"
+                    }
+                    if duplicate:
+                        image_data["duplicate_of"] = entry["image_ref"]
+                    images.append(image_data)
+
+                    if ocr_path != "ocr":
+                        continue
+                    # 이미 OCR한 이미지는 결과 재사용
+                    if entry is not None and entry["ocr_text"] is not None:
+                        image_data["ocr_text"] = entry["ocr_text"]
+                        image_data["confidence"] = "high" if entry["ocr_text"] else "medium"
+                        continue
+                    # 같은 페이지에서 이미 OCR 대기 중인 이미지는 결과만 공유
+                    pending = next(
+                        (group for group in ocr_groups if entry is not None and group[0] is entry), None
+                    )
+                    if pending is not None:
+                        pending[2].append(image_data)
+                        continue
+                    if embedded is not None:
+                        region = embedded.to_image()
+                    if region is not None:
+                        ocr_groups.append((entry, region, [image_data]))
 
                 except Exception as e:
                     print(f"이미지 추출 오류 (페이지 {page_num}, 이미지 {img_idx}): {e}")
 
+            # OCR 처리 (페이지의 이미지 영역을 한 번에 배치 처리)
+            if ocr_groups and self.ocr_pool.available:
+                with self._stage("ocr"):
+                    ocr_texts = self.ocr_pool.ocr_many([region for _, region, _ in ocr_groups])
+                for (entry, _, targets), ocr_text in zip(ocr_groups, ocr_texts):
+                    for image_data in targets:
+                        image_data["ocr_text"] = ocr_text
+                        image_data["confidence"] = "high" if ocr_text else "medium"
+                    if entry is not None:
+                        image_index.record_ocr(entry, ocr_text)
+
         except Exception as e:
             print(f"이미지 추출 오류 (페이지 {page_num}): {e}")
 
@@ -462,89 +1001,5 @@ class DocumentExtractionService:
         return [x0, top, x1 - x0, bottom - top]
     
     def _extract_numeric_data(self, text: str) -> List[Dict[str, Any]]:
-        """텍스트에서 수치 데이터 추출 (한글 컨텍스트 포함)"""
-        import re
-        
-        numeric_data = []
-        
-        # 패턴 1: 목표주가 (예: "목표주가 120,000원", "TP 120000원")
-        target_price_patterns = [
-            r'목표주가\s*[:：]?\s*([\d,]+)\s*원',
-            r'TP\s*[:：]?\s*([\d,]+)\s*원',
-            r'Target\s*Price\s*[:：]?\s*([\d,]+)',
-        ]
-        
-        for pattern in target_price_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                price_str = match.group(1).replace(",", "")
-                try:
-                    price = float(price_str)
-                    numeric_data.append({
-                        "type": "target_price",
-                        "value": price,
-                        "unit": "원",
-                        "context": match.group(0),
-                        "position": match.start()
-                    })
-                except ValueError:
-                    pass
-        
-        # 패턴 2: 실적 예측 (예: "매출액 1조 2,000억원", "영업이익 500억원")
-        performance_patterns = [
-            r'(매출액|영업이익|당기순이익|순이익)\s*[:：]?\s*([\d,]+)\s*(억|조|원|천억)',
-            r'(Revenue|Operating\s*Profit|Net\s*Profit)\s*[:：]?\s*([\d,]+)',
-        ]
-        
-        for pattern in performance_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                metric = match.group(1)
-                value_str = match.group(2).replace(",", "")
-                unit = match.group(3) if len(match.groups()) > 2 else ""
-                
-                try:
-                    value = float(value_str)
-                    # 단위 변환 (조, 억, 천억)
-                    if "조" in unit or "trillion" in unit.lower():
-                        value = value * 10000  # 조 -> 억
-                    elif "천억" in unit:
-                        value = value * 1000  # 천억 -> 억
-                    
-                    numeric_data.append({
-                        "type": "performance",
-                        "metric": metric,
-                        "value": value,
-                        "unit": unit or "억원",
-                        "context": match.group(0),
-                        "position": match.start()
-                    })
-                except ValueError:
-                    pass
-        
-        # 패턴 3: 주가 관련 (예: "현재주가 50,000원", "52주 최고가 60,000원")
-        stock_price_patterns = [
-            r'(현재주가|현재가|주가|52주\s*최고가|52주\s*최저가)\s*[:：]?\s*([\d,]+)\s*원',
-            r'(Current\s*Price|Stock\s*Price|52W\s*High|52W\s*Low)\s*[:：]?\s*([\d,]+)',
-        ]
-        
-        for pattern in stock_price_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                price_type = match.group(1)
-                price_str = match.group(2).replace(",", "")
-                try:
-                    price = float(price_str)
-                    numeric_data.append({
-                        "type": "stock_price",
-                        "price_type": price_type,
-                        "value": price,
-                        "unit": "원",
-                        "context": match.group(0),
-                        "position": match.start()
-                    })
-                except ValueError:
-                    pass
-        
-        return numeric_data
-
+        """텍스트에서 수치 데이터 추출 (한글 컨텍스트 포함, 단일 패스 스캐너)"""
+        return scan_numeric_data(text)
@@ -0,0 +1,126 @@
+"""
+Embedding cache - 텍스트 내용 해시 기반 임베딩 벡터 캐시
+"""
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_MAX_MB = int(os.getenv("EMBEDDING_CACHE_MAX_MB", "1024"))
+# 정리할 때 max_bytes의 이 비율까지 줄임 (저장할 때마다 정리하지 않도록)
+_EVICT_TARGET = 0.9
+
+
+def _default_cache_dir() -> Path:
+    """기본 캐시 디렉토리 (STORAGE_PATH 하위)"""
+    return Path(
+        os.getenv("EMBEDDING_CACHE_DIR")
+        or Path(os.getenv("STORAGE_PATH", "/app/storage")) / "embedding_cache"
+    )
+
+
+class EmbeddingCache:
+    """
+    임베딩 캐시
+
+    키는 임베딩 모델과 텍스트 내용의 SHA-256이며, 벡터는 float32 바이트로
+    항목당 파일 하나에 저장합니다(키 앞 2자리로 디렉토리 분산).
+    리포트마다 반복되는 머리글/고지문과 재파싱 시 같은 텍스트는 다시 임베딩하지 않습니다.
+
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다(LRU, 파일 mtime 기준).
+    항목이 많으므로 저장할 때마다 디렉토리를 훑지 않고, 처음 한 번 잰 크기에 저장한 크기를 더해
+    max_bytes를 넘었을 때만 정리합니다(max_bytes의 90%까지).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        enabled: bool = EMBEDDING_CACHE_ENABLED
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+        self.max_bytes = max_bytes if max_bytes is not None else EMBEDDING_CACHE_MAX_MB * 1024 * 1024
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    def key_for(self, text: str, model: str) -> str:
+        """모델 + 텍스트 내용 캐시 키"""
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        """캐시 조회 (없거나 손상되었으면 None)"""
+        if not self.enabled:
+            return None
+
+        path = self._path_for(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        if not data or len(data) % 4:
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            # LRU 순서 갱신
+            os.utime(path)
+        except OSError:
+            pass
+        return np.frombuffer(data, dtype=np.float32).tolist()
+
+    def put(self, key: str, vector: List[float]):
+        """캐시 저장 (임시 파일에 쓴 뒤 교체) 후 크기 제한 초과분 제거"""
+        if not self.enabled:
+            return
+
+        try:
+            path = self._path_for(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            data = np.asarray(vector, dtype=np.float32).tobytes()
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            self._added(len(data))
+        except Exception as e:
+            print(f"임베딩 캐시 저장 오류 ({key}): {e}")
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.f32"
+
+    def _added(self, size: int):
+        """저장한 크기 반영, max_bytes를 넘으면 정리"""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        """캐시 항목 (mtime, 크기, 경로)"""
+        entries = []
+        for path in self.cache_dir.glob("*/*.f32"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        """전체 크기가 max_bytes의 90% 이하가 될 때까지 오래된 항목 삭제 (잠금 안에서 호출)"""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes * _EVICT_TARGET:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
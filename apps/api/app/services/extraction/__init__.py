@@ -0,0 +1 @@
+# Document extraction helpers package
@@ -0,0 +1,146 @@
+"""
+Boilerplate - 페이지마다 반복되는 머리글/바닥글/고지문 탐지
+"""
+import math
+import os
+import re
+from typing import Any, Dict, List, Set, Tuple
+
+
+# 전체 페이지 중 이 비율 이상에 같은 위치로 나오는 줄은 반복 문구로 판단 (최소 2페이지)
+BOILERPLATE_MIN_PAGE_RATIO = float(os.getenv("BOILERPLATE_MIN_PAGE_RATIO", "0.5"))
+# 같은 위치로 볼 세로 좌표 구간 (단위: pt)
+BOILERPLATE_Y_BUCKET = 12
+
+_WHITESPACE = re.compile(r"\s+")
+_DIGITS = re.compile(r"\d+")
+
+
+def normalize_line(text: str) -> str:
+    """비교용 줄 정규화 (공백 정리, 숫자는 #로 치환해 쪽 번호/날짜 차이 무시)"""
+    return _DIGITS.sub("#", _WHITESPACE.sub(" ", text or "").strip())
+
+
+def _is_paragraph(block: Dict[str, Any]) -> bool:
+    return "_para_" in str(block.get("id", ""))
+
+
+def mark_boilerplate(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    추출 결과에서 반복 문구 탐지
+
+    문단(줄) 블록을 정규화한 내용과 세로 위치로 묶어, 여러 페이지에 반복되는 줄에
+    "boilerplate": True를 표시하고 result["boilerplate"]에 목록을 기록합니다.
+    """
+    texts = result.get("texts", [])
+    page_numbers = {block.get("page_number") for block in texts}
+    page_count = len(page_numbers)
+    min_pages = max(2, math.ceil(page_count * BOILERPLATE_MIN_PAGE_RATIO))
+
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for block in texts:
+        if not _is_paragraph(block):
+            continue
+        normalized = normalize_line(block.get("content", ""))
+        if not normalized:
+            continue
+        bbox = block.get("bbox") or [0, 0, 0, 0]
+        key = (normalized, round(bbox[1] / BOILERPLATE_Y_BUCKET))
+        groups.setdefault(key, []).append(block)
+
+    boilerplate = []
+    if page_count >= 2:
+        for (normalized, _), blocks in groups.items():
+            pages = sorted({block.get("page_number") for block in blocks})
+            if len(pages) < min_pages:
+                continue
+            for block in blocks:
+                block["boilerplate"] = True
+            boilerplate.append({
+                "text": normalized,
+                "content": blocks[0].get("content", ""),
+                "pages": pages,
+                "top": blocks[0].get("bbox", [0, 0])[1],
+            })
+
+    result["boilerplate"] = boilerplate
+    return boilerplate
+
+
+def strip_boilerplate_lines(text: str, boilerplate_lines: Set[str]) -> str:
+    """전체 텍스트에서 반복 문구 줄 제거"""
+    if not boilerplate_lines or not text:
+        return text
+    return "\n".join(
+        line for line in text.split("\n")
+        if normalize_line(line) not in boilerplate_lines
+    )
+
+
+def prompt_texts(result: Dict[str, Any]) -> List[str]:
+    """
+    LLM 프롬프트용 텍스트 블록 내용 목록
+
+    반복 문구로 표시된 블록은 제외하고, 페이지 전체 텍스트 블록에서는 해당 줄을 지웁니다.
+    mark_boilerplate를 거치지 않은 결과는 원래 내용 그대로 반환합니다.
+    """
+    boilerplate_lines = {entry["text"] for entry in result.get("boilerplate", [])}
+    contents = []
+    for block in result.get("texts", []):
+        if block.get("boilerplate"):
+            continue
+        content = block.get("content", "")
+        if boilerplate_lines and block.get("data_type") != "numeric":
+            content = strip_boilerplate_lines(content, boilerplate_lines)
+        if content.strip():
+            contents.append(content)
+    return contents
+
+
+def search_passages(result: Dict[str, Any], min_chars: int = 20) -> List[Tuple[Dict[str, Any], str]]:
+    """
+    검색 인덱스용 (텍스트 블록, 내용) 목록
+
+    prompt_texts와 같이 반복 문구를 제외하고, 수치 데이터 블록과 min_chars보다 짧은 내용은 뺍니다.
+    """
+    boilerplate_lines = {entry["text"] for entry in result.get("boilerplate", [])}
+    passages = []
+    for block in result.get("texts", []):
+        if block.get("boilerplate") or block.get("data_type") == "numeric":
+            continue
+        content = strip_boilerplate_lines(block.get("content", ""), boilerplate_lines).strip()
+        if len(content) >= min_chars:
+            passages.append((block, content))
+    return passages
+
+
+def page_texts(result: Dict[str, Any]) -> List[Tuple[int, str]]:
+    """
+    LLM 청크용 페이지별 본문 [(페이지 번호, 내용)]
+
+    페이지 전체 텍스트(OCR 페이지는 OCR 텍스트)에서 반복 문구 줄을 지워 한 번씩만 사용합니다.
+    전체 텍스트 블록이 없는 페이지는 문단 블록을 이어 붙입니다. 수치 데이터 블록은 제외합니다.
+    """
+    boilerplate_lines = {entry["text"] for entry in result.get("boilerplate", [])}
+    full_pages: Dict[int, List[str]] = {}
+    paragraph_pages: Dict[int, List[str]] = {}
+    for block in result.get("texts", []):
+        if block.get("boilerplate") or block.get("data_type") == "numeric":
+            continue
+        block_id = str(block.get("id", ""))
+        page_number = block.get("page_number") or 0
+        if block_id.endswith(("_full", "_ocr")):
+            target = full_pages
+        elif _is_paragraph(block):
+            target = paragraph_pages
+        else:
+            continue
+        content = strip_boilerplate_lines(block.get("content", ""), boilerplate_lines).strip()
+        if content:
+            target.setdefault(page_number, []).append(content)
+
+    pages = []
+    for page_number in sorted(set(full_pages) | set(paragraph_pages)):
+        contents = full_pages.get(page_number) or paragraph_pages.get(page_number, [])
+        pages.append((page_number, "\n".join(contents)))
+    return pages
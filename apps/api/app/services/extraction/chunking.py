@@ -0,0 +1,99 @@
+"""
+Chunking - LLM 토큰 예산 단위 문서 청크 분할
+
+긴 리포트를 앞부분만 잘라 보내지 않고, 페이지 순서대로 토큰 예산 이하의 청크로 나눠
+청크별로 추출한 뒤 합칠 수 있게 합니다 (map-reduce).
+"""
+import math
+import os
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+
+# 청크당 리포트 내용 토큰 수 (gpt-4 8k 컨텍스트에서 프롬프트 지시문과 응답 토큰을 뺀 값)
+LLM_CHUNK_TOKENS = int(os.getenv("LLM_CHUNK_TOKENS", "3000"))
+# 청크 추출 동시 LLM 요청 수
+LLM_CHUNK_CONCURRENCY = int(os.getenv("LLM_CHUNK_CONCURRENCY", "4"))
+
+TOKENIZER_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=1)
+def _encoding() -> Optional[Any]:
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.get_encoding(TOKENIZER_ENCODING)
+    except Exception as e:
+        print(f"토크나이저 로드 실패, 토큰 수 추정 사용: {e}")
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    토큰 수 (tiktoken이 없으면 추정)
+
+    추정치는 비ASCII 문자(한글 등) 1자당 1토큰, ASCII는 4자당 1토큰으로 넉넉하게 잡습니다.
+    """
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    non_ascii = sum(1 for char in text if not char.isascii())
+    return non_ascii + math.ceil((len(text) - non_ascii) / 4)
+
+
+def _split_to_budget(text: str, max_tokens: int) -> List[str]:
+    """예산보다 긴 텍스트를 줄 단위로 (한 줄이 넘으면 문자 단위로) 나눔"""
+    if count_tokens(text) <= max_tokens:
+        return [text]
+
+    pieces = []
+    for line in text.split("\n"):
+        tokens = count_tokens(line)
+        if tokens <= max_tokens:
+            pieces.append(line)
+            continue
+        # 한 줄이 예산보다 길면 토큰 비율로 문자 수를 정해 자름
+        step = max(1, int(len(line) * max_tokens / tokens))
+        while line:
+            head, line = line[:step], line[step:]
+            while count_tokens(head) > max_tokens and len(head) > 1:
+                line = head[len(head) // 2:] + line
+                head = head[:len(head) // 2]
+            pieces.append(head)
+    return pieces
+
+
+def chunk_texts(texts: List[str], max_tokens: int = LLM_CHUNK_TOKENS) -> List[str]:
+    """
+    텍스트 목록을 순서대로 max_tokens 이하의 청크로 묶음
+
+    텍스트 경계(페이지/줄)에서 나누며, 예산보다 긴 텍스트만 더 잘게 나눕니다.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    current_tokens = 0
+    for text in texts:
+        for piece in _split_to_budget(text, max_tokens):
+            tokens = count_tokens(piece) + 1  # 구분 줄바꿈
+            if current and current_tokens + tokens > max_tokens:
+                chunks.append("\n".join(current))
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += tokens
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def chunk_pages(pages: List[Tuple[int, str]], max_tokens: int = LLM_CHUNK_TOKENS) -> List[str]:
+    """페이지별 본문을 "[페이지 N]" 표시와 함께 청크로 묶음 (LLM이 페이지 번호를 알 수 있게)"""
+    return chunk_texts([f"[페이지 {page_number}]\n{text}" for page_number, text in pages], max_tokens)
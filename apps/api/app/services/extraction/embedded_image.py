@@ -0,0 +1,167 @@
+"""
+Embedded image - PDF 이미지 XObject 직접 추출
+"""
+import hashlib
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from PIL import Image
+
+from app.services.extraction.image_dedupe import image_content_hash
+
+try:
+    from pdfminer.pdftypes import resolve1
+except ImportError:
+    def resolve1(obj):
+        return obj
+
+
+# 스트림 그대로 파일로 쓸 수 있는 필터 -> 확장자
+PASSTHROUGH_FILTERS = {
+    "DCTDecode": ".jpg",
+    "JPXDecode": ".jp2",
+}
+
+# 색 공간 -> (PIL 모드, 채널 수)
+_COLOR_MODES = {
+    "DeviceRGB": ("RGB", 3),
+    "CalRGB": ("RGB", 3),
+    "DeviceGray": ("L", 1),
+    "CalGray": ("L", 1),
+    "DeviceCMYK": ("CMYK", 4),
+}
+_ICC_MODES = {1: ("L", 1), 3: ("RGB", 3), 4: ("CMYK", 4)}
+
+
+def _name(obj: Any) -> str:
+    """PSLiteral 등에서 이름 문자열 추출"""
+    obj = resolve1(obj)
+    name = getattr(obj, "name", obj)
+    if isinstance(name, bytes):
+        name = name.decode("latin-1")
+    return str(name)
+
+
+class EmbeddedImage:
+    """
+    PDF에 포함된 원본 이미지
+
+    JPEG/JPEG2000 스트림은 재인코딩 없이 그대로 저장하고,
+    Flate(또는 무압축) 샘플은 원본 해상도 그대로 PNG로 저장합니다.
+    """
+
+    def __init__(
+        self,
+        extension: str,
+        data: Optional[bytes] = None,
+        image: Optional[Image.Image] = None
+    ):
+        self.extension = extension
+        self._data = data
+        self._image = image
+
+    def save(self, path: Path):
+        """파일로 저장 (패스스루 스트림은 바이트 그대로 기록)"""
+        if self._data is not None:
+            Path(path).write_bytes(self._data)
+        else:
+            self._image.save(str(path))
+
+    def preview(self, size: tuple = (64, 64)) -> Optional[Image.Image]:
+        """
+        지문 계산용 축소 이미지
+
+        JPEG는 draft 모드로 축소 디코딩하므로 전체 해상도로 디코딩하지 않습니다.
+        """
+        if self._image is not None:
+            return self._image
+        try:
+            image = Image.open(BytesIO(self._data))
+            image.draft("RGB", size)
+            image.load()
+            return image
+        except Exception as e:
+            print(f"이미지 디코딩 오류: {e}")
+            return None
+
+    def content_hash(self) -> Optional[str]:
+        """
+        내용 해시 (sha256)
+
+        패스스루 스트림은 원본 바이트로 계산합니다 (바이트가 같으면 픽셀도 같으므로 전체 디코딩 불필요).
+        """
+        if self._data is not None:
+            return hashlib.sha256(self._data).hexdigest()
+        return image_content_hash(self._image)
+
+    def to_image(self) -> Optional[Image.Image]:
+        """OCR 등에 사용할 PIL 이미지"""
+        if self._image is None and self._data is not None:
+            try:
+                self._image = Image.open(BytesIO(self._data))
+                self._image.load()
+            except Exception as e:
+                print(f"이미지 디코딩 오류: {e}")
+                return None
+        return self._image
+
+
+def load_embedded_image(img: Dict[str, Any]) -> Optional[EmbeddedImage]:
+    """
+    pdfplumber 이미지 객체에서 원본 이미지 스트림 추출
+
+    지원하지 않는 형식(이미지 마스크, 8비트가 아닌 샘플, JBIG2/CCITT, 인덱스 색상 등)은
+    None을 반환하며, 이 경우 호출자는 페이지 래스터에서 영역을 잘라 사용합니다.
+    """
+    stream = img.get("stream")
+    if stream is None or img.get("imagemask"):
+        return None
+
+    try:
+        filters = [_name(f) for f, _ in stream.get_filters()]
+
+        # JPEG/JPEG2000 단일 필터: 원본 바이트 그대로 사용
+        if len(filters) == 1 and filters[0] in PASSTHROUGH_FILTERS:
+            return EmbeddedImage(PASSTHROUGH_FILTERS[filters[0]], data=stream.get_rawdata())
+
+        if any(f not in ("FlateDecode", "Fl") for f in filters):
+            return None
+
+        width, height = img.get("srcsize") or (0, 0)
+        if not width or not height or img.get("bits") != 8:
+            return None
+
+        mode = _color_mode(img.get("colorspace"))
+        if mode is None:
+            return None
+        pil_mode, channels = mode
+
+        samples = stream.get_data()
+        if len(samples) < width * height * channels:
+            return None
+
+        image = Image.frombytes(pil_mode, (int(width), int(height)), samples[:width * height * channels])
+        if pil_mode == "CMYK":
+            image = image.convert("RGB")
+        return EmbeddedImage(".png", image=image)
+    except Exception as e:
+        print(f"이미지 XObject 추출 오류: {e}")
+        return None
+
+
+def _color_mode(colorspace: Any) -> Optional[tuple]:
+    """이미지 색 공간 -> (PIL 모드, 채널 수)"""
+    colorspace = resolve1(colorspace)
+    if isinstance(colorspace, list) and colorspace:
+        family = _name(colorspace[0])
+        if family == "ICCBased" and len(colorspace) > 1:
+            icc_stream = resolve1(colorspace[1])
+            components = getattr(icc_stream, "attrs", {}).get("N")
+            return _ICC_MODES.get(resolve1(components))
+        if len(colorspace) == 1:
+            return _COLOR_MODES.get(family)
+        return None
+    if colorspace is None:
+        return None
+    return _COLOR_MODES.get(_name(colorspace))
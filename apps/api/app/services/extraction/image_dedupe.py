@@ -0,0 +1,200 @@
+"""
+Image dedupe - perceptual hash 기반 반복 이미지 중복 제거
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from PIL import Image
+
+
+IMAGE_DEDUPE_ENABLED = os.getenv("IMAGE_DEDUPE_ENABLED", "true").lower() == "true"
+# 같은 이미지로 볼 최대 해밍 거리 (64비트 dHash 기준)
+IMAGE_DEDUPE_MAX_DISTANCE = int(os.getenv("IMAGE_DEDUPE_MAX_DISTANCE", "4"))
+# 다른 리포트의 이미지를 지문만으로 재사용할 최대 크기 (페이지 배치 크기의 긴 변, pt)
+# 더 큰 이미지(차트 등)는 같은 양식이라도 숫자가 다를 수 있으므로 내용 해시가 같을 때만 재사용
+IMAGE_DEDUPE_SHARED_MAX_PT = float(os.getenv("IMAGE_DEDUPE_SHARED_MAX_PT", "96"))
+# 증권사별 인덱스에 유지할 최대 이미지 수 (오래된 항목부터 제거)
+IMAGE_INDEX_MAX_ENTRIES = int(os.getenv("IMAGE_INDEX_MAX_ENTRIES", "2000"))
+
+# 평균 밝기 / 가로세로 비율 허용 오차 (단색 배경, 늘어난 배너 오인 방지)
+_MAX_MEAN_DIFF = 16
+_MAX_ASPECT_DIFF = 0.1
+
+_save_lock = threading.Lock()
+
+
+def _default_index_dir() -> Path:
+    """기본 인덱스 디렉토리 (STORAGE_PATH 하위)"""
+    return Path(os.getenv("STORAGE_PATH", "/app/storage")) / "image_index"
+
+
+def image_fingerprint(image: Image.Image) -> Dict[str, Any]:
+    """
+    이미지 지문 (dHash 64비트, 평균 밝기, 가로세로 비율)
+
+    dHash는 9x8 흑백 축소 이미지에서 가로로 이웃한 픽셀의 밝기 차이 부호로 만듭니다.
+    재인코딩, 해상도 차이, 약간의 노이즈에도 같은 값에 가깝게 유지됩니다.
+    """
+    width, height = image.size
+    gray = image.convert("L")
+    small = gray.resize((9, 8), Image.BILINEAR)
+    pixels = small.tobytes()
+
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (1 if left > right else 0)
+
+    return {
+        "hash": value,
+        "mean": sum(pixels) / len(pixels),
+        "aspect": width / height if height else 0.0,
+    }
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def image_content_hash(image: Image.Image) -> str:
+    """디코딩한 픽셀 내용 해시 (sha256, 모드/크기 포함)"""
+    digest = hashlib.sha256(f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode("ascii"))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+class ImageHashIndex:
+    """
+    이미지 지문 인덱스
+
+    한 리포트 추출 동안 본 이미지를 기억하며, path가 주어지면 같은 증권사의
+    다른 리포트와 공유하도록 JSON 파일로 저장합니다. 항목은 저장된 이미지 경로,
+    내용 해시와 OCR 결과(아직 OCR하지 않았으면 None)를 가집니다.
+
+    지문(dHash)이 가까운 이미지는 같은 리포트 안에서만 재사용합니다. 다른 리포트의
+    이미지는 로고 크기 이하이거나 내용 해시가 같을 때만 재사용합니다 (같은 양식의
+    차트는 숫자가 달라도 지문이 가까움).
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_distance: int = IMAGE_DEDUPE_MAX_DISTANCE,
+        max_entries: int = IMAGE_INDEX_MAX_ENTRIES
+    ):
+        self.path = Path(path) if path else None
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self._entries: List[Dict[str, Any]] = self._load() if self.path else []
+        self._new_entries: List[Dict[str, Any]] = []
+
+    @classmethod
+    def for_scope(cls, scope: Optional[str], index_dir: Optional[Path] = None) -> "ImageHashIndex":
+        """증권사(scope)별 공유 인덱스, scope가 없으면 리포트 단위 메모리 인덱스"""
+        if not scope:
+            return cls()
+        name = hashlib.sha1(scope.encode("utf-8")).hexdigest()[:16]
+        return cls(path=Path(index_dir or _default_index_dir()) / f"{name}.json")
+
+    def find(
+        self,
+        fingerprint: Dict[str, Any],
+        owner: Optional[str] = None,
+        content_hash: Optional[Callable[[], Optional[str]]] = None,
+        shareable: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        지문이 가까운 기존 이미지 항목 (저장 파일이 없어진 항목은 무시)
+
+        owner(리포트)가 다른 항목은 shareable(로고 크기)이거나 content_hash()가 항목의
+        내용 해시와 같을 때만 반환합니다. content_hash는 필요할 때 한 번만 호출합니다.
+        """
+        candidates = []
+        for entry in self._entries:
+            if abs(entry["mean"] - fingerprint["mean"]) > _MAX_MEAN_DIFF:
+                continue
+            if abs(entry["aspect"] - fingerprint["aspect"]) > _MAX_ASPECT_DIFF * max(entry["aspect"], 1e-6):
+                continue
+            distance = hamming_distance(entry["hash"], fingerprint["hash"])
+            if distance <= self.max_distance:
+                candidates.append((distance, entry))
+
+        digest = None
+        for _, entry in sorted(candidates, key=lambda item: item[0]):
+            if not shareable and _entry_owner(entry) != owner:
+                if digest is None:
+                    digest = (content_hash() if content_hash else None) or ""
+                if not digest or entry.get("content_hash") != digest:
+                    continue
+            if not os.path.exists(entry["image_path"]):
+                self._entries.remove(entry)
+                continue
+            return entry
+        return None
+
+    def add(
+        self,
+        fingerprint: Dict[str, Any],
+        image_ref: str,
+        image_path: str,
+        content_hash: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """새 이미지 항목 등록 (image_ref는 "리포트:이미지 id", ocr_text는 OCR 후 호출자가 채움)"""
+        entry = {
+            "hash": fingerprint["hash"],
+            "mean": fingerprint["mean"],
+            "aspect": fingerprint["aspect"],
+            "image_ref": image_ref,
+            "image_path": image_path,
+            "content_hash": content_hash,
+            "ocr_text": None,
+        }
+        self._entries.append(entry)
+        self._new_entries.append(entry)
+        return entry
+
+    def record_ocr(self, entry: Dict[str, Any], ocr_text: str):
+        """항목의 OCR 결과 기록 (이후 같은 이미지는 OCR하지 않음)"""
+        entry["ocr_text"] = ocr_text
+        if entry not in self._new_entries:
+            self._new_entries.append(entry)
+
+    def save(self):
+        """공유 인덱스 파일에 새 항목 병합 저장 (다른 프로세스가 추가한 항목 유지)"""
+        if not self.path or not self._new_entries:
+            return
+
+        with _save_lock:
+            try:
+                merged = {entry["image_ref"]: entry for entry in self._load()}
+                for entry in self._new_entries:
+                    merged[entry["image_ref"]] = entry
+                entries = list(merged.values())[-self.max_entries:]
+
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+                os.replace(tmp_path, self.path)
+                self._new_entries = []
+            except Exception as e:
+                print(f"이미지 인덱스 저장 오류 ({self.path}): {e}")
+
+    def _load(self) -> List[Dict[str, Any]]:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            print(f"이미지 인덱스 읽기 오류 ({self.path}): {e}")
+            return []
+
+
+def _entry_owner(entry: Dict[str, Any]) -> str:
+    """항목을 저장한 리포트 (image_ref의 리포트 부분)"""
+    return entry["image_ref"].rsplit(":", 1)[0]
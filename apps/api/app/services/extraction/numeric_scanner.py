@@ -0,0 +1,171 @@
+"""
+Numeric scanner - 한국어 증권 리포트 수치 데이터 단일 패스 스캐너
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+
+# 숫자 (천 단위 콤마, 소수점 허용)
+_NUM = r"\d[\d,]*(?:\.\d+)?"
+
+
+def _en(word: str) -> str:
+    """영문 라벨 (첫 글자 대/소문자 분기 + 나머지 대소문자 무시)"""
+    head, tail = word[0], word[1:].replace(" ", r"\s*")
+    return f"{head.upper()}(?i:{tail})|{head.lower()}(?i:{tail})"
+
+
+# 라벨 정규화 키 -> 수치 종류
+LABEL_TYPES = {
+    "목표주가": "target_price",
+    "tp": "target_price",
+    "targetprice": "target_price",
+    "매출액": "performance",
+    "영업이익": "performance",
+    "당기순이익": "performance",
+    "순이익": "performance",
+    "revenue": "performance",
+    "operatingprofit": "performance",
+    "netprofit": "performance",
+    "현재주가": "stock_price",
+    "현재가": "stock_price",
+    "주가": "stock_price",
+    "52주최고가": "stock_price",
+    "52주최저가": "stock_price",
+    "currentprice": "stock_price",
+    "stockprice": "stock_price",
+    "52whigh": "stock_price",
+    "52wlow": "stock_price",
+}
+
+# 목표주가, 실적, 주가 라벨과 뒤따르는 금액을 하나의 정규식으로 결합 (텍스트를 한 번만 훑음).
+# 모든 라벨 대안이 고정 문자로 시작하므로 정규식 엔진이 첫 글자 집합으로
+# 후보 위치만 빠르게 건너뛸 수 있습니다 (전역 IGNORECASE를 쓰지 않는 이유).
+NUMERIC_PATTERN = re.compile(
+    "(?P<label>"
+    + "|".join([
+        "목표주가", "TP", _en("Target Price"),
+        "매출액", "영업이익", "당기순이익", "순이익",
+        _en("Revenue"), _en("Operating Profit"), _en("Net Profit"),
+        "현재주가", "현재가", "주가", r"52주\s*최고가", r"52주\s*최저가",
+        _en("Current Price"), _en("Stock Price"), r"52W\s*(?i:high|low)",
+    ])
+    + r")\s*[:：]?\s*"
+    + rf"(?P<value>(?:{_NUM}\s*조\s*)?{_NUM})\s*(?P<unit>만\s*원|(?:천억|억|조)(?:\s*원)?|원)?"
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 실적 금액 단위 -> 억원 배율
+_EOK_MULTIPLIERS = {
+    "조": 10000.0,
+    "천억": 1000.0,
+    "억": 1.0,
+    "원": 1e-8,
+}
+
+_JO_SPLIT = re.compile(r"\s*조\s*")
+
+
+def _to_float(value: str) -> Optional[float]:
+    try:
+        return float(value.replace(",", ""))
+    except ValueError:
+        return None
+
+
+def parse_price(value: str, unit: str = "원") -> Optional[float]:
+    """가격을 원 단위로 변환 ("12만원" -> 120000)"""
+    price = _to_float(value)
+    if price is None:
+        return None
+    if unit and unit.startswith("만"):
+        price *= 10000
+    return price
+
+
+def parse_eok_amount(value: str, unit: str) -> Optional[float]:
+    """
+    실적 금액을 억원 단위로 변환
+
+    "1조 2,000" + "억" -> 12000, "1" + "조" -> 10000, "500" + "천억" -> 500000
+    """
+    parts = _JO_SPLIT.split(value.strip())
+    if len(parts) == 2 and parts[1]:
+        jo = _to_float(parts[0])
+        rest = _to_float(parts[1])
+        if jo is None or rest is None:
+            return None
+        return jo * _EOK_MULTIPLIERS["조"] + rest * _EOK_MULTIPLIERS.get(unit, 1.0)
+
+    amount = _to_float(parts[0])
+    if amount is None:
+        return None
+    return amount * _EOK_MULTIPLIERS.get(unit, 1.0)
+
+
+def scan_numeric_data(text: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    텍스트에서 목표주가, 실적, 주가 수치를 한 번에 추출
+
+    가격은 원, 단위가 있는 실적 금액은 억원 단위로 정규화하며 결과는 텍스트 위치 순서입니다.
+    한국어 라벨은 단위(원/억/조 등)가 있어야 하며, 영문 라벨은 숫자만으로도 인식합니다
+    (단위가 없는 실적 금액은 규모를 알 수 없으므로 unit이 None).
+    """
+    if not text:
+        return []
+
+    numeric_data = []
+    for match in NUMERIC_PATTERN.finditer(text):
+        label = match.group("label")
+        value_str = match.group("value")
+        unit = _WHITESPACE.sub("", match.group("unit") or "")
+        eok_unit = unit[:-1] if len(unit) > 1 and unit.endswith("원") and unit != "만원" else unit
+        position = match.start()
+        is_english = label[0].isascii() and not label.startswith("52주")
+
+        # "TP"가 영단어 일부(OUTPUT 등)인 경우 제외
+        if label == "TP" and position > 0 and text[position - 1].isascii() and text[position - 1].isalpha():
+            continue
+
+        value_type = LABEL_TYPES.get(_WHITESPACE.sub("", label).lower())
+        if value_type is None:
+            continue
+
+        if value_type == "performance":
+            if is_english:
+                value = parse_eok_amount(value_str, eok_unit) if eok_unit else _to_float(value_str)
+            elif eok_unit in _EOK_MULTIPLIERS:
+                value = parse_eok_amount(value_str, eok_unit)
+            else:
+                continue
+            if value is None:
+                continue
+            numeric_data.append({
+                "type": "performance",
+                "metric": label,
+                "value": value,
+                "unit": "억원" if eok_unit else None,
+                "context": match.group(0).rstrip(),
+                "position": position
+            })
+            continue
+
+        # 가격 (목표주가, 주가)
+        if not is_english and unit not in ("원", "만원"):
+            continue
+        value = parse_price(value_str, unit if unit in ("원", "만원") else "원")
+        if value is None:
+            continue
+        data = {"type": value_type}
+        if value_type == "stock_price":
+            data["price_type"] = label
+        data.update({
+            "value": value,
+            "unit": "원",
+            "context": match.group(0).rstrip(),
+            "position": position
+        })
+        numeric_data.append(data)
+
+    return numeric_data
@@ -0,0 +1,136 @@
+"""
+OCR engine pool - 프로세스 전역 OCR 엔진 풀
+"""
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional, Sequence
+
+try:
+    from paddleocr import PaddleOCR
+    PADDLEOCR_AVAILABLE = True
+except ImportError:
+    PADDLEOCR_AVAILABLE = False
+
+
+# 프로세스당 OCR 엔진 수 (엔진 하나는 동시에 한 요청만 처리)
+OCR_POOL_SIZE = int(os.getenv("OCR_POOL_SIZE", "1"))
+
+
+def _create_paddle_engine() -> Any:
+    """PaddleOCR 엔진 생성 (한국어, 영어 지원)"""
+    return PaddleOCR(use_angle_cls=True, lang='korean')
+
+
+class OcrEnginePool:
+    """
+    OCR 엔진 풀
+
+    엔진은 처음 사용할 때(또는 preload 호출 시) 한 번만 생성되며,
+    프로세스 안의 모든 추출 서비스가 같은 엔진을 공유합니다.
+    """
+
+    def __init__(
+        self,
+        size: int = OCR_POOL_SIZE,
+        engine_factory: Optional[Callable[[], Any]] = None
+    ):
+        self.size = max(1, size)
+        self._engine_factory = engine_factory
+        if self._engine_factory is None and PADDLEOCR_AVAILABLE:
+            self._engine_factory = _create_paddle_engine
+        self._engines: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._failed = False
+
+    @property
+    def available(self) -> bool:
+        """OCR 사용 가능 여부 (엔진 로드 시도 포함)"""
+        self.preload()
+        return self._loaded and not self._failed
+
+    def preload(self):
+        """엔진 미리 로드 (워커 프로세스 시작 시 호출)"""
+        if self._loaded or self._failed:
+            return
+        with self._lock:
+            if self._loaded or self._failed:
+                return
+            if self._engine_factory is None:
+                self._failed = True
+                return
+            try:
+                for _ in range(self.size):
+                    self._engines.put(self._engine_factory())
+                self._loaded = True
+            except Exception as e:
+                print(f"OCR 엔진 초기화 실패: {e}")
+                self._failed = True
+
+    @contextmanager
+    def acquire(self):
+        """엔진 하나를 빌려 사용"""
+        engine = self._engines.get()
+        try:
+            yield engine
+        finally:
+            self._engines.put(engine)
+
+    def ocr(self, image: Any) -> str:
+        """단일 이미지 OCR (경로, PIL 이미지 또는 ndarray)"""
+        return self.ocr_many([image])[0]
+
+    def ocr_many(self, images: Sequence[Any]) -> List[str]:
+        """
+        여러 이미지를 한 번에 OCR
+
+        풀의 엔진 수만큼 동시에 처리하며 결과는 입력 순서대로 반환합니다.
+        OCR을 사용할 수 없거나 실패한 이미지는 빈 문자열입니다.
+        """
+        if not images:
+            return []
+        if not self.available:
+            return ["" for _ in images]
+
+        workers = min(self.size, len(images))
+        if workers == 1:
+            return [self._ocr_one(image) for image in images]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._ocr_one, images))
+
+    def _ocr_one(self, image: Any) -> str:
+        """엔진 하나로 이미지 OCR"""
+        try:
+            with self.acquire() as engine:
+                ocr_result = engine.ocr(self._prepare_image(image), cls=True)
+            if ocr_result and ocr_result[0]:
+                return "\n".join([line[1][0] for line in ocr_result[0]])
+        except Exception as e:
+            print(f"OCR 오류: {e}")
+        return ""
+
+    def _prepare_image(self, image: Any) -> Any:
+        """PIL 이미지를 PaddleOCR 입력 형식(BGR ndarray)으로 변환"""
+        if isinstance(image, os.PathLike):
+            return str(image)
+        if hasattr(image, "convert"):
+            import numpy as np
+            return np.asarray(image.convert("RGB"))[:, :, ::-1]
+        return image
+
+
+_ocr_engine_pool: Optional[OcrEnginePool] = None
+_ocr_engine_pool_lock = threading.Lock()
+
+
+def get_ocr_engine_pool() -> OcrEnginePool:
+    """프로세스 전역 OCR 엔진 풀 반환 (지연 생성)"""
+    global _ocr_engine_pool
+    if _ocr_engine_pool is None:
+        with _ocr_engine_pool_lock:
+            if _ocr_engine_pool is None:
+                _ocr_engine_pool = OcrEnginePool()
+    return _ocr_engine_pool
@@ -0,0 +1,94 @@
+"""
+Page raster cache - 추출 실행 단위 페이지 래스터 캐시
+"""
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+from PIL import Image
+
+
+class PageRasterCache:
+    """
+    페이지 래스터 캐시
+
+    하나의 추출 실행 안에서 각 페이지를 최대 1회만 렌더링하고,
+    이미지 영역은 렌더링된 래스터에서 bbox로 잘라 사용합니다.
+    메모리 사용량을 제한하기 위해 최근 max_pages개 페이지만 유지합니다.
+    """
+
+    def __init__(self, file_path: str, dpi: int = 300, max_pages: int = 2):
+        self.file_path = file_path
+        self.dpi = dpi
+        self.max_pages = max(1, max_pages)
+        self.render_count = 0
+        self._rasters: "OrderedDict[int, Optional[Image.Image]]" = OrderedDict()
+
+    @property
+    def scale(self) -> float:
+        """PDF 포인트(1/72인치) -> 픽셀 배율"""
+        return self.dpi / 72.0
+
+    def get(self, page: Any, page_num: int) -> Optional[Image.Image]:
+        """페이지 래스터 반환 (캐시에 없을 때만 렌더링)"""
+        if page_num in self._rasters:
+            self._rasters.move_to_end(page_num)
+            return self._rasters[page_num]
+
+        raster = self._render(page, page_num)
+        self.render_count += 1
+        self._rasters[page_num] = raster
+        while len(self._rasters) > self.max_pages:
+            self._rasters.popitem(last=False)
+        return raster
+
+    def crop(
+        self,
+        page: Any,
+        page_num: int,
+        bbox: Sequence[float]
+    ) -> Optional[Image.Image]:
+        """페이지 좌표 bbox (x0, top, x1, bottom) 영역을 래스터에서 잘라 반환"""
+        raster = self.get(page, page_num)
+        if raster is None:
+            return None
+
+        # pdfplumber 좌표는 페이지 bbox 기준이므로 원점 보정
+        origin_x, origin_y = (page.bbox[0], page.bbox[1]) if hasattr(page, "bbox") else (0, 0)
+        x0, top, x1, bottom = bbox
+        box = (
+            max(0, int((x0 - origin_x) * self.scale)),
+            max(0, int((top - origin_y) * self.scale)),
+            min(raster.width, int(round((x1 - origin_x) * self.scale))),
+            min(raster.height, int(round((bottom - origin_y) * self.scale))),
+        )
+        if box[2] <= box[0] or box[3] <= box[1]:
+            return None
+        return raster.crop(box)
+
+    def clear(self):
+        """캐시 비우기"""
+        self._rasters.clear()
+
+    def _render(self, page: Any, page_num: int) -> Optional[Image.Image]:
+        """페이지 렌더링 (pdfplumber/pypdfium2 우선, 실패 시 pdf2image)"""
+        try:
+            return page.to_image(resolution=self.dpi).original.convert("RGB")
+        except Exception as e:
+            print(f"페이지 렌더링 오류 (페이지 {page_num}): {e}")
+
+        try:
+            from pdf2image import convert_from_path
+            page_images = convert_from_path(
+                self.file_path,
+                first_page=page_num,
+                last_page=page_num,
+                dpi=self.dpi
+            )
+            if page_images:
+                return page_images[0]
+        except ImportError:
+            pass
+        except Exception as e:
+            print(f"페이지 렌더링 오류 (pdf2image, 페이지 {page_num}): {e}")
+
+        return None
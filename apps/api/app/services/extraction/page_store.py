@@ -0,0 +1,73 @@
+"""
+Page result store - 리포트별 페이지 추출 결과 저장소
+
+페이지 범위를 나눠 여러 워커에서 추출할 때 각 워커가 페이지 결과를 공유 스토리지
+(STORAGE_PATH)에 저장하고, 병합 단계에서 페이지 순서대로 다시 읽습니다.
+추출 설정(cache_version)별로 디렉토리를 나누므로 다른 설정의 결과가 섞이지 않습니다.
+"""
+import gzip
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+_PAGE_FILE = re.compile(r"^page_(\d+)\.json\.gz$")
+
+
+def _default_store_dir() -> Path:
+    """기본 저장 디렉토리 (STORAGE_PATH 하위)"""
+    return Path(
+        os.getenv("EXTRACTION_PAGE_STORE_DIR")
+        or Path(os.getenv("STORAGE_PATH", "/app/storage")) / "extraction_pages"
+    )
+
+
+class PageResultStore:
+    """리포트 하나의 페이지 결과 저장소 (페이지당 gzip JSON 파일 1개)"""
+
+    def __init__(self, report_id: Any, version: str, root: Optional[Path] = None):
+        self.report_dir = Path(root or _default_store_dir()) / str(report_id)
+        self.path = self.report_dir / version
+
+    def put(self, page_result: Dict[str, Any]):
+        """페이지 결과 저장 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 완성된 파일만 봄)"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        path = self._path_for(page_result["page_number"])
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        payload = json.dumps(page_result, ensure_ascii=False, separators=(",", ":"), default=str)
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=3) as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    def get(self, page_number: int) -> Optional[Dict[str, Any]]:
+        """페이지 결과 조회 (없거나 손상되었으면 None)"""
+        path = self._path_for(page_number)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"페이지 결과 읽기 오류 ({path}): {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def page_numbers(self) -> List[int]:
+        """저장된 페이지 번호 (오름차순)"""
+        if not self.path.exists():
+            return []
+        return sorted(
+            int(match.group(1))
+            for match in (_PAGE_FILE.match(path.name) for path in self.path.iterdir())
+            if match
+        )
+
+    def clear(self):
+        """리포트의 저장된 페이지 결과 전체 삭제 (모든 추출 설정)"""
+        shutil.rmtree(self.report_dir, ignore_errors=True)
+
+    def _path_for(self, page_number: int) -> Path:
+        return self.path / f"page_{page_number:05d}.json.gz"
@@ -0,0 +1,119 @@
+"""
+Pdfium text - pypdfium2 기반 고속 텍스트/단어 위치 추출
+"""
+from contextlib import nullcontext
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+
+# 같은 단어로 볼 최대 문자 간격 / 같은 줄로 볼 최대 세로 차이 (pdfplumber 기본값과 동일, 단위: pt)
+WORD_X_TOLERANCE = 3
+WORD_Y_TOLERANCE = 3
+
+
+class PdfiumTextPage:
+    """
+    pypdfium2로 읽은 페이지 텍스트
+
+    좌표는 pdfplumber와 같은 기준(원점 좌상단, top/bottom)으로 변환해 둡니다.
+    chars는 공백을 제외한 문자 목록입니다 (텍스트 레이어 품질 판정용).
+    """
+
+    def __init__(
+        self,
+        width: float,
+        height: float,
+        text: str,
+        words: List[Dict[str, Any]],
+        chars: List[str]
+    ):
+        self.width = width
+        self.height = height
+        self.text = text
+        self.words = words
+        self.chars = chars
+
+
+def iter_pdfium_pages(
+    file_path: str,
+    first_page: int = 1,
+    last_page: Optional[int] = None,
+    stage_timer: Any = None
+) -> Iterator[PdfiumTextPage]:
+    """페이지 범위(1부터 시작)를 순서대로 읽어 PdfiumTextPage 반환 (stage_timer: StageTimer)"""
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        last_page = min(last_page or len(pdf), len(pdf))
+        for page_index in range(first_page - 1, last_page):
+            page = pdf[page_index]
+            try:
+                yield read_pdfium_page(page, stage_timer)
+            finally:
+                page.close()
+    finally:
+        pdf.close()
+
+
+def read_pdfium_page(page: Any, stage_timer: Any = None) -> PdfiumTextPage:
+    """페이지 전체 텍스트와 단어 위치 추출 (문자 단위로 한 번만 순회)"""
+    def stage(name):
+        return stage_timer.measure(name) if stage_timer is not None else nullcontext()
+
+    width, height = page.get_width(), page.get_height()
+    textpage = page.get_textpage()
+    try:
+        with stage("text"):
+            text = textpage.get_text_range().replace("\r\n", "\n").replace("\r", "\n")
+        with stage("words"):
+            words, chars = _read_words(textpage.raw, textpage.count_chars(), height)
+    finally:
+        textpage.close()
+    return PdfiumTextPage(width, height, text, words, chars)
+
+
+def _read_words(raw_textpage: Any, char_count: int, page_height: float) -> tuple:
+    """문자 박스를 이어 붙여 단어 목록 생성 (공백, 줄바꿈, 간격 기준으로 분리)"""
+    words = []
+    chars = []
+    rect = pdfium_c.FS_RECTF()
+    current = None
+
+    for index in range(char_count):
+        code = pdfium_c.FPDFText_GetUnicode(raw_textpage, index)
+        # 유니코드로 매핑되지 않은 글리프는 대체 문자로 표시 (텍스트 레이어 품질 판정용)
+        char = chr(code) if code else "\ufffd"
+        if char.isspace():
+            current = None
+            continue
+        chars.append(char)
+
+        if not pdfium_c.FPDFText_GetLooseCharBox(raw_textpage, index, rect):
+            continue
+        x0, x1 = rect.left, rect.right
+        top, bottom = page_height - rect.top, page_height - rect.bottom
+
+        if (current is not None
+                and x0 - current["x1"] <= WORD_X_TOLERANCE
+                and abs(top - current["top"]) <= WORD_Y_TOLERANCE):
+            current["text"] += char
+            current["x1"] = max(current["x1"], x1)
+            current["bottom"] = max(current["bottom"], bottom)
+            continue
+
+        current = {
+            "text": char,
+            "x0": x0,
+            "x1": x1,
+            "top": top,
+            "bottom": bottom,
+            "size": round(pdfium_c.FPDFText_GetFontSize(raw_textpage, index), 2),
+        }
+        words.append(current)
+
+    return words, chars
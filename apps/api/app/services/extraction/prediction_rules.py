@@ -0,0 +1,293 @@
+"""
+Prediction rules - 수치 스캔 결과와 실적 전망 표로 만드는 규칙 기반 예측 후보
+
+LLM 없이 확정할 수 있는 예측(목표주가, 전망 표의 매출액/영업이익/순이익)을 만들고,
+규칙으로 확정하지 못한 예측 타입을 함께 반환합니다.
+호출하는 쪽은 확정하지 못한 타입만 LLM으로 추출합니다.
+"""
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+PREDICTION_TYPES = ["target_price", "revenue", "operating_profit", "net_profit"]
+
+# 행 라벨/수치 스캐너 metric 정규화 키 -> 예측 타입
+METRIC_TYPES = {
+    "매출액": "revenue",
+    "매출": "revenue",
+    "영업수익": "revenue",
+    "revenue": "revenue",
+    "revenues": "revenue",
+    "sales": "revenue",
+    "영업이익": "operating_profit",
+    "operatingprofit": "operating_profit",
+    "operatingincome": "operating_profit",
+    "순이익": "net_profit",
+    "당기순이익": "net_profit",
+    "지배주주순이익": "net_profit",
+    "지배순이익": "net_profit",
+    "netprofit": "net_profit",
+    "netincome": "net_profit",
+}
+
+# 금액 단위 -> 억원 배율
+_EOK_UNITS = {
+    "조원": 10000.0,
+    "십억원": 10.0,
+    "억원": 1.0,
+    "백만원": 0.01,
+    "천원": 0.00001,
+    "원": 0.00000001,
+    "tn": 10000.0,
+    "bn": 10.0,
+    "mn": 0.01,
+}
+
+_UNIT = re.compile(r"(조|십억|억|백만|천)?\s*원|(?:KRW|W|₩)\s*(tn|bn|mn)", re.IGNORECASE)
+_PARENTHESES = re.compile(r"\([^)]*\)")
+_WHITESPACE = re.compile(r"\s+")
+# 전망 기간 헤더: 2025F, 2025E, 25F, 2025(F), 1Q25F, 1Q2025E
+_ANNUAL_PERIOD = re.compile(r"^(?:20)?(\d{2})\s*\(?[FEP]\)?$", re.IGNORECASE)
+_QUARTER_PERIOD = re.compile(r"^([1-4])Q\s*(?:20)?(\d{2})\s*\(?[FEP]\)?$", re.IGNORECASE)
+# 본문 수치 앞의 전망 연도 (2025F 영업이익 ..., 2025년 영업이익 ... 전망)
+_TEXT_PERIOD = re.compile(r"(20\d{2})\s*(?:([FE])(?![A-Za-z])|년)")
+_FORECAST_WORDS = re.compile(r"전망|예상|추정|예측|목표")
+_CELL_NUMBER = re.compile(r"^(\()?(-)?(\d[\d,]*(?:\.\d+)?)\)?$")
+# 본문 줄 표의 기간 헤더 토큰 (실적 A 포함)
+_PERIOD_TOKEN = re.compile(r"^(?:[1-4]Q)?(?:20)?\d{2}\(?[AFEP]\)?$", re.IGNORECASE)
+
+# 같은 (타입, 기간) 값이 이 비율 이내로 같으면 일치 (단위 반올림 차이)
+_AGREEMENT_TOLERANCE = 0.005
+
+
+def normalize_label(label: str) -> str:
+    """행 라벨 정규화 (괄호 단위, 공백 제거, 소문자)"""
+    return _WHITESPACE.sub("", _PARENTHESES.sub("", label or "")).lower()
+
+
+def parse_unit(text: str) -> Optional[float]:
+    """셀 텍스트의 금액 단위 -> 억원 배율 ("(십억원)" -> 10, "KRW bn" -> 10)"""
+    match = _UNIT.search(text or "")
+    if not match:
+        return None
+    if match.group(2):
+        return _EOK_UNITS[match.group(2).lower()]
+    return _EOK_UNITS[f"{match.group(1) or ''}원"]
+
+
+def parse_period(cell: str) -> Optional[str]:
+    """전망 기간 헤더 ("2025F" -> "2025", "1Q25E" -> "2025Q1", 실적(A)은 None)"""
+    cell = _WHITESPACE.sub("", cell or "")
+    match = _ANNUAL_PERIOD.match(cell)
+    if match:
+        return f"20{match.group(1)}"
+    match = _QUARTER_PERIOD.match(cell)
+    if match:
+        return f"20{match.group(2)}Q{match.group(1)}"
+    return None
+
+
+def parse_cell_number(cell: str) -> Optional[float]:
+    """표 셀 숫자 ("1,234" -> 1234, "(56)" / "-56" -> -56, 그 외 None)"""
+    match = _CELL_NUMBER.match((cell or "").strip())
+    if not match:
+        return None
+    value = float(match.group(3).replace(",", ""))
+    return -value if match.group(1) or match.group(2) else value
+
+
+def _table_forecasts(table: Dict[str, Any]) -> List[Tuple[str, str, float]]:
+    """
+    실적 전망 표에서 (타입, 기간, 억원 값) 목록
+
+    기간 헤더 행(전망 열이 하나 이상)과 단위(헤더까지의 셀 또는 행 라벨)를 찾지 못하면
+    값을 만들지 않습니다.
+    """
+    rows = table.get("data") or []
+    header_index, periods = None, {}
+    for row_index, row in enumerate(rows):
+        periods = {col: parse_period(cell) for col, cell in enumerate(row)}
+        periods = {col: period for col, period in periods.items() if period}
+        if periods:
+            header_index = row_index
+            break
+
+    # 단위는 헤더 행에서 먼저 찾고, 없으면 헤더 위 행에서 찾음
+    table_unit = None
+    header_rows = rows[:(header_index or 0) + 1]
+    for row in header_rows[-1:] + header_rows[:-1]:
+        for cell in row:
+            table_unit = parse_unit(cell)
+            if table_unit:
+                break
+        if table_unit:
+            break
+
+    forecasts = []
+    for row in rows[(header_index + 1 if header_index is not None else 0):]:
+        if not row:
+            continue
+        prediction_type = METRIC_TYPES.get(normalize_label(row[0]))
+        if not prediction_type:
+            continue
+        unit = parse_unit(row[0]) or table_unit
+        if not periods or not unit:
+            continue
+        for col, period in periods.items():
+            value = parse_cell_number(row[col]) if col < len(row) else None
+            if value is not None:
+                forecasts.append((prediction_type, period, value * unit))
+    return forecasts
+
+
+def line_tables(page_text: str, page_number: Optional[int] = None, block_id: str = "") -> List[Dict[str, Any]]:
+    """
+    본문 텍스트의 줄 단위 표를 표 형식({"id", "page_number", "data"})으로 변환
+
+    텍스트 단계 추출에는 표가 없으므로 "(십억원) 2023A 2024F ..." 같은 기간 헤더 줄과
+    그 아래 "라벨 숫자 숫자 ..." 줄(헤더 열 수와 같은 경우)을 표 행으로 사용합니다.
+    헤더 바로 위 줄이 단위 표기("(단위: 십억원)")이면 첫 행으로 포함합니다.
+    """
+    tables = []
+    lines = (page_text or "").split("\n")
+    index = 0
+    while index < len(lines):
+        tokens = lines[index].split()
+        count = 0
+        while count < len(tokens) and _PERIOD_TOKEN.match(tokens[-1 - count]):
+            count += 1
+        if count < 2 or not any(parse_period(token) for token in tokens[len(tokens) - count:]):
+            index += 1
+            continue
+
+        data = [[lines[index - 1].strip()]] if index and "단위" in lines[index - 1] else []
+        data.append([" ".join(tokens[:len(tokens) - count])] + tokens[len(tokens) - count:])
+        index += 1
+        while index < len(lines):
+            row_tokens = lines[index].split()
+            if len(row_tokens) <= count or any(parse_cell_number(t) is None for t in row_tokens[-count:]):
+                break
+            data.append([" ".join(row_tokens[:-count])] + row_tokens[-count:])
+            index += 1
+        tables.append({"id": f"{block_id}_table_{len(tables)}", "page_number": page_number, "data": data})
+    return tables
+
+
+def _numeric_hits(result: Dict[str, Any]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """numeric 블록의 수치 목록 [(수치, numeric 블록)]"""
+    hits = []
+    for block in result.get("texts", []):
+        if block.get("data_type") != "numeric":
+            continue
+        try:
+            items = json.loads(block.get("content") or "[]")
+        except ValueError:
+            continue
+        hits.extend((item, block) for item in items if isinstance(item, dict))
+    return hits
+
+
+def _line_period(page_text: str, position: int) -> Optional[str]:
+    """본문 수치가 있는 줄의 전망 연도 (수치 앞의 마지막 연도, "년"은 전망 표현이 있을 때만)"""
+    if not page_text:
+        return None
+    line_start = page_text.rfind("\n", 0, position) + 1
+    line_end = page_text.find("\n", position)
+    line = page_text[line_start:line_end if line_end >= 0 else len(page_text)]
+    matches = list(_TEXT_PERIOD.finditer(page_text[line_start:position]))
+    if not matches:
+        return None
+    year, marker = matches[-1].groups()
+    if marker or _FORECAST_WORDS.search(line):
+        return year
+    return None
+
+
+def _agreement(values: List[float]) -> str:
+    first = values[0]
+    tolerance = max(abs(first) * _AGREEMENT_TOLERANCE, 0.01)
+    return "high" if all(abs(value - first) <= tolerance for value in values) else "medium"
+
+
+def extract_rule_predictions(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    규칙 기반 예측 후보
+
+    반환값:
+    - predictions: Prediction 저장 형식 dict 목록 (source/evidence는 extra_data용)
+    - unresolved: 규칙으로 확정하지 못한 예측 타입 (LLM으로 추출)
+
+    목표주가는 한 값이 나머지 언급을 합친 것보다 많을 때만 확정하고, 실적은 전망 표
+    (앞 페이지의 표 우선)와 전망 연도가 붙은 본문 수치를 억원 단위로 사용합니다.
+    본문 서술("영업이익은 5,000억원으로 예상")처럼 규칙이 놓치는 예측이 있으므로, 확정하지
+    못한 타입은 규칙 근거가 없어도 모두 LLM으로 넘깁니다. 타입의 규칙 예측이 모두 high일 때만
+    확정하며, medium(값이 엇갈림)이 하나라도 있으면 예측은 반환하되 LLM 타입으로 남깁니다.
+    """
+    forecasts: Dict[Tuple[str, str], List[Tuple[float, str]]] = {}
+
+    page_texts = {
+        block.get("page_number"): block
+        for block in result.get("texts", [])
+        if block.get("id", "").endswith(("_full", "_ocr"))
+    }
+    # 추출된 표(deep/full 단계) 우선, 그다음 본문 줄 표 (같은 값이면 일치로 판정)
+    tables = sorted(result.get("tables", []), key=lambda t: (t.get("page_number") or 0))
+    for page_number in sorted(page_texts, key=lambda p: p or 0):
+        block = page_texts[page_number]
+        tables.extend(line_tables(block.get("content") or "", page_number, block.get("id", "")))
+    for table in tables:
+        for prediction_type, period, value in _table_forecasts(table):
+            forecasts.setdefault((prediction_type, period), []).append((value, table.get("id")))
+
+    target_prices: Dict[float, List[str]] = {}
+    for hit, block in _numeric_hits(result):
+        if hit.get("type") == "target_price" and hit.get("value"):
+            target_prices.setdefault(float(hit["value"]), []).append(block.get("id"))
+        elif hit.get("type") == "performance":
+            prediction_type = METRIC_TYPES.get(normalize_label(hit.get("metric", "")))
+            # 단위가 없는 수치(영문 라벨 "Revenue 1,200")는 억원 환산을 알 수 없으므로 제외
+            if not prediction_type or hit.get("unit") != "억원":
+                continue
+            page_text = (page_texts.get(block.get("page_number")) or {}).get("content") or ""
+            period = _line_period(page_text, hit.get("position", 0))
+            if period:
+                forecasts.setdefault((prediction_type, period), []).append((float(hit["value"]), block.get("id")))
+
+    predictions = []
+    if target_prices:
+        ranked = sorted(target_prices.items(), key=lambda item: -len(item[1]))
+        value, sources = ranked[0]
+        others = sum(len(ids) for _, ids in ranked[1:])
+        if len(sources) > others:
+            predictions.append({
+                "prediction_type": "target_price",
+                "predicted_value": value,
+                "unit": "원",
+                "period": None,
+                "confidence": "high" if not others else "medium",
+                "source": "rule",
+                "evidence": list(dict.fromkeys(sources)),
+            })
+
+    for (prediction_type, period), entries in sorted(
+        forecasts.items(), key=lambda item: (PREDICTION_TYPES.index(item[0][0]), item[0][1])
+    ):
+        predictions.append({
+            "prediction_type": prediction_type,
+            "predicted_value": round(entries[0][0], 2),
+            "unit": "억원",
+            "period": period,
+            "confidence": _agreement([value for value, _ in entries]),
+            "source": "rule",
+            "evidence": list(dict.fromkeys(source for _, source in entries if source)),
+        })
+
+    confidences: Dict[str, List[str]] = {}
+    for prediction in predictions:
+        confidences.setdefault(prediction["prediction_type"], []).append(prediction["confidence"])
+    unresolved = [
+        t for t in PREDICTION_TYPES
+        if not confidences.get(t) or any(confidence != "high" for confidence in confidences[t])
+    ]
+    return {"predictions": predictions, "unresolved": unresolved}
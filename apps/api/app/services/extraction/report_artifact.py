@@ -0,0 +1,560 @@
+"""
+Report artifact - 리포트별 컬럼형 추출 결과 파일
+
+추출 결과(중첩 dict)를 리포트당 파일 하나로 저장합니다.
+
+    [0:8]    MAGIC
+    [8:16]   디렉토리 길이 (uint64, little endian)
+    [16:..]  디렉토리 JSON (컬럼 위치/형식, 페이지 메타데이터)
+    이후      8바이트 정렬된 컬럼 데이터
+
+- 수치 컬럼(페이지 번호, 문단 범위, bbox, 표 셀 값 등)은 무압축 배열로 저장해
+  mmap 위에서 복사 없이 numpy 배열로 읽습니다.
+- 텍스트는 페이지별로 zlib 압축하므로 필요한 페이지만 풀어 읽습니다.
+- 문단은 페이지 텍스트 안의 (시작, 끝) 문자 범위로만 저장합니다 (내용 중복 없음).
+"""
+import json
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+MAGIC = b"RPTART01"
+ARTIFACT_VERSION = 1
+ARTIFACT_SUFFIX = ".rpa"
+
+# 문단 플래그 비트
+FLAG_BOILERPLATE = 1
+FLAG_BOLD = 2
+
+# 페이지 텍스트 블록 종류 (문단/수치 데이터 외)
+BLOCK_KINDS = ["full", "ocr", "error"]
+# 수치 데이터 종류
+NUMERIC_KINDS = ["target_price", "performance", "stock_price"]
+
+_ALIGN = 8
+
+
+def artifact_dir() -> Path:
+    """아티팩트 디렉토리 (REPORT_ARTIFACT_DIR, 기본값 STORAGE_PATH/artifacts)"""
+    return Path(
+        os.getenv("REPORT_ARTIFACT_DIR")
+        or Path(os.getenv("STORAGE_PATH", "/app/storage")) / "artifacts"
+    )
+
+
+def artifact_path_for(report_id: Any) -> Path:
+    return artifact_dir() / f"{report_id}{ARTIFACT_SUFFIX}"
+
+
+def _block_kind(block: Dict[str, Any]) -> Optional[str]:
+    """텍스트 블록 종류 (para, numeric, full, ocr, error)"""
+    block_id = str(block.get("id", ""))
+    if block.get("data_type") == "numeric":
+        return "numeric"
+    if "_para_" in block_id:
+        return "para"
+    if block.get("source") == "ocr" or block_id.endswith("_ocr"):
+        return "ocr"
+    if block_id.endswith("_error"):
+        return "error"
+    return "full"
+
+
+def _to_float(value: Any) -> float:
+    """표 셀 숫자 값 (숫자가 아니면 NaN)"""
+    text = str(value or "").replace(",", "").strip()
+    if text.startswith("(") and text.endswith(")"):
+        text = "-" + text[1:-1]
+    try:
+        return float(text)
+    except ValueError:
+        return float("nan")
+
+
+class _PageTextBuilder:
+    """페이지 텍스트 버퍼 (블록 내용을 이어 붙이고 문자 범위를 반환)"""
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self.length = 0
+
+    def append(self, text: str) -> Tuple[int, int]:
+        if self.parts:
+            self.parts.append("\n")
+            self.length += 1
+        start = self.length
+        self.parts.append(text)
+        self.length += len(text)
+        return start, self.length
+
+    def text(self) -> str:
+        return "".join(self.parts)
+
+
+def _page_of(item: Dict[str, Any]) -> int:
+    """항목의 페이지 번호 (없으면 DB 저장과 같이 1페이지로 간주)"""
+    return item.get("page_number") or 1
+
+
+def write_report_artifact(path: Path, result: Dict[str, Any], report_id: Any = None) -> Path:
+    """추출 결과를 아티팩트 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    pages = sorted(
+        {page.get("page_number") for page in result.get("pages", []) if page.get("page_number") is not None}
+        | {_page_of(block) for block in result.get("texts", [])}
+        | {_page_of(table) for table in result.get("tables", [])}
+        | {_page_of(image) for image in result.get("images", [])}
+    )
+    page_index = {page: idx for idx, page in enumerate(pages)}
+    page_meta = {page.get("page_number"): page for page in result.get("pages", [])}
+
+    texts_by_page: Dict[int, List[Dict[str, Any]]] = {page: [] for page in pages}
+    for block in result.get("texts", []):
+        texts_by_page[_page_of(block)].append(block)
+
+    # 1. 페이지 텍스트와 문단/블록 범위
+    page_sizes = np.zeros((len(pages), 2), dtype=np.float32)
+    page_chunks = []
+    blocks, paragraphs, numerics = [], [], []
+    for page in pages:
+        builder = _PageTextBuilder()
+        page_blocks = texts_by_page[page]
+        full_text, full_start = "", 0
+        for block in page_blocks:
+            kind = _block_kind(block)
+            if kind in BLOCK_KINDS:
+                start, end = builder.append(block.get("content", ""))
+                blocks.append((page, start, end, BLOCK_KINDS.index(kind), block.get("bbox")))
+                # 전체/OCR 블록 bbox는 페이지 전체 크기
+                bbox = block.get("bbox") or [0, 0, 0, 0]
+                page_sizes[page_index[page]] = bbox[2:4]
+                if kind == "full":
+                    full_text = block.get("content", "")
+                    full_start = start
+
+        cursor = 0
+        for block in page_blocks:
+            kind = _block_kind(block)
+            if kind == "para":
+                content = block.get("content", "")
+                found = full_text.find(content, cursor) if content else -1
+                if found >= 0:
+                    span = (full_start + found, full_start + found + len(content))
+                    cursor = found + len(content)
+                else:
+                    span = builder.append(content)
+                paragraphs.append((page, span, block))
+            elif kind == "numeric":
+                try:
+                    hits = json.loads(block.get("content", "[]"))
+                except ValueError:
+                    hits = []
+                for hit in hits:
+                    position = hit.get("position", 0)
+                    context = hit.get("context", "")
+                    label = hit.get("metric") or hit.get("price_type") or ""
+                    if full_text[position:position + len(context)] != context:
+                        start, _ = builder.append(context)
+                        position = start - full_start
+                    numerics.append((page, position, len(context), len(label), hit))
+
+        page_chunks.append(zlib.compress(builder.text().encode("utf-8"), 6))
+
+    columns: Dict[str, Tuple[np.ndarray, str]] = {}
+
+    def add(name: str, array: Any, dtype: Any, shape: Tuple[int, ...] = None):
+        array = np.asarray(array, dtype=dtype)
+        if shape is not None:
+            array = array.reshape(shape)
+        columns[name] = (np.ascontiguousarray(array), "raw")
+
+    add("page_number", pages, np.int32)
+    columns["page_size"] = (page_sizes, "raw")
+    chunk_offsets = np.zeros(len(pages) + 1, dtype=np.int64)
+    chunk_offsets[1:] = np.cumsum([len(chunk) for chunk in page_chunks])
+    columns["page_text_offsets"] = (chunk_offsets, "raw")
+    columns["page_text"] = (np.frombuffer(b"".join(page_chunks), dtype=np.uint8), "zlib-pages")
+
+    add("block_page", [b[0] for b in blocks], np.int32)
+    add("block_span", [(b[1], b[2]) for b in blocks], np.int32, (len(blocks), 2))
+    add("block_kind", [b[3] for b in blocks], np.uint8)
+    add("block_bbox", [b[4] or [0, 0, 0, 0] for b in blocks], np.float32, (len(blocks), 4))
+
+    add("para_page", [p[0] for p in paragraphs], np.int32)
+    add("para_span", [p[1] for p in paragraphs], np.int32, (len(paragraphs), 2))
+    add("para_bbox", [p[2].get("bbox") or [0, 0, 0, 0] for p in paragraphs], np.float32, (len(paragraphs), 4))
+    add("para_order", [p[2].get("order", 0) for p in paragraphs], np.int32)
+    add("para_font_size", [
+        p[2].get("font_size") if p[2].get("font_size") is not None else np.nan for p in paragraphs
+    ], np.float32)
+    add("para_flags", [
+        (FLAG_BOILERPLATE if p[2].get("boilerplate") else 0)
+        | (FLAG_BOLD if p[2].get("font_style") == "bold" else 0)
+        for p in paragraphs
+    ], np.uint8)
+
+    add("numeric_page", [n[0] for n in numerics], np.int32)
+    add("numeric_span", [(n[1], n[1] + n[2]) for n in numerics], np.int32, (len(numerics), 2))
+    add("numeric_label_length", [n[3] for n in numerics], np.int32)
+    add("numeric_kind", [NUMERIC_KINDS.index(n[4].get("type")) for n in numerics], np.uint8)
+    add("numeric_value", [n[4].get("value") for n in numerics], np.float64)
+
+    # 2. 표 (셀 텍스트는 압축 문자열, 셀 숫자 값은 float64 배열)
+    # 페이지별 조회(searchsorted)를 위해 페이지 순으로 정렬 (보강 추출 결과는 뒤에 덧붙여짐)
+    tables = sorted(result.get("tables", []), key=_page_of)
+    cell_texts: List[str] = []
+    table_shapes, table_cell_start = [], []
+    for table in tables:
+        rows = table.get("data") or []
+        n_cols = max((len(row) for row in rows), default=0)
+        table_shapes.append((len(rows), n_cols))
+        table_cell_start.append(len(cell_texts))
+        for row in rows:
+            cells = [str(cell) if cell is not None else "" for cell in row]
+            cell_texts.extend(cells + [""] * (n_cols - len(cells)))
+    add("table_page", [_page_of(t) for t in tables], np.int32)
+    add("table_bbox", [t.get("bbox") or [0, 0, 0, 0] for t in tables], np.float32, (len(tables), 4))
+    add("table_shape", table_shapes, np.int32, (len(tables), 2))
+    add("table_cell_start", table_cell_start, np.int64)
+    add("cell_value", [_to_float(text) for text in cell_texts], np.float64)
+    cell_lengths = [len(text) for text in cell_texts]
+    cell_offsets = np.zeros(len(cell_texts) + 1, dtype=np.int64)
+    cell_offsets[1:] = np.cumsum(cell_lengths)
+    columns["cell_offsets"] = (cell_offsets, "raw")
+    columns["cell_text"] = (
+        np.frombuffer(zlib.compress("".join(cell_texts).encode("utf-8"), 6), dtype=np.uint8), "zlib"
+    )
+
+    # 3. 이미지 (위치는 배열, 경로/OCR 등 문자열은 압축 JSON)
+    images = sorted(result.get("images", []), key=_page_of)
+    add("image_page", [_page_of(i) for i in images], np.int32)
+    add("image_bbox", [i.get("bbox") or [0, 0, 0, 0] for i in images], np.float32, (len(images), 4))
+    image_meta = [
+        {key: value for key, value in image.items() if key not in ("page_number", "bbox")}
+        for image in images
+    ]
+    columns["image_meta"] = (
+        np.frombuffer(zlib.compress(json.dumps(image_meta, ensure_ascii=False).encode("utf-8"), 6), dtype=np.uint8),
+        "zlib"
+    )
+
+    directory = {
+        "version": ARTIFACT_VERSION,
+        "report_id": str(report_id) if report_id is not None else None,
+        "metadata": result.get("metadata", {}),
+        "boilerplate": result.get("boilerplate", []),
+        "pages": [
+            {key: page_meta.get(page, {}).get(key) for key in ("text_layer", "extraction_path")}
+            for page in pages
+        ],
+        "columns": {},
+    }
+
+    # 컬럼 위치는 디렉토리 길이에 따라 달라지므로 데이터 시작 위치를 고정 폭으로 계산
+    offset = 0
+    layout = []
+    for name, (array, codec) in columns.items():
+        data = array.tobytes()
+        layout.append((name, offset, data))
+        directory["columns"][name] = {
+            "offset": offset,
+            "length": len(data),
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "codec": codec,
+        }
+        offset += len(data) + (-len(data)) % _ALIGN
+
+    directory_bytes = json.dumps(directory, ensure_ascii=False, default=str).encode("utf-8")
+    header_length = 16 + len(directory_bytes)
+    data_start = header_length + (-header_length) % _ALIGN
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(directory_bytes)))
+        f.write(directory_bytes)
+        f.write(b"\0" * (data_start - header_length))
+        for _, column_offset, data in layout:
+            f.seek(data_start + column_offset)
+            f.write(data)
+        f.write(b"\0" * ((-f.tell()) % _ALIGN))
+    os.replace(tmp_path, path)
+    return path
+
+
+class ReportArtifact:
+    """
+    아티팩트 읽기 (mmap, 필요한 페이지/컬럼만 지연 로드)
+
+    with ReportArtifact(path) as artifact:
+        artifact.page(3)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if self._mmap[:8] != MAGIC:
+                raise ValueError(f"리포트 아티팩트 형식이 아닙니다: {self.path}")
+            (directory_length,) = struct.unpack("<Q", self._mmap[8:16])
+            self.directory = json.loads(self._mmap[16:16 + directory_length].decode("utf-8"))
+            header_length = 16 + directory_length
+            self._data_start = header_length + (-header_length) % _ALIGN
+        except Exception:
+            self._file.close()
+            raise
+        self._columns: Dict[str, np.ndarray] = {}
+        self._cell_text: Optional[str] = None
+        self._image_meta: Optional[List[Dict[str, Any]]] = None
+
+    def __enter__(self) -> "ReportArtifact":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        # mmap 위의 배열 참조를 먼저 해제
+        self._columns.clear()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # 호출자가 아직 배열을 참조 중이면 파일 닫힘 시 해제
+            pass
+        self._file.close()
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        return self.directory.get("metadata", {})
+
+    @property
+    def page_numbers(self) -> List[int]:
+        return self.column("page_number").tolist()
+
+    def column(self, name: str) -> np.ndarray:
+        """컬럼 배열 (무압축 컬럼은 mmap 위 읽기 전용 뷰)"""
+        if name not in self._columns:
+            info = self.directory["columns"][name]
+            start = self._data_start + info["offset"]
+            array = np.frombuffer(
+                self._mmap, dtype=np.dtype(info["dtype"]),
+                count=int(np.prod(info["shape"])), offset=start
+            )
+            self._columns[name] = array.reshape(info["shape"])
+        return self._columns[name]
+
+    def _page_position(self, page_number: int) -> int:
+        pages = self.column("page_number")
+        position = int(np.searchsorted(pages, page_number))
+        if position >= len(pages) or pages[position] != page_number:
+            raise KeyError(page_number)
+        return position
+
+    def _rows_for_page(self, column: str, page_number: int) -> range:
+        """페이지 번호 컬럼(정렬됨)에서 해당 페이지 행 범위"""
+        pages = self.column(column)
+        return range(
+            int(np.searchsorted(pages, page_number, side="left")),
+            int(np.searchsorted(pages, page_number, side="right"))
+        )
+
+    def page_buffer(self, page_number: int) -> str:
+        """페이지 텍스트 버퍼 (해당 페이지만 압축 해제)"""
+        position = self._page_position(page_number)
+        offsets = self.column("page_text_offsets")
+        blob = self.column("page_text")
+        return zlib.decompress(blob[offsets[position]:offsets[position + 1]].tobytes()).decode("utf-8")
+
+    def page_text(self, page_number: int) -> str:
+        """페이지 전체 텍스트 (텍스트 레이어, 없으면 OCR 텍스트)"""
+        buffer = self.page_buffer(page_number)
+        for block in self.text_blocks(page_number, buffer):
+            if block["kind"] in ("full", "ocr") and block["content"]:
+                return block["content"]
+        return ""
+
+    def text_blocks(self, page_number: int, buffer: Optional[str] = None) -> List[Dict[str, Any]]:
+        """페이지 텍스트 블록 (전체/OCR/오류)"""
+        buffer = self.page_buffer(page_number) if buffer is None else buffer
+        spans, kinds, bboxes = self.column("block_span"), self.column("block_kind"), self.column("block_bbox")
+        blocks = []
+        for row in self._rows_for_page("block_page", page_number):
+            kind = BLOCK_KINDS[kinds[row]]
+            start, end = spans[row]
+            blocks.append({
+                "kind": kind,
+                "span": (int(start), int(end)),
+                "content": buffer[start:end],
+                "page_number": page_number,
+                "bbox": bboxes[row].tolist(),
+            })
+        return blocks
+
+    def paragraphs(self, page_number: int, buffer: Optional[str] = None) -> List[Dict[str, Any]]:
+        """페이지 문단 목록"""
+        buffer = self.page_buffer(page_number) if buffer is None else buffer
+        spans, bboxes = self.column("para_span"), self.column("para_bbox")
+        orders, sizes, flags = self.column("para_order"), self.column("para_font_size"), self.column("para_flags")
+        paragraphs = []
+        for row in self._rows_for_page("para_page", page_number):
+            start, end = spans[row]
+            size = float(sizes[row])
+            paragraphs.append({
+                "id": f"text_{page_number}_para_{int(orders[row])}",
+                "content": buffer[start:end],
+                "page_number": page_number,
+                "bbox": bboxes[row].tolist(),
+                "font_size": None if np.isnan(size) else size,
+                "font_style": "bold" if flags[row] & FLAG_BOLD else "normal",
+                "order": int(orders[row]),
+                "boilerplate": bool(flags[row] & FLAG_BOILERPLATE),
+            })
+        return paragraphs
+
+    def numeric_data(self, page_number: int, buffer: Optional[str] = None) -> List[Dict[str, Any]]:
+        """페이지 수치 데이터 (목표주가, 실적, 주가)"""
+        buffer = self.page_buffer(page_number) if buffer is None else buffer
+        full_start = 0
+        for block in self.text_blocks(page_number, buffer):
+            if block["kind"] == "full":
+                full_start = block["span"][0]
+                break
+        spans, label_lengths = self.column("numeric_span"), self.column("numeric_label_length")
+        kinds, values = self.column("numeric_kind"), self.column("numeric_value")
+        hits = []
+        for row in self._rows_for_page("numeric_page", page_number):
+            start, end = (int(v) + full_start for v in spans[row])
+            context = buffer[start:end]
+            kind = NUMERIC_KINDS[kinds[row]]
+            hit = {"type": kind}
+            label = context[:int(label_lengths[row])]
+            if kind == "performance":
+                hit["metric"] = label
+            elif kind == "stock_price":
+                hit["price_type"] = label
+            hit.update({
+                "value": float(values[row]),
+                "unit": "억원" if kind == "performance" else "원",
+                "context": context,
+                "position": int(spans[row][0]),
+            })
+            hits.append(hit)
+        return hits
+
+    def tables(self, page_number: Optional[int] = None) -> List[Dict[str, Any]]:
+        """표 목록 (page_number가 없으면 전체)"""
+        table_pages = self.column("table_page")
+        rows = (
+            self._rows_for_page("table_page", page_number) if page_number is not None
+            else range(len(table_pages))
+        )
+        return [self.table(row) for row in rows]
+
+    def table(self, index: int) -> Dict[str, Any]:
+        """표 하나 (셀 텍스트와 숫자 값)"""
+        if self._cell_text is None:
+            self._cell_text = zlib.decompress(self.column("cell_text").tobytes()).decode("utf-8")
+        n_rows, n_cols = (int(v) for v in self.column("table_shape")[index])
+        first = int(self.column("table_cell_start")[index])
+        offsets = self.column("cell_offsets")
+        values = self.column("cell_value")[first:first + n_rows * n_cols]
+        cells = [
+            self._cell_text[offsets[first + i]:offsets[first + i + 1]]
+            for i in range(n_rows * n_cols)
+        ]
+        page_number = int(self.column("table_page")[index])
+        same_page = self._rows_for_page("table_page", page_number)
+        return {
+            "id": f"table_{page_number}_{index - same_page.start}",
+            "page_number": page_number,
+            "data": [cells[r * n_cols:(r + 1) * n_cols] for r in range(n_rows)],
+            "values": [
+                [None if np.isnan(v) else float(v) for v in values[r * n_cols:(r + 1) * n_cols]]
+                for r in range(n_rows)
+            ],
+            "rows": n_rows,
+            "columns": n_cols,
+            "bbox": self.column("table_bbox")[index].tolist(),
+        }
+
+    def images(self, page_number: Optional[int] = None) -> List[Dict[str, Any]]:
+        """이미지 목록 (page_number가 없으면 전체)"""
+        if self._image_meta is None:
+            self._image_meta = json.loads(zlib.decompress(self.column("image_meta").tobytes()).decode("utf-8"))
+        image_pages = self.column("image_page")
+        rows = (
+            self._rows_for_page("image_page", page_number) if page_number is not None
+            else range(len(image_pages))
+        )
+        bboxes = self.column("image_bbox")
+        return [
+            {**self._image_meta[row], "page_number": int(image_pages[row]), "bbox": bboxes[row].tolist()}
+            for row in rows
+        ]
+
+    def page(self, page_number: int) -> Dict[str, Any]:
+        """페이지 하나의 전체 내용 (텍스트, 문단, 수치 데이터, 표, 이미지)"""
+        position = self._page_position(page_number)
+        buffer = self.page_buffer(page_number)
+        width, height = self.column("page_size")[position].tolist()
+        meta = self.directory["pages"][position]
+        return {
+            "page_number": page_number,
+            "width": width,
+            "height": height,
+            "text_layer": meta.get("text_layer"),
+            "extraction_path": meta.get("extraction_path"),
+            "text": self.page_text(page_number),
+            "paragraphs": self.paragraphs(page_number, buffer),
+            "numeric_data": self.numeric_data(page_number, buffer),
+            "tables": self.tables(page_number),
+            "images": self.images(page_number),
+        }
+
+    def iter_pages(self) -> Iterator[Dict[str, Any]]:
+        for page_number in self.page_numbers:
+            yield self.page(page_number)
+
+    def to_result(self) -> Dict[str, Any]:
+        """추출 결과 dict로 복원 (보강 추출 결과 병합 등 전체가 필요한 경우)"""
+        result = {
+            "pages": [],
+            "texts": [],
+            "tables": self.tables(),
+            "images": self.images(),
+            "metadata": self.metadata,
+            "boilerplate": self.directory.get("boilerplate", []),
+        }
+        for position, page_number in enumerate(self.page_numbers):
+            buffer = self.page_buffer(page_number)
+            meta = self.directory["pages"][position]
+            result["pages"].append({"page_number": page_number, **meta})
+
+            for block in self.text_blocks(page_number, buffer):
+                kind = block.pop("kind")
+                block.pop("span")
+                block["id"] = f"text_{page_number}_{kind}"
+                if kind == "ocr":
+                    block["source"] = "ocr"
+                result["texts"].append(block)
+            numeric = self.numeric_data(page_number, buffer)
+            if numeric:
+                width, height = self.column("page_size")[position].tolist()
+                result["texts"].append({
+                    "id": f"numeric_{page_number}",
+                    "content": json.dumps(numeric, ensure_ascii=False),
+                    "page_number": page_number,
+                    "bbox": [0, 0, width, height],
+                    "data_type": "numeric",
+                })
+            result["texts"].extend(self.paragraphs(page_number, buffer))
+        return result
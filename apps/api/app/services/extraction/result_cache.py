@@ -0,0 +1,119 @@
+"""
+Extraction result cache - PDF 내용 해시 기반 추출 결과 캐시
+"""
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+EXTRACTION_CACHE_ENABLED = os.getenv("EXTRACTION_CACHE_ENABLED", "true").lower() == "true"
+EXTRACTION_CACHE_MAX_MB = int(os.getenv("EXTRACTION_CACHE_MAX_MB", "1024"))
+
+
+def _default_cache_dir() -> Path:
+    """기본 캐시 디렉토리 (STORAGE_PATH 하위)"""
+    return Path(
+        os.getenv("EXTRACTION_CACHE_DIR")
+        or Path(os.getenv("STORAGE_PATH", "/app/storage")) / "extraction_cache"
+    )
+
+
+def file_sha256(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """파일 바이트의 SHA-256"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ExtractionResultCache:
+    """
+    추출 결과 캐시
+
+    키는 파일 바이트의 SHA-256과 추출기 버전이며, 결과는 gzip 압축 JSON으로
+    디스크에 저장합니다. 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지
+    않은 항목부터 삭제합니다(LRU, 파일 mtime 기준).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_bytes: Optional[int] = None,
+        enabled: bool = EXTRACTION_CACHE_ENABLED
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else _default_cache_dir()
+        self.max_bytes = max_bytes if max_bytes is not None else EXTRACTION_CACHE_MAX_MB * 1024 * 1024
+        self.enabled = enabled
+        self._lock = threading.Lock()
+
+    def key_for(self, file_path: str, extractor_version: str) -> str:
+        """파일 내용 + 추출기 버전 캐시 키"""
+        return f"{file_sha256(file_path)}-v{extractor_version}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (없거나 손상되었으면 None)"""
+        if not self.enabled:
+            return None
+
+        path = self._path_for(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                result = json.load(f)
+            # LRU 순서 갱신
+            os.utime(path)
+            return result
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"추출 캐시 읽기 오류 ({key}): {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def has(self, key: str) -> bool:
+        """캐시 항목 존재 여부 (내용은 읽지 않음)"""
+        return self.enabled and self._path_for(key).exists()
+
+    def put(self, key: str, result: Dict[str, Any]):
+        """캐시 저장 후 크기 제한 초과분 제거"""
+        if not self.enabled:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path_for(key)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            payload = json.dumps(result, ensure_ascii=False, separators=(",", ":"), default=str)
+            with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            self._evict()
+        except Exception as e:
+            print(f"추출 캐시 저장 오류 ({key}): {e}")
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json.gz"
+
+    def _evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 항목 삭제"""
+        with self._lock:
+            entries = []
+            total = 0
+            for path in self.cache_dir.glob("*.json.gz"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
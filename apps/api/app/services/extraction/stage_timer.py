@@ -0,0 +1,55 @@
+"""
+Stage timer - 추출 단계별 소요 시간 측정 (벤치마크/프로파일링용)
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+
+# 측정 단계 (text: 전체 텍스트와 블록 구성, words: 단어 위치, images: 이미지 저장/래스터, ocr: OCR)
+EXTRACTION_STAGES = ("text", "words", "tables", "images", "ocr")
+
+
+class StageTimer:
+    """
+    단계별 누적 시간(초)과 호출 수
+
+    단계가 중첩되면 바깥 단계에서는 안쪽 단계 시간을 뺍니다
+    (예: images 안의 ocr). 따라서 단계별 시간의 합은 측정한 전체 시간과 같습니다.
+    한 추출 서비스(한 스레드) 안에서만 사용합니다.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._children: List[float] = []
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        self._children.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.add(stage, elapsed - self._children.pop())
+            if self._children:
+                self._children[-1] += elapsed
+
+    def add(self, stage: str, seconds: float, calls: int = 1):
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.calls[stage] = self.calls.get(stage, 0) + calls
+
+    def merge(self, timings: Dict[str, Any]):
+        """as_dict() 결과 병합 (프로세스 풀 워커에서 측정한 시간)"""
+        for stage, seconds in timings.get("seconds", {}).items():
+            self.add(stage, seconds, timings.get("calls", {}).get(stage, 0))
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"seconds": dict(self.seconds), "calls": dict(self.calls)}
+
+    def drain(self) -> Dict[str, Any]:
+        """측정값 반환 후 초기화"""
+        timings = self.as_dict()
+        self.seconds, self.calls = {}, {}
+        return timings
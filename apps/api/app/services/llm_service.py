@@ -1,13 +1,23 @@
 """
 LLM Service - 통합 LLM 서비스
 """
+import asyncio
 import os
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from openai import OpenAI
 import anthropic
 import google.generativeai as genai
 import httpx
 
+from app.services.embedding_cache import EmbeddingCache
+
+
+EMBEDDING_MODEL = "text-embedding-3-large"
+# 임베딩 요청당 최대 입력 수(OpenAI 한도 2048)와 문자 수, 동시 요청 수
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "256"))
+EMBEDDING_BATCH_MAX_CHARS = int(os.getenv("EMBEDDING_BATCH_MAX_CHARS", "100000"))
+EMBEDDING_CONCURRENCY = int(os.getenv("EMBEDDING_CONCURRENCY", "4"))
+
 
 class LLMService:
     """통합 LLM 서비스"""
@@ -42,6 +52,8 @@ class LLMService:
             except Exception as e:
                 print(f"Gemini 모델 초기화 실패: {str(e)}")
 
+        self.embedding_cache = EmbeddingCache()
+
     async def generate(
         self,
         llm_name: str,
@@ -70,7 +82,9 @@ class LLMService:
                 "환경 변수를 설정하거나 .env 파일에 OPENAI_API_KEY를 추가해주세요."
             )
         
-        response = self.openai_client.chat.completions.create(
+        # 동기 클라이언트는 스레드에서 호출 (동시에 보낸 청크 요청이 이벤트 루프를 막지 않도록)
+        response = await asyncio.to_thread(
+            self.openai_client.chat.completions.create,
             model=options.get("model", "gpt-4"),
             messages=[{"role": "user", "content": prompt}],
             max_tokens=options.get("max_tokens", 4000),
@@ -171,17 +185,77 @@ class LLMService:
 
     async def embed(self, text: str, model: str = "openai") -> list:
         """텍스트 임베딩"""
-        if model == "openai":
+        return (await self.embed_many([text], model))[0]
+
+    async def embed_many(
+        self,
+        texts: List[str],
+        model: str = "openai",
+        batch_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> List[list]:
+        """
+        여러 텍스트 임베딩 (입력 순서대로 반환)
+
+        같은 내용은 한 번만 요청하고 캐시(모델 + 내용 해시)에 있는 벡터는 재사용합니다.
+        나머지는 batch_size개(EMBEDDING_BATCH_SIZE)와 EMBEDDING_BATCH_MAX_CHARS 문자 이하로
+        묶어 최대 concurrency개(EMBEDDING_CONCURRENCY) 요청을 동시에 보냅니다.
+        """
+        if model != "openai":
+            raise ValueError(f"Embedding not supported for {model}")
+        if not texts:
+            return []
+
+        batch_size = max(1, min(batch_size or EMBEDDING_BATCH_SIZE, 2048))
+        concurrency = max(1, concurrency or EMBEDDING_CONCURRENCY)
+
+        # 중복 제거 후 캐시 조회
+        vectors: Dict[str, list] = {}
+        keys = [self.embedding_cache.key_for(text, EMBEDDING_MODEL) for text in texts]
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key in vectors or key in missing:
+                continue
+            cached = self.embedding_cache.get(key)
+            if cached is not None:
+                vectors[key] = cached
+            else:
+                missing[key] = text
+
+        if missing:
             if not self.openai_api_key or not self.openai_client:
                 raise ValueError(
                     "OPENAI_API_KEY 환경 변수가 설정되지 않았습니다. "
                     "환경 변수를 설정하거나 .env 파일에 OPENAI_API_KEY를 추가해주세요."
                 )
-            response = self.openai_client.embeddings.create(
-                model="text-embedding-3-large",
-                input=text,
-            )
-            return response.data[0].embedding
-        else:
-            raise ValueError(f"Embedding not supported for {model}")
+
+            batches: List[List[str]] = []
+            batch: List[str] = []
+            batch_chars = 0
+            for key, text in missing.items():
+                if batch and (len(batch) >= batch_size or batch_chars + len(text) > EMBEDDING_BATCH_MAX_CHARS):
+                    batches.append(batch)
+                    batch, batch_chars = [], 0
+                batch.append(key)
+                batch_chars += len(text)
+            batches.append(batch)
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def embed_batch(batch_keys: List[str]):
+                async with semaphore:
+                    # OpenAI 클라이언트는 동기 방식이므로 스레드에서 실행
+                    response = await asyncio.to_thread(
+                        self.openai_client.embeddings.create,
+                        model=EMBEDDING_MODEL,
+                        input=[missing[key] for key in batch_keys],
+                    )
+                for item in response.data:
+                    key = batch_keys[item.index]
+                    vectors[key] = item.embedding
+                    self.embedding_cache.put(key, item.embedding)
+
+            await asyncio.gather(*(embed_batch(batch_keys) for batch_keys in batches))
+
+        return [vectors[key] for key in keys]
 
@@ -9,10 +9,13 @@ import os
 import aiofiles
 from pathlib import Path
 
-from app.models.report import Report
+from app.models.report import Report, ExtractedText
 from app.models.enums import ReportStatus
 from app.schemas.report import ReportUploadResponse, ExtractionStatusResponse
 from app.services.document_extraction_service import DocumentExtractionService
+from app.services.extraction.report_artifact import ReportArtifact, artifact_path_for
+from app.services.llm_service import LLMService
+from app.services.vector_index import VectorIndex
 from app.database import SessionLocal
 from fastapi import UploadFile, BackgroundTasks
 import asyncio
@@ -34,9 +37,10 @@ class ReportService:
         file: UploadFile,
         analyst_id: Optional[UUID] = None,
         company_id: Optional[UUID] = None,
-        background_tasks: Optional[BackgroundTasks] = None
+        background_tasks: Optional[BackgroundTasks] = None,
+        extraction_backend: Optional[str] = None
     ) -> ReportUploadResponse:
-        """리포트 업로드 및 추출 시작"""
+        """리포트 업로드 및 추출 시작 (extraction_backend: 이 리포트의 추출 백엔드)"""
         # 정합성 검증
         if analyst_id:
             from app.models.analyst import Analyst
@@ -100,13 +104,14 @@ class ReportService:
             background_tasks.add_task(
                 self._parse_report_background,
                 str(report_id),
-                str(file_path)
+                str(file_path),
+                extraction_backend
             )
         else:
             # BackgroundTasks가 없으면 Celery 시도, 실패 시 동기 실행
             try:
                 from app.tasks.report_tasks import parse_report_task
-                parse_report_task.delay(str(report_id), str(file_path))
+                parse_report_task.delay(str(report_id), str(file_path), extraction_backend)
             except Exception as e:
                 logger.warning(f"Celery 작업 시작 실패, 동기 실행으로 전환: {str(e)}")
                 # 동기적으로 파싱 실행
@@ -120,7 +125,9 @@ class ReportService:
                         loop = asyncio.new_event_loop()
                         asyncio.set_event_loop(loop)
                         try:
-                            loop.run_until_complete(agent.parse_report(report_id, str(file_path)))
+                            loop.run_until_complete(
+                                agent.parse_report(report_id, str(file_path), extraction_backend)
+                            )
                         finally:
                             loop.close()
                     finally:
@@ -136,7 +143,12 @@ class ReportService:
             estimated_completion_time=datetime.utcnow() + timedelta(minutes=10)
         )
     
-    def _parse_report_background(self, report_id_str: str, file_path: str):
+    def _parse_report_background(
+        self,
+        report_id_str: str,
+        file_path: str,
+        extraction_backend: Optional[str] = None
+    ):
         """BackgroundTasks에서 실행되는 리포트 파싱 함수"""
         from app.services.ai_agents.report_parsing_agent import ReportParsingAgent
         from uuid import UUID
@@ -151,7 +163,7 @@ class ReportService:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             try:
-                loop.run_until_complete(agent.parse_report(report_id, file_path))
+                loop.run_until_complete(agent.parse_report(report_id, file_path, extraction_backend))
             finally:
                 loop.close()
         except Exception as e:
@@ -173,13 +185,20 @@ class ReportService:
         if not report:
             return None
 
+        # 추출 진행률 (ReportParsingAgent가 페이지 단위로 갱신)
+        total_pages = report.total_pages or 0
+        pages_processed = report.pages_processed or 0
+        percentage = round(pages_processed / total_pages * 100) if total_pages else 0
+
         return ExtractionStatusResponse(
             report_id=report_id,
             status=report.status or ReportStatus.PROCESSING.value,
             progress={
-                "pages_processed": 0,
-                "total_pages": 0,
-                "percentage": 0
+                "pages_processed": pages_processed,
+                "total_pages": total_pages,
+                "percentage": percentage,
+                # text: 텍스트만 추출됨 (표/이미지/OCR 보강 대기), full: 전체 추출 완료
+                "extraction_tier": report.extraction_tier
             },
             estimated_completion_time=None
         )
@@ -268,6 +287,82 @@ class ReportService:
             for p in predictions
         ]
     
+    def get_report_page(self, report_id: UUID, page_number: int) -> Optional[Dict[str, Any]]:
+        """
+        추출된 페이지 내용 조회 (텍스트, 문단, 수치 데이터, 표, 이미지)
+
+        추출 아티팩트에서 해당 페이지만 읽습니다. 리포트/아티팩트/페이지가 없으면 None.
+        """
+        artifact_path = artifact_path_for(report_id)
+        if not artifact_path.exists():
+            return None
+        with ReportArtifact(artifact_path) as artifact:
+            try:
+                return artifact.page(page_number)
+            except KeyError:
+                return None
+
+    def get_report_tables(self, report_id: UUID, page_number: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """추출된 표 조회 (page_number가 없으면 전체), 아티팩트가 없으면 None"""
+        artifact_path = artifact_path_for(report_id)
+        if not artifact_path.exists():
+            return None
+        with ReportArtifact(artifact_path) as artifact:
+            return artifact.tables(page_number)
+
+    async def search_passages(
+        self,
+        query: str,
+        limit: int = 10,
+        report_ids: Optional[List[UUID]] = None,
+        sort: str = "relevance"
+    ) -> List[Dict[str, Any]]:
+        """
+        리포트 문단 의미 검색
+
+        질의를 임베딩해 검색 인덱스에서 가까운 문단을 찾고 리포트/애널리스트/기업 정보를 붙입니다.
+        sort="date"이면 찾은 문단을 발간일 오름차순으로 정렬합니다 (누가 먼저 언급했는지 확인용).
+        """
+        from app.models.analyst import Analyst
+        from app.models.company import Company
+
+        vector = await LLMService().embed(query)
+        # 재파싱으로 지워진 문단이 섞일 수 있어 여유 있게 조회
+        hits = VectorIndex().search(vector, limit=limit * 2, report_ids=report_ids)
+        if not hits:
+            return []
+
+        scores = {hit["text_id"]: hit["score"] for hit in hits}
+        rows = self.db.query(ExtractedText, Report, Analyst.name, Company.name_kr).join(
+            Report, Report.id == ExtractedText.report_id
+        ).outerjoin(
+            Analyst, Analyst.id == Report.analyst_id
+        ).outerjoin(
+            Company, Company.id == Report.company_id
+        ).filter(
+            ExtractedText.id.in_([UUID(text_id) for text_id in scores])
+        ).all()
+
+        results = [
+            {
+                "text_id": str(text.id),
+                "report_id": str(report.id),
+                "report_title": report.title,
+                "publication_date": report.publication_date,
+                "analyst_name": analyst_name,
+                "company_name": company_name,
+                "page_number": text.page_number,
+                "content": text.content,
+                "score": round(scores[str(text.id)], 4),
+            }
+            for text, report, analyst_name, company_name in rows
+        ]
+        results.sort(key=lambda r: -r["score"])
+        results = results[:limit]
+        if sort == "date":
+            results.sort(key=lambda r: (r["publication_date"], -r["score"]))
+        return results
+
     def get_reports_grouped_by_period(
         self,
         period: Optional[str] = None,
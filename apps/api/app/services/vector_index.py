@@ -0,0 +1,444 @@
+"""
+Vector index - 리포트 문단 임베딩 검색 인덱스
+
+리포트마다 세그먼트(디렉토리) 하나를 추가하는 방식으로 증분 갱신합니다. 세그먼트는
+한 번 쓰면 바뀌지 않으며 다음 배열(.npy, 메모리 매핑으로 읽음)로 구성됩니다.
+
+- vectors_f16: 정규화한 벡터 (float16, 후보 재채점용)
+- codes_i8, scales: 행별 스케일로 양자화한 벡터 (int8, 1차 채점용)
+- lists: IVF 리스트 번호 (세그먼트를 만들 때의 centroid 기준, 없으면 -1)
+- text_ids, report_ids: ExtractedText id와 리포트 id
+
+검색은 질의와 가까운 centroid nprobe개의 리스트만 int8로 채점한 뒤 상위 후보를
+float16으로 다시 채점합니다.
+
+세그먼트 병합은 add_report가 아니라 백그라운드 작업(compact_vector_index)에서 합니다.
+크기가 비슷한(같은 단계의) 세그먼트가 VECTOR_INDEX_MERGE_FACTOR개 모이면 그것만 합치므로
+(삭제 표시된 벡터 제외) 벡터 하나가 다시 쓰이는 횟수는 세그먼트 단계 수 정도입니다.
+벡터 수가 학습 당시의 두 배 이상이면 전체를 합치며 centroid(k-means)를 다시 학습합니다.
+무거운 읽기/학습/쓰기는 인덱스 잠금 밖에서 하고, 잠금 안에서는 manifest만 교체합니다.
+"""
+import fcntl
+import json
+import math
+import os
+import shutil
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+VECTOR_INDEX_NPROBE = int(os.getenv("VECTOR_INDEX_NPROBE", "8"))
+# 같은 단계(벡터 수가 이 배수 범위 안)의 세그먼트가 이만큼 모이면 병합
+VECTOR_INDEX_MERGE_FACTOR = max(2, int(os.getenv("VECTOR_INDEX_MERGE_FACTOR", "4")))
+# centroid 학습 최소 벡터 수 (그 전에는 전체 int8 채점)
+VECTOR_INDEX_MIN_TRAIN = int(os.getenv("VECTOR_INDEX_MIN_TRAIN", "4096"))
+# float16으로 다시 채점할 후보 수 (요청 결과 수의 배수)
+VECTOR_INDEX_RERANK_FACTOR = 10
+
+_KMEANS_SAMPLE = 50000
+_KMEANS_ITERATIONS = 10
+_ID_DTYPE = "S36"
+
+
+def _default_index_dir() -> Path:
+    """기본 인덱스 디렉토리 (STORAGE_PATH 하위)"""
+    return Path(
+        os.getenv("VECTOR_INDEX_DIR")
+        or Path(os.getenv("STORAGE_PATH", "/app/storage")) / "vector_index"
+    )
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _quantize(vectors: np.ndarray):
+    """행별 스케일 int8 양자화"""
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales = np.maximum(scales, 1e-12).astype(np.float32)
+    codes = np.round(vectors / scales[:, None]).astype(np.int8)
+    return codes, scales
+
+
+def _train_centroids(vectors: np.ndarray, seed: int = 0) -> np.ndarray:
+    """구면 k-means (리스트 수는 벡터 수의 제곱근)"""
+    rng = np.random.default_rng(seed)
+    if len(vectors) > _KMEANS_SAMPLE:
+        vectors = vectors[rng.choice(len(vectors), _KMEANS_SAMPLE, replace=False)]
+    vectors = vectors.astype(np.float32)
+    n_lists = int(min(4096, max(16, np.sqrt(len(vectors)))))
+    centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+    for _ in range(_KMEANS_ITERATIONS):
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, vectors)
+        counts = np.bincount(assign, minlength=n_lists)
+        # 빈 리스트는 이전 centroid 유지
+        filled = counts > 0
+        centroids[filled] = sums[filled]
+        centroids = _normalize(centroids)
+    return centroids.astype(np.float32)
+
+
+def _assign_lists(vectors: np.ndarray, centroids: Optional[np.ndarray]) -> np.ndarray:
+    if centroids is None:
+        return np.full(len(vectors), -1, dtype=np.int32)
+    lists = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), 8192):
+        chunk = vectors[start:start + 8192].astype(np.float32)
+        lists[start:start + 8192] = np.argmax(chunk @ centroids.T, axis=1)
+    return lists
+
+
+def _segment_tier(count: int) -> int:
+    """세그먼트 단계 (벡터 수가 VECTOR_INDEX_MERGE_FACTOR 배수 범위 안이면 같은 단계)"""
+    return int(math.log(max(count, 1), VECTOR_INDEX_MERGE_FACTOR))
+
+
+def _plan_compaction(manifest: Dict[str, Any], full: bool = False) -> Optional[Tuple[List[Dict[str, Any]], bool]]:
+    """
+    병합할 세그먼트와 centroid 재학습 여부 (병합할 것이 없으면 None)
+
+    벡터 수가 학습 당시의 두 배 이상이면 전체를 병합하며 재학습하고, 아니면 가장 작은 단계에서
+    VECTOR_INDEX_MERGE_FACTOR개 이상 모인 세그먼트만 병합합니다. full이면 세그먼트가 여러 개이거나
+    삭제 표시가 있을 때 전체를 병합합니다.
+    """
+    segments = manifest["segments"]
+    total = sum(segment["count"] for segment in segments)
+    retrain = total >= VECTOR_INDEX_MIN_TRAIN and total >= 2 * manifest.get("trained_count", 0)
+    tombstones = any(segment["deleted"] or segment.get("deleted_texts") for segment in segments)
+    if retrain or (full and (len(segments) > 1 or tombstones)):
+        return list(segments), retrain
+
+    tiers: Dict[int, List[Dict[str, Any]]] = {}
+    for segment in segments:
+        tiers.setdefault(_segment_tier(segment["count"]), []).append(segment)
+    for tier in sorted(tiers):
+        if len(tiers[tier]) >= VECTOR_INDEX_MERGE_FACTOR:
+            return tiers[tier], False
+    return None
+
+
+@lru_cache(maxsize=256)
+def _open_segment(path: str) -> Dict[str, np.ndarray]:
+    """세그먼트 배열 열기 (세그먼트는 바뀌지 않으므로 메모리 매핑 재사용)"""
+    segment = Path(path)
+    return {
+        name: np.load(segment / f"{name}.npy", mmap_mode="r")
+        for name in ("vectors_f16", "codes_i8", "scales", "lists", "text_ids", "report_ids")
+    }
+
+
+@lru_cache(maxsize=8)
+def _open_centroids(path: str) -> np.ndarray:
+    return np.load(path)
+
+
+class VectorIndex:
+    """리포트 문단 벡터 인덱스 (프로세스 간 쓰기는 파일 잠금으로 직렬화)"""
+
+    def __init__(self, index_dir: Optional[Path] = None):
+        self.index_dir = Path(index_dir) if index_dir else _default_index_dir()
+        self.manifest_path = self.index_dir / "manifest.json"
+
+    def add_report(
+        self,
+        report_id: Any,
+        embeddings: Dict[str, List[float]],
+        replace: bool = True
+    ) -> int:
+        """
+        리포트 문단 벡터 추가 ({ExtractedText id: 벡터}), 추가한 벡터 수 반환
+
+        replace이면 이 리포트의 이전 벡터를 삭제 표시합니다 (재파싱).
+        아니면 같은 텍스트 id의 이전 벡터만 삭제 표시합니다 (보강 추출 재시도).
+        """
+        report_key = str(report_id)
+        with self._locked():
+            manifest = self._load_manifest()
+            for segment in manifest["segments"]:
+                if report_key not in segment["reports"] or report_key in segment["deleted"]:
+                    continue
+                if replace:
+                    segment["deleted"].append(report_key)
+                elif embeddings:
+                    deleted_texts = segment.setdefault("deleted_texts", [])
+                    known = set(deleted_texts)
+                    deleted_texts.extend(text_id for text_id in embeddings if text_id not in known)
+
+            if embeddings:
+                vectors = _normalize(np.asarray(list(embeddings.values()), dtype=np.float32))
+                if manifest["dim"] is None:
+                    manifest["dim"] = int(vectors.shape[1])
+                elif vectors.shape[1] != manifest["dim"]:
+                    raise ValueError(f"벡터 차원 불일치: {vectors.shape[1]} (인덱스 {manifest['dim']})")
+
+                centroids = self._centroids(manifest)
+                name = self._next_name(manifest, "segment")
+                self._write_segment(name, vectors, list(embeddings.keys()), [report_key] * len(vectors), centroids)
+                manifest["segments"].append({
+                    "name": name,
+                    "count": len(vectors),
+                    "centroids": manifest["centroids"],
+                    "reports": [report_key],
+                    "deleted": [],
+                })
+
+            self._save_manifest(manifest)
+        return len(embeddings)
+
+    def remove_report(self, report_id: Any):
+        """리포트 벡터 삭제 표시 (다음 병합 때 제거)"""
+        self.add_report(report_id, {}, replace=True)
+
+    def needs_compaction(self) -> bool:
+        """병합할 세그먼트가 있는지 (add_report 후 백그라운드 병합 예약 여부)"""
+        return _plan_compaction(self._load_manifest()) is not None
+
+    def compact(self, full: bool = False) -> int:
+        """
+        세그먼트 병합 (삭제 표시된 벡터 제거, 필요하면 centroid 재학습), 병합 횟수 반환
+
+        더 병합할 세그먼트가 없을 때까지 반복합니다. full이면 먼저 전체를 하나로 병합합니다
+        (삭제 표시 정리용, 인덱스 전체를 다시 씀). 다른 프로세스가 병합 중이면 바로 반환합니다.
+        """
+        merges = 0
+        with self._locked(".compact.lock", blocking=False) as acquired:
+            if acquired and full and self._compact(full=True):
+                merges += 1
+            while acquired and self._compact():
+                merges += 1
+        return merges
+
+    def search(
+        self,
+        query: List[float],
+        limit: int = 10,
+        nprobe: Optional[int] = None,
+        report_ids: Optional[List[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        가까운 문단 검색 (코사인 유사도 내림차순)
+
+        report_ids가 있으면 해당 리포트 안에서만 찾습니다.
+        """
+        try:
+            return self._search(query, limit, nprobe, report_ids)
+        except FileNotFoundError:
+            # 검색 중 병합으로 세그먼트가 교체되면 새 manifest로 한 번 더 시도
+            return self._search(query, limit, nprobe, report_ids)
+
+    def stats(self) -> Dict[str, Any]:
+        manifest = self._load_manifest()
+        return {
+            "dim": manifest["dim"],
+            "segments": len(manifest["segments"]),
+            "vectors": sum(segment["count"] for segment in manifest["segments"]),
+            "trained": manifest["centroids"] is not None,
+        }
+
+    def _search(self, query, limit, nprobe, report_ids) -> List[Dict[str, Any]]:
+        manifest = self._load_manifest()
+        if not manifest["segments"] or limit <= 0:
+            return []
+
+        q = _normalize(np.asarray([query], dtype=np.float32))[0]
+        if q.shape[0] != manifest["dim"]:
+            raise ValueError(f"질의 벡터 차원 불일치: {q.shape[0]} (인덱스 {manifest['dim']})")
+
+        probe_lists = {}
+        for centroids_name in {segment["centroids"] for segment in manifest["segments"] if segment["centroids"]}:
+            centroids = _open_centroids(str(self.index_dir / centroids_name))
+            n_probe = min(len(centroids), nprobe or VECTOR_INDEX_NPROBE)
+            probe_lists[centroids_name] = np.argpartition(-(centroids @ q), n_probe - 1)[:n_probe]
+
+        wanted = {str(report_id).encode() for report_id in report_ids} if report_ids else None
+        n_candidates = limit * VECTOR_INDEX_RERANK_FACTOR
+        candidates = []
+        for segment in manifest["segments"]:
+            if wanted is not None and not wanted.intersection(r.encode() for r in segment["reports"]):
+                continue
+            arrays = _open_segment(str(self.index_dir / segment["name"]))
+            rows = np.arange(segment["count"])
+            if segment["centroids"] in probe_lists:
+                rows = rows[np.isin(arrays["lists"], probe_lists[segment["centroids"]])]
+            excluded = set(segment["deleted"])
+            excluded_texts = segment.get("deleted_texts")
+            if wanted is not None or excluded or excluded_texts:
+                segment_reports = np.asarray(arrays["report_ids"][rows])
+                keep = np.ones(len(rows), dtype=bool)
+                if wanted is not None:
+                    keep &= np.isin(segment_reports, list(wanted))
+                if excluded:
+                    keep &= ~np.isin(segment_reports, [r.encode() for r in excluded])
+                if excluded_texts:
+                    keep &= ~np.isin(arrays["text_ids"][rows], [t.encode() for t in excluded_texts])
+                rows = rows[keep]
+            if not len(rows):
+                continue
+
+            # 1차 채점 (int8)
+            scores = (arrays["codes_i8"][rows].astype(np.float32) @ q) * arrays["scales"][rows]
+            if len(rows) > n_candidates:
+                top = np.argpartition(-scores, n_candidates - 1)[:n_candidates]
+                rows, scores = rows[top], scores[top]
+            candidates.extend((float(score), segment["name"], int(row)) for score, row in zip(scores, rows))
+
+        candidates.sort(key=lambda item: -item[0])
+        results = []
+        for _, name, row in candidates[:n_candidates]:
+            arrays = _open_segment(str(self.index_dir / name))
+            results.append({
+                "text_id": arrays["text_ids"][row].decode(),
+                "report_id": arrays["report_ids"][row].decode(),
+                # 재채점 (float16)
+                "score": float(arrays["vectors_f16"][row].astype(np.float32) @ q),
+            })
+        results.sort(key=lambda item: -item["score"])
+        return results[:limit]
+
+    def _compact(self, full: bool = False) -> bool:
+        """
+        세그먼트 한 묶음 병합 (병합할 세그먼트가 없으면 False)
+
+        1. 잠금 안에서 병합할 세그먼트를 고르고 새 파일 이름을 예약
+        2. 잠금 밖에서 세그먼트를 읽어 합치고 (재학습이면 centroid 학습) 새 세그먼트 저장
+        3. 잠금 안에서 원래 세그먼트가 그대로면 manifest 교체 (그 사이 추가된 삭제 표시는 유지)
+        """
+        with self._locked():
+            manifest = self._load_manifest()
+            plan = _plan_compaction(manifest, full)
+            if plan is None:
+                return False
+            sources, retrain = plan
+            segment_name = self._next_name(manifest, "segment")
+            centroids_name = f"{self._next_name(manifest, 'centroids')}.npy" if retrain else None
+            self._save_manifest(manifest)
+            assigned, centroids = manifest["centroids"], self._centroids(manifest)
+
+        vectors, text_ids, report_ids = [], [], []
+        for segment in sources:
+            arrays = _open_segment(str(self.index_dir / segment["name"]))
+            keep = ~np.isin(arrays["report_ids"], [r.encode() for r in segment["deleted"]])
+            keep &= ~np.isin(arrays["text_ids"], [t.encode() for t in segment.get("deleted_texts", [])])
+            vectors.append(np.asarray(arrays["vectors_f16"][keep]))
+            text_ids.append(np.asarray(arrays["text_ids"][keep]))
+            report_ids.append(np.asarray(arrays["report_ids"][keep]))
+
+        total = sum(len(v) for v in vectors)
+        new_files = []
+        if total:
+            merged = np.concatenate(vectors).astype(np.float32)
+            merged_report_ids = np.concatenate(report_ids)
+            if retrain and total >= VECTOR_INDEX_MIN_TRAIN:
+                np.save(self.index_dir / centroids_name, _train_centroids(merged))
+                new_files.append(centroids_name)
+                assigned, centroids = centroids_name, _open_centroids(str(self.index_dir / centroids_name))
+            else:
+                centroids_name = None
+            self._write_segment(segment_name, merged, np.concatenate(text_ids), merged_report_ids, centroids)
+            new_files.append(segment_name)
+
+        with self._locked():
+            manifest = self._load_manifest()
+            current = {segment["name"]: segment for segment in manifest["segments"]}
+            if any(segment["name"] not in current for segment in sources):
+                # 다른 병합이 먼저 교체함
+                self._remove_files(new_files)
+                return True
+
+            source_names = {segment["name"] for segment in sources}
+            manifest["segments"] = [s for s in manifest["segments"] if s["name"] not in source_names]
+            if centroids_name:
+                manifest["centroids"] = centroids_name
+                manifest["trained_count"] = total
+            if total:
+                # 병합하는 동안 추가된 삭제 표시
+                deleted, deleted_texts = set(), set()
+                for segment in sources:
+                    deleted.update(set(current[segment["name"]]["deleted"]) - set(segment["deleted"]))
+                    deleted_texts.update(
+                        set(current[segment["name"]].get("deleted_texts", []))
+                        - set(segment.get("deleted_texts", []))
+                    )
+                new_segment = {
+                    "name": segment_name,
+                    "count": total,
+                    "centroids": assigned,
+                    "reports": sorted({r.decode() for r in merged_report_ids}),
+                    "deleted": sorted(deleted),
+                }
+                if deleted_texts:
+                    new_segment["deleted_texts"] = sorted(deleted_texts)
+                manifest["segments"].append(new_segment)
+
+            # 어느 세그먼트도 쓰지 않는 centroid 파일 정리
+            in_use = {segment["centroids"] for segment in manifest["segments"]} | {manifest["centroids"]}
+            old_centroids = {segment["centroids"] for segment in sources} - in_use - {None}
+            self._save_manifest(manifest)
+            _open_segment.cache_clear()
+            # 이미 열린 메모리 매핑은 파일 삭제 후에도 유효
+            self._remove_files(sorted(source_names) + sorted(old_centroids))
+        return True
+
+    def _remove_files(self, names: List[str]):
+        for name in names:
+            path = self.index_dir / name
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink(missing_ok=True)
+
+    def _next_name(self, manifest: Dict[str, Any], prefix: str) -> str:
+        """새 파일 이름 예약 (manifest 버전 증가, 잠금 안에서 호출)"""
+        manifest["version"] += 1
+        return f"{prefix}_{manifest['version']:06d}"
+
+    def _write_segment(self, name, vectors, text_ids, report_ids, centroids):
+        tmp_dir = self.index_dir / f".{name}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        codes, scales = _quantize(vectors)
+        np.save(tmp_dir / "vectors_f16.npy", vectors.astype(np.float16))
+        np.save(tmp_dir / "codes_i8.npy", codes)
+        np.save(tmp_dir / "scales.npy", scales)
+        np.save(tmp_dir / "lists.npy", _assign_lists(vectors, centroids))
+        np.save(tmp_dir / "text_ids.npy", np.asarray(text_ids, dtype=_ID_DTYPE))
+        np.save(tmp_dir / "report_ids.npy", np.asarray(report_ids, dtype=_ID_DTYPE))
+        os.replace(tmp_dir, self.index_dir / name)
+
+    def _centroids(self, manifest) -> Optional[np.ndarray]:
+        if not manifest["centroids"]:
+            return None
+        return _open_centroids(str(self.index_dir / manifest["centroids"]))
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {"dim": None, "version": 0, "centroids": None, "trained_count": 0, "segments": []}
+
+    def _save_manifest(self, manifest: Dict[str, Any]):
+        tmp_path = self.manifest_path.with_name(f"manifest.json.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    @contextmanager
+    def _locked(self, name: str = ".lock", blocking: bool = True) -> Iterator[bool]:
+        """파일 잠금 (blocking=False면 이미 잠겨 있을 때 False를 넘기고 기다리지 않음)"""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.index_dir / name, "w") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
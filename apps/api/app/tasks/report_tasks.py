@@ -2,9 +2,11 @@
 Report processing tasks
 """
 import asyncio
+from celery import chord
 from app.celery_app import celery_app
 from app.database import SessionLocal
 from app.services.ai_agents.report_parsing_agent import ReportParsingAgent
+from app.services.vector_index import VectorIndex
 from uuid import UUID
 
 
@@ -18,17 +20,100 @@ def run_async(coro):
     return loop.run_until_complete(coro)
 
 
-@celery_app.task(name="parse_report")
-def parse_report_task(report_id: str, file_path: str):
-    """리포트 파싱 작업"""
+# 워커가 작업 도중 종료되면 다른 워커에 다시 전달 (체크포인트 이후 페이지부터 이어서 추출)
+@celery_app.task(name="parse_report", acks_late=True, reject_on_worker_lost=True)
+def parse_report_task(report_id: str, file_path: str, extraction_backend: str = None):
+    """
+    리포트 파싱 작업 (extraction_backend: "pdfplumber" 또는 "pdfium", 생략 시 기본값)
+
+    긴 PDF는 페이지 범위 작업(extract_page_range)으로 나눠 여러 워커에서 추출하고,
+    chord 콜백(parse_extracted_report)에서 결과를 병합한 뒤 파싱을 이어갑니다.
+    """
     db = SessionLocal()
     try:
         agent = ReportParsingAgent(db)
+        page_ranges = run_async(agent.plan_page_ranges(UUID(report_id), file_path, extraction_backend))
+        if page_ranges:
+            chord(
+                extract_page_range_task.s(report_id, file_path, first_page, last_page, extraction_backend)
+                for first_page, last_page in page_ranges
+            )(parse_extracted_report_task.s(report_id, file_path, extraction_backend))
+            return {
+                "status": "distributed",
+                "report_id": report_id,
+                "page_ranges": len(page_ranges)
+            }
+
         # Async 함수 실행
-        result = run_async(agent.parse_report(UUID(report_id), file_path))
+        result = run_async(agent.parse_report(UUID(report_id), file_path, extraction_backend))
+        return {
+            "status": "skipped" if result.get("skipped") else "completed",
+            "report_id": report_id,
+            "result": result
+        }
+    except Exception as e:
+        return {
+            "status": "failed",
+            "report_id": report_id,
+            "error": str(e)
+        }
+    finally:
+        db.close()
+
+
+@celery_app.task(name="extract_page_range", acks_late=True, reject_on_worker_lost=True)
+def extract_page_range_task(
+    report_id: str,
+    file_path: str,
+    first_page: int,
+    last_page: int,
+    extraction_backend: str = None
+):
+    """
+    페이지 범위 추출 작업 (분산 추출의 map 단계)
+
+    실패해도 예외를 올리지 않고 결과로 반환하므로 chord 콜백은 항상 실행되며,
+    콜백에서 빠진 페이지를 직접 추출합니다.
+    """
+    db = SessionLocal()
+    try:
+        agent = ReportParsingAgent(db)
+        result = run_async(agent.extract_page_range(
+            UUID(report_id), file_path, first_page, last_page, extraction_backend
+        ))
+        return {"status": "completed", **result}
+    except Exception as e:
+        return {
+            "status": "failed",
+            "first_page": first_page,
+            "last_page": last_page,
+            "error": str(e)
+        }
+    finally:
+        db.close()
+
+
+@celery_app.task(name="parse_extracted_report")
+def parse_extracted_report_task(
+    page_range_results: list,
+    report_id: str,
+    file_path: str,
+    extraction_backend: str = None
+):
+    """분산 추출 결과 병합 후 리포트 파싱 작업 (chord 콜백, reduce 단계)"""
+    db = SessionLocal()
+    try:
+        agent = ReportParsingAgent(db)
+        result = run_async(agent.parse_report(
+            UUID(report_id), file_path, extraction_backend, distributed=True
+        ))
         return {
             "status": "completed",
             "report_id": report_id,
+            "failed_page_ranges": [
+                [r.get("first_page"), r.get("last_page")]
+                for r in page_range_results if r.get("status") != "completed"
+            ],
             "result": result
         }
     except Exception as e:
@@ -41,6 +126,41 @@ def parse_report_task(report_id: str, file_path: str):
         db.close()
 
 
+@celery_app.task(name="extract_report_deep")
+def extract_report_deep_task(report_id: str, file_path: str):
+    """리포트 보강 추출 작업 (표, 이미지, OCR - deep_extraction 큐)"""
+    db = SessionLocal()
+    try:
+        agent = ReportParsingAgent(db)
+        result = run_async(agent.enrich_report(UUID(report_id), file_path))
+        return {
+            "status": "completed",
+            "report_id": report_id,
+            "result": result
+        }
+    except Exception as e:
+        return {
+            "status": "failed",
+            "report_id": report_id,
+            "error": str(e)
+        }
+    finally:
+        db.close()
+
+
+@celery_app.task(name="compact_vector_index")
+def compact_vector_index_task():
+    """
+    검색 인덱스 세그먼트 병합 작업 (크기가 비슷한 세그먼트 병합, 필요하면 centroid 재학습)
+
+    리포트 파싱 중 벡터를 추가한 뒤 예약됩니다. 이미 다른 워커가 병합 중이면 바로 끝납니다.
+    """
+    try:
+        return {"status": "completed", "merges": VectorIndex().compact()}
+    except Exception as e:
+        return {"status": "failed", "error": str(e)}
+
+
 @celery_app.task(name="extract_predictions")
 def extract_predictions_task(report_id: str):
     """예측 정보 추출 작업"""
@@ -25,6 +25,9 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 일괄 수집 추출 백엔드 ("pdfium"이면 텍스트만 빠르게 추출, 미설정 시 기본 백엔드)
+BATCH_EXTRACTION_BACKEND = os.getenv("BATCH_EXTRACTION_BACKEND") or None
+
 
 def find_pdf_files(base_path: Path) -> List[Path]:
     """PDF 파일 찾기"""
@@ -95,7 +98,8 @@ async def upload_pdf_file(
         result = await service.upload_and_extract(
             file=file_obj,
             analyst_id=analyst_id,
-            company_id=company_id
+            company_id=company_id,
+            extraction_backend=BATCH_EXTRACTION_BACKEND
         )
         
         logger.info(f"리포트 업로드 완료: {result.report_id} - {file_path.name}")
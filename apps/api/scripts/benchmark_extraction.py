@@ -0,0 +1,234 @@
+"""
+PDF 추출 벤치마크
+
+합성 증권사 리포트 코퍼스(scripts/synthetic_report_corpus.py)를 백엔드/추출 단계/워커 수
+조합별로 추출해 처리량(pages/sec), 최대 메모리(peak RSS), 단계별 소요 시간
+(text, words, tables, images, ocr)을 측정합니다. 조합마다 별도 프로세스에서 실행하므로
+최대 메모리가 서로 섞이지 않습니다.
+
+결과는 JSON으로 저장해 커밋 간 비교할 수 있습니다.
+
+사용법:
+    python scripts/benchmark_extraction.py [--configs pdfplumber:full,pdfium:full] [--workers 1]
+        [--repeat 3] [--scale 1] [--output bench.json] [--compare baseline.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.synthetic_report_corpus import build_corpus
+
+
+DEFAULT_CONFIGS = "pdfplumber:full,pdfplumber:text,pdfplumber:deep,pdfium:full"
+RESULT_SCHEMA_VERSION = 1
+
+
+def _peak_rss_mb(who: int) -> float:
+    """최대 RSS (MB, Linux ru_maxrss 단위는 KB, macOS는 바이트)"""
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_config(corpus_dir: Path, backend: str, tier: str, workers: int, repeat: int) -> Dict[str, Any]:
+    """
+    조합 하나 측정 (자식 프로세스에서 실행)
+
+    코퍼스 전체를 repeat번 추출해 가장 빠른 회차의 시간과 단계별 시간을 사용합니다.
+    """
+    from app.services import document_extraction_service as extraction_module
+    from app.services.document_extraction_service import DocumentExtractionService
+    from app.services.extraction.stage_timer import StageTimer
+
+    manifest = json.loads((corpus_dir / "manifest.json").read_text(encoding="utf-8"))
+    best = None
+    for _ in range(repeat):
+        # 추출 이미지는 PDF 옆 images/에 저장되므로 회차마다 비워 같은 조건으로 측정
+        shutil.rmtree(corpus_dir / "images", ignore_errors=True)
+        timer = StageTimer()
+        service = DocumentExtractionService(
+            max_workers=workers, backend=backend, tier=tier, stage_timer=timer
+        )
+        profiles: Dict[str, Dict[str, float]] = {}
+        total_pages = 0
+        start = time.perf_counter()
+        for document in manifest["documents"]:
+            doc_start = time.perf_counter()
+            result = asyncio.run(service.extract_async(
+                f"bench-{document['file']}", str(corpus_dir / document["file"]), parallel=workers > 1
+            ))
+            elapsed = time.perf_counter() - doc_start
+            pages = len(result["pages"])
+            total_pages += pages
+            profile = profiles.setdefault(document["profile"], {"pages": 0, "seconds": 0.0})
+            profile["pages"] += pages
+            profile["seconds"] += elapsed
+        seconds = time.perf_counter() - start
+        if best is None or seconds < best["seconds"]:
+            best = {"seconds": seconds, "pages": total_pages, "profiles": profiles, "stages": timer.as_dict()}
+
+    # 프로세스 풀 워커를 종료해야 자식 프로세스 최대 메모리가 집계됨
+    if extraction_module._process_pool is not None:
+        extraction_module._process_pool.shutdown(wait=True)
+
+    return {
+        "backend": backend,
+        "tier": tier,
+        "workers": workers,
+        "documents": len(manifest["documents"]),
+        "pages": best["pages"],
+        "seconds": round(best["seconds"], 4),
+        "pages_per_sec": round(best["pages"] / best["seconds"], 2) if best["seconds"] else None,
+        "peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF),
+        "workers_peak_rss_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN) if workers > 1 else None,
+        "stages": {
+            stage: {
+                "seconds": round(seconds, 4),
+                "calls": best["stages"]["calls"].get(stage, 0),
+            }
+            for stage, seconds in sorted(best["stages"]["seconds"].items())
+        },
+        "profiles": {
+            name: {
+                "pages": profile["pages"],
+                "seconds": round(profile["seconds"], 4),
+                "pages_per_sec": round(profile["pages"] / profile["seconds"], 2) if profile["seconds"] else None,
+            }
+            for name, profile in profiles.items()
+        },
+    }
+
+
+def run_config_subprocess(corpus_dir: Path, backend: str, tier: str, workers: int, repeat: int, env: Dict[str, str]) -> Dict[str, Any]:
+    """조합 하나를 새 프로세스에서 측정"""
+    completed = subprocess.run(
+        [
+            sys.executable, __file__, "--run-config", f"{backend}:{tier}",
+            "--corpus", str(corpus_dir), "--workers", str(workers), "--repeat", str(repeat),
+        ],
+        capture_output=True, text=True, env=env
+    )
+    if completed.returncode != 0:
+        return {"backend": backend, "tier": tier, "workers": workers, "error": completed.stderr.strip()[-2000:]}
+    # 추출 중 출력되는 로그 뒤의 마지막 줄이 결과
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def print_results(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Any]] = None):
+    baseline_rates = {}
+    if baseline:
+        baseline_rates = {
+            (r["backend"], r["tier"], r["workers"]): r.get("pages_per_sec")
+            for r in baseline.get("results", [])
+        }
+
+    print(f"{'backend:tier':<18} {'workers':>7} {'pages/s':>9} {'RSS(MB)':>8}  stages (s)")
+    for result in results:
+        name = f"{result['backend']}:{result['tier']}"
+        if "error" in result:
+            print(f"{name:<18} {result['workers']:>7}  실패: {result['error'].splitlines()[-1] if result['error'] else ''}")
+            continue
+        stages = " ".join(f"{stage}={timing['seconds']:.3f}" for stage, timing in result["stages"].items())
+        line = f"{name:<18} {result['workers']:>7} {result['pages_per_sec']:>9.1f} {result['peak_rss_mb']:>8.1f}  {stages}"
+        previous = baseline_rates.get((result["backend"], result["tier"], result["workers"]))
+        if previous:
+            line += f"  ({(result['pages_per_sec'] / previous - 1) * 100:+.1f}% vs baseline)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDF 추출 벤치마크")
+    parser.add_argument("--configs", default=DEFAULT_CONFIGS, help="backend:tier 목록 (쉼표 구분)")
+    parser.add_argument("--workers", default="1", help="워커 수 목록 (쉼표 구분, 2 이상이면 병렬 추출)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (가장 빠른 회차 사용)")
+    parser.add_argument("--seed", type=int, default=7, help="코퍼스 seed")
+    parser.add_argument("--scale", type=int, default=1, help="코퍼스 유형별 리포트 수 배수")
+    parser.add_argument("--corpus", help="코퍼스 디렉토리 (없으면 임시 디렉토리에 생성)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON")
+    parser.add_argument("--run-config", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_config:
+        # 자식 프로세스: 조합 하나 측정 후 결과 JSON 한 줄 출력
+        backend, tier = args.run_config.split(":")
+        result = run_config(Path(args.corpus), backend, tier, int(args.workers), args.repeat)
+        print(json.dumps(result, ensure_ascii=False))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corpus_dir = Path(args.corpus or Path(tmp_dir) / "corpus")
+        manifest = build_corpus(corpus_dir, args.seed, args.scale)
+
+        # 추출 이미지와 반복 이미지 인덱스는 임시 디렉토리에 저장
+        env = dict(os.environ, STORAGE_PATH=str(Path(tmp_dir) / "storage"))
+
+        from app.services.document_extraction_service import EXTRACTOR_VERSION
+        from app.services.extraction.ocr_engine_pool import PADDLEOCR_AVAILABLE
+
+        results = []
+        for config in args.configs.split(","):
+            backend, tier = config.strip().split(":")
+            for workers in (int(w) for w in args.workers.split(",")):
+                results.append(run_config_subprocess(corpus_dir, backend, tier, workers, args.repeat, env))
+
+    report = {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "extractor_version": EXTRACTOR_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "ocr_available": PADDLEOCR_AVAILABLE,
+        "corpus": {
+            "seed": manifest["seed"],
+            "scale": manifest["scale"],
+            "documents": len(manifest["documents"]),
+            "pages": manifest["pages"],
+            "sha256": manifest["sha256"],
+        },
+        "results": results,
+    }
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        if baseline.get("corpus", {}).get("sha256") != report["corpus"]["sha256"]:
+            print("경고: 비교 대상과 코퍼스가 다릅니다 (seed/scale 확인)")
+
+    print(f"코퍼스: {report['corpus']['documents']}개 리포트, {report['corpus']['pages']} 페이지 "
+          f"(OCR 엔진 {'있음' if report['ocr_available'] else '없음'}, 커밋 {report['git_commit']})")
+    print_results(results, baseline)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+수치 데이터 스캐너 마이크로벤치마크
+
+기존 패턴별 다중 패스 구현과 단일 패스 스캐너(numeric_scanner)의
+페이지당 처리 시간을 비교합니다.
+
+사용법:
+    python scripts/benchmark_numeric_scanner.py [--pages 200] [--repeat 5]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.extraction.numeric_scanner import scan_numeric_data
+
+
+def legacy_extract_numeric_data(text: str) -> List[Dict[str, Any]]:
+    """기존 구현 (패턴별 re.finditer 3회 루프, 호출마다 re import)"""
+    import re
+
+    numeric_data = []
+
+    # 패턴 1: 목표주가 (예: "목표주가 120,000원", "TP 120000원")
+    target_price_patterns = [
+        r'목표주가\s*[:：]?\s*([\d,]+)\s*원',
+        r'TP\s*[:：]?\s*([\d,]+)\s*원',
+        r'Target\s*Price\s*[:：]?\s*([\d,]+)',
+    ]
+
+    for pattern in target_price_patterns:
+        matches = re.finditer(pattern, text, re.IGNORECASE)
+        for match in matches:
+            price_str = match.group(1).replace(",", "")
+            try:
+                price = float(price_str)
+                numeric_data.append({
+                    "type": "target_price",
+                    "value": price,
+                    "unit": "원",
+                    "context": match.group(0),
+                    "position": match.start()
+                })
+            except ValueError:
+                pass
+
+    # 패턴 2: 실적 예측 (예: "매출액 1조 2,000억원", "영업이익 500억원")
+    performance_patterns = [
+        r'(매출액|영업이익|당기순이익|순이익)\s*[:：]?\s*([\d,]+)\s*(억|조|원|천억)',
+        r'(Revenue|Operating\s*Profit|Net\s*Profit)\s*[:：]?\s*([\d,]+)',
+    ]
+
+    for pattern in performance_patterns:
+        matches = re.finditer(pattern, text, re.IGNORECASE)
+        for match in matches:
+            metric = match.group(1)
+            value_str = match.group(2).replace(",", "")
+            unit = match.group(3) if len(match.groups()) > 2 else ""
+
+            try:
+                value = float(value_str)
+                # 단위 변환 (조, 억, 천억)
+                if "조" in unit or "trillion" in unit.lower():
+                    value = value * 10000  # 조 -> 억
+                elif "천억" in unit:
+                    value = value * 1000  # 천억 -> 억
+
+                numeric_data.append({
+                    "type": "performance",
+                    "metric": metric,
+                    "value": value,
+                    "unit": unit or "억원",
+                    "context": match.group(0),
+                    "position": match.start()
+                })
+            except ValueError:
+                pass
+
+    # 패턴 3: 주가 관련 (예: "현재주가 50,000원", "52주 최고가 60,000원")
+    stock_price_patterns = [
+        r'(현재주가|현재가|주가|52주\s*최고가|52주\s*최저가)\s*[:：]?\s*([\d,]+)\s*원',
+        r'(Current\s*Price|Stock\s*Price|52W\s*High|52W\s*Low)\s*[:：]?\s*([\d,]+)',
+    ]
+
+    for pattern in stock_price_patterns:
+        matches = re.finditer(pattern, text, re.IGNORECASE)
+        for match in matches:
+            price_type = match.group(1)
+            price_str = match.group(2).replace(",", "")
+            try:
+                price = float(price_str)
+                numeric_data.append({
+                    "type": "stock_price",
+                    "price_type": price_type,
+                    "value": price,
+                    "unit": "원",
+                    "context": match.group(0),
+                    "position": match.start()
+                })
+            except ValueError:
+                pass
+
+    return numeric_data
+
+
+
+def build_page_text(page_num: int) -> str:
+    """벤치마크용 리포트 페이지 텍스트 (약 3,000자)"""
+    lines = [
+        f"삼성전자 (005930) 기업분석 {page_num}페이지",
+        f"투자의견 매수, 목표주가 {120000 + page_num * 100:,}원으로 상향. TP {95 + page_num % 5}만원 제시",
+        f"현재주가 {71000 + page_num:,}원, 52주 최고가 88,800원, 52주 최저가 58,600원",
+        f"2025년 매출액 1조 2,{page_num % 1000:03d}억원, 영업이익 {500 + page_num}억원, 당기순이익 300억원 전망",
+        "메모리 업황 회복과 HBM 출하 증가로 하반기 실적 개선이 예상된다.",
+        "Target Price: 130,000 / Current Price: 71,000 / Revenue: 302,231",
+    ]
+    filler = "반도체 업황 및 수요 회복에 따른 이익 개선이 기대되며 밸류에이션 매력이 높다. " * 30
+    return "\n".join(lines + [filler])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수치 데이터 스캐너 벤치마크")
+    parser.add_argument("--pages", type=int, default=200, help="페이지 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    pages = [build_page_text(n) for n in range(1, args.pages + 1)]
+
+    def run_legacy():
+        for text in pages:
+            legacy_extract_numeric_data(text)
+
+    def run_scanner():
+        for text in pages:
+            scan_numeric_data(text)
+
+    legacy_time = min(timeit.repeat(run_legacy, number=1, repeat=args.repeat))
+    scanner_time = min(timeit.repeat(run_scanner, number=1, repeat=args.repeat))
+
+    print(f"페이지 수: {args.pages}")
+    print(f"기존 구현:   {legacy_time / args.pages * 1e6:8.1f} µs/page")
+    print(f"단일 패스:   {scanner_time / args.pages * 1e6:8.1f} µs/page")
+    print(f"속도 향상:   {legacy_time / scanner_time:8.2f}x")
+    print(f"추출 건수:   기존 {len(legacy_extract_numeric_data(pages[0]))}건 / "
+          f"단일 패스 {len(scan_numeric_data(pages[0]))}건 (1페이지 기준)")
+
+
+if __name__ == "__main__":
+    main()
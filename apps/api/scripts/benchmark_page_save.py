@@ -0,0 +1,174 @@
+"""
+추출 데이터 저장 마이크로벤치마크
+
+기존 행 단위 ORM 저장(db.add)과 테이블마다 INSERT 한 번으로 저장하는
+ReportParsingAgent._save_pages_data의 리포트당 저장 시간을 비교합니다.
+
+기본은 인메모리 SQLite이며, --database-url로 PostgreSQL 등 실제 DB를 지정할 수 있습니다
+(추출 데이터 테이블만 생성/삭제합니다). --pdf를 주면 합성 페이지 대신 PDF 추출 결과를 저장합니다.
+
+사용법:
+    python scripts/benchmark_page_save.py [--pages 24] [--repeat 5] [--pdf report.pdf]
+        [--database-url sqlite://]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from uuid import uuid4
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from app.models.report import ExtractedImage, ExtractedTable, ExtractedText
+from app.services.ai_agents.report_parsing_agent import ReportParsingAgent
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    """SQLite에서는 JSONB 대신 JSON 사용"""
+    return "JSON"
+
+
+TABLES = [ExtractedText.__table__, ExtractedTable.__table__, ExtractedImage.__table__]
+
+
+def synthetic_pages(page_count: int) -> List[Dict[str, Any]]:
+    """페이지마다 전체 텍스트/문단 30개, 표 1~2개, 이미지 1~2개가 있는 페이지 결과"""
+    pages = []
+    for page_number in range(1, page_count + 1):
+        text_blocks = [{
+            "id": f"text_{page_number}_full",
+            "content": f"{page_number}페이지 목표주가 120,000원 유지, 2025F 영업이익 5,000억원 " * 20,
+            "page_number": page_number,
+            "bbox": [0, 0, 595, 842],
+        }]
+        text_blocks.extend({
+            "id": f"text_{page_number}_para_{idx}",
+            "content": f"문단 {idx}: 메모리 업황 회복에 따른 실적 개선 전망",
+            "page_number": page_number,
+            "bbox": [40, 60 + idx * 24, 500, 12],
+            "font_size": 10.5,
+            "order": idx,
+        } for idx in range(30))
+        tables = [{
+            "id": f"table_{page_number}_{idx}",
+            "page_number": page_number,
+            "data": [["(십억원)", "2024A", "2025F", "2026F"]] + [
+                [f"항목{row}", "1,000", "1,200", "1,500"] for row in range(12)
+            ],
+            "bbox": [72, 300 + idx * 200, 450, 180],
+        } for idx in range(1 + page_number % 2)]
+        images = [{
+            "id": f"image_{page_number}_{idx}",
+            "page_number": page_number,
+            "image_path": f"/storage/images/{page_number}_{idx}.png",
+            "bbox": [300, 500, 100, 80],
+        } for idx in range(1 + (page_number + 1) % 2)]
+        pages.append({"page_number": page_number, "text_blocks": text_blocks, "tables": tables, "images": images})
+    return pages
+
+
+def legacy_save_pages_data(db, report_id, page_results: List[Dict[str, Any]]):
+    """기존 구현 (행마다 ORM 객체 생성 후 db.add)"""
+    for page_result in page_results:
+        for text_data in page_result.get("text_blocks", []):
+            text = ExtractedText(
+                id=uuid4(),
+                report_id=report_id,
+                page_number=text_data.get("page_number", 1),
+                content=text_data.get("content", ""),
+                bbox=text_data.get("bbox"),
+                confidence=text_data.get("confidence", "medium"),
+                language=text_data.get("language", "ko"),
+            )
+            db.add(text)
+            text_data["extracted_text_id"] = str(text.id)
+
+        for table_data in page_result.get("tables", []):
+            db.add(ExtractedTable(
+                report_id=report_id,
+                page_number=table_data.get("page_number", 1),
+                table_data=table_data.get("data", []),
+                bbox=table_data.get("bbox"),
+                confidence=table_data.get("confidence", "medium"),
+            ))
+
+        for image_data in page_result.get("images", []):
+            db.add(ExtractedImage(
+                report_id=report_id,
+                page_number=image_data.get("page_number", 1),
+                image_path=image_data.get("image_path", ""),
+                image_type=image_data.get("image_type", "chart"),
+                bbox=image_data.get("bbox"),
+                analysis_result=image_data.get("analysis_result"),
+            ))
+
+
+def measure(db, save: Callable[[Any, List[Dict[str, Any]]], None], pages: List[Dict[str, Any]], repeat: int) -> float:
+    """리포트 하나 저장 + 커밋 시간 (가장 빠른 회차, 초)"""
+    best = None
+    for _ in range(repeat):
+        report_id = uuid4()
+        start = time.perf_counter()
+        save(report_id, pages)
+        db.commit()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추출 데이터 저장 벤치마크")
+    parser.add_argument("--pages", type=int, default=24, help="합성 리포트 페이지 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (가장 빠른 회차 사용)")
+    parser.add_argument("--pdf", help="합성 페이지 대신 저장할 PDF")
+    parser.add_argument("--database-url", default="sqlite://", help="측정할 DB (추출 데이터 테이블을 생성/삭제)")
+    args = parser.parse_args()
+
+    if args.pdf:
+        from app.services.document_extraction_service import DocumentExtractionService
+
+        result = asyncio.run(DocumentExtractionService().extract_async("benchmark", args.pdf, parallel=False))
+        pages = result["pages"]
+    else:
+        pages = synthetic_pages(args.pages)
+
+    engine = create_engine(args.database_url)
+    # 외래 키 대상(reports)은 만들지 않으므로 SQLite처럼 검사하지 않는 DB에서만 사용
+    for table in TABLES:
+        table.drop(engine, checkfirst=True)
+        table.create(engine)
+    db = sessionmaker(bind=engine)()
+
+    agent = ReportParsingAgent.__new__(ReportParsingAgent)
+    agent.db = db
+
+    counts = (
+        sum(len(page.get("text_blocks", [])) for page in pages),
+        sum(len(page.get("tables", [])) for page in pages),
+        sum(len(page.get("images", [])) for page in pages),
+    )
+    try:
+        legacy = measure(db, lambda report_id, rows: legacy_save_pages_data(db, report_id, rows), pages, args.repeat)
+        bulk = measure(db, agent._save_pages_data, pages, args.repeat)
+    finally:
+        db.close()
+        for table in reversed(TABLES):
+            table.drop(engine, checkfirst=True)
+
+    print(f"페이지 {len(pages)}개: 텍스트 {counts[0]}개, 표 {counts[1]}개, 이미지 {counts[2]}개")
+    print(f"행 단위 ORM 저장:   {legacy * 1000:8.1f} ms")
+    print(f"일괄 INSERT 저장:  {bulk * 1000:8.1f} ms ({legacy / bulk:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+표 탐지 마이크로벤치마크
+
+표가 많은 실적 추정(Earnings estimate) 페이지로 구성된 합성 PDF에서
+기존 구현(extract_tables + 표마다 find_tables 재실행)과 단일 패스 구현
+(find_tables 1회, 같은 Table 객체에서 데이터와 bbox 사용)의 페이지당
+처리 시간을 비교합니다.
+
+기존 구현의 bbox 탐지 설정에는 pdfplumber 0.10 이후 지원하지 않는 edge_tolerance가
+포함되어 있어 find_tables가 예외로 끝나고 모든 표 bbox가 페이지 전체로
+기록되었습니다. 따라서 기존 구현은 원래 설정(bbox 실패)과 유효한 설정(표마다
+재탐지 성공) 두 가지로 측정합니다.
+
+사용법:
+    python scripts/benchmark_table_detection.py [--pages 20] [--tables 4] [--repeat 3]
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pdfplumber
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.document_extraction_service import DocumentExtractionService, TABLE_STRATEGIES
+from scripts.synthetic_report_pdf import PAGE_HEIGHT, SyntheticPdf
+
+
+# 기존 구현의 bbox 탐지 설정 (그대로 복사)
+LEGACY_BBOX_SETTINGS = {
+    "vertical_strategy": "lines_strict",
+    "horizontal_strategy": "lines_strict",
+    "explicit_vertical_lines": [],
+    "explicit_horizontal_lines": [],
+    "snap_tolerance": 3,
+    "join_tolerance": 3,
+    "edge_tolerance": 3,
+    "min_words_vertical": 3,
+    "min_words_horizontal": 1,
+}
+
+
+def legacy_extract_tables(page: Any, bbox_settings: Dict[str, Any]) -> List[List[float]]:
+    """기존 구현 (extract_tables 후 표마다 find_tables로 bbox 재탐지)"""
+    bboxes = []
+    tables = page.extract_tables()
+    for table_idx, table in enumerate(tables):
+        if not table:
+            continue
+        table_bbox = None
+        try:
+            table_objects = page.find_tables(bbox_settings)
+            if table_idx < len(table_objects):
+                bbox = table_objects[table_idx].bbox
+                table_bbox = [bbox[0], bbox[1], bbox[2] - bbox[0], bbox[3] - bbox[1]]
+        except Exception:
+            pass
+        bboxes.append(table_bbox or [0, 0, page.width, page.height])
+    return bboxes
+
+
+def build_estimate_pdf(pages: int, tables_per_page: int) -> bytes:
+    """표가 많은 실적 추정 페이지 합성 PDF"""
+    years = ["2023A", "2024A", "2025F", "2026F", "2027F"]
+    metrics = ["매출액", "영업이익", "세전이익", "순이익", "EPS(원)", "BPS(원)", "PER(배)", "ROE(%)"]
+    pdf = SyntheticPdf()
+    for page_num in range(1, pages + 1):
+        page = pdf.add_page()
+        page.text(40, PAGE_HEIGHT - 40, f"실적 추정 및 밸류에이션 ({page_num})", size=12)
+        y = PAGE_HEIGHT - 70
+        for table_idx in range(tables_per_page):
+            rows = [["(십억원)"] + years]
+            for metric_idx, metric in enumerate(metrics):
+                base = 1000 + page_num * 37 + table_idx * 11 + metric_idx * 113
+                rows.append([metric] + [f"{base + year_idx * 97:,}" for year_idx in range(len(years))])
+            y = page.table(40, y, rows, [90] + [80] * len(years)) - 20
+    return pdf.to_bytes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="표 탐지 벤치마크")
+    parser.add_argument("--pages", type=int, default=20, help="페이지 수")
+    parser.add_argument("--tables", type=int, default=4, help="페이지당 표 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    args = parser.parse_args()
+
+    service = DocumentExtractionService()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = Path(tmp_dir) / "estimates.pdf"
+        pdf_path.write_bytes(build_estimate_pdf(args.pages, args.tables))
+
+        # 페이지 객체 캐시(page.chars 등)가 측정에 섞이지 않도록 매번 새로 엽니다.
+        def run_legacy(bbox_settings):
+            with pdfplumber.open(str(pdf_path)) as pdf:
+                for page in pdf.pages:
+                    legacy_extract_tables(page, bbox_settings)
+                    page.close()
+
+        def run_single_pass():
+            with pdfplumber.open(str(pdf_path)) as pdf:
+                for page_num, page in enumerate(pdf.pages, start=1):
+                    asyncio.run(service._extract_tables(page, page_num))
+                    page.close()
+
+        legacy_time = min(timeit.repeat(
+            lambda: run_legacy(LEGACY_BBOX_SETTINGS), number=1, repeat=args.repeat
+        ))
+        legacy_bbox_time = min(timeit.repeat(
+            lambda: run_legacy(TABLE_STRATEGIES["lines_strict"]), number=1, repeat=args.repeat
+        ))
+        single_time = min(timeit.repeat(run_single_pass, number=1, repeat=args.repeat))
+
+        with pdfplumber.open(str(pdf_path)) as pdf:
+            table_count = len(asyncio.run(service._extract_tables(pdf.pages[0], 1)))
+
+    print(f"페이지 수: {args.pages} (페이지당 표 {args.tables}개)")
+    print(f"기존 구현 (bbox 실패):  {legacy_time / args.pages * 1e3:8.1f} ms/page")
+    print(f"기존 구현 (bbox 성공):  {legacy_bbox_time / args.pages * 1e3:8.1f} ms/page")
+    print(f"단일 패스:              {single_time / args.pages * 1e3:8.1f} ms/page")
+    print(f"속도 향상 (bbox 성공 대비): {legacy_bbox_time / single_time:8.2f}x")
+    print(f"탐지 표 수:  {table_count}개 (1페이지 기준, 전략: {service.table_strategy})")
+
+
+if __name__ == "__main__":
+    main()
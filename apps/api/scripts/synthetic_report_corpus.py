@@ -0,0 +1,250 @@
+"""
+벤치마크용 합성 증권사 리포트 코퍼스
+
+같은 seed로 항상 같은 PDF(바이트 단위 동일)를 만듭니다. 리포트 유형별로
+페이지 수, 표, 차트(JPEG 이미지), 스캔 페이지(텍스트 레이어 없는 전체 페이지 이미지)
+구성이 다릅니다.
+
+사용법:
+    python scripts/synthetic_report_corpus.py --output /tmp/corpus [--seed 7] [--scale 1]
+"""
+import argparse
+import hashlib
+import json
+import random
+import sys
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, List
+
+from PIL import Image, ImageDraw
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.synthetic_report_pdf import PAGE_HEIGHT, PAGE_WIDTH, SyntheticPage, SyntheticPdf
+
+
+# 리포트 유형: (개수, 페이지 수 범위, 페이지당 표 수 범위, 페이지당 차트 수 범위, 스캔 페이지 비율)
+REPORT_PROFILES = {
+    # 기업 코멘트 (짧은 텍스트 위주)
+    "comment": (3, (2, 4), (0, 1), (0, 1), 0.0),
+    # 실적 리뷰 (추정 표 위주)
+    "earnings": (2, (6, 10), (2, 3), (0, 1), 0.0),
+    # 신규 커버리지 (긴 리포트, 차트 많음)
+    "initiation": (1, (24, 32), (0, 2), (1, 3), 0.0),
+    # 스캔 리포트 (일부 페이지가 이미지 전용)
+    "scanned": (2, (4, 6), (0, 1), (0, 1), 0.5),
+}
+
+COMPANIES = ["삼성전자", "SK하이닉스", "현대차", "NAVER", "카카오", "LG에너지솔루션", "셀트리온", "POSCO홀딩스"]
+FIRMS = ["한국증권", "미래투자증권", "대신리서치", "하나금융투자"]
+PHRASES = [
+    "메모리 업황 회복에 따른 실적 개선이 예상된다",
+    "하반기 신제품 출시 효과로 매출 성장이 지속될 전망이다",
+    "원가 부담 완화로 영업이익률이 개선되고 있다",
+    "재고 조정이 마무리되며 수요 회복 신호가 확인된다",
+    "환율 효과를 제외해도 본업의 수익성은 견조하다",
+    "주주환원 정책 강화가 밸류에이션 재평가 요인이다",
+    "경쟁 심화에 따른 판가 하락은 리스크 요인이다",
+    "투자의견 매수와 목표주가를 유지한다",
+]
+METRICS = ["매출액", "영업이익", "세전이익", "순이익", "EPS(원)", "BPS(원)", "PER(배)", "PBR(배)", "ROE(%)"]
+YEARS = ["2023A", "2024A", "2025F", "2026F", "2027F"]
+
+# 스캔 페이지 해상도 (72dpi 기준 페이지 크기의 배수)
+SCAN_SCALE = 1.4
+
+
+def _jpeg(image: Image.Image, quality: int = 80) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def _chart_image(rng: random.Random, width: int = 480, height: int = 280) -> Image.Image:
+    """막대/선 차트 이미지"""
+    image = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(image)
+    draw.line([(40, height - 30), (width - 10, height - 30)], fill="black", width=2)
+    draw.line([(40, 10), (40, height - 30)], fill="black", width=2)
+    count = rng.randint(6, 12)
+    step = (width - 60) // count
+    values = [rng.uniform(0.2, 0.95) for _ in range(count)]
+    if rng.random() < 0.5:
+        for idx, value in enumerate(values):
+            x = 50 + idx * step
+            draw.rectangle([x, height - 30 - value * (height - 50), x + step * 0.6, height - 31], fill=(40, 90, 170))
+    else:
+        points = [(50 + idx * step, height - 30 - value * (height - 50)) for idx, value in enumerate(values)]
+        draw.line(points, fill=(200, 60, 40), width=3)
+    return image
+
+
+def _logo_image() -> Image.Image:
+    """모든 페이지에 반복되는 증권사 로고"""
+    image = Image.new("RGB", (120, 40), (0, 60, 130))
+    ImageDraw.Draw(image).rectangle([8, 8, 32, 32], fill="white")
+    return image
+
+
+def _scan_image(rng: random.Random) -> Image.Image:
+    """스캔 페이지 이미지 (텍스트 줄 모양, 표 괘선, 노이즈)"""
+    width, height = int(PAGE_WIDTH * SCAN_SCALE), int(PAGE_HEIGHT * SCAN_SCALE)
+    image = Image.new("L", (width, height), 245)
+    draw = ImageDraw.Draw(image)
+    y = 60
+    while y < height - 80:
+        if rng.random() < 0.1:
+            # 표
+            rows, cols = rng.randint(4, 8), rng.randint(3, 6)
+            cell_w, cell_h = (width - 120) // cols, 22
+            for row in range(rows + 1):
+                draw.line([(60, y + row * cell_h), (60 + cols * cell_w, y + row * cell_h)], fill=40)
+            for col in range(cols + 1):
+                draw.line([(60 + col * cell_w, y), (60 + col * cell_w, y + rows * cell_h)], fill=40)
+            y += rows * cell_h + 30
+            continue
+        # 텍스트 줄 (글자 덩어리)
+        x = 60
+        line_end = rng.randint(width // 2, width - 60)
+        while x < line_end:
+            word = rng.randint(12, 60)
+            draw.rectangle([x, y, x + word, y + 11], fill=rng.randint(20, 70))
+            x += word + rng.randint(6, 12)
+        y += rng.randint(20, 28)
+    # 스캔 노이즈
+    for _ in range(400):
+        px, py = rng.randrange(width), rng.randrange(height)
+        draw.point((px, py), fill=rng.randint(120, 200))
+    return image.convert("RGB")
+
+
+def _text_page(
+    page: SyntheticPage,
+    rng: random.Random,
+    company: str,
+    firm: str,
+    page_num: int,
+    n_tables: int,
+    n_charts: int,
+    logo: bytes
+) -> tuple:
+    """텍스트 레이어 페이지 (머리글, 본문, 추정 표, 차트, 쪽 번호), 실제 배치한 (표 수, 차트 수) 반환"""
+    page.image(PAGE_WIDTH - 150, PAGE_HEIGHT - 50, 110, 36, logo, (120, 40))
+    page.text(40, PAGE_HEIGHT - 40, f"{firm} 리서치센터 | {company} 기업분석", size=9)
+    y = PAGE_HEIGHT - 80
+    if page_num == 1:
+        target = rng.randrange(50, 200) * 1000
+        y = page.paragraph(40, y, [
+            f"{company} - 투자의견 매수, 목표주가 {target:,}원",
+            f"현재주가 {int(target * rng.uniform(0.6, 0.9)):,}원",
+            f"2025F 영업이익 {rng.randint(1000, 90000):,}억원 전망",
+        ], size=12, leading=18) - 10
+
+    for _ in range(rng.randint(6, 14)):
+        y = page.paragraph(40, y, [rng.choice(PHRASES) for _ in range(rng.randint(1, 3))]) - 6
+        if y < 140:
+            break
+
+    placed_tables = placed_charts = 0
+    for _ in range(n_tables):
+        rows = [["(십억원)"] + YEARS]
+        for metric in rng.sample(METRICS, rng.randint(4, len(METRICS))):
+            rows.append([metric] + [f"{rng.randint(100, 99999):,}" for _ in YEARS])
+        if y - 16 * len(rows) < 60:
+            break
+        y = page.table(40, y - 10, rows, [90] + [80] * len(YEARS)) - 10
+        placed_tables += 1
+
+    for _ in range(n_charts):
+        if y - 170 < 50:
+            break
+        chart = _chart_image(rng)
+        page.image(40, y - 170, 300, 165, _jpeg(chart), chart.size)
+        y -= 180
+        placed_charts += 1
+
+    page.text(PAGE_WIDTH / 2 - 10, 30, f"- {page_num} -", size=8)
+    return placed_tables, placed_charts
+
+
+def build_report(profile: str, index: int, seed: int) -> Dict[str, Any]:
+    """리포트 하나 생성 (PDF 바이트와 구성 정보)"""
+    _, page_range, table_range, chart_range, scanned_ratio = REPORT_PROFILES[profile]
+    rng = random.Random(f"{seed}:{profile}:{index}")
+    company, firm = rng.choice(COMPANIES), rng.choice(FIRMS)
+    logo = _jpeg(_logo_image())
+
+    pdf = SyntheticPdf()
+    page_count = rng.randint(*page_range)
+    spec = {"profile": profile, "pages": page_count, "tables": 0, "charts": 0, "scanned_pages": 0}
+    for page_num in range(1, page_count + 1):
+        page = pdf.add_page()
+        if page_num > 1 and rng.random() < scanned_ratio:
+            scan = _scan_image(rng)
+            page.image(0, 0, PAGE_WIDTH, PAGE_HEIGHT, _jpeg(scan, quality=70), scan.size)
+            spec["scanned_pages"] += 1
+            continue
+        tables, charts = _text_page(
+            page, rng, company, firm, page_num,
+            rng.randint(*table_range), rng.randint(*chart_range), logo
+        )
+        spec["tables"] += tables
+        spec["charts"] += charts
+
+    data = pdf.to_bytes()
+    spec["sha256"] = hashlib.sha256(data).hexdigest()
+    return {"name": f"{profile}_{index:02d}.pdf", "data": data, **spec}
+
+
+def build_corpus(output_dir: Path, seed: int = 7, scale: int = 1) -> Dict[str, Any]:
+    """
+    코퍼스 생성 (output_dir에 PDF와 manifest.json 저장)
+
+    scale은 유형별 리포트 수 배수입니다. 같은 seed/scale이면 같은 코퍼스가 만들어지며
+    이미 같은 내용의 파일이 있으면 다시 쓰지 않습니다.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    documents: List[Dict[str, Any]] = []
+    for profile, (count, *_) in REPORT_PROFILES.items():
+        for index in range(count * scale):
+            report = build_report(profile, index, seed)
+            path = output_dir / report.pop("name")
+            data = report.pop("data")
+            if not path.exists() or hashlib.sha256(path.read_bytes()).hexdigest() != report["sha256"]:
+                path.write_bytes(data)
+            documents.append({"file": path.name, **report})
+
+    manifest = {
+        "seed": seed,
+        "scale": scale,
+        "documents": documents,
+        "pages": sum(document["pages"] for document in documents),
+        # 코퍼스 전체 식별자 (결과 비교 시 같은 코퍼스인지 확인)
+        "sha256": hashlib.sha256("".join(d["sha256"] for d in documents).encode()).hexdigest(),
+    }
+    (output_dir / "manifest.json").write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 증권사 리포트 코퍼스 생성")
+    parser.add_argument("--output", required=True, help="출력 디렉토리")
+    parser.add_argument("--seed", type=int, default=7, help="난수 seed")
+    parser.add_argument("--scale", type=int, default=1, help="유형별 리포트 수 배수")
+    args = parser.parse_args()
+
+    manifest = build_corpus(Path(args.output), args.seed, args.scale)
+    for document in manifest["documents"]:
+        print(
+            f"{document['file']:<20} {document['pages']:>3}p  표 {document['tables']:>3}  "
+            f"차트 {document['charts']:>3}  스캔 {document['scanned_pages']:>2}"
+        )
+    print(f"총 {len(manifest['documents'])}개 리포트, {manifest['pages']} 페이지 (sha256 {manifest['sha256'][:12]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+벤치마크용 합성 증권사 리포트 PDF 작성기
+
+외부 라이브러리 없이 한국어 텍스트(비임베드 CID 폰트 HYSMyeongJo-Medium),
+선으로 그린 표, 이미지 XObject를 포함한 PDF를 만듭니다.
+"""
+from typing import List, Optional, Sequence
+
+
+PAGE_WIDTH = 595  # A4 (pt)
+PAGE_HEIGHT = 842
+
+_FONT_OBJECTS = [
+    b"<< /Type /Font /Subtype /Type0 /BaseFont /HYSMyeongJo-Medium /Encoding /UniKS-UCS2-H "
+    b"/DescendantFonts [%(cid_font)d 0 R] >>",
+    b"<< /Type /Font /Subtype /CIDFontType0 /BaseFont /HYSMyeongJo-Medium "
+    b"/CIDSystemInfo << /Registry (Adobe) /Ordering (Korea1) /Supplement 1 >> "
+    b"/FontDescriptor %(descriptor)d 0 R /DW 1000 /W [1 95 500] >>",
+    b"<< /Type /FontDescriptor /FontName /HYSMyeongJo-Medium /Flags 6 "
+    b"/FontBBox [0 -148 1001 880] /ItalicAngle 0 /Ascent 880 /Descent -148 "
+    b"/CapHeight 880 /StemV 50 >>",
+]
+
+
+def _encode_text(text: str) -> str:
+    """UniKS-UCS2-H 인코딩 16진 문자열"""
+    return "<" + text.encode("utf-16-be").hex().upper() + ">"
+
+
+class SyntheticPage:
+    """페이지 콘텐츠 스트림 작성기 (좌표는 PDF 좌표계, 원점은 좌하단)"""
+
+    def __init__(self):
+        self._commands: List[str] = []
+        self.images: List[dict] = []
+
+    def text(self, x: float, y: float, text: str, size: float = 10):
+        """텍스트 한 줄"""
+        self._commands.append(f"BT /F1 {size} Tf {x} {y} Td {_encode_text(text)} Tj ET")
+
+    def paragraph(self, x: float, y: float, lines: Sequence[str], size: float = 10, leading: float = 14) -> float:
+        """여러 줄 텍스트, 다음 줄의 y 좌표 반환"""
+        for line in lines:
+            self.text(x, y, line, size)
+            y -= leading
+        return y
+
+    def line(self, x0: float, y0: float, x1: float, y1: float, width: float = 0.5):
+        """직선"""
+        self._commands.append(f"{width} w {x0} {y0} m {x1} {y1} l S")
+
+    def table(
+        self,
+        x: float,
+        y: float,
+        rows: Sequence[Sequence[str]],
+        col_widths: Sequence[float],
+        row_height: float = 16,
+        size: float = 8
+    ) -> float:
+        """괘선 표 (y는 표 상단), 표 아래 y 좌표 반환"""
+        width = sum(col_widths)
+        bottom = y - row_height * len(rows)
+        for row_idx in range(len(rows) + 1):
+            row_y = y - row_height * row_idx
+            self.line(x, row_y, x + width, row_y)
+        col_x = x
+        for col_width in list(col_widths) + [0]:
+            self.line(col_x, y, col_x, bottom)
+            col_x += col_width
+        for row_idx, row in enumerate(rows):
+            cell_x = x
+            for cell, col_width in zip(row, col_widths):
+                self.text(cell_x + 3, y - row_height * (row_idx + 1) + 4, str(cell), size)
+                cell_x += col_width
+        return bottom
+
+    def image(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        data: bytes,
+        pixel_size: Sequence[int],
+        jpeg: bool = True
+    ):
+        """이미지 XObject 배치 (jpeg=False이면 8비트 무압축 RGB 샘플)"""
+        name = f"Im{len(self.images) + 1}"
+        self.images.append({"name": name, "data": data, "size": tuple(pixel_size), "jpeg": jpeg})
+        self._commands.append(f"q {width} 0 0 {height} {x} {y} cm /{name} Do Q")
+
+    def content(self) -> bytes:
+        return "\n".join(self._commands).encode("latin-1")
+
+
+class SyntheticPdf:
+    """합성 PDF 문서"""
+
+    def __init__(self):
+        self.pages: List[SyntheticPage] = []
+
+    def add_page(self) -> SyntheticPage:
+        page = SyntheticPage()
+        self.pages.append(page)
+        return page
+
+    def to_bytes(self) -> bytes:
+        objects: List[Optional[bytes]] = [b"<< /Type /Catalog /Pages 2 0 R >>", None]
+        font_id = len(objects) + 1
+        objects.append(_FONT_OBJECTS[0] % {b"cid_font": font_id + 1})
+        objects.append(_FONT_OBJECTS[1] % {b"descriptor": font_id + 2})
+        objects.append(_FONT_OBJECTS[2])
+
+        page_ids = []
+        for page in self.pages:
+            xobjects = []
+            for image in page.images:
+                width, height = image["size"]
+                image_filter = b" /Filter /DCTDecode" if image["jpeg"] else b""
+                objects.append(
+                    b"<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceRGB "
+                    b"/BitsPerComponent 8%s /Length %d >>\nstream\n%s\nendstream"
+                    % (width, height, image_filter, len(image["data"]), image["data"])
+                )
+                xobjects.append(b"/%s %d 0 R" % (image["name"].encode(), len(objects)))
+
+            stream = page.content()
+            objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+            content_id = len(objects)
+            objects.append(
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] "
+                b"/Resources << /Font << /F1 %d 0 R >> /XObject << %s >> >> /Contents %d 0 R >>"
+                % (PAGE_WIDTH, PAGE_HEIGHT, font_id, b" ".join(xobjects), content_id)
+            )
+            page_ids.append(len(objects))
+
+        kids = " ".join(f"{page_id} 0 R" for page_id in page_ids).encode()
+        objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+        output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for obj_id, body in enumerate(objects, start=1):
+            offsets.append(len(output))
+            output += b"%d 0 obj\n%s\nendobj\n" % (obj_id, body)
+        xref_offset = len(output)
+        output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        for offset in offsets:
+            output += b"%010d 00000 n \n" % offset
+        output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(objects) + 1, xref_offset
+        )
+        return bytes(output)
@@ -0,0 +1,88 @@
+"""
+Boilerplate 탐지 단위 테스트
+"""
+from app.services.extraction.boilerplate import mark_boilerplate, page_texts, prompt_texts
+
+
+def build_result(page_count):
+    """페이지마다 머리글, 본문 2줄, 쪽 번호가 있는 추출 결과"""
+    topics = ["실적 요약", "밸류에이션", "업황 전망", "리스크 요인"]
+    texts = []
+    for page_num in range(1, page_count + 1):
+        topic = topics[page_num - 1]
+        lines = [
+            ("한국증권 리서치센터 | 기업분석", 30),
+            (f"{topic} 본문 첫 줄", 100),
+            (f"{topic} 본문 둘째 줄", 120),
+            (f"- {page_num} -", 800),
+        ]
+        texts.append({
+            "id": f"text_{page_num}_full",
+            "content": "\n".join(line for line, _ in lines),
+            "page_number": page_num,
+            "bbox": [0, 0, 595, 842],
+        })
+        for idx, (line, top) in enumerate(lines):
+            texts.append({
+                "id": f"text_{page_num}_para_{idx}",
+                "content": line,
+                "page_number": page_num,
+                "bbox": [40, top, 200, 10],
+            })
+    return {"texts": texts}
+
+
+class TestBoilerplate:
+    """Boilerplate 탐지 테스트"""
+
+    def test_marks_repeated_header_and_page_numbers(self):
+        """머리글과 쪽 번호가 반복 문구로 표시되는지 테스트"""
+        result = build_result(4)
+        boilerplate = mark_boilerplate(result)
+
+        assert sorted(entry["content"] for entry in boilerplate) == ["- 1 -", "한국증권 리서치센터 | 기업분석"]
+        assert all(entry["pages"] == [1, 2, 3, 4] for entry in boilerplate)
+        flagged = [t["content"] for t in result["texts"] if t.get("boilerplate")]
+        assert len(flagged) == 8
+        assert not any("본문" in content for content in flagged)
+
+    def test_prompt_texts_exclude_boilerplate(self):
+        """프롬프트 텍스트에서 반복 문구 블록과 전체 텍스트의 해당 줄이 빠지는지 테스트"""
+        result = build_result(3)
+        mark_boilerplate(result)
+
+        contents = prompt_texts(result)
+
+        assert contents[0] == "실적 요약 본문 첫 줄\n실적 요약 본문 둘째 줄"
+        assert not any("리서치센터" in content or content.startswith("- ") for content in contents)
+        assert len(contents) == 3 * 3
+
+    def test_page_texts_use_each_page_once(self):
+        """페이지별 본문이 반복 문구 없이 페이지당 한 번씩만 들어가는지 테스트"""
+        result = build_result(3)
+        mark_boilerplate(result)
+        # 전체 텍스트 블록이 없는 페이지는 문단 블록 사용
+        result["texts"] = [block for block in result["texts"] if block["id"] != "text_3_full"]
+
+        pages = page_texts(result)
+
+        assert [page_number for page_number, _ in pages] == [1, 2, 3]
+        assert pages[0][1] == "실적 요약 본문 첫 줄\n실적 요약 본문 둘째 줄"
+        assert pages[2][1] == "업황 전망 본문 첫 줄\n업황 전망 본문 둘째 줄"
+
+    def test_same_text_at_different_position_not_marked(self):
+        """내용이 같아도 위치가 다르면 반복 문구가 아닌지 테스트"""
+        result = {"texts": [
+            {"id": "text_1_para_0", "content": "투자의견 매수", "page_number": 1, "bbox": [40, 100, 80, 10]},
+            {"id": "text_2_para_0", "content": "투자의견 매수", "page_number": 2, "bbox": [40, 500, 80, 10]},
+        ]}
+
+        assert mark_boilerplate(result) == []
+        assert prompt_texts(result) == ["투자의견 매수", "투자의견 매수"]
+
+    def test_single_page_has_no_boilerplate(self):
+        """1페이지 문서는 반복 문구가 없는지 테스트"""
+        result = build_result(1)
+
+        assert mark_boilerplate(result) == []
+        assert len(prompt_texts(result)) == 5
@@ -0,0 +1,49 @@
+"""
+Chunking 단위 테스트
+"""
+from app.services.extraction import chunking
+from app.services.extraction.chunking import chunk_pages, chunk_texts, count_tokens
+
+
+class TestChunking:
+    """Chunking 테스트"""
+
+    def test_estimated_token_count(self, monkeypatch):
+        """tiktoken이 없을 때 한글 1자 1토큰, ASCII 4자 1토큰으로 추정하는지 테스트"""
+        monkeypatch.setattr(chunking, "TIKTOKEN_AVAILABLE", False)
+        chunking._encoding.cache_clear()
+        try:
+            assert count_tokens("목표주가") == 4
+            assert count_tokens("EPS 1,200") == 3
+            assert count_tokens("") == 0
+        finally:
+            chunking._encoding.cache_clear()
+
+    def test_chunks_respect_budget_and_order(self):
+        """청크가 예산 이하이고 순서와 내용이 보존되는지 테스트"""
+        texts = [f"{idx}번째 문단 " + "실적 전망 " * (idx % 7 + 1) for idx in range(200)]
+
+        chunks = chunk_texts(texts, max_tokens=300)
+
+        assert len(chunks) > 1
+        assert all(count_tokens(chunk) <= 300 for chunk in chunks)
+        assert "\n".join(chunks).split("\n") == texts
+
+    def test_long_text_is_split(self):
+        """예산보다 긴 한 줄도 나눠서 빠짐없이 포함하는지 테스트"""
+        line = "가나다라마바사" * 500
+
+        chunks = chunk_texts(["머리말", line], max_tokens=1000)
+
+        assert all(count_tokens(chunk) <= 1000 for chunk in chunks)
+        assert "".join(chunk.replace("\n", "") for chunk in chunks) == "머리말" + line
+
+    def test_chunk_pages_marks_pages(self):
+        """페이지 표시가 붙고 뒷 페이지까지 포함되는지 테스트"""
+        pages = [(page_number, f"{page_number}페이지 본문 " * 200) for page_number in range(1, 21)]
+
+        chunks = chunk_pages(pages, max_tokens=2000)
+
+        assert len(chunks) > 1
+        assert chunks[0].startswith("[페이지 1]\n")
+        assert "[페이지 20]" in chunks[-1]
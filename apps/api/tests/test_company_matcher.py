@@ -0,0 +1,66 @@
+"""
+Company Matcher 단위 테스트
+"""
+from app.services.company_matcher import AhoCorasick, CompanyMatcher
+
+
+COMPANIES = [
+    ("samsung", "삼성전자", "Samsung Electronics", "005930"),
+    ("lg", "LG", "LG Corp", "003550"),
+    ("lges", "LG에너지솔루션", "LG Energy Solution", "373220"),
+    ("hynix", "SK하이닉스", "SK hynix", "000660"),
+    ("kia", "기아", "Kia", "000270"),
+]
+
+
+class TestCompanyMatcher:
+    """Company Matcher 테스트"""
+
+    def test_aho_corasick_finds_overlapping_patterns(self):
+        """겹치는 패턴을 모두 찾는지 테스트"""
+        automaton = AhoCorasick()
+        for pattern in ["he", "she", "his", "hers"]:
+            automaton.add(pattern, pattern)
+        automaton.build()
+
+        found = sorted((start, value) for start, _, value in automaton.iter_matches("ushers"))
+        assert found == [(1, "she"), (2, "he"), (2, "hers")]
+
+    def test_find_prefers_longest_and_respects_boundaries(self):
+        """긴 기업명 우선, 단어 경계(영문/종목코드) 및 조사 허용 테스트"""
+        matcher = CompanyMatcher(COMPANIES)
+
+        hits = [company_id for _, _, _, company_id in matcher.find("LG에너지솔루션은 LG의 자회사")]
+        assert hits == ["lges", "lg"]
+        # 영문 단어 일부, 긴 숫자 안의 종목코드, 한글 단어 중간은 제외
+        assert matcher.find("ALGO 10059301 현대기아차") == []
+
+    def test_match_report_picks_dominant_company(self):
+        """첫 페이지 언급과 종목코드로 대상 기업을 확정하는지 테스트"""
+        matcher = CompanyMatcher(COMPANIES)
+        pages = [
+            (1, "삼성전자(005930) 메모리 업황 회복\nSK하이닉스 대비 HBM 점유율 열위"),
+            (2, "삼성전자 목표주가 상향"),
+        ]
+
+        match = matcher.match_report(pages)
+        assert match.company_id == "samsung"
+        assert not match.ambiguous
+
+    def test_match_report_ambiguous_returns_none(self):
+        """후보가 비슷하면 확정하지 않는지 테스트 (LLM으로 넘김)"""
+        matcher = CompanyMatcher(COMPANIES)
+
+        match = matcher.match_report([(1, "반도체 업종: 삼성전자, SK하이닉스 비중 확대")])
+        assert match.company_id is None
+        assert match.ambiguous
+        assert matcher.match_report([(1, "업종 전망")]).ambiguous is False
+
+    def test_lookup_by_ticker_and_name(self):
+        """종목코드, 정확한 기업명, 기업명 안의 유일한 기업 조회 테스트"""
+        matcher = CompanyMatcher(COMPANIES)
+
+        assert matcher.lookup("아무개", "000660") == "hynix"
+        assert matcher.lookup("lg 에너지솔루션") == "lges"
+        assert matcher.lookup("기아 주식회사") == "kia"
+        assert matcher.lookup("없는기업") is None
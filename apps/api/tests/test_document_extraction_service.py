@@ -0,0 +1,500 @@
+"""
+Document Extraction Service 단위 테스트
+"""
+import asyncio
+import time
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from app.services.document_extraction_service import DocumentExtractionService, EXTRACTOR_VERSION
+from app.services.extraction.ocr_engine_pool import OcrEnginePool
+from app.services.extraction.page_raster_cache import PageRasterCache
+from app.services.extraction.stage_timer import StageTimer
+
+
+RGB_2X2 = bytes([255, 0, 0, 0, 255, 0, 0, 0, 255, 255, 255, 255])
+
+
+def build_pdf(page_texts, images_per_page=0, image_y=100, image_data=RGB_2X2, image_attrs=b"", page_commands=()):
+    """
+    테스트용 최소 PDF 생성 (페이지당 텍스트 줄 목록, Helvetica)
+
+    images_per_page만큼 PDF 좌표 y=image_y 위치에 100x50pt 크기의 이미지를 가로로 배치합니다.
+    이미지 XObject는 기본적으로 2x2 무압축 RGB이며 image_attrs로 속성을 덮어씁니다.
+    page_commands의 콘텐츠 스트림 명령은 모든 페이지 끝에 추가됩니다.
+    """
+    attrs = image_attrs or b"/Width 2 /Height 2 /ColorSpace /DeviceRGB /BitsPerComponent 8"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Pages (페이지 생성 후 채움)
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Type /XObject /Subtype /Image %s /Length %d >>\nstream\n%s\nendstream"
+        % (attrs, len(image_data), image_data),
+    ]
+    page_ids = []
+    for lines in page_texts:
+        commands = ["BT /F1 12 Tf 14 TL 72 720 Td"]
+        for line in lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            commands.append(f"({escaped}) Tj T*")
+        commands.append("ET")
+        for img_idx in range(images_per_page):
+            commands.append(f"q 100 0 0 50 {72 + img_idx * 120} {image_y} cm /Im1 Do Q")
+        commands.extend(page_commands)
+        stream = "\n".join(commands).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> /XObject << /Im1 4 0 R >> >> "
+            b"/Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for obj_id, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (obj_id, body)
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        output += b"%010d 00000 n \n" % offset
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, xref_offset
+    )
+    return bytes(output)
+
+
+def grid_commands(x, top, rows, cols, cell_width=60, cell_height=20):
+    """괘선 표 콘텐츠 스트림 명령 (top은 PDF 좌표계의 표 상단 y)"""
+    bottom = top - rows * cell_height
+    right = x + cols * cell_width
+    commands = []
+    for row in range(rows + 1):
+        y = top - row * cell_height
+        commands.append(f"{x} {y} m {right} {y} l S")
+    for col in range(cols + 1):
+        col_x = x + col * cell_width
+        commands.append(f"{col_x} {top} m {col_x} {bottom} l S")
+    for row in range(rows):
+        for col in range(cols):
+            commands.append(
+                f"BT /F1 8 Tf {x + col * cell_width + 4} {top - (row + 1) * cell_height + 6} Td "
+                f"(R{row}C{col}) Tj ET"
+            )
+    return commands
+
+
+class FakeOcrEngine:
+    """PaddleOCR 결과 형식을 흉내 내는 테스트용 엔진"""
+
+    def ocr(self, image, cls=True):
+        return [[[None, ("OCR 텍스트", 0.99)]]]
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    """5페이지 샘플 PDF"""
+    pages = [
+        [f"Page {n} Title", f"Target Price: {n}0,000", "Operating Profit: 500"]
+        for n in range(1, 6)
+    ]
+    path = tmp_path / "sample.pdf"
+    path.write_bytes(build_pdf(pages))
+    return str(path)
+
+
+@pytest.fixture
+def image_pdf(tmp_path):
+    """페이지당 이미지 3개가 있는 2페이지 PDF"""
+    path = tmp_path / "images.pdf"
+    path.write_bytes(build_pdf([["Chart page 1"], ["Chart page 2"]], images_per_page=3))
+    return str(path)
+
+
+class TestDocumentExtractionService:
+    """Document Extraction Service 테스트"""
+
+    def test_extract_sequential(self, sample_pdf):
+        """순차 추출 결과 형식 테스트"""
+        service = DocumentExtractionService(max_workers=1)
+        result = asyncio.run(service.extract_async("report-1", sample_pdf))
+
+        assert result["metadata"]["page_count"] == 5
+        assert [p["page_number"] for p in result["pages"]] == [1, 2, 3, 4, 5]
+        assert result["texts"][0]["content"].startswith("Page 1 Title")
+        assert all(t["page_number"] in range(1, 6) for t in result["texts"])
+
+    def test_extract_parallel_matches_sequential(self, sample_pdf):
+        """병렬 추출 결과가 순차 추출과 동일한지 테스트"""
+        sequential = asyncio.run(
+            DocumentExtractionService(max_workers=1).extract_async("report-1", sample_pdf)
+        )
+        parallel = asyncio.run(
+            DocumentExtractionService(max_workers=2, pages_per_task=2).extract_async(
+                "report-1", sample_pdf, parallel=True
+            )
+        )
+
+        assert parallel == sequential
+
+    def test_extract_missing_file(self, tmp_path):
+        """존재하지 않는 파일 테스트"""
+        service = DocumentExtractionService(max_workers=1)
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(service.extract_async("report-1", str(tmp_path / "missing.pdf")))
+
+    def test_extract_images_uses_embedded_stream(self, tmp_path):
+        """JPEG 이미지는 페이지 렌더링 없이 원본 바이트 그대로 저장되는지 테스트"""
+        buffer = BytesIO()
+        Image.new("RGB", (40, 20), (200, 30, 30)).save(buffer, format="JPEG")
+        jpeg = buffer.getvalue()
+        path = tmp_path / "jpeg.pdf"
+        path.write_bytes(build_pdf(
+            [["Chart page"]], images_per_page=2, image_data=jpeg,
+            image_attrs=b"/Width 40 /Height 20 /ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode"
+        ))
+        service = DocumentExtractionService(max_workers=1)
+        raster_cache = PageRasterCache(str(path), dpi=72)
+
+        with service._open_pdf(str(path)) as pdf:
+            images = asyncio.run(
+                service._extract_images(pdf.pages[0], 1, "report-1", str(path), raster_cache)
+            )
+
+        assert len(images) == 2
+        assert raster_cache.render_count == 0
+        for image in images:
+            assert image["image_source"] == "embedded"
+            assert image["image_path"].endswith(".jpg")
+            with open(image["image_path"], "rb") as f:
+                assert f.read() == jpeg
+
+    def test_extract_images_flate_original_resolution(self, image_pdf):
+        """무압축/Flate 이미지는 원본 해상도로 저장되는지 테스트"""
+        service = DocumentExtractionService(max_workers=1)
+        raster_cache = PageRasterCache(image_pdf, dpi=72)
+
+        with service._open_pdf(image_pdf) as pdf:
+            images = asyncio.run(
+                service._extract_images(pdf.pages[0], 1, "report-1", image_pdf, raster_cache)
+            )
+
+        assert raster_cache.render_count == 0
+        with Image.open(images[0]["image_path"]) as saved:
+            assert saved.size == (2, 2)
+
+    def test_extract_images_renders_page_once_for_fallback(self, tmp_path):
+        """직접 디코딩할 수 없는 이미지는 페이지를 1회만 렌더링해 영역을 잘라내는지 테스트"""
+        path = tmp_path / "masked.pdf"
+        path.write_bytes(build_pdf(
+            [["Chart page"]], images_per_page=3, image_data=bytes([0x50, 0xA0]),
+            image_attrs=b"/Width 2 /Height 2 /ImageMask true /BitsPerComponent 1"
+        ))
+        service = DocumentExtractionService(max_workers=1)
+        raster_cache = PageRasterCache(str(path), dpi=72)
+
+        with service._open_pdf(str(path)) as pdf:
+            images = asyncio.run(
+                service._extract_images(pdf.pages[0], 1, "report-1", str(path), raster_cache)
+            )
+
+        assert len(images) == 3
+        assert raster_cache.render_count == 1
+        for image in images:
+            assert image["image_source"] == "rendered"
+            with Image.open(image["image_path"]) as saved:
+                # 페이지 전체가 아닌 이미지 영역만 저장
+                assert saved.size == (100, 50)
+
+    def test_iter_pages_streams_in_order(self, sample_pdf):
+        """스트리밍 추출이 페이지 순서대로 결과를 반환하는지 테스트"""
+        service = DocumentExtractionService(max_workers=2, pages_per_task=2)
+
+        async def collect(parallel):
+            return [
+                page_result["page_number"]
+                async for page_result in service.iter_pages(
+                    "report-1", sample_pdf, 5, parallel=parallel, first_page=2
+                )
+            ]
+
+        assert asyncio.run(collect(False)) == [2, 3, 4, 5]
+        assert asyncio.run(collect(True)) == [2, 3, 4, 5]
+
+    @pytest.mark.parametrize("backend", ["pdfplumber", "pdfium"])
+    def test_sequential_extraction_does_not_block_event_loop(self, sample_pdf, monkeypatch, backend):
+        """순차 추출 중에도 이벤트 루프의 다른 작업이 실행되는지 테스트 (페이지 추출은 스레드에서)"""
+        service = DocumentExtractionService(max_workers=1, backend=backend)
+        method = "_extract_text_page_content" if backend == "pdfium" else "_extract_page_content"
+        extract_page = getattr(service, method)
+
+        def slow(*args):
+            time.sleep(0.05)
+            return extract_page(*args)
+
+        async def slow_async(*args):
+            time.sleep(0.05)
+            return await extract_page(*args)
+
+        monkeypatch.setattr(service, method, slow if backend == "pdfium" else slow_async)
+
+        async def run():
+            ticks = 0
+            stop = asyncio.Event()
+
+            async def ticker():
+                nonlocal ticks
+                while not stop.is_set():
+                    ticks += 1
+                    await asyncio.sleep(0.005)
+
+            task = asyncio.create_task(ticker())
+            pages = [page["page_number"] async for page in service.iter_pages("report-1", sample_pdf, 5)]
+            stop.set()
+            await task
+            return pages, ticks
+
+        pages, ticks = asyncio.run(run())
+        assert pages == [1, 2, 3, 4, 5]
+        # 5페이지 x 50ms 동안 루프가 막히면 ticker는 몇 번밖에 돌지 못함
+        assert ticks >= 20
+
+    def test_ocr_routing_by_text_layer(self, tmp_path):
+        """텍스트 레이어가 있는 페이지는 글자가 겹치는 영역만 OCR을 건너뛰는지 테스트"""
+        path = tmp_path / "text_layer.pdf"
+        path.write_bytes(build_pdf([[f"Line {n} text" for n in range(8)]], images_per_page=3, image_y=640))
+        service = DocumentExtractionService(max_workers=1)
+        service.ocr_pool = OcrEnginePool(size=1, engine_factory=FakeOcrEngine)
+
+        with service._open_pdf(str(path)) as pdf:
+            page_result = asyncio.run(
+                service._extract_page_content(pdf.pages[0], 1, "report-1", str(path))
+            )
+
+        assert page_result["extraction_path"] == "text_layer"
+        assert [image["ocr_path"] for image in page_result["images"]] == ["text_layer", "ocr", "ocr"]
+        assert [bool(image["ocr_text"]) for image in page_result["images"]] == [False, True, True]
+
+    def test_scanned_page_uses_ocr_text(self, image_pdf):
+        """텍스트 레이어가 부족한 페이지는 OCR 텍스트를 텍스트 블록으로 추가하는지 테스트"""
+        service = DocumentExtractionService(max_workers=1)
+        service.ocr_pool = OcrEnginePool(size=1, engine_factory=FakeOcrEngine)
+
+        with service._open_pdf(image_pdf) as pdf:
+            page_result = asyncio.run(
+                service._extract_page_content(pdf.pages[0], 1, "report-1", image_pdf)
+            )
+
+        assert page_result["extraction_path"] == "ocr"
+        assert all(image["ocr_path"] == "ocr" for image in page_result["images"])
+        ocr_blocks = [b for b in page_result["text_blocks"] if b.get("source") == "ocr"]
+        assert len(ocr_blocks) == 1
+
+    def test_extract_tables_single_pass(self, tmp_path):
+        """표 데이터와 bbox가 같은 탐지 결과에서 나오는지 테스트"""
+        path = tmp_path / "tables.pdf"
+        path.write_bytes(build_pdf(
+            [["Estimates"]],
+            page_commands=grid_commands(72, 600, 3, 4) + grid_commands(72, 400, 2, 2)
+        ))
+        service = DocumentExtractionService(max_workers=1)
+
+        with service._open_pdf(str(path)) as pdf:
+            tables = asyncio.run(service._extract_tables(pdf.pages[0], 1))
+
+        assert [(t["rows"], t["columns"]) for t in tables] == [(3, 4), (2, 2)]
+        assert tables[0]["data"][2][3] == "R2C3"
+        assert tables[1]["data"][0] == ["R0C0", "R0C1"]
+        # pdfplumber 좌표계 (top = 792 - PDF y)
+        assert tables[0]["bbox"] == pytest.approx([72, 192, 240, 60], abs=1)
+        assert tables[1]["bbox"] == pytest.approx([72, 392, 120, 40], abs=1)
+        assert all(t["confidence"] == "high" for t in tables)
+
+    def test_unknown_table_strategy(self):
+        """지원하지 않는 표 탐지 전략 테스트"""
+        with pytest.raises(ValueError):
+            DocumentExtractionService(max_workers=1, table_strategy="unknown")
+
+    def test_pdfium_backend_text_blocks(self, sample_pdf):
+        """pdfium 백엔드가 pdfplumber와 같은 형식의 텍스트 블록을 만드는지 테스트"""
+        plumber = asyncio.run(
+            DocumentExtractionService(max_workers=1).extract_async("report-1", sample_pdf)
+        )
+        pdfium = asyncio.run(
+            DocumentExtractionService(max_workers=1, backend="pdfium").extract_async("report-1", sample_pdf)
+        )
+
+        assert [t["id"] for t in pdfium["texts"]] == [t["id"] for t in plumber["texts"]]
+        assert [t["content"] for t in pdfium["texts"]] == [t["content"] for t in plumber["texts"]]
+        for fast, full in zip(pdfium["texts"], plumber["texts"]):
+            assert fast["bbox"] == pytest.approx(full["bbox"], abs=3)
+        assert pdfium["tables"] == [] and pdfium["images"] == []
+        assert [p["text_layer"] for p in pdfium["pages"]] == [p["text_layer"] for p in plumber["pages"]]
+
+    def test_pdfium_backend_parallel_matches_sequential(self, sample_pdf):
+        """pdfium 백엔드 병렬 추출 결과가 순차 추출과 동일한지 테스트"""
+        sequential = asyncio.run(
+            DocumentExtractionService(max_workers=1, backend="pdfium").extract_async("report-1", sample_pdf)
+        )
+        parallel = asyncio.run(
+            DocumentExtractionService(max_workers=2, pages_per_task=2, backend="pdfium").extract_async(
+                "report-1", sample_pdf, parallel=True
+            )
+        )
+
+        assert parallel == sequential
+
+    def test_stage_timings_sequential_and_parallel(self, sample_pdf):
+        """단계별 소요 시간이 순차/병렬 추출 모두에서 기록되고 결과에 섞이지 않는지 테스트"""
+        sequential_timer, parallel_timer = StageTimer(), StageTimer()
+        sequential = asyncio.run(
+            DocumentExtractionService(max_workers=1, stage_timer=sequential_timer).extract_async("report-1", sample_pdf)
+        )
+        parallel = asyncio.run(
+            DocumentExtractionService(max_workers=2, pages_per_task=2, stage_timer=parallel_timer).extract_async(
+                "report-1", sample_pdf, parallel=True
+            )
+        )
+
+        assert parallel == sequential
+        assert not any("stage_timings" in page for page in parallel["pages"])
+        for timer in (sequential_timer, parallel_timer):
+            assert {"text", "words", "tables", "images"} <= set(timer.seconds)
+            assert timer.calls["tables"] == 5
+            assert all(seconds >= 0 for seconds in timer.seconds.values())
+
+    def test_cache_version_per_backend(self):
+        """백엔드별로 추출 결과 캐시 버전이 구분되는지 테스트"""
+        plumber = DocumentExtractionService(max_workers=1, backend="pdfplumber")
+        pdfium = DocumentExtractionService(max_workers=1, backend="pdfium")
+
+        assert plumber.cache_version == EXTRACTOR_VERSION
+        assert pdfium.cache_version != plumber.cache_version
+        with pytest.raises(ValueError):
+            DocumentExtractionService(max_workers=1, backend="unknown")
+
+    def test_text_and_deep_tiers_split_full_extraction(self, tmp_path):
+        """text 단계와 deep 단계 결과를 합치면 전체 추출과 같은지 테스트"""
+        path = tmp_path / "tiers.pdf"
+        path.write_bytes(build_pdf(
+            [[f"Line {n} text" for n in range(8)]], images_per_page=1, image_y=200,
+            page_commands=grid_commands(72, 400, 2, 2)
+        ))
+
+        def extract(tier):
+            service = DocumentExtractionService(max_workers=1, tier=tier)
+            service.ocr_pool = OcrEnginePool(size=1, engine_factory=FakeOcrEngine)
+            return asyncio.run(service.extract_async("report-1", str(path)))
+
+        full = extract("full")
+        text = extract("text")
+        deep = extract("deep")
+
+        assert text["texts"] == full["texts"]
+        assert text["tables"] == [] and text["images"] == []
+        assert deep["texts"] == []
+        assert deep["tables"] == full["tables"]
+        assert [i["id"] for i in deep["images"]] == [i["id"] for i in full["images"]]
+
+    def test_deep_tier_requires_pdfplumber(self):
+        """deep 단계는 pdfplumber 백엔드에서만 허용되는지 테스트"""
+        with pytest.raises(ValueError):
+            DocumentExtractionService(max_workers=1, backend="pdfium", tier="deep")
+        assert DocumentExtractionService(max_workers=1, tier="deep").cache_version.endswith("-deep")
+
+    def test_repeated_images_stored_and_ocr_once(self, tmp_path, monkeypatch):
+        """반복 이미지는 한 번만 저장/OCR하고 이후에는 참조만 하는지 테스트"""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path / "storage"))
+        buffer = BytesIO()
+        Image.new("RGB", (40, 20), (30, 60, 200)).save(buffer, format="JPEG")
+        path = tmp_path / "reports" / "logo.pdf"
+        path.parent.mkdir()
+        path.write_bytes(build_pdf(
+            [["Chart page 1"], ["Chart page 2"], ["Chart page 3"]], images_per_page=2,
+            image_data=buffer.getvalue(),
+            image_attrs=b"/Width 40 /Height 20 /ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode"
+        ))
+        calls = []
+
+        class CountingOcrEngine(FakeOcrEngine):
+            def ocr(self, image, cls=True):
+                calls.append(1)
+                return super().ocr(image, cls)
+
+        def extract(report_id):
+            service = DocumentExtractionService(max_workers=1)
+            service.ocr_pool = OcrEnginePool(size=1, engine_factory=CountingOcrEngine)
+            return asyncio.run(service.extract_async(report_id, str(path), image_scope="테스트증권"))
+
+        first = extract("report-1")
+        images = first["images"]
+        assert len(images) == 6
+        assert "duplicate_of" not in images[0]
+        assert all(image["duplicate_of"] == "report-1:image_1_0" for image in images[1:])
+        assert {image["image_path"] for image in images} == {images[0]["image_path"]}
+        assert all(image["ocr_text"] == "OCR 텍스트" for image in images)
+        assert len(calls) == 1
+        assert len(list((path.parent / "images").iterdir())) == 1
+
+        # 같은 증권사의 다른 리포트는 저장/OCR 없이 기존 이미지 참조
+        second = extract("report-2")
+        assert all(image["duplicate_of"] == "report-1:image_1_0" for image in second["images"])
+        assert len(calls) == 1
+
+    def test_similar_charts_from_other_reports_not_reused(self, tmp_path, monkeypatch):
+        """같은 양식에 숫자만 다른 다른 리포트의 차트는 지문이 가까워도 재사용하지 않는지 테스트"""
+        from PIL import ImageDraw
+
+        from app.services.extraction.image_dedupe import hamming_distance, image_fingerprint
+
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path / "storage"))
+
+        def chart(values):
+            image = Image.new("RGB", (400, 200), (255, 255, 255))
+            draw = ImageDraw.Draw(image)
+            for idx, value in enumerate(values):
+                draw.rectangle([40 + idx * 80, 170 - 120, 90 + idx * 80, 170], fill=(40, 80, 160))
+                draw.text((45 + idx * 80, 30), f"{value:,}", fill=(0, 0, 0))
+            buffer = BytesIO()
+            image.save(buffer, format="JPEG", quality=90)
+            return buffer.getvalue()
+
+        charts = [chart([1200, 1350, 1500, 1720]), chart([1210, 1390, 1480, 1770])]
+        fingerprints = [image_fingerprint(Image.open(BytesIO(data))) for data in charts]
+        assert hamming_distance(fingerprints[0]["hash"], fingerprints[1]["hash"]) <= 4
+
+        calls = []
+
+        class CountingOcrEngine(FakeOcrEngine):
+            def ocr(self, image, cls=True):
+                calls.append(1)
+                return super().ocr(image, cls)
+
+        def extract(report_id, data):
+            path = tmp_path / report_id / "chart.pdf"
+            path.parent.mkdir()
+            path.write_bytes(build_pdf(
+                [["EPS chart"]], images_per_page=1, image_data=data,
+                image_attrs=b"/Width 400 /Height 200 /ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode"
+            ))
+            service = DocumentExtractionService(max_workers=1)
+            service.ocr_pool = OcrEnginePool(size=1, engine_factory=CountingOcrEngine)
+            return asyncio.run(service.extract_async(report_id, str(path), image_scope="테스트증권"))["images"]
+
+        first = extract("report-1", charts[0])
+        second = extract("report-2", charts[1])
+        assert "duplicate_of" not in second[0]
+        assert second[0]["image_path"] != first[0]["image_path"]
+        assert "report-2" in second[0]["image_path"]
+        assert len(calls) == 2
+
+        # 내용이 같은 차트는 다른 리포트에서도 재사용
+        third = extract("report-3", charts[0])
+        assert third[0]["duplicate_of"] == "report-1:image_1_0"
+        assert len(calls) == 2
@@ -0,0 +1,78 @@
+"""
+Embedding Cache / LLMService.embed_many 단위 테스트
+"""
+import asyncio
+import os
+from types import SimpleNamespace
+
+from app.services.embedding_cache import EmbeddingCache
+from app.services.llm_service import LLMService
+
+
+class FakeEmbeddings:
+    """OpenAI embeddings.create 대체 (요청별 입력 기록)"""
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, model, input):
+        self.requests.append(list(input))
+        return SimpleNamespace(data=[
+            SimpleNamespace(index=idx, embedding=[float(len(text)), 0.5])
+            for idx, text in enumerate(input)
+        ])
+
+
+def make_service(tmp_path):
+    service = LLMService()
+    service.openai_api_key = "test"
+    service.openai_client = SimpleNamespace(embeddings=FakeEmbeddings())
+    service.embedding_cache = EmbeddingCache(cache_dir=tmp_path)
+    return service
+
+
+class TestEmbeddingCache:
+    """Embedding Cache 테스트"""
+
+    def test_round_trip_and_model_key(self, tmp_path):
+        """벡터 저장/조회와 모델별 키 분리 테스트"""
+        cache = EmbeddingCache(cache_dir=tmp_path)
+        key = cache.key_for("목표주가 120,000원", "text-embedding-3-large")
+        cache.put(key, [0.25, -1.5, 3.0])
+
+        assert cache.get(key) == [0.25, -1.5, 3.0]
+        assert cache.key_for("목표주가 120,000원", "other-model") != key
+        assert cache.get(cache.key_for("다른 텍스트", "text-embedding-3-large")) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제하는지 테스트"""
+        # 항목 하나 16바이트, 4개까지 저장 (정리 후에는 max_bytes의 90% 이하)
+        cache = EmbeddingCache(cache_dir=tmp_path, max_bytes=64)
+        keys = [cache.key_for(f"텍스트 {idx}", "model") for idx in range(5)]
+        for idx, key in enumerate(keys[:4]):
+            cache.put(key, [float(idx)] * 4)
+            os.utime(cache._path_for(key), (1000 + idx, 1000 + idx))
+
+        # 가장 오래된 항목을 조회하면 최근 사용으로 갱신
+        assert cache.get(keys[0]) == [0.0] * 4
+        cache.put(keys[4], [4.0] * 4)
+
+        assert [cache.get(key) is not None for key in keys] == [True, False, False, True, True]
+        assert sum(path.stat().st_size for path in tmp_path.glob("*/*.f32")) <= 64 * 0.9
+
+    def test_embed_many_batches_dedupes_and_caches(self, tmp_path):
+        """중복 제거, 배치 분할, 입력 순서 유지, 재호출 시 캐시 사용 테스트"""
+        service = make_service(tmp_path)
+        texts = ["a", "bb", "a", "ccc", "dddd", "bb"]
+
+        vectors = asyncio.run(service.embed_many(texts, batch_size=2, concurrency=2))
+
+        assert [vector[0] for vector in vectors] == [1.0, 2.0, 1.0, 3.0, 4.0, 2.0]
+        requests = service.openai_client.embeddings.requests
+        assert sorted(text for request in requests for text in request) == ["a", "bb", "ccc", "dddd"]
+        assert all(len(request) <= 2 for request in requests)
+
+        # 같은 내용은 다시 요청하지 않음
+        again = asyncio.run(service.embed_many(["ccc", "a"]))
+        assert [vector[0] for vector in again] == [3.0, 1.0]
+        assert len(service.openai_client.embeddings.requests) == len(requests)
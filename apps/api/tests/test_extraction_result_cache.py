@@ -0,0 +1,51 @@
+"""
+Extraction Result Cache 단위 테스트
+"""
+import os
+
+from app.services.extraction.result_cache import ExtractionResultCache
+
+
+class TestExtractionResultCache:
+    """Extraction Result Cache 테스트"""
+
+    def test_round_trip(self, tmp_path):
+        """저장한 추출 결과를 그대로 읽어오는지 테스트"""
+        pdf_path = tmp_path / "report.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 sample")
+        cache = ExtractionResultCache(cache_dir=tmp_path / "cache", enabled=True)
+        result = {"pages": [{"page_number": 1}], "texts": [{"content": "목표주가 120,000원"}]}
+
+        key = cache.key_for(str(pdf_path), "1")
+        assert cache.get(key) is None
+        cache.put(key, result)
+
+        assert cache.get(key) == result
+
+    def test_key_depends_on_content_and_version(self, tmp_path):
+        """같은 내용의 파일은 같은 키, 버전이 다르면 다른 키인지 테스트"""
+        first = tmp_path / "a.pdf"
+        second = tmp_path / "b.pdf"
+        first.write_bytes(b"same bytes")
+        second.write_bytes(b"same bytes")
+        cache = ExtractionResultCache(cache_dir=tmp_path / "cache", enabled=True)
+
+        assert cache.key_for(str(first), "1") == cache.key_for(str(second), "1")
+        assert cache.key_for(str(first), "1") != cache.key_for(str(first), "2")
+
+    def test_lru_eviction(self, tmp_path):
+        """크기 제한을 넘으면 가장 오래 사용하지 않은 항목이 삭제되는지 테스트"""
+        cache = ExtractionResultCache(cache_dir=tmp_path / "cache", max_bytes=10 ** 9, enabled=True)
+        payload = {"texts": [{"content": os.urandom(2000).hex()}]}
+        cache.put("old", payload)
+        cache.put("recent", payload)
+        os.utime(cache._path_for("old"), (1, 1))
+        os.utime(cache._path_for("recent"), (2, 2))
+
+        cache.get("old")  # 사용하면 최근 항목이 됨
+        cache.max_bytes = cache._path_for("old").stat().st_size * 2 + 1
+        cache.put("new", payload)
+
+        assert cache.get("recent") is None
+        assert cache.get("old") == payload
+        assert cache.get("new") == payload
@@ -0,0 +1,64 @@
+"""
+Numeric Scanner 단위 테스트
+"""
+from app.services.extraction.numeric_scanner import scan_numeric_data, parse_eok_amount
+
+
+class TestNumericScanner:
+    """Numeric Scanner 테스트"""
+
+    def test_target_price(self):
+        """목표주가 추출 및 만원 단위 정규화 테스트"""
+        results = scan_numeric_data("목표주가 120,000원 유지, TP 13만원, Target Price: 140,000")
+
+        assert [r["type"] for r in results] == ["target_price"] * 3
+        assert [r["value"] for r in results] == [120000.0, 130000.0, 140000.0]
+
+    def test_target_price_not_duplicated_as_stock_price(self):
+        """목표주가 안의 '주가'가 주가로 중복 추출되지 않는지 테스트"""
+        results = scan_numeric_data("목표주가 120,000원")
+
+        assert len(results) == 1
+        assert results[0]["type"] == "target_price"
+
+    def test_performance_units_normalized_to_eok(self):
+        """실적 금액이 억원 단위로 정규화되는지 테스트"""
+        results = scan_numeric_data("매출액 1조 2,000억원, 영업이익 500억원, 당기순이익 3천억, 순이익 2조원")
+
+        assert [(r["metric"], r["value"]) for r in results] == [
+            ("매출액", 12000.0),
+            ("영업이익", 500.0),
+            ("당기순이익", 3000.0),
+            ("순이익", 20000.0),
+        ]
+        assert all(r["unit"] == "억원" for r in results)
+
+    def test_english_performance_without_unit(self):
+        """단위 없는 영문 실적 수치는 단위를 알 수 없음(None)으로 표시하는지 테스트"""
+        results = scan_numeric_data("Revenue 12,000, Operating profit 500억원")
+
+        assert [(r["metric"], r["value"], r["unit"]) for r in results] == [
+            ("Revenue", 12000.0, None),
+            ("Operating profit", 500.0, "억원"),
+        ]
+
+    def test_stock_price(self):
+        """주가 추출 테스트"""
+        results = scan_numeric_data("현재주가 71,000원, 52주 최고가 88,800원, 52W Low 58,600")
+
+        assert [(r["price_type"], r["value"]) for r in results] == [
+            ("현재주가", 71000.0),
+            ("52주 최고가", 88800.0),
+            ("52W Low", 58600.0),
+        ]
+
+    def test_requires_unit_for_korean_labels(self):
+        """한국어 라벨은 단위가 없으면 추출하지 않는지 테스트"""
+        assert scan_numeric_data("목표주가 120,000 상향, 매출액 성장률 12%") == []
+        assert scan_numeric_data("OUTPUT 3원") == []
+
+    def test_parse_eok_amount(self):
+        """억원 변환 테스트"""
+        assert parse_eok_amount("1조 2,000", "억") == 12000.0
+        assert parse_eok_amount("1", "조") == 10000.0
+        assert parse_eok_amount("5", "천억") == 5000.0
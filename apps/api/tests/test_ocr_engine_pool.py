@@ -0,0 +1,40 @@
+"""
+OCR Engine Pool 단위 테스트
+"""
+from app.services.extraction.ocr_engine_pool import OcrEnginePool
+
+
+class FakeEngine:
+    """PaddleOCR 결과 형식을 흉내 내는 테스트용 엔진"""
+
+    def ocr(self, image, cls=True):
+        return [[[None, (f"text-{image}", 0.99)]]]
+
+
+class TestOcrEnginePool:
+    """OCR Engine Pool 테스트"""
+
+    def test_engines_loaded_once(self):
+        """엔진이 풀 크기만큼 한 번만 생성되는지 테스트"""
+        created = []
+        pool = OcrEnginePool(size=2, engine_factory=lambda: created.append(1) or FakeEngine())
+
+        pool.preload()
+        pool.ocr_many(["a", "b", "c"])
+        pool.ocr("d")
+
+        assert len(created) == 2
+
+    def test_ocr_many_keeps_order(self):
+        """배치 OCR 결과가 입력 순서를 유지하는지 테스트"""
+        pool = OcrEnginePool(size=3, engine_factory=FakeEngine)
+
+        assert pool.ocr_many(["a", "b", "c", "d"]) == ["text-a", "text-b", "text-c", "text-d"]
+
+    def test_unavailable_pool_returns_empty_text(self):
+        """엔진이 없으면 빈 문자열을 반환하는지 테스트"""
+        pool = OcrEnginePool(size=1, engine_factory=None)
+        pool._engine_factory = None
+
+        assert pool.available is False
+        assert pool.ocr_many(["a", "b"]) == ["", ""]
@@ -0,0 +1,49 @@
+"""
+Page Result Store 단위 테스트
+"""
+from app.services.extraction.page_store import PageResultStore
+
+
+def page_result(page_number):
+    return {
+        "page_number": page_number,
+        "text_blocks": [{"id": f"text_{page_number}_full", "content": f"{page_number}페이지 목표주가 120,000원"}],
+        "tables": [],
+        "images": [],
+    }
+
+
+class TestPageResultStore:
+    """Page Result Store 테스트"""
+
+    def test_round_trip_and_page_numbers(self, tmp_path):
+        """저장한 페이지 결과를 읽고 저장된 페이지 번호를 순서대로 반환하는지 테스트"""
+        store = PageResultStore("report-1", "5", root=tmp_path)
+        for page_number in (3, 1, 12):
+            store.put(page_result(page_number))
+
+        assert store.page_numbers() == [1, 3, 12]
+        assert store.get(3) == page_result(3)
+        assert store.get(2) is None
+
+    def test_versions_are_separate_and_clear_removes_all(self, tmp_path):
+        """추출 설정별로 분리되고 clear가 리포트의 모든 설정을 지우는지 테스트"""
+        full = PageResultStore("report-1", "5", root=tmp_path)
+        text = PageResultStore("report-1", "5-text", root=tmp_path)
+        full.put(page_result(1))
+
+        assert text.page_numbers() == []
+        text.put(page_result(2))
+        full.clear()
+
+        assert full.page_numbers() == []
+        assert text.page_numbers() == []
+
+    def test_corrupt_page_is_dropped(self, tmp_path):
+        """손상된 페이지 파일은 None을 반환하고 삭제되는지 테스트"""
+        store = PageResultStore("report-1", "5", root=tmp_path)
+        store.put(page_result(1))
+        store._path_for(1).write_bytes(b"not gzip")
+
+        assert store.get(1) is None
+        assert store.page_numbers() == []
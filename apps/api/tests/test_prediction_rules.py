@@ -0,0 +1,162 @@
+"""
+Prediction Rules 단위 테스트
+"""
+import json
+
+from app.services.extraction.numeric_scanner import scan_numeric_data
+from app.services.extraction.prediction_rules import (
+    PREDICTION_TYPES,
+    extract_rule_predictions,
+    line_tables,
+    parse_period,
+    parse_unit,
+)
+
+
+def make_result(pages, tables=None):
+    """페이지 텍스트로 추출 결과 구성 (full 블록 + numeric 블록)"""
+    texts = []
+    for page_number, text in pages.items():
+        texts.append({"id": f"text_{page_number}_full", "content": text, "page_number": page_number})
+        numeric = scan_numeric_data(text)
+        if numeric:
+            texts.append({
+                "id": f"numeric_{page_number}",
+                "content": json.dumps(numeric, ensure_ascii=False),
+                "page_number": page_number,
+                "data_type": "numeric",
+            })
+    return {"texts": texts, "tables": tables or []}
+
+
+def by_key(predictions):
+    return {(p["prediction_type"], p["period"]): p for p in predictions}
+
+
+class TestPredictionRules:
+    """Prediction Rules 테스트"""
+
+    def test_parse_period_and_unit(self):
+        """전망 기간 헤더와 금액 단위 파싱 테스트"""
+        assert parse_period("2025F") == "2025"
+        assert parse_period("26E") == "2026"
+        assert parse_period("1Q25F") == "2025Q1"
+        assert parse_period("2024A") is None
+        assert parse_unit("(단위: 십억원)") == 10.0
+        assert parse_unit("(KRW bn)") == 10.0
+        assert parse_unit("PER(배)") is None
+
+    def test_forecast_table_and_target_price(self):
+        """전망 표(억원 정규화, 실적 열 제외)와 목표주가로 LLM 없이 확정하는지 테스트"""
+        tables = [{
+            "id": "table_2_0",
+            "page_number": 2,
+            "data": [
+                ["(십억원)", "2024A", "2025F", "2026F"],
+                ["매출액", "1,000", "1,200", "1,500"],
+                ["영업이익", "100", "(20)", "150"],
+                ["영업이익률(%)", "10.0", "-1.7", "10.0"],
+                ["순이익", "80", "90", "n/a"],
+            ],
+        }]
+        result = make_result({1: "투자의견 매수, 목표주가 120,000원\n목표주가 120,000원 유지"}, tables)
+
+        rules = extract_rule_predictions(result)
+        predictions = by_key(rules["predictions"])
+
+        assert rules["unresolved"] == []
+        assert predictions[("target_price", None)]["predicted_value"] == 120000.0
+        assert predictions[("target_price", None)]["confidence"] == "high"
+        assert predictions[("revenue", "2025")]["predicted_value"] == 12000.0
+        assert predictions[("operating_profit", "2025")]["predicted_value"] == -200.0
+        assert predictions[("net_profit", "2025")]["unit"] == "억원"
+        assert ("revenue", "2024") not in predictions
+        assert ("net_profit", "2026") not in predictions
+
+    def test_line_tables_from_text_tier(self):
+        """텍스트 단계 본문의 줄 단위 표를 사용하는지 테스트 (추출된 표와 같으면 high)"""
+        text = "\n".join([
+            "실적 추정",
+            "(단위: 억원)",
+            "구분 2024A 2025F 2026F",
+            "매출액 9,000 10,000 11,000",
+            "EPS(원) 1,000 1,200 1,300",
+            "본문 계속",
+        ])
+        tables = line_tables(text, 3, "text_3_full")
+        assert len(tables) == 1
+        assert tables[0]["data"][0] == ["(단위: 억원)"]
+        assert len(tables[0]["data"]) == 4
+
+        pdf_table = {"id": "table_3_0", "page_number": 3, "data": [
+            ["(억원)", "2024A", "2025F", "2026F"], ["매출액", "9,000", "10,000", "11,000"],
+        ]}
+        predictions = by_key(extract_rule_predictions(make_result({3: text}, [pdf_table]))["predictions"])
+        assert predictions[("revenue", "2025")]["predicted_value"] == 10000.0
+        assert predictions[("revenue", "2025")]["confidence"] == "high"
+        assert predictions[("revenue", "2025")]["evidence"] == ["table_3_0", "text_3_full_table_0"]
+
+    def test_unresolved_types_go_to_llm(self):
+        """기간 없는 실적 수치와 엇갈리는 목표주가는 미확정 타입으로 남기는지 테스트"""
+        result = make_result({
+            1: "2025F 영업이익 500억원 전망\n매출액 1조원 수준\n목표주가 100,000원에서 120,000원으로 상향",
+            2: "목표주가 120,000원",
+        })
+
+        rules = extract_rule_predictions(result)
+        predictions = by_key(rules["predictions"])
+
+        assert predictions[("operating_profit", "2025")]["predicted_value"] == 500.0
+        assert ("target_price", None) not in predictions
+        assert rules["unresolved"] == ["target_price", "revenue", "net_profit"]
+
+    def test_prose_forecasts_stay_unresolved(self):
+        """목표주가만 확정되면 본문 서술형 실적 전망은 LLM으로 넘기는지 테스트"""
+        result = make_result({
+            1: "목표주가 120,000원 유지\n2025년 영업이익은 5,000억원으로 예상되며 매출액은 3조원 전망",
+        })
+
+        rules = extract_rule_predictions(result)
+
+        assert [p["prediction_type"] for p in rules["predictions"]] == ["target_price"]
+        assert rules["unresolved"] == ["revenue", "operating_profit", "net_profit"]
+
+    def test_conflicting_values_stay_unresolved(self):
+        """값이 엇갈리는(medium) 타입은 예측을 반환하되 LLM 타입으로 남기는지 테스트"""
+        tables = [{
+            "id": "table_2_0",
+            "page_number": 2,
+            "data": [["(억원)", "2025F"], ["매출액", "12,000"], ["영업이익", "500"]],
+        }]
+        result = make_result({1: "2025F 매출액 1조 5,000억원 전망\n2025F 영업이익 500억원"}, tables)
+
+        rules = extract_rule_predictions(result)
+        predictions = by_key(rules["predictions"])
+
+        assert predictions[("revenue", "2025")]["confidence"] == "medium"
+        assert predictions[("operating_profit", "2025")]["confidence"] == "high"
+        assert rules["unresolved"] == ["target_price", "revenue", "net_profit"]
+
+    def test_forecast_units(self):
+        """표 헤더 단위(백만원/조원)로 억원 환산하고, 단위 없는 영문 수치는 쓰지 않는지 테스트"""
+        tables = [
+            {"id": "table_1_0", "page_number": 1, "data": [["(백만원)", "2025F"], ["매출액", "1,200,000"]]},
+            {"id": "table_1_1", "page_number": 1, "data": [["(조원)", "2025F"], ["영업이익", "1.5"]]},
+        ]
+        result = make_result({2: "2025F Net profit 900\n2025F Revenue 12,000"}, tables)
+
+        rules = extract_rule_predictions(result)
+        predictions = by_key(rules["predictions"])
+
+        assert predictions[("revenue", "2025")]["predicted_value"] == 12000.0
+        assert predictions[("revenue", "2025")]["evidence"] == ["table_1_0"]
+        assert predictions[("operating_profit", "2025")]["predicted_value"] == 15000.0
+        assert ("net_profit", "2025") not in predictions
+        assert rules["unresolved"] == ["target_price", "net_profit"]
+
+    def test_no_candidates_falls_back_to_all_types(self):
+        """규칙 후보가 없으면 전체 타입을 LLM으로 넘기는지 테스트"""
+        rules = extract_rule_predictions(make_result({1: "업종 전망 코멘트"}))
+
+        assert rules["predictions"] == []
+        assert rules["unresolved"] == PREDICTION_TYPES
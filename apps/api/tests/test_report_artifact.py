@@ -0,0 +1,176 @@
+"""
+Report artifact 단위 테스트
+"""
+import json
+
+import numpy as np
+import pytest
+
+from app.services.extraction.boilerplate import mark_boilerplate
+from app.services.extraction.numeric_scanner import scan_numeric_data
+from app.services.extraction.report_artifact import ReportArtifact, write_report_artifact
+
+
+def build_result(page_count=3):
+    """페이지마다 머리글, 본문, 수치 데이터, 표 1개, 이미지 1개가 있는 추출 결과"""
+    result = {"pages": [], "texts": [], "tables": [], "images": [], "metadata": {"page_count": page_count}}
+    for page_num in range(1, page_count + 1):
+        lines = [
+            ("한국증권 리서치센터", 30, 9.0),
+            (f"목표주가 {page_num}0,000원 유지", 100, 14.0),
+            (f"영업이익 {page_num},200억원 전망", 120, 10.5),
+        ]
+        full_text = "\n".join(line for line, _, _ in lines)
+        result["pages"].append({
+            "page_number": page_num,
+            "text_layer": {"usable": True, "char_count": len(full_text)},
+            "extraction_path": "text_layer",
+        })
+        result["texts"].append({
+            "id": f"text_{page_num}_full",
+            "content": full_text,
+            "page_number": page_num,
+            "bbox": [0, 0, 595, 842],
+        })
+        result["texts"].append({
+            "id": f"numeric_{page_num}",
+            "content": json.dumps(scan_numeric_data(full_text), ensure_ascii=False),
+            "page_number": page_num,
+            "bbox": [0, 0, 595, 842],
+            "data_type": "numeric",
+        })
+        for idx, (line, top, size) in enumerate(lines):
+            result["texts"].append({
+                "id": f"text_{page_num}_para_{idx}",
+                "content": line,
+                "page_number": page_num,
+                "bbox": [40, top, 200, 10],
+                "font_size": size,
+                "font_style": "bold" if idx == 1 else "normal",
+                "order": idx,
+            })
+        result["tables"].append({
+            "id": f"table_{page_num}_0",
+            "page_number": page_num,
+            "data": [["(십억원)", "2025F", "2026F"], ["매출액", "1,200", f"{page_num},300"], ["PER(배)", "(3.5)", None]],
+            "rows": 3,
+            "columns": 3,
+            "bbox": [72, 300, 240, 60],
+        })
+        result["images"].append({
+            "id": f"image_{page_num}_0",
+            "page_number": page_num,
+            "bbox": [300, 500, 100, 80],
+            "image_path": f"/storage/images/{page_num}.png",
+            "ocr_text": "",
+        })
+    mark_boilerplate(result)
+    return result
+
+
+class TestReportArtifact:
+    """Report artifact 테스트"""
+
+    def test_page_round_trip(self, tmp_path):
+        """페이지 텍스트, 문단, 수치 데이터, 표, 이미지가 그대로 복원되는지 테스트"""
+        result = build_result()
+        path = write_report_artifact(tmp_path / "report.rpa", result, "report-1")
+
+        with ReportArtifact(path) as artifact:
+            assert artifact.page_numbers == [1, 2, 3]
+            assert artifact.directory["report_id"] == "report-1"
+            page = artifact.page(2)
+
+        assert page["text"] == result["texts"][5]["content"]
+        assert (page["width"], page["height"]) == (595, 842)
+        assert page["extraction_path"] == "text_layer"
+        expected = [t for t in result["texts"] if t["page_number"] == 2 and "_para_" in t["id"]]
+        assert [p["content"] for p in page["paragraphs"]] == [t["content"] for t in expected]
+        assert [p["id"] for p in page["paragraphs"]] == [t["id"] for t in expected]
+        assert page["paragraphs"][0]["boilerplate"] is True
+        assert page["paragraphs"][1]["font_style"] == "bold"
+        assert page["paragraphs"][2]["font_size"] == 10.5
+        assert page["numeric_data"] == scan_numeric_data(page["text"])
+        table = page["tables"][0]
+        assert table["id"] == "table_2_0"
+        assert table["data"][2] == ["PER(배)", "(3.5)", ""]
+        assert table["values"][1] == [None, 1200.0, 2300.0]
+        assert table["values"][2] == [None, -3.5, None]
+        assert page["images"] == [{**result["images"][1], "bbox": [300.0, 500.0, 100.0, 80.0]}]
+
+    def test_numeric_columns_are_mmap_views(self, tmp_path):
+        """수치 컬럼이 파일을 복사하지 않는 읽기 전용 배열인지 테스트"""
+        path = write_report_artifact(tmp_path / "report.rpa", build_result(), "report-1")
+
+        with ReportArtifact(path) as artifact:
+            bboxes = artifact.column("para_bbox")
+            assert bboxes.dtype == np.float32
+            assert bboxes.shape == (9, 4)
+            assert not bboxes.flags.writeable
+            assert artifact.column("para_page").tolist() == [1, 1, 1, 2, 2, 2, 3, 3, 3]
+            del bboxes
+
+    def test_paragraph_outside_full_text(self, tmp_path):
+        """전체 텍스트에 없는 문단도 내용이 보존되는지 테스트"""
+        result = build_result(1)
+        result["texts"].append({
+            "id": "text_1_para_3", "content": "각주 문단", "page_number": 1, "bbox": [40, 700, 100, 10], "order": 3,
+        })
+        path = write_report_artifact(tmp_path / "report.rpa", result)
+
+        with ReportArtifact(path) as artifact:
+            paragraphs = artifact.paragraphs(1)
+            assert paragraphs[-1]["content"] == "각주 문단"
+            assert artifact.page_text(1) == result["texts"][0]["content"]
+
+    def test_to_result_rewrites_identically(self, tmp_path):
+        """복원한 결과로 다시 저장해도 페이지 내용이 같은지 테스트"""
+        first = write_report_artifact(tmp_path / "first.rpa", build_result(), "report-1")
+        with ReportArtifact(first) as artifact:
+            restored = artifact.to_result()
+            expected = list(artifact.iter_pages())
+        second = write_report_artifact(tmp_path / "second.rpa", restored, "report-1")
+
+        with ReportArtifact(second) as artifact:
+            assert list(artifact.iter_pages()) == expected
+            assert artifact.directory["boilerplate"] == restored["boilerplate"]
+
+    def test_unsorted_tables_and_images(self, tmp_path):
+        """보강 추출로 뒤에 덧붙인 표/이미지도 페이지별로 조회되는지 테스트"""
+        result = build_result()
+        # 텍스트 단계 결과 뒤에 보강 추출 결과를 덧붙인 순서 (3, 1, 2 페이지)
+        result["tables"] = [result["tables"][2], result["tables"][0], result["tables"][1]]
+        result["images"] = [result["images"][2], result["images"][0], result["images"][1]]
+        path = write_report_artifact(tmp_path / "report.rpa", result)
+
+        with ReportArtifact(path) as artifact:
+            assert artifact.column("table_page").tolist() == [1, 2, 3]
+            for page_num in (1, 2, 3):
+                assert [t["id"] for t in artifact.tables(page_num)] == [f"table_{page_num}_0"]
+                assert [i["id"] for i in artifact.images(page_num)] == [f"image_{page_num}_0"]
+
+    def test_items_without_page_number(self, tmp_path):
+        """페이지 번호가 없는 텍스트/표/이미지는 DB 저장과 같이 1페이지로 저장하는지 테스트"""
+        result = build_result(2)
+        result["texts"].append({"id": "text_orphan_para_9", "order": 9, "content": "페이지 정보 없는 문단", "page_number": None})
+        result["tables"].append({"id": "table_orphan", "data": [["a", "1"]]})
+        result["images"].append({"id": "image_orphan", "image_path": "/tmp/orphan.png", "page_number": None})
+        path = write_report_artifact(tmp_path / "report.rpa", result)
+
+        with ReportArtifact(path) as artifact:
+            assert artifact.column("page_number").tolist() == [1, 2]
+            assert "페이지 정보 없는 문단" in [p["content"] for p in artifact.page(1)["paragraphs"]]
+            assert [["a", "1"]] in [t["data"] for t in artifact.tables(1)]
+            assert "image_orphan" in [i["id"] for i in artifact.images(1)]
+
+    def test_missing_page_and_invalid_file(self, tmp_path):
+        """없는 페이지와 아티팩트가 아닌 파일 테스트"""
+        path = write_report_artifact(tmp_path / "report.rpa", build_result(1))
+        with ReportArtifact(path) as artifact:
+            with pytest.raises(KeyError):
+                artifact.page(5)
+
+        invalid = tmp_path / "invalid.rpa"
+        invalid.write_bytes(b"%PDF-1.4 not an artifact")
+        with pytest.raises(ValueError):
+            ReportArtifact(invalid)
@@ -0,0 +1,795 @@
+"""
+Report Parsing Agent 단위 테스트 (DB 세션과 LLM/추출 단계는 대체)
+"""
+import asyncio
+import json
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.models.enums import ReportStatus
+from app.models.report import ExtractedImage, ExtractedTable, ExtractedText, ReportSection
+from app.services.ai_agents import report_parsing_agent as agent_module
+from app.services.ai_agents.report_parsing_agent import ReportParsingAgent
+from app.services.document_extraction_service import DocumentExtractionService
+from app.services.extraction.numeric_scanner import scan_numeric_data
+from app.services.extraction.page_store import PageResultStore
+
+
+def make_report(**fields):
+    values = {
+        "id": uuid4(),
+        "company_id": uuid4(),
+        "analyst": None,
+        "status": ReportStatus.PROCESSING.value,
+        "parse_key": None,
+        "extraction_tier": None,
+        "pages_processed": 0,
+        "total_pages": 0,
+    }
+    values.update(fields)
+    return SimpleNamespace(**values)
+
+
+def page_result(page_number, image_path=None):
+    images = []
+    if image_path is not None:
+        images.append({"id": f"image_{page_number}_0", "page_number": page_number, "image_path": str(image_path)})
+    return {
+        "page_number": page_number,
+        "text_blocks": [{
+            "id": f"text_{page_number}_full", "content": f"{page_number}페이지 본문", "page_number": page_number,
+        }],
+        "tables": [],
+        "images": images,
+    }
+
+
+class FakeExtractionService:
+    """페이지 결과를 그대로 내보내는 추출 서비스 (iter_pages 시작 페이지 기록)"""
+
+    merge_page_result = DocumentExtractionService.merge_page_result
+
+    def __init__(self, page_count, cache_version="5", make_page=None, known_page_count=True):
+        self.page_count = page_count
+        self.cache_version = cache_version
+        self.make_page = make_page or page_result
+        self.known_page_count = known_page_count
+        self.first_pages = []
+
+    async def new_result(self, file_path):
+        page_count = self.page_count if self.known_page_count else 0
+        return {"pages": [], "texts": [], "tables": [], "images": [], "metadata": {"page_count": page_count}}
+
+    async def iter_pages(self, report_id, file_path, page_count, parallel=None, first_page=1, image_scope=None):
+        self.first_pages.append(first_page)
+        # page_count가 0이면 마지막 페이지까지
+        for page_number in range(first_page, min(page_count or self.page_count, self.page_count) + 1):
+            yield self.make_page(page_number)
+
+
+def deep_page_result(page_number):
+    """보강 추출 페이지 결과 (표, 이미지, OCR 텍스트)"""
+    return {
+        "page_number": page_number,
+        "text_blocks": [{
+            "id": f"text_{page_number}_ocr", "content": f"{page_number}페이지 OCR 본문 " * 5,
+            "page_number": page_number, "source": "ocr",
+        }],
+        "tables": [{"id": f"table_{page_number}_0", "page_number": page_number, "data": [["매출액", "1,000"]]}],
+        "images": [{"id": f"image_{page_number}_0", "page_number": page_number, "image_path": "/storage/1.png"}],
+    }
+
+
+def make_storage_agent(report):
+    """추출 데이터 저장/삭제와 진행률 커밋을 기록하는 에이전트"""
+    agent = ReportParsingAgent.__new__(ReportParsingAgent)
+    agent.db = MagicMock()
+    agent.extraction_cache = MagicMock()
+    agent.extraction_cache.get.return_value = None
+    agent.vector_index = MagicMock()
+    agent.vector_index.needs_compaction.return_value = False
+    agent.calls = []
+    agent.progress = []
+
+    update_progress = agent._update_progress
+
+    def record_progress(report, pages_processed, total_pages):
+        agent.progress.append(pages_processed)
+        update_progress(report, pages_processed, total_pages)
+
+    agent._update_progress = record_progress
+    agent._save_pages_data = lambda report_id, pages: agent.calls.append(
+        ("save", [page["page_number"] for page in pages])
+    )
+    agent._delete_page_data = lambda report_id, first_page, last_page=None, commit=True: agent.calls.append(
+        ("delete", first_page, last_page)
+    )
+    agent._image_scope = lambda report: None
+    return agent
+
+
+def make_agent(report):
+    """LLM/임베딩/저장 단계를 대체한 에이전트 (db는 report를 반환하는 MagicMock)"""
+    agent = ReportParsingAgent.__new__(ReportParsingAgent)
+    agent.db = MagicMock()
+    agent.db.query.return_value.filter.return_value.first.return_value = report
+    agent.extraction_service = SimpleNamespace(backend="pdfplumber", cache_version="5")
+    agent.extraction_cache = MagicMock()
+    agent.vector_index = MagicMock()
+    agent.vector_index.needs_compaction.return_value = False
+    agent.calls = []
+
+    extraction_result = {"pages": [], "texts": [], "tables": [], "images": []}
+
+    async def extract_document(report, file_path, service=None, replace=False):
+        agent.calls.append(("extract", replace))
+        return extraction_result
+
+    async def structured(*args, **kwargs):
+        return {"sections": [], "predictions": []}
+
+    async def predictions(*args, **kwargs):
+        return []
+
+    async def embeddings(*args, **kwargs):
+        return {}
+
+    async def save_extracted(report_id, sections, embeddings):
+        agent.calls.append(("save_sections", len(sections)))
+
+    async def schedule_deep(report_id, file_path):
+        agent.calls.append(("deep", str(file_path)))
+
+    async def noop(*args, **kwargs):
+        return None
+
+    agent._extraction_service_for = lambda backend, tiered: SimpleNamespace(
+        backend=backend or "pdfplumber", cache_version="5-text" if tiered else "5"
+    )
+    agent._parse_key = lambda file_path, service: f"hash-v{service.cache_version}-p{agent_module.PARSER_VERSION}"
+    agent._extract_document = extract_document
+    agent._write_artifact = lambda report_id, result: None
+    agent._extract_structured = structured
+    agent._extract_predictions = predictions
+    agent._generate_embeddings = embeddings
+    agent._save_extracted_data = save_extracted
+    agent._schedule_deep_extraction = schedule_deep
+    agent._start_auto_data_collection = noop
+    return agent
+
+
+class TestParseReport:
+    """parse_report 흐름 테스트"""
+
+    def test_tiered_parse_schedules_deep_extraction(self):
+        """단계별 파싱은 보강 추출을 예약하는지 테스트"""
+        report = make_report()
+        agent = make_agent(report)
+
+        asyncio.run(agent.parse_report(report.id, "/tmp/report.pdf", tiered=True))
+
+        assert ("deep", "/tmp/report.pdf") in agent.calls
+        assert report.extraction_tier == "text"
+
+    def test_same_parse_key_is_skipped(self):
+        """같은 파일/버전으로 파싱 완료된 리포트는 추출 없이 건너뛰는지 테스트"""
+        parse_key = f"hash-v5-text-p{agent_module.PARSER_VERSION}"
+        report = make_report(status=ReportStatus.COMPLETED.value, parse_key=parse_key)
+        agent = make_agent(report)
+
+        result = asyncio.run(agent.parse_report(report.id, "/tmp/report.pdf", tiered=True))
+
+        assert result["skipped"] is True
+        assert result["parse_key"] == parse_key
+        assert agent.calls == []
+
+    def test_force_reparses_and_replaces_data(self):
+        """force이면 같은 키여도 다시 파싱하고 기존 추출 데이터를 교체 모드로 추출하는지 테스트"""
+        report = make_report(
+            status=ReportStatus.COMPLETED.value, parse_key=f"hash-v5-text-p{agent_module.PARSER_VERSION}"
+        )
+        agent = make_agent(report)
+
+        result = asyncio.run(agent.parse_report(report.id, "/tmp/report.pdf", tiered=True, force=True))
+
+        assert not result.get("skipped")
+        assert agent.calls[:2] == [("extract", True), ("save_sections", 0)]
+
+    def test_pdfium_backend_skips_deep_extraction(self):
+        """pdfium을 지정한 텍스트 전용 파싱은 보강 추출을 예약하지 않는지 테스트"""
+        report = make_report()
+        agent = make_agent(report)
+
+        asyncio.run(agent.parse_report(report.id, "/tmp/report.pdf", extraction_backend="pdfium", tiered=True))
+
+        assert not any(call[0] == "deep" for call in agent.calls)
+        assert report.status == ReportStatus.COMPLETED.value
+
+
+class TestExtractionResume:
+    """체크포인트에서 이어서 추출하는 테스트"""
+
+    def test_resume_from_checkpointed_prefix(self, tmp_path, monkeypatch):
+        """이미지 파일이 남은 연속 페이지만 복원하고 이후 데이터는 지운 뒤 이어서 추출하는지 테스트"""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
+        report = make_report()
+        agent = make_storage_agent(report)
+        service = FakeExtractionService(page_count=5)
+
+        image = tmp_path / "page_2.png"
+        image.write_bytes(b"png")
+        checkpoint = PageResultStore(report.id, service.cache_version)
+        checkpoint.put(page_result(1))
+        checkpoint.put(page_result(2, image))
+        # 3페이지 이미지 파일은 없어졌고, 4페이지는 3페이지 이후에 저장된 결과
+        checkpoint.put(page_result(3, tmp_path / "missing.png"))
+        checkpoint.put(page_result(4))
+
+        result = asyncio.run(agent._extract_document(report, "/tmp/report.pdf", service))
+
+        assert [page["page_number"] for page in result["pages"]] == [1, 2, 3, 4, 5]
+        assert [text["id"] for text in result["texts"]][:2] == ["text_1_full", "text_2_full"]
+        assert service.first_pages == [3]
+        # 복원하지 못한 3페이지부터 이전 시도 데이터를 지우고 새로 저장
+        assert agent.calls == [("delete", 3, None), ("save", [3]), ("save", [4]), ("save", [5])]
+        assert agent.progress == [2, 3, 4, 5]
+        assert (report.pages_processed, report.total_pages) == (5, 5)
+        assert checkpoint.page_numbers() == []
+
+    def test_no_checkpoint_starts_from_first_page(self, tmp_path, monkeypatch):
+        """체크포인트가 없으면 1페이지부터 추출하고 남은 데이터를 지우는지 테스트"""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
+        report = make_report()
+        agent = make_storage_agent(report)
+        service = FakeExtractionService(page_count=2)
+
+        asyncio.run(agent._extract_document(report, "/tmp/report.pdf", service))
+
+        assert service.first_pages == [1]
+        assert agent.calls == [("delete", 1, None), ("save", [1]), ("save", [2])]
+        assert agent.progress == [0, 1, 2]
+
+
+class TestCachedResult:
+    """추출 결과 캐시 재사용 테스트"""
+
+    def cached_result(self, source_report, image_path):
+        page = page_result(1, image_path)
+        page["images"].append({
+            "id": "image_1_1", "page_number": 1, "image_path": str(image_path),
+            "duplicate_of": f"{source_report}:image_1_0",
+        })
+        return {"pages": [page], "texts": page["text_blocks"], "tables": [], "images": list(page["images"]),
+                "metadata": {"page_count": 1}}
+
+    def test_cache_hit_from_other_report_links_images(self, tmp_path, monkeypatch):
+        """다른 리포트의 캐시 결과를 쓰면 이미지를 이 리포트 경로로 링크하고 경로를 바꾸는지 테스트"""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
+        source_report = uuid4()
+        source_image = tmp_path / "a" / "images" / f"{source_report}_page1_img0.jpg"
+        source_image.parent.mkdir(parents=True)
+        source_image.write_bytes(b"jpeg")
+        report = make_report()
+        agent = make_storage_agent(report)
+        agent.extraction_cache.get.return_value = self.cached_result(source_report, source_image)
+        file_path = tmp_path / "b" / "report.pdf"
+
+        result = asyncio.run(agent._extract_document(report, str(file_path), FakeExtractionService(page_count=1)))
+
+        target = tmp_path / "b" / "images" / f"{report.id}_page1_img0.jpg"
+        assert target.read_bytes() == b"jpeg"
+        assert [image["image_path"] for image in result["images"]] == [str(target)] * 2
+        assert result["pages"][0]["images"][1]["duplicate_of"] == f"{report.id}:image_1_0"
+        assert agent.calls == [("delete", 1, None), ("save", [1])]
+
+    def test_cache_hit_with_missing_images_extracts_again(self, tmp_path, monkeypatch):
+        """원래 리포트의 이미지 파일이 없으면 캐시 결과를 쓰지 않고 다시 추출하는지 테스트"""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
+        source_report = uuid4()
+        report = make_report()
+        agent = make_storage_agent(report)
+        agent.extraction_cache.get.return_value = self.cached_result(
+            source_report, tmp_path / "a" / "images" / f"{source_report}_page1_img0.jpg"
+        )
+        service = FakeExtractionService(page_count=1)
+
+        asyncio.run(agent._extract_document(report, str(tmp_path / "b" / "report.pdf"), service))
+
+        assert service.first_pages == [1]
+
+
+class TestDistributedExtraction:
+    """분산 추출(페이지 범위 작업) 테스트"""
+
+    def make_distributed_agent(self, report, service, monkeypatch, pages_per_task=20):
+        monkeypatch.setattr(agent_module, "DISTRIBUTED_EXTRACTION_MIN_PAGES", 10)
+        monkeypatch.setattr(agent_module, "DISTRIBUTED_EXTRACTION_PAGES_PER_TASK", pages_per_task)
+        agent = make_storage_agent(report)
+        agent.db.query.return_value.filter.return_value.first.return_value = report
+        agent.extraction_cache.has.return_value = False
+        agent._has_parsed_data = lambda report: False
+        agent._extraction_service_for = lambda backend, tiered: service
+        return agent
+
+    def test_plan_page_ranges_boundaries(self, monkeypatch):
+        """페이지 수가 작업 단위의 배수가 아니거나 0, 최소 페이지 미만일 때의 범위 테스트"""
+        report = make_report()
+
+        def plan(page_count):
+            agent = self.make_distributed_agent(report, FakeExtractionService(page_count), monkeypatch)
+            return asyncio.run(agent.plan_page_ranges(report.id, "/tmp/report.pdf"))
+
+        assert plan(45) == [(1, 20), (21, 40), (41, 45)]
+        assert plan(40) == [(1, 20), (21, 40)]
+        assert plan(10) == [(1, 10)]
+        assert plan(21) == [(1, 20), (21, 21)]
+        assert plan(9) == []
+        assert plan(0) == []
+
+    def test_collect_extracts_missing_ranges(self, tmp_path, monkeypatch):
+        """범위 작업이 저장하지 못한 페이지는 직접 추출해 페이지 순서대로 병합하는지 테스트"""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
+        report = make_report()
+        service = FakeExtractionService(page_count=5)
+        agent = self.make_distributed_agent(report, service, monkeypatch)
+        store = PageResultStore(report.id, service.cache_version)
+        for page_number in (1, 2, 4):
+            store.put(page_result(page_number))
+
+        result = asyncio.run(agent._collect_page_ranges(report, "/tmp/report.pdf", service))
+
+        assert [page["page_number"] for page in result["pages"]] == [1, 2, 3, 4, 5]
+        assert service.first_pages == [3, 5]
+        assert agent.calls == [("delete", 3, 3), ("save", [3]), ("delete", 5, 5), ("save", [5])]
+        agent.extraction_cache.put.assert_called_once()
+        assert store.page_numbers() == []
+
+    def test_collect_fails_on_incomplete_document(self, tmp_path, monkeypatch):
+        """직접 추출해도 빠진 페이지가 있으면 일부만 병합하지 않고 실패하는지 테스트"""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
+        report = make_report()
+        service = FakeExtractionService(page_count=5)
+        # 3페이지를 다시 추출해도 결과가 나오지 않음
+        service.iter_pages = lambda *args, **kwargs: FakeExtractionService(0).iter_pages(*args, **kwargs)
+        agent = self.make_distributed_agent(report, service, monkeypatch)
+        store = PageResultStore(report.id, service.cache_version)
+        for page_number in (1, 2, 4, 5):
+            store.put(page_result(page_number))
+
+        with pytest.raises(ValueError, match=r"누락 \[3\]"):
+            asyncio.run(agent._collect_page_ranges(report, "/tmp/report.pdf", service))
+
+        agent.extraction_cache.put.assert_not_called()
+        assert store.page_numbers() == [1, 2, 4, 5]
+
+    def test_collect_unknown_page_count_extracts_to_end(self, tmp_path, monkeypatch):
+        """페이지 수를 모르면 저장된 마지막 페이지 이후를 끝까지 추출하는지 테스트"""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
+        report = make_report()
+        service = FakeExtractionService(page_count=4, known_page_count=False)
+        agent = self.make_distributed_agent(report, service, monkeypatch)
+        store = PageResultStore(report.id, service.cache_version)
+        for page_number in (1, 2):
+            store.put(page_result(page_number))
+
+        result = asyncio.run(agent._collect_page_ranges(report, "/tmp/report.pdf", service))
+
+        assert [page["page_number"] for page in result["pages"]] == [1, 2, 3, 4]
+        assert agent.calls == [("delete", 3, None), ("save", [3]), ("save", [4])]
+        assert (report.pages_processed, report.total_pages) == (4, 4)
+
+
+class TestSavePagesData:
+    """추출 데이터 일괄 저장 테스트"""
+
+    def test_one_insert_per_table_with_linked_text_ids(self):
+        """테이블마다 INSERT 한 번으로 저장하고 ExtractedText id를 블록에 기록하는지 테스트"""
+        report_id = uuid4()
+        agent = ReportParsingAgent.__new__(ReportParsingAgent)
+        agent.db = MagicMock()
+        pages = [page_result(1, "/storage/images/1.png"), page_result(2)]
+        pages[0]["text_blocks"].append({"id": "text_1_para_0", "content": "문단", "page_number": 1, "bbox": [1, 2, 3, 4]})
+        pages[1]["tables"].append({"id": "table_2_0", "page_number": 2, "data": [["매출액", "1,000"]], "bbox": [0, 0, 9, 9]})
+
+        agent._save_pages_data(report_id, pages)
+
+        calls = agent.db.execute.call_args_list
+        assert [call.args[0].table for call in calls] == [
+            ExtractedText.__table__, ExtractedTable.__table__, ExtractedImage.__table__
+        ]
+        texts, tables, images = (call.args[1] for call in calls)
+
+        blocks = [block for page in pages for block in page["text_blocks"]]
+        assert [row["id"] for row in texts] == [UUID(block["extracted_text_id"]) for block in blocks]
+        assert texts[1] == {
+            "id": texts[1]["id"], "report_id": report_id, "page_number": 1, "content": "문단",
+            "bbox": [1, 2, 3, 4], "confidence": "medium", "language": "ko",
+        }
+        assert tables == [{
+            "report_id": report_id, "page_number": 2, "table_data": [["매출액", "1,000"]],
+            "bbox": [0, 0, 9, 9], "confidence": "medium",
+        }]
+        assert images == [{
+            "report_id": report_id, "page_number": 1, "image_path": "/storage/images/1.png",
+            "image_type": "chart", "bbox": None, "analysis_result": None,
+        }]
+        agent.db.add.assert_not_called()
+        agent.db.commit.assert_not_called()
+
+    def test_empty_tables_are_skipped(self):
+        """저장할 행이 없는 테이블은 INSERT하지 않는지 테스트"""
+        agent = ReportParsingAgent.__new__(ReportParsingAgent)
+        agent.db = MagicMock()
+
+        agent._save_pages_data(uuid4(), [page_result(1)])
+
+        assert [call.args[0].table for call in agent.db.execute.call_args_list] == [ExtractedText.__table__]
+
+
+class TestReplaceAndEnrich:
+    """재파싱 교체와 보강 추출 재시도 테스트"""
+
+    def test_reparse_replaces_page_data_in_one_commit(self, tmp_path, monkeypatch):
+        """재파싱은 추출이 끝난 뒤 기존 데이터 삭제와 새 데이터 저장을 한 번에 커밋하는지 테스트"""
+        monkeypatch.setenv("STORAGE_PATH", str(tmp_path))
+        report = make_report(status=ReportStatus.COMPLETED.value)
+        agent = make_storage_agent(report)
+        agent.db.commit.side_effect = lambda: agent.calls.append(("commit",))
+        agent._delete_page_data = lambda report_id, first_page, last_page=None, commit=True: agent.calls.append(
+            ("delete", first_page, last_page, commit)
+        )
+
+        asyncio.run(agent._extract_document(report, "/tmp/report.pdf", FakeExtractionService(page_count=2), replace=True))
+
+        # 페이지 추출 중에는 진행률만 커밋하고 기존 데이터는 유지
+        assert agent.calls == [
+            ("commit",), ("commit",), ("commit",),
+            ("delete", 1, None, False), ("save", [1, 2]), ("commit",),
+        ]
+
+    def test_sections_and_vectors_are_replaced(self):
+        """섹션은 삭제 후 일괄 저장(커밋은 완료 상태와 함께)하고 벡터는 교체하는지 테스트"""
+        report_id = uuid4()
+        agent = ReportParsingAgent.__new__(ReportParsingAgent)
+        agent.db = MagicMock()
+        agent.vector_index = MagicMock()
+        agent.vector_index.needs_compaction.return_value = False
+        inserted = []
+        agent._bulk_insert = lambda model, rows: inserted.append((model, rows))
+        sections = [{"section_type": "summary", "title": "요약", "content": "본문", "page_number": 1, "order": 0}]
+
+        asyncio.run(agent._save_extracted_data(report_id, sections, {"text-1": [0.1, 0.2]}))
+
+        agent.db.query.return_value.filter.return_value.delete.assert_called_once_with(synchronize_session=False)
+        assert inserted[0][0] is ReportSection
+        assert inserted[0][1][0]["report_id"] == report_id
+        assert inserted[0][1][0]["title"] == "요약"
+        agent.db.commit.assert_not_called()
+        agent.vector_index.add_report.assert_called_once_with(report_id, {"text-1": [0.1, 0.2]}, replace=True)
+
+    def test_index_compaction_scheduled_outside_add(self):
+        """벡터 추가 후 병합이 필요하면 add_report 안이 아니라 백그라운드 작업으로 예약하는지 테스트"""
+        agent = ReportParsingAgent.__new__(ReportParsingAgent)
+        agent.vector_index = MagicMock()
+        scheduled = []
+        agent._schedule_index_compaction = lambda: scheduled.append(agent.vector_index.add_report.call_count)
+
+        agent.vector_index.needs_compaction.return_value = False
+        agent._index_embeddings("report-1", {"text-1": [0.1]}, replace=True)
+        agent.vector_index.needs_compaction.return_value = True
+        agent._index_embeddings("report-2", {"text-2": [0.1]}, replace=True)
+
+        assert scheduled == [2]
+        agent.vector_index.compact.assert_not_called()
+
+    def test_enrich_retry_replaces_previous_deep_rows(self, monkeypatch):
+        """재전달된 보강 추출이 이전 시도의 표/이미지/OCR 행과 벡터를 교체하는지 테스트"""
+        report = make_report(extraction_tier="text")
+        agent = ReportParsingAgent.__new__(ReportParsingAgent)
+        agent.db = MagicMock()
+        agent.db.query.return_value.filter.return_value.first.return_value = report
+        agent.extraction_cache = MagicMock()
+        agent.extraction_cache.get.return_value = None
+        agent.vector_index = MagicMock()
+        agent.vector_index.needs_compaction.return_value = False
+        agent.calls = []
+        agent.db.commit.side_effect = lambda: agent.calls.append(("commit",))
+        agent._delete_deep_data = lambda report_id, text_ids: agent.calls.append(("delete", list(text_ids)))
+        agent._bulk_insert = lambda model, rows: agent.calls.append(("insert", model, rows))
+        agent._merge_artifact = lambda report_id, result: result
+        agent._apply_table_predictions = lambda report, merged: agent.calls.append(("table_rules", len(merged["tables"])))
+        agent._image_scope = lambda report: None
+
+        async def embeddings(result):
+            return {block["extracted_text_id"]: [1.0, 0.0] for block in result["texts"]}
+
+        agent._generate_embeddings = embeddings
+        monkeypatch.setattr(
+            agent_module, "DocumentExtractionService",
+            lambda tier: FakeExtractionService(page_count=2, cache_version="5-deep", make_page=deep_page_result)
+        )
+
+        runs = []
+        for _ in range(2):
+            # 첫 시도는 저장 후 완료 표시 전에 중단된 것으로 간주
+            report.extraction_tier = "text"
+            agent.calls = []
+            result = asyncio.run(agent.enrich_report(report.id, "/tmp/report.pdf"))
+            runs.append(agent.calls)
+
+        assert result == {"report_id": report.id, "tables": 2, "images": 2, "ocr_texts": 2}
+        assert report.extraction_tier == "full"
+        for calls in runs:
+            kinds = [call[0] if call[0] != "insert" else call[1] for call in calls]
+            assert kinds == ["delete", ExtractedText, ExtractedTable, ExtractedImage, "commit", "table_rules", "commit"]
+            # 지우는 OCR 텍스트 id와 새로 저장하는 id가 같음 (재시도해도 같은 행/벡터 교체)
+            assert calls[0][1] == [row["id"] for row in calls[1][2]]
+        assert runs[0][0] == runs[1][0]
+        index_calls = agent.vector_index.add_report.call_args_list
+        assert index_calls[0] == index_calls[1]
+        assert index_calls[1].kwargs == {"replace": False}
+        assert sorted(index_calls[1].args[1]) == sorted(str(text_id) for text_id in runs[1][0][1])
+
+
+def make_structured_agent(responses):
+    """
+    청크 i의 구조화 추출 LLM 응답이 responses[i]인 에이전트
+
+    청크는 "CHUNK{i}" 본문으로 대체하고, 개별 추출 요청(_request_sections,
+    _request_prediction_chunk)은 호출된 청크를 agent.fallbacks에 기록합니다.
+    """
+    agent = ReportParsingAgent.__new__(ReportParsingAgent)
+    agent.fallbacks = []
+    agent._prompt_chunks = lambda extraction_result: [f"CHUNK{index}" for index in range(len(responses))]
+
+    async def generate(provider, prompt, options):
+        index = next(i for i in range(len(responses)) if f"CHUNK{i}\n" in prompt or prompt.endswith(f"CHUNK{i}"))
+        return {"content": responses[index]}
+
+    async def request_sections(context):
+        agent.fallbacks.append(("sections", context.splitlines()[-1]))
+        return [{"section_type": "analysis", "title": "재추출", "content": context.splitlines()[-1]}]
+
+    async def request_predictions(context, prediction_types):
+        agent.fallbacks.append(("predictions", context.splitlines()[-1]))
+        return [{"prediction_type": "revenue", "predicted_value": 1, "period": "2025"}]
+
+    agent.llm_service = SimpleNamespace(generate=generate)
+    agent._request_sections = request_sections
+    agent._request_prediction_chunk = request_predictions
+    return agent
+
+
+def structured_response(sections, predictions=None):
+    response = {"sections": sections}
+    if predictions is not None:
+        response["predictions"] = predictions
+    return json.dumps(response, ensure_ascii=False)
+
+
+class TestStructuredExtraction:
+    """구조화 추출 테스트 (LLM 응답 대체)"""
+
+    def test_retries_only_failing_chunk(self):
+        """검증에 실패한 청크의 섹션/예측만 개별 추출로 다시 요청하는지 테스트"""
+        prediction = {"prediction_type": "target_price", "predicted_value": "120,000", "unit": "원"}
+        agent = make_structured_agent([
+            structured_response([{"section_type": "summary", "title": "요약", "content": "첫 요약"}], [prediction]),
+            structured_response([{"title": "타입 없음"}], [{"prediction_type": "unknown", "predicted_value": 1}]),
+            structured_response([{"section_type": "risk", "title": "리스크", "content": "환율"}], []),
+        ])
+        result = {"texts": [{"id": "text_1_full", "content": "본문", "page_number": 1}]}
+
+        structured = asyncio.run(agent._extract_structured(result, False, ["target_price", "revenue"]))
+
+        assert sorted(agent.fallbacks) == [("predictions", "CHUNK1"), ("sections", "CHUNK1")]
+        assert [section["section_type"] for section in structured["sections"]] == ["summary", "analysis", "risk"]
+        assert [(p["prediction_type"], p["predicted_value"]) for p in structured["predictions"]] == [
+            ("target_price", 120000.0), ("revenue", 1),
+        ]
+
+    def test_sections_merged_by_type(self):
+        """청크마다 제목이 다른 같은 타입 섹션을 하나로 합치고 내용을 이어 붙이는지 테스트"""
+        agent = make_structured_agent([
+            structured_response([
+                {"section_type": "summary", "title": "투자 요약", "content": "실적 개선", "page_number": 1},
+                {"section_type": "risk", "title": "리스크", "content": "환율"},
+            ]),
+            structured_response([
+                {"section_type": "summary", "title": "Summary", "content": "목표주가 상향", "page_number": 4},
+                {"section_type": "summary", "title": "요약 (계속)", "content": "실적 개선"},
+            ]),
+        ])
+        result = {"texts": [{"id": "text_1_full", "content": "본문", "page_number": 1}]}
+
+        structured = asyncio.run(agent._extract_structured(result, False, []))
+
+        assert agent.fallbacks == []
+        assert "predictions" not in structured
+        assert [(s["section_type"], s["title"], s["content"], s["page_number"]) for s in structured["sections"]] == [
+            ("summary", "투자 요약", "실적 개선\n\n목표주가 상향", 1),
+            ("risk", "리스크", "환율", None),
+        ]
+
+
+    def test_parse_structured_response_validates_items(self):
+        """응답을 항목별로 검증해 유효한 항목만 남기고, JSON이 아니면 빈 결과를 반환하는지 테스트"""
+        agent = ReportParsingAgent.__new__(ReportParsingAgent)
+        content = "다음은 결과입니다.\n```json\n" + json.dumps({
+            "company": {"company_name_kr": " 삼성전자 ", "ticker": "005930", "confidence": "high"},
+            "sections": [
+                {"section_type": "summary", "title": "요약", "content": "실적 개선", "page_number": 1},
+                {"title": "타입 없음"},
+            ],
+            "predictions": [
+                {"prediction_type": "target_price", "predicted_value": "120,000", "unit": "원"},
+                {"prediction_type": "revenue", "predicted_value": "n/a"},
+                {"prediction_type": "net_profit", "predicted_value": 300, "unit": "억원", "period": "2025"},
+            ],
+        }, ensure_ascii=False) + "\n```"
+
+        parsed = agent._parse_structured_response(content, True, ["target_price", "revenue"])
+
+        assert parsed["company"].company_name_kr == "삼성전자"
+        assert [section["section_type"] for section in parsed["sections"]] == ["summary"]
+        # 검증 실패(revenue)와 요청하지 않은 타입(net_profit)은 제외
+        assert [(p["prediction_type"], p["predicted_value"]) for p in parsed["predictions"]] == [
+            ("target_price", 120000.0)
+        ]
+        assert agent._parse_structured_response("분석할 수 없습니다.", True) == {}
+        assert agent._parse_structured_response('{"sections": [}', True) == {}
+        # 항목이 있는데 모두 검증에 실패하면 키를 빼서 개별 추출로 대체
+        all_invalid = agent._parse_structured_response(structured_response([{"title": "x"}], []), False, ["revenue"])
+        assert all_invalid == {"predictions": []}
+
+    def test_non_json_response_falls_back(self):
+        """JSON이 아닌 응답이면 섹션/예측을 개별 추출하고 기업명은 반환하지 않는지 테스트"""
+        agent = make_structured_agent(["죄송합니다. 분석할 수 없습니다."])
+        result = {"texts": [{"id": "text_1_full", "content": "본문", "page_number": 1}]}
+
+        structured = asyncio.run(agent._extract_structured(result, True, ["revenue"]))
+
+        assert sorted(agent.fallbacks) == [("predictions", "CHUNK0"), ("sections", "CHUNK0")]
+        assert "company" not in structured
+        assert structured["sections"][0]["title"] == "재추출"
+        assert structured["predictions"][0]["prediction_type"] == "revenue"
+
+    def test_valid_response_calls_no_fallback(self):
+        """유효한 응답이면 개별 추출 없이 기업명/섹션/예측을 모두 반환하는지 테스트"""
+        agent = make_structured_agent([json.dumps({
+            "company": {"company_name_kr": "삼성전자", "confidence": "high"},
+            "sections": [{"section_type": "forecast", "title": "전망", "content": "목표주가 상향"}],
+            "predictions": [{"prediction_type": "target_price", "predicted_value": 120000, "unit": "원"}],
+        }, ensure_ascii=False)])
+        result = {"texts": [{"id": "text_1_full", "content": "본문", "page_number": 1}]}
+
+        structured = asyncio.run(agent._extract_structured(result, True, ["target_price"]))
+
+        assert agent.fallbacks == []
+        assert structured["company"].company_name_kr == "삼성전자"
+        assert [s["section_type"] for s in structured["sections"]] == ["forecast"]
+        assert [p["predicted_value"] for p in structured["predictions"]] == [120000.0]
+
+    def test_parse_report_falls_back_for_missing_company(self):
+        """구조화 추출에 기업명이 없으면 기업명만 개별 추출하고 섹션은 구조화 결과를 쓰는지 테스트"""
+        report = make_report(company_id=None)
+        agent = make_agent(report)
+        company_id = uuid4()
+
+        async def structured(*args, **kwargs):
+            return {"sections": [{"section_type": "summary", "title": "요약", "content": "내용", "page_number": 1}]}
+
+        async def extract_company_name(extraction_result):
+            agent.calls.append(("company_fallback",))
+            return company_id
+
+        async def extract_sections(extraction_result):
+            agent.calls.append(("sections_fallback",))
+            return []
+
+        agent._extract_structured = structured
+        agent._extract_company_name = extract_company_name
+        agent._extract_sections = extract_sections
+
+        asyncio.run(agent.parse_report(report.id, "/tmp/report.pdf"))
+
+        assert ("company_fallback",) in agent.calls
+        assert ("sections_fallback",) not in agent.calls
+        assert ("save_sections", 1) in agent.calls
+        assert report.company_id == company_id
+
+
+class TestExtractPredictions:
+    """예측 저장 테스트"""
+
+    def test_reparse_replaces_predictions_without_commit(self):
+        """재파싱 시 같은 (타입, 기간) 예측은 갱신, 없어진 예측은 삭제(실제 결과 연결 시 유지)하는지 테스트"""
+        report = make_report()
+        agent = ReportParsingAgent.__new__(ReportParsingAgent)
+        agent.db = MagicMock()
+        verified = SimpleNamespace(prediction_type="target_price", period=None, predicted_value=120000, actual_results=["r"])
+        stale = SimpleNamespace(prediction_type="revenue", period="2024", predicted_value=1, actual_results=[])
+        kept = SimpleNamespace(prediction_type="net_profit", period="2023", predicted_value=2, actual_results=["r"])
+        agent.db.query.return_value.filter.return_value.first.return_value = report
+        agent.db.query.return_value.filter.return_value.all.return_value = [verified, stale, kept]
+        rule_result = {
+            "predictions": [{
+                "prediction_type": "target_price", "predicted_value": 130000.0, "unit": "원", "period": None,
+                "confidence": "high", "source": "rule", "evidence": ["numeric_1"],
+            }],
+            "unresolved": ["operating_profit"],
+        }
+        llm_predictions = [
+            {"prediction_type": "operating_profit", "predicted_value": 5000, "unit": "억원", "period": "2025"},
+            {"prediction_type": "target_price", "predicted_value": 1, "unit": "원"},
+        ]
+
+        predictions = asyncio.run(agent._extract_predictions(report.id, {}, [], llm_predictions, rule_result))
+
+        assert predictions[0] is verified
+        assert verified.predicted_value == Decimal("130000.0")
+        assert verified.extra_data == {"source": "rule", "evidence": ["numeric_1"]}
+        assert predictions[1].prediction_type == "operating_profit"
+        assert predictions[1].report_id == report.id
+        agent.db.add.assert_called_once_with(predictions[1])
+        agent.db.delete.assert_called_once_with(stale)
+        agent.db.commit.assert_not_called()
+
+    def test_llm_replaces_unresolved_rule_predictions(self):
+        """확정하지 못한 타입의 규칙 예측(medium)은 같은 (타입, 기간)의 LLM 값으로 대체하는지 테스트"""
+        report = make_report()
+        agent = ReportParsingAgent.__new__(ReportParsingAgent)
+        agent.db = MagicMock()
+        agent.db.query.return_value.filter.return_value.first.return_value = report
+        agent.db.query.return_value.filter.return_value.all.return_value = []
+        rule_result = {
+            "predictions": [
+                {"prediction_type": "revenue", "predicted_value": 12000.0, "unit": "억원", "period": "2025",
+                 "confidence": "medium", "source": "rule", "evidence": ["table_2_0", "numeric_1"]},
+                {"prediction_type": "revenue", "predicted_value": 13000.0, "unit": "억원", "period": "2026",
+                 "confidence": "high", "source": "rule", "evidence": ["table_2_0"]},
+            ],
+            "unresolved": ["revenue"],
+        }
+        llm_predictions = [{"prediction_type": "revenue", "predicted_value": 12500, "unit": "억원", "period": "2025"}]
+
+        predictions = asyncio.run(agent._extract_predictions(report.id, {}, [], llm_predictions, rule_result))
+
+        assert [(p.period, p.predicted_value, p.extra_data) for p in predictions] == [
+            ("2025", Decimal("12500"), None),
+            ("2026", Decimal("13000.0"), {"source": "rule", "evidence": ["table_2_0"]}),
+        ]
+
+    def test_enrich_applies_table_forecasts(self):
+        """보강 추출로 병합된 표의 확정 예측만 갱신/추가하고 다른 예측은 그대로 두는지 테스트"""
+        report = make_report()
+        agent = ReportParsingAgent.__new__(ReportParsingAgent)
+        agent.db = MagicMock()
+        llm_revenue = SimpleNamespace(prediction_type="revenue", period="2025", predicted_value=1, actual_results=[])
+        llm_target = SimpleNamespace(prediction_type="target_price", period=None, predicted_value=2, actual_results=[])
+        agent.db.query.return_value.filter.return_value.all.return_value = [llm_revenue, llm_target]
+        page_text = "2025F 영업이익 600억원 전망"
+        merged = {
+            "texts": [
+                {"id": "text_1_full", "content": page_text, "page_number": 1},
+                {"id": "numeric_1", "content": json.dumps(scan_numeric_data(page_text)), "page_number": 1,
+                 "data_type": "numeric"},
+            ],
+            "tables": [{"id": "table_2_0", "page_number": 2, "data": [
+                ["(십억원)", "2025F", "2026F"], ["매출액", "1,200", "1,500"], ["영업이익", "50", "60"],
+            ]}],
+        }
+
+        predictions = agent._apply_table_predictions(report, merged)
+
+        assert [(p.prediction_type, p.period) for p in predictions] == [("revenue", "2025"), ("revenue", "2026")]
+        assert predictions[0] is llm_revenue
+        assert llm_revenue.predicted_value == Decimal("12000.0")
+        assert llm_target.predicted_value == 2
+        agent.db.add.assert_called_once_with(predictions[1])
+        agent.db.delete.assert_not_called()
+        agent.db.commit.assert_not_called()
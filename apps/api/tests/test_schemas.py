@@ -8,6 +8,8 @@ from datetime import datetime
 from app.schemas.evaluation import EvaluationDetailResponse, EvaluationScoreResponse
 from app.schemas.award import AwardResponse
 from app.schemas.scorecard import ScorecardResponse
+from app.schemas.report import StructuredCompany, StructuredPrediction
+from pydantic import ValidationError
 
 
 class TestSchemas:
@@ -87,3 +89,19 @@ class TestSchemas:
         assert response.final_score == 85.5
         assert response.ranking == 1
 
+    def test_structured_company(self):
+        """StructuredCompany 스키마 테스트 (빈 값 정규화)"""
+        company = StructuredCompany(company_name_kr=" 삼성전자 ", ticker="", confidence="high")
+        assert company.company_name_kr == "삼성전자"
+        assert company.ticker is None
+
+        with pytest.raises(ValidationError):
+            StructuredCompany(company_name_kr="삼성전자", confidence="unknown")
+
+    def test_structured_prediction(self):
+        """StructuredPrediction 스키마 테스트 (천 단위 구분자, 예측 타입 검증)"""
+        prediction = StructuredPrediction(prediction_type="target_price", predicted_value="120,000", unit="원")
+        assert prediction.predicted_value == 120000
+
+        with pytest.raises(ValidationError):
+            StructuredPrediction(prediction_type="eps", predicted_value=1)
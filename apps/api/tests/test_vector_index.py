@@ -0,0 +1,142 @@
+"""
+Vector Index 단위 테스트
+"""
+import numpy as np
+
+from app.services import vector_index as vector_index_module
+from app.services.vector_index import VectorIndex
+
+
+def clustered_vectors(count, dim=32, clusters=20, seed=0):
+    """군집 구조가 있는 임의 벡터"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    labels = rng.integers(0, clusters, size=count)
+    return (centers[labels] + 0.3 * rng.normal(size=(count, dim))).astype(np.float32)
+
+
+def embeddings_for(prefix, vectors):
+    return {f"{prefix}-{idx:08d}": vector.tolist() for idx, vector in enumerate(vectors)}
+
+
+class TestVectorIndex:
+    """Vector Index 테스트"""
+
+    def test_search_returns_nearest_text(self, tmp_path):
+        """가장 가까운 문단과 리포트 id를 반환하는지 테스트"""
+        index = VectorIndex(tmp_path)
+        vectors = clustered_vectors(200)
+        index.add_report("report-a", embeddings_for("a", vectors[:100]))
+        index.add_report("report-b", embeddings_for("b", vectors[100:]))
+
+        results = index.search(vectors[150].tolist(), limit=3)
+
+        assert results[0]["text_id"] == "b-00000050"
+        assert results[0]["report_id"] == "report-b"
+        assert results[0]["score"] > 0.99
+        assert [r["score"] for r in results] == sorted((r["score"] for r in results), reverse=True)
+
+    def test_replace_and_report_filter(self, tmp_path):
+        """재파싱 시 이전 벡터가 제외되고 report_ids로 범위를 제한하는지 테스트"""
+        index = VectorIndex(tmp_path)
+        vectors = clustered_vectors(60)
+        index.add_report("report-a", embeddings_for("old", vectors[:30]))
+        index.add_report("report-b", embeddings_for("b", vectors[30:]))
+        index.add_report("report-a", embeddings_for("new", vectors[:30]))
+
+        results = index.search(vectors[5].tolist(), limit=60)
+        assert not any(r["text_id"].startswith("old") for r in results)
+        assert results[0]["text_id"] == "new-00000005"
+
+        filtered = index.search(vectors[5].tolist(), limit=60, report_ids=["report-b"])
+        assert filtered and all(r["report_id"] == "report-b" for r in filtered)
+
+    def test_add_without_replace_supersedes_same_text_ids(self, tmp_path):
+        """replace 없이 같은 텍스트 id를 다시 추가하면 이전 벡터만 교체하는지 테스트 (보강 추출 재시도)"""
+        index = VectorIndex(tmp_path)
+        vectors = clustered_vectors(60)
+        index.add_report("report-a", embeddings_for("a", vectors[:50]))
+        index.add_report("report-a", {"ocr-1": vectors[50].tolist()}, replace=False)
+        index.add_report("report-a", {"ocr-1": vectors[51].tolist()}, replace=False)
+
+        results = index.search(vectors[51].tolist(), limit=60)
+        assert [r["text_id"] for r in results].count("ocr-1") == 1
+        assert results[0]["text_id"] == "ocr-1" and results[0]["score"] > 0.99
+        assert index.search(vectors[10].tolist(), limit=1)[0]["text_id"] == "a-00000010"
+
+        index.compact(full=True)
+        assert index.stats()["vectors"] == 51
+        assert [r["text_id"] for r in index.search(vectors[51].tolist(), limit=60)].count("ocr-1") == 1
+
+    def test_compaction_trains_ivf_with_good_recall(self, tmp_path, monkeypatch):
+        """세그먼트 병합 시 centroid를 학습하고 IVF 검색 결과가 전체 검색과 대부분 같은지 테스트"""
+        monkeypatch.setattr(vector_index_module, "VECTOR_INDEX_MIN_TRAIN", 1000)
+        index = VectorIndex(tmp_path)
+        vectors = clustered_vectors(3000)
+        for report in range(6):
+            chunk = vectors[report * 500:(report + 1) * 500]
+            index.add_report(f"report-{report}", embeddings_for(f"r{report}", chunk))
+        assert index.stats()["segments"] == 6
+        assert index.needs_compaction()
+        index.compact()
+
+        stats = index.stats()
+        assert stats["trained"]
+        assert stats["vectors"] == 3000
+        assert stats["segments"] < 6
+
+        normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        hits = 0
+        for query_row in range(0, 3000, 150):
+            exact = np.argsort(-(normalized @ normalized[query_row]))[:10]
+            expected = {f"r{row // 500}-{row % 500:08d}" for row in exact}
+            found = {r["text_id"] for r in index.search(vectors[query_row].tolist(), limit=10)}
+            hits += len(expected & found)
+        assert hits / (20 * 10) >= 0.9
+
+    def test_size_tiered_merge_keeps_large_segments(self, tmp_path, monkeypatch):
+        """크기가 비슷한 작은 세그먼트만 병합하고 큰 세그먼트는 다시 쓰지 않는지 테스트"""
+        monkeypatch.setattr(vector_index_module, "VECTOR_INDEX_MIN_TRAIN", 100000)
+        monkeypatch.setattr(vector_index_module, "VECTOR_INDEX_MERGE_FACTOR", 4)
+        index = VectorIndex(tmp_path)
+        vectors = clustered_vectors(1040)
+        index.add_report("report-big", embeddings_for("big", vectors[:1000]))
+        large_segment = index._load_manifest()["segments"][0]["name"]
+        for report in range(3):
+            chunk = vectors[1000 + report * 10:1010 + report * 10]
+            index.add_report(f"report-{report}", embeddings_for(f"r{report}", chunk))
+        assert not index.needs_compaction()
+
+        index.add_report("report-3", embeddings_for("r3", vectors[1030:]))
+        assert index.needs_compaction()
+        assert index.compact() == 1
+
+        segments = index._load_manifest()["segments"]
+        assert [segment["name"] for segment in segments][0] == large_segment
+        assert [segment["count"] for segment in segments] == [1000, 40]
+        assert index.search(vectors[1035].tolist(), limit=1)[0]["text_id"] == "r3-00000005"
+
+    def test_merge_runs_outside_index_lock(self, tmp_path, monkeypatch):
+        """병합 중에도 벡터를 추가/삭제할 수 있고, 그 사이의 삭제 표시가 병합 결과에 남는지 테스트"""
+        monkeypatch.setattr(vector_index_module, "VECTOR_INDEX_MIN_TRAIN", 100000)
+        monkeypatch.setattr(vector_index_module, "VECTOR_INDEX_MERGE_FACTOR", 2)
+        index = VectorIndex(tmp_path)
+        vectors = clustered_vectors(30)
+        index.add_report("report-a", embeddings_for("a", vectors[:10]))
+        index.add_report("report-b", embeddings_for("b", vectors[10:20]))
+
+        write_segment = index._write_segment
+
+        def write_during_add(*args):
+            index._write_segment = write_segment
+            # 병합이 인덱스 잠금을 잡고 있으면 여기서 멈춤
+            index.remove_report("report-a")
+            index.add_report("report-c", embeddings_for("c", vectors[20:30]))
+            write_segment(*args)
+
+        index._write_segment = write_during_add
+        assert index.compact() == 1
+
+        assert sorted(segment["count"] for segment in index._load_manifest()["segments"]) == [10, 20]
+        results = index.search(vectors[0].tolist(), limit=30)
+        assert {r["report_id"] for r in results} == {"report-b", "report-c"}